@@ -208,6 +208,11 @@ namespace triton {
   }
 
 
+  triton::usize API::getEnginesGeneration(void) const {
+    return this->enginesGeneration;
+  }
+
+
   void API::checkArchitecture(void) const {
     if (!this->isArchitectureValid())
       throw triton::exceptions::API("API::checkArchitecture(): You must define an architecture.");
@@ -366,10 +371,12 @@ namespace triton {
 
   void API::initEngines(void) {
     this->checkArchitecture();
+    this->enginesGeneration++;
 
     this->modes = new(std::nothrow) triton::modes::Modes();
     if (this->modes == nullptr)
       throw triton::exceptions::API("API::initEngines(): No enough memory.");
+    this->astLazyEvaluation = this->modes->isModeEnabled(triton::modes::AST_LAZY_EVALUATION);
 
     this->symbolic = new(std::nothrow) triton::engines::symbolic::SymbolicEngine(&this->arch, this->modes, &this->callbacks);
     if (this->symbolic == nullptr)
@@ -414,6 +421,7 @@ namespace triton {
       this->symbolic            = nullptr;
       this->taint               = nullptr;
       this->z3Interface         = nullptr;
+      this->astLazyEvaluation   = false;
     }
   }
 
@@ -449,6 +457,30 @@ namespace triton {
   }
 
 
+  triton::usize API::fork(void) {
+    this->checkIrBuilder();
+    return this->irBuilder->fork();
+  }
+
+
+  void API::restoreFork(triton::usize id) {
+    this->checkIrBuilder();
+    this->irBuilder->restoreFork(id);
+  }
+
+
+  void API::removeFork(triton::usize id) {
+    this->checkIrBuilder();
+    this->irBuilder->removeFork(id);
+  }
+
+
+  std::vector<triton::usize> API::getForks(void) const {
+    this->checkIrBuilder();
+    return this->irBuilder->getForks();
+  }
+
+
 
   /* AST garbage collector API ====================================================================== */
 
@@ -460,16 +492,70 @@ namespace triton {
 
   void API::freeAllAstNodes(void) {
     this->checkAstGarbageCollector();
+    /* Memoized full ASTs may use freed nodes */
+    this->invalidateFullAsts();
     this->astGarbageCollector->freeAllAstNodes();
   }
 
 
   void API::freeAstNodes(std::set<triton::ast::AbstractNode*>& nodes) {
     this->checkAstGarbageCollector();
+    /* Memoized full ASTs may use freed nodes */
+    this->invalidateFullAsts();
     this->astGarbageCollector->freeAstNodes(nodes);
   }
 
 
+  void API::beginAstEpoch(void) {
+    this->checkAstGarbageCollector();
+    this->astGarbageCollector->beginAstEpoch();
+  }
+
+
+  void API::endAstEpoch(void) {
+    this->checkAstGarbageCollector();
+    this->astGarbageCollector->endAstEpoch();
+  }
+
+
+  void API::freeAstEpoch(void) {
+    std::vector<triton::ast::AbstractNode*> roots;
+
+    this->checkIrBuilder();
+    this->checkAstGarbageCollector();
+
+    /* Memoized full ASTs may use freed nodes */
+    this->invalidateFullAsts();
+
+    /* The ASTs of the expressions created during the epoch are kept */
+    this->irBuilder->getAstRoots(roots);
+    this->astGarbageCollector->freeAstEpoch(roots);
+  }
+
+
+  triton::usize API::freeUnreachableAstNodes(void) {
+    std::vector<triton::ast::AbstractNode*> roots;
+
+    this->checkIrBuilder();
+    this->checkAstGarbageCollector();
+
+    this->irBuilder->getAstRoots(roots);
+    return this->astGarbageCollector->freeUnreachableAstNodes(roots);
+  }
+
+
+  void API::pinAstNode(triton::ast::AbstractNode* node) {
+    this->checkAstGarbageCollector();
+    this->astGarbageCollector->pinAstNode(node);
+  }
+
+
+  void API::unpinAstNode(triton::ast::AbstractNode* node) {
+    this->checkAstGarbageCollector();
+    this->astGarbageCollector->unpinAstNode(node);
+  }
+
+
   void API::extractUniqueAstNodes(std::set<triton::ast::AbstractNode*>& uniqueNodes, triton::ast::AbstractNode* root) const {
     this->checkAstGarbageCollector();
     this->astGarbageCollector->extractUniqueAstNodes(uniqueNodes, root);
@@ -478,7 +564,11 @@ namespace triton {
 
   triton::ast::AbstractNode* API::recordAstNode(triton::ast::AbstractNode* node) {
     this->checkAstGarbageCollector();
-    return this->astGarbageCollector->recordAstNode(node);
+    node = this->astGarbageCollector->recordAstNode(node);
+    /* Childs are built first, so they are already simplified */
+    if (this->symbolic != nullptr && this->modes->isModeEnabled(triton::modes::AST_NATIVE_SIMPLIFICATIONS))
+      node = this->symbolic->applyNativeSimplifications(node);
+    return node;
   }
 
 
@@ -537,6 +627,29 @@ namespace triton {
 
 
 
+  /* AST Evaluation API ============================================================================ */
+
+  triton::uint512 API::evaluateAst(triton::ast::AbstractNode* node, const std::map<triton::usize, triton::uint512>& values) {
+    return this->astEvaluator.evaluate(node, values);
+  }
+
+
+  std::vector<triton::uint512> API::evaluateAstBatch(triton::ast::AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values) {
+    return this->astBatchEvaluator.evaluate(node, values);
+  }
+
+
+  std::vector<triton::uint64> API::evaluateAstBatch64(triton::ast::AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values) {
+    return this->astBatchEvaluator.evaluate64(node, values);
+  }
+
+
+  triton::ast::AstProgram API::compileAst(triton::ast::AbstractNode* node) const {
+    return triton::ast::AstProgram(node);
+  }
+
+
+
   /* Callbacks API ================================================================================= */
 
   void API::addCallback(triton::callbacks::getConcreteMemoryValueCallback cb) {
@@ -605,6 +718,7 @@ namespace triton {
   void API::enableMode(enum triton::modes::mode_e mode, bool flag) {
     this->checkModes();
     this->modes->enableMode(mode, flag);
+    this->astLazyEvaluation = this->modes->isModeEnabled(triton::modes::AST_LAZY_EVALUATION);
   }
 
 
@@ -614,6 +728,11 @@ namespace triton {
   }
 
 
+  bool API::isAstLazyEvaluationEnabled(void) const {
+    return this->astLazyEvaluation;
+  }
+
+
 
   /* Symbolic engine API ============================================================================ */
 
@@ -713,6 +832,24 @@ namespace triton {
   }
 
 
+  triton::usize API::freeUnreachableSymbolicExpressions(void) {
+    this->checkIrBuilder();
+    return this->irBuilder->freeUnreachableSymbolicExpressions();
+  }
+
+
+  void API::pinSymbolicExpression(triton::usize symExprId) {
+    this->checkSymbolic();
+    this->symbolic->pinSymbolicExpression(symExprId);
+  }
+
+
+  void API::unpinSymbolicExpression(triton::usize symExprId) {
+    this->checkSymbolic();
+    this->symbolic->unpinSymbolicExpression(symExprId);
+  }
+
+
   triton::engines::symbolic::SymbolicExpression* API::createSymbolicExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::OperandWrapper& dst, const std::string& comment) {
     this->checkSymbolic();
     return this->symbolic->createSymbolicExpression(inst, node, dst, comment);
@@ -807,11 +944,100 @@ namespace triton {
     this->checkSymbolic();
     if (z3 == true)
       node = this->processZ3Simplification(node);
+    if (this->modes->isModeEnabled(triton::modes::AST_NATIVE_SIMPLIFICATIONS))
+      node = this->symbolic->processNativeSimplifications(node);
     node = this->symbolic->processSimplification(node);
     return node;
   }
 
 
+  void API::setSimplificationPasses(const std::vector<triton::engines::symbolic::simplification_e>& passes) {
+    this->checkSymbolic();
+    this->symbolic->setNativeSimplificationPasses(passes);
+  }
+
+
+  const std::vector<triton::engines::symbolic::simplification_e>& API::getSimplificationPasses(void) const {
+    this->checkSymbolic();
+    return this->symbolic->getNativeSimplificationPasses();
+  }
+
+
+  void API::addSimplificationRule(const std::string& rule) {
+    this->checkSymbolic();
+    this->symbolic->addSimplificationRule(rule);
+  }
+
+
+  std::vector<std::string> API::getSimplificationRules(void) const {
+    this->checkSymbolic();
+    return this->symbolic->getSimplificationRules();
+  }
+
+
+  void API::removeAllSimplificationRules(void) {
+    this->checkSymbolic();
+    this->symbolic->removeAllSimplificationRules();
+  }
+
+
+  void API::saveAst(std::ostream& stream, triton::ast::AbstractNode* node) const {
+    this->checkSymbolic();
+    triton::engines::symbolic::SymbolicSerialization(this->symbolic).save(stream, {node}, {}, {});
+  }
+
+
+  triton::ast::AbstractNode* API::loadAst(std::istream& stream) {
+    std::vector<triton::ast::AbstractNode*> nodes;
+    std::vector<triton::engines::symbolic::SymbolicExpression*> exprs;
+    std::vector<triton::engines::symbolic::SymbolicVariable*> vars;
+
+    this->checkSymbolic();
+    triton::engines::symbolic::SymbolicSerialization(this->symbolic).load(stream, nodes, exprs, vars);
+
+    if (nodes.size() != 1)
+      throw triton::exceptions::SymbolicSerialization("API::loadAst(): The stream does not contain an AST.");
+
+    return nodes[0];
+  }
+
+
+  void API::saveSymbolicExpressions(std::ostream& stream, const std::vector<triton::engines::symbolic::SymbolicExpression*>& exprs) const {
+    this->checkSymbolic();
+    triton::engines::symbolic::SymbolicSerialization(this->symbolic).save(stream, {}, exprs, {});
+  }
+
+
+  std::vector<triton::engines::symbolic::SymbolicExpression*> API::loadSymbolicExpressions(std::istream& stream) {
+    std::vector<triton::ast::AbstractNode*> nodes;
+    std::vector<triton::engines::symbolic::SymbolicExpression*> exprs;
+    std::vector<triton::engines::symbolic::SymbolicVariable*> vars;
+
+    this->checkSymbolic();
+    triton::engines::symbolic::SymbolicSerialization(this->symbolic).load(stream, nodes, exprs, vars);
+
+    return exprs;
+  }
+
+
+  void API::saveSymbolicVariables(std::ostream& stream, const std::vector<triton::engines::symbolic::SymbolicVariable*>& vars) const {
+    this->checkSymbolic();
+    triton::engines::symbolic::SymbolicSerialization(this->symbolic).save(stream, {}, {}, vars);
+  }
+
+
+  std::vector<triton::engines::symbolic::SymbolicVariable*> API::loadSymbolicVariables(std::istream& stream) {
+    std::vector<triton::ast::AbstractNode*> nodes;
+    std::vector<triton::engines::symbolic::SymbolicExpression*> exprs;
+    std::vector<triton::engines::symbolic::SymbolicVariable*> vars;
+
+    this->checkSymbolic();
+    triton::engines::symbolic::SymbolicSerialization(this->symbolic).load(stream, nodes, exprs, vars);
+
+    return vars;
+  }
+
+
   triton::engines::symbolic::SymbolicExpression* API::getSymbolicExpressionFromId(triton::usize symExprId) const {
     this->checkSymbolic();
     return this->symbolic->getSymbolicExpressionFromId(symExprId);
@@ -940,6 +1166,29 @@ namespace triton {
   }
 
 
+  void API::invalidateFullAsts(void) {
+    if (this->symbolic != nullptr)
+      this->symbolic->invalidateFullAsts();
+  }
+
+
+  void API::invalidateAsts(triton::ast::AbstractNode* node) {
+    if (this->symbolic != nullptr)
+      this->symbolic->invalidateAsts(node);
+  }
+
+
+  std::shared_ptr<const std::string> API::internComment(const std::string& comment) {
+    if (this->symbolic != nullptr)
+      return this->symbolic->internComment(comment);
+
+    if (comment.empty())
+      return nullptr;
+
+    return std::make_shared<const std::string>(comment);
+  }
+
+
   std::map<triton::usize, triton::engines::symbolic::SymbolicExpression*> API::sliceExpressions(triton::engines::symbolic::SymbolicExpression* expr) {
     this->checkSymbolic();
     return this->symbolic->sliceExpressions(expr);
@@ -985,6 +1234,12 @@ namespace triton {
   }
 
 
+  enum triton::engines::solver::presolve_e API::preSolve(triton::ast::AbstractNode* node) const {
+    this->checkSolver();
+    return this->solver->preSolve(node);
+  }
+
+
 
   /* Z3 interface API ============================================================================== */
 
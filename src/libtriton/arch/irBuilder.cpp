@@ -7,11 +7,14 @@
 
 #include <new>
 
+#include <triton/cpuSize.hpp>
 #include <triton/exceptions.hpp>
 #include <triton/irBuilder.hpp>
 #include <triton/memoryAccess.hpp>
 #include <triton/operandWrapper.hpp>
 #include <triton/register.hpp>
+#include <triton/x8664Cpu.hpp>
+#include <triton/x86Cpu.hpp>
 #include <triton/x86Semantics.hpp>
 
 
@@ -42,25 +45,146 @@ namespace triton {
 
       this->architecture              = architecture;
       this->astGarbageCollector       = astGarbageCollector;
-      this->backupAstGarbageCollector = new(std::nothrow) triton::ast::AstGarbageCollector(modes, true);
-      this->backupSymbolicEngine      = new(std::nothrow) triton::engines::symbolic::SymbolicEngine(architecture, modes, nullptr, true);
+      this->backupSymbolicEngine      = new(std::nothrow) triton::engines::symbolic::SymbolicEngine(architecture, modes);
       this->modes                     = modes;
       this->symbolicEngine            = symbolicEngine;
       this->taintEngine               = taintEngine;
+      this->uniqueForkId              = 0;
       this->x86Isa                    = new(std::nothrow) triton::arch::x86::x86Semantics(architecture, symbolicEngine, taintEngine);
 
-      if (this->x86Isa == nullptr || this->backupSymbolicEngine == nullptr || this->backupAstGarbageCollector == nullptr)
+      if (this->x86Isa == nullptr || this->backupSymbolicEngine == nullptr)
         throw triton::exceptions::IrBuilder("IrBuilder::IrBuilder(): Not enough memory.");
     }
 
 
     IrBuilder::~IrBuilder() {
+      for (auto it = this->forks.begin(); it != this->forks.end(); it++)
+        this->deleteFork(it->second);
+
       delete this->backupSymbolicEngine;
-      delete this->backupAstGarbageCollector;
       delete this->x86Isa;
     }
 
 
+    triton::usize IrBuilder::freeUnreachableSymbolicExpressions(void) {
+      std::vector<triton::ast::AbstractNode*> roots;
+      std::vector<triton::usize> freed = this->symbolicEngine->freeUnreachableSymbolicExpressions(this->astGarbageCollector->getPinnedAstNodes());
+
+      /* The AST nodes of the freed expressions are about to be freed, the backup engine must drop them too */
+      this->backupSymbolicEngine->forgetSymbolicExpressions(freed);
+
+      /* The AST nodes of the freed expressions are not reachable anymore */
+      this->getAstRoots(roots);
+      this->astGarbageCollector->freeUnreachableAstNodes(roots);
+
+      return freed.size();
+    }
+
+
+    void IrBuilder::getAstRoots(std::vector<triton::ast::AbstractNode*>& roots) const {
+      this->symbolicEngine->getAstRoots(roots);
+
+      for (auto it = this->forks.begin(); it != this->forks.end(); it++) {
+        it->second.symbolicEngine->getAstRoots(roots);
+        for (auto var = it->second.variableNodes.begin(); var != it->second.variableNodes.end(); var++)
+          roots.push_back(var->second);
+      }
+    }
+
+
+    triton::arch::CpuInterface* IrBuilder::copyCpu(triton::arch::CpuInterface* cpu) const {
+      triton::arch::CpuInterface* copy = nullptr;
+
+      switch (this->architecture->getArchitecture()) {
+        case triton::arch::ARCH_X86:
+          copy = new(std::nothrow) triton::arch::x86::x86Cpu(*dynamic_cast<triton::arch::x86::x86Cpu*>(cpu));
+          break;
+
+        case triton::arch::ARCH_X86_64:
+          copy = new(std::nothrow) triton::arch::x86::x8664Cpu(*dynamic_cast<triton::arch::x86::x8664Cpu*>(cpu));
+          break;
+
+        default:
+          throw triton::exceptions::IrBuilder("IrBuilder::copyCpu(): You must define an architecture.");
+      }
+
+      if (copy == nullptr)
+        throw triton::exceptions::IrBuilder("IrBuilder::copyCpu(): Not enough memory.");
+
+      return copy;
+    }
+
+
+    void IrBuilder::deleteFork(Fork& state) {
+      delete state.cpu;
+      delete state.symbolicEngine;
+      delete state.taintEngine;
+    }
+
+
+    triton::usize IrBuilder::fork(void) {
+      Fork state;
+
+      state.cpu            = this->copyCpu(this->architecture->getCpu());
+      state.symbolicEngine = new(std::nothrow) triton::engines::symbolic::SymbolicEngine(*this->symbolicEngine);
+      state.taintEngine    = new(std::nothrow) triton::engines::taint::TaintEngine(*this->taintEngine);
+      state.variableNodes  = this->astGarbageCollector->getAstVariableNodes();
+
+      if (state.symbolicEngine == nullptr || state.taintEngine == nullptr) {
+        this->deleteFork(state);
+        throw triton::exceptions::IrBuilder("IrBuilder::fork(): Not enough memory.");
+      }
+
+      this->forks[this->uniqueForkId] = state;
+
+      return this->uniqueForkId++;
+    }
+
+
+    void IrBuilder::restoreFork(triton::usize id) {
+      if (this->forks.find(id) == this->forks.end())
+        throw triton::exceptions::IrBuilder("IrBuilder::restoreFork(): Fork id not found.");
+
+      const Fork& state = this->forks.at(id);
+
+      switch (this->architecture->getArchitecture()) {
+        case triton::arch::ARCH_X86:
+          *dynamic_cast<triton::arch::x86::x86Cpu*>(this->architecture->getCpu()) = *dynamic_cast<triton::arch::x86::x86Cpu*>(state.cpu);
+          break;
+
+        case triton::arch::ARCH_X86_64:
+          *dynamic_cast<triton::arch::x86::x8664Cpu*>(this->architecture->getCpu()) = *dynamic_cast<triton::arch::x86::x8664Cpu*>(state.cpu);
+          break;
+      }
+
+      /* The state and the fork share their content until one of them writes it, the ids are not reused */
+      this->symbolicEngine->restore(*state.symbolicEngine);
+      *this->taintEngine    = *state.taintEngine;
+
+      /* Variables created after the fork do not exist anymore */
+      this->astGarbageCollector->setAstVariableNodes(state.variableNodes);
+    }
+
+
+    void IrBuilder::removeFork(triton::usize id) {
+      if (this->forks.find(id) == this->forks.end())
+        throw triton::exceptions::IrBuilder("IrBuilder::removeFork(): Fork id not found.");
+
+      this->deleteFork(this->forks.at(id));
+      this->forks.erase(id);
+    }
+
+
+    std::vector<triton::usize> IrBuilder::getForks(void) const {
+      std::vector<triton::usize> ret;
+
+      for (auto it = this->forks.begin(); it != this->forks.end(); it++)
+        ret.push_back(it->first);
+
+      return ret;
+    }
+
+
     bool IrBuilder::buildSemantics(triton::arch::Instruction& inst) {
       bool ret = false;
 
@@ -79,6 +203,18 @@ namespace triton {
         this->architecture->setConcreteRegisterValue(it2->second);
       }
 
+      /* Only the taint is spread, without building the semantics */
+      if (this->modes->isModeEnabled(triton::modes::TAINT_ONLY) && !this->symbolicEngine->isEnabled()) {
+        if (this->buildTaintSemantics(inst))
+          return true;
+      }
+
+      /* Pre IR processing */
+      this->preIrInit(inst);
+
+      /* All AST nodes allocated by this instruction are recorded into its own epoch */
+      triton::ast::AstEpochScope epoch(this->astGarbageCollector);
+
       /* Stage 3 - Initialize the target address of memory operands */
       std::vector<triton::arch::OperandWrapper>::iterator it3;
       for (it3 = inst.operands.begin(); it3 != inst.operands.end(); it3++) {
@@ -87,9 +223,6 @@ namespace triton {
         }
       }
 
-      /* Pre IR processing */
-      this->preIrInit(inst);
-
       /* Processing */
       switch (this->architecture->getArchitecture()) {
         case triton::arch::ARCH_X86:
@@ -104,15 +237,55 @@ namespace triton {
     }
 
 
+    bool IrBuilder::buildTaintSemantics(triton::arch::Instruction& inst) {
+      bool ret = false;
+
+      /* Initialize the target address of memory operands from the concrete context */
+      std::vector<triton::arch::OperandWrapper>::iterator it;
+      for (it = inst.operands.begin(); it != inst.operands.end(); it++) {
+        if (it->getType() == triton::arch::OP_MEM) {
+          this->symbolicEngine->initLeaAddress(it->getMemory());
+        }
+      }
+
+      switch (this->architecture->getArchitecture()) {
+        case triton::arch::ARCH_X86:
+        case triton::arch::ARCH_X86_64:
+          ret = this->x86Isa->buildTaintSemantics(inst);
+      }
+
+      /* Unsupported instructions are processed by the semantics */
+      if (ret) {
+        inst.symbolicExpressions.clear();
+        inst.memoryAccess.clear();
+        inst.registerState.clear();
+      }
+
+      return ret;
+    }
+
+
     void IrBuilder::preIrInit(triton::arch::Instruction& inst) {
       /* Clear previous expressions if exist */
       inst.symbolicExpressions.clear();
 
+      /*
+       * Free expressions and nodes which are not reachable anymore. This is
+       * done before processing a new instruction, so the expressions and ASTs
+       * of the previous one stay valid until then.
+       */
+      if (this->modes->isModeEnabled(triton::modes::SYMBOLIC_GARBAGE_COLLECTION) && this->symbolicEngine->isSymbolicCollectionRequired())
+        this->freeUnreachableSymbolicExpressions();
+
+      if (this->modes->isModeEnabled(triton::modes::AST_GARBAGE_COLLECTION) && this->astGarbageCollector->isAstCollectionRequired()) {
+        std::vector<triton::ast::AbstractNode*> roots;
+        this->getAstRoots(roots);
+        this->astGarbageCollector->freeUnreachableAstNodes(roots);
+      }
+
       /* Backup the symbolic engine in the case where only the taint is available. */
-      if (!this->symbolicEngine->isEnabled()) {
+      if (!this->symbolicEngine->isEnabled())
         *this->backupSymbolicEngine = *this->symbolicEngine;
-        *this->backupAstGarbageCollector = *this->astGarbageCollector;
-      }
     }
 
 
@@ -131,10 +304,19 @@ namespace triton {
        * If the symbolic engine is disable we delete symbolic
        * expressions and AST nodes. Note that if the taint engine
        * is enable we must compute semanitcs to spread the taint.
+       * Nothing built by this instruction is kept, so all its
+       * AST nodes are freed at once with its epoch.
        */
       if (!this->symbolicEngine->isEnabled()) {
-        this->removeSymbolicExpressions(inst, uniqueNodes);
+        for (auto it = inst.symbolicExpressions.begin(); it != inst.symbolicExpressions.end(); it++)
+          this->symbolicEngine->removeSymbolicExpression((*it)->getId());
+        inst.symbolicExpressions.clear();
+
+        /* The restored expressions only use nodes of the previous instructions, so there is no root to keep */
         *this->symbolicEngine = *this->backupSymbolicEngine;
+        this->astGarbageCollector->freeAstEpoch();
+
+        return;
       }
 
       /*
@@ -192,11 +374,10 @@ namespace triton {
           this->astGarbageCollector->extractUniqueAstNodes(uniqueNodes, std::get<1>(*it));
       }
 
-      /* Free collected nodes */
+      /* Free collected nodes and keep the others. Memoized full ASTs must not use them anymore */
+      this->symbolicEngine->invalidateFullAsts(uniqueNodes);
       this->astGarbageCollector->freeAstNodes(uniqueNodes);
-
-      if (!this->symbolicEngine->isEnabled())
-        *this->astGarbageCollector = *this->backupAstGarbageCollector;
+      this->astGarbageCollector->endAstEpoch();
     }
 
 
@@ -754,9 +754,7 @@ namespace triton {
 
 
       triton::uint8 x8664Cpu::getConcreteMemoryValue(triton::uint64 addr) const {
-        if (this->memory.find(addr) == this->memory.end())
-          return 0x00;
-        return this->memory.at(addr);
+        return this->memory.get(addr);
       }
 
 
@@ -1026,7 +1024,7 @@ namespace triton {
 
 
       void x8664Cpu::setConcreteMemoryValue(triton::uint64 addr, triton::uint8 value) {
-        this->memory[addr] = value;
+        this->memory.set(addr, value);
       }
 
 
@@ -1039,7 +1037,7 @@ namespace triton {
           throw triton::exceptions::Cpu("x8664Cpu::setConcreteMemoryValue(): Invalid size memory.");
 
         for (triton::uint32 i = 0; i < size; i++) {
-          this->memory[addr+i] = (cv & 0xff).convert_to<triton::uint8>();
+          this->memory.set(addr+i, (cv & 0xff).convert_to<triton::uint8>());
           cv >>= 8;
         }
       }
@@ -1047,14 +1045,14 @@ namespace triton {
 
       void x8664Cpu::setConcreteMemoryAreaValue(triton::uint64 baseAddr, const std::vector<triton::uint8>& values) {
         for (triton::usize index = 0; index < values.size(); index++) {
-          this->memory[baseAddr+index] = values[index];
+          this->memory.set(baseAddr+index, values[index]);
         }
       }
 
 
       void x8664Cpu::setConcreteMemoryAreaValue(triton::uint64 baseAddr, const triton::uint8* area, triton::usize size) {
         for (triton::usize index = 0; index < size; index++) {
-          this->memory[baseAddr+index] = area[index];
+          this->memory.set(baseAddr+index, area[index]);
         }
       }
 
@@ -1390,7 +1388,7 @@ namespace triton {
 
       bool x8664Cpu::isMemoryMapped(triton::uint64 baseAddr, triton::usize size) {
         for (triton::usize index = 0; index < size; index++) {
-          if (this->memory.find(baseAddr + index) == this->memory.end())
+          if (!this->memory.isMapped(baseAddr + index))
             return false;
         }
         return true;
@@ -1399,8 +1397,7 @@ namespace triton {
 
       void x8664Cpu::unmapMemory(triton::uint64 baseAddr, triton::usize size) {
         for (triton::usize index = 0; index < size; index++) {
-          if (this->memory.find(baseAddr + index) != this->memory.end())
-            this->memory.erase(baseAddr + index);
+          this->memory.remove(baseAddr + index);
         }
       }
 
@@ -631,9 +631,7 @@ namespace triton {
 
 
       triton::uint8 x86Cpu::getConcreteMemoryValue(triton::uint64 addr) const {
-        if (this->memory.find(addr) == this->memory.end())
-          return 0x00;
-        return this->memory.at(addr);
+        return this->memory.get(addr);
       }
 
 
@@ -805,7 +803,7 @@ namespace triton {
 
 
       void x86Cpu::setConcreteMemoryValue(triton::uint64 addr, triton::uint8 value) {
-        this->memory[addr] = value;
+        this->memory.set(addr, value);
       }
 
 
@@ -818,7 +816,7 @@ namespace triton {
           throw triton::exceptions::Cpu("x86Cpu::setConcreteMemoryValue(): Invalid size memory.");
 
         for (triton::uint32 i = 0; i < size; i++) {
-          this->memory[addr+i] = (cv & 0xff).convert_to<triton::uint8>();
+          this->memory.set(addr+i, (cv & 0xff).convert_to<triton::uint8>());
           cv >>= 8;
         }
       }
@@ -826,14 +824,14 @@ namespace triton {
 
       void x86Cpu::setConcreteMemoryAreaValue(triton::uint64 baseAddr, const std::vector<triton::uint8>& values) {
         for (triton::usize index = 0; index < values.size(); index++) {
-          this->memory[baseAddr+index] = values[index];
+          this->memory.set(baseAddr+index, values[index]);
         }
       }
 
 
       void x86Cpu::setConcreteMemoryAreaValue(triton::uint64 baseAddr, const triton::uint8* area, triton::usize size) {
         for (triton::usize index = 0; index < size; index++) {
-          this->memory[baseAddr+index] = area[index];
+          this->memory.set(baseAddr+index, area[index]);
         }
       }
 
@@ -1071,7 +1069,7 @@ namespace triton {
 
       bool x86Cpu::isMemoryMapped(triton::uint64 baseAddr, triton::usize size) {
         for (triton::usize index = 0; index < size; index++) {
-          if (this->memory.find(baseAddr + index) == this->memory.end())
+          if (!this->memory.isMapped(baseAddr + index))
             return false;
         }
         return true;
@@ -1080,8 +1078,7 @@ namespace triton {
 
       void x86Cpu::unmapMemory(triton::uint64 baseAddr, triton::usize size) {
         for (triton::usize index = 0; index < size; index++) {
-          if (this->memory.find(baseAddr + index) != this->memory.end())
-            this->memory.erase(baseAddr + index);
+          this->memory.remove(baseAddr + index);
         }
       }
 
@@ -636,6 +636,236 @@ namespace triton {
       }
 
 
+      bool x86Semantics::buildTaintSemantics(triton::arch::Instruction& inst) {
+        auto pc      = triton::arch::OperandWrapper(TRITON_X86_REG_PC.getParent());
+        auto stack   = triton::arch::OperandWrapper(TRITON_X86_REG_SP.getParent());
+        bool tainted = false;
+        bool branch  = false;
+        bool flags   = false;
+        bool arith   = false;
+
+        /* The REP prefixes update the counter (see controlFlow_s) */
+        switch (inst.getPrefix()) {
+          case ID_PREFIX_REP:
+          case ID_PREFIX_REPE:
+          case ID_PREFIX_REPNE:
+            return false;
+        }
+
+        switch (inst.getType()) {
+          /* Data transfers */
+          case ID_INS_MOV:
+          case ID_INS_MOVABS:
+          case ID_INS_MOVSX:
+          case ID_INS_MOVSXD:
+          case ID_INS_MOVZX:
+            tainted = this->taintEngine->taintAssignment(inst.operands[0], inst.operands[1]);
+            break;
+
+          case ID_INS_LEA: {
+            const triton::arch::MemoryAccess& src = inst.operands[1].getConstMemory();
+            tainted = this->taintEngine->setTaint(inst.operands[0], this->taintEngine->isRegisterTainted(src.getConstBaseRegister()) |
+                                                                    this->taintEngine->isRegisterTainted(src.getConstIndexRegister()));
+            break;
+          }
+
+          case ID_INS_XCHG: {
+            bool dstT = this->taintEngine->isTainted(inst.operands[0]);
+            bool srcT = this->taintEngine->isTainted(inst.operands[1]);
+            tainted  = this->taintEngine->setTaint(inst.operands[0], srcT);
+            tainted |= this->taintEngine->setTaint(inst.operands[1], dstT);
+            break;
+          }
+
+          case ID_INS_PUSH: {
+            auto& src           = inst.operands[0];
+            triton::uint32 size = (src.getType() == triton::arch::OP_IMM ? stack.getSize() : src.getSize());
+            triton::uint64 sp   = this->architecture->getConcreteRegisterValue(stack.getConstRegister()).convert_to<triton::uint64>();
+            auto dst            = triton::arch::OperandWrapper(triton::arch::MemoryAccess(sp - size, size));
+            tainted  = this->taintEngine->taintAssignment(dst, src);
+            tainted |= this->taintEngine->isTainted(stack);
+            break;
+          }
+
+          case ID_INS_POP: {
+            auto& dst         = inst.operands[0];
+            triton::uint64 sp = this->architecture->getConcreteRegisterValue(stack.getConstRegister()).convert_to<triton::uint64>();
+            auto src          = triton::arch::OperandWrapper(triton::arch::MemoryAccess(sp, dst.getSize()));
+            /* The address of a destination based on the stack is computed after the increment (see pop_s) */
+            if (dst.getType() == triton::arch::OP_MEM && dst.getConstMemory().getConstBaseRegister().getParent().getId() == stack.getConstRegister().getId())
+              return false;
+            tainted  = this->taintEngine->taintAssignment(dst, src);
+            tainted |= this->taintEngine->isTainted(stack);
+            break;
+          }
+
+          /* Arithmetic and logical operations */
+          case ID_INS_ADD:
+          case ID_INS_SUB:
+            tainted = this->taintEngine->taintUnion(inst.operands[0], inst.operands[1]);
+            arith   = true;
+            flags   = true;
+            break;
+
+          case ID_INS_ADC:
+          case ID_INS_SBB:
+            this->taintEngine->taintUnion(inst.operands[0], inst.operands[1]);
+            tainted = this->taintEngine->taintUnion(inst.operands[0], triton::arch::OperandWrapper(TRITON_X86_REG_CF));
+            arith   = true;
+            flags   = true;
+            break;
+
+          case ID_INS_AND:
+          case ID_INS_OR:
+          case ID_INS_XOR:
+            tainted = this->taintEngine->taintUnion(inst.operands[0], inst.operands[1]);
+            flags   = true;
+            break;
+
+          case ID_INS_CMP:
+            tainted = this->taintEngine->isTainted(inst.operands[0]) | this->taintEngine->isTainted(inst.operands[1]);
+            arith   = true;
+            flags   = true;
+            break;
+
+          case ID_INS_TEST:
+            tainted = this->taintEngine->isTainted(inst.operands[0]) | this->taintEngine->isTainted(inst.operands[1]);
+            flags   = true;
+            break;
+
+          case ID_INS_DEC:
+          case ID_INS_INC:
+            tainted = this->taintEngine->taintUnion(inst.operands[0], inst.operands[0]);
+            /* The carry flag is not affected */
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_AF, tainted);
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_OF, tainted);
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_PF, tainted);
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_SF, tainted);
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_ZF, tainted);
+            break;
+
+          case ID_INS_NEG:
+            tainted = this->taintEngine->taintUnion(inst.operands[0], inst.operands[0]);
+            arith   = true;
+            flags   = true;
+            break;
+
+          case ID_INS_NOT:
+            tainted = this->taintEngine->taintUnion(inst.operands[0], inst.operands[0]);
+            break;
+
+          case ID_INS_NOP:
+            break;
+
+          /* Branches */
+          case ID_INS_CALL: {
+            triton::uint64 sp = this->architecture->getConcreteRegisterValue(stack.getConstRegister()).convert_to<triton::uint64>();
+            this->taintEngine->taintAssignmentMemoryImmediate(triton::arch::MemoryAccess(sp - stack.getSize(), stack.getSize()));
+            tainted  = this->taintEngine->taintAssignment(pc, inst.operands[0]);
+            tainted |= this->taintEngine->isTainted(stack);
+            branch   = true;
+            break;
+          }
+
+          case ID_INS_RET: {
+            triton::uint64 sp = this->architecture->getConcreteRegisterValue(stack.getConstRegister()).convert_to<triton::uint64>();
+            tainted  = this->taintEngine->taintAssignment(pc, triton::arch::OperandWrapper(triton::arch::MemoryAccess(sp, stack.getSize())));
+            tainted |= this->taintEngine->isTainted(stack);
+            branch   = true;
+            break;
+          }
+
+          case ID_INS_JMP:
+            tainted = this->taintEngine->taintAssignment(pc, inst.operands[0]);
+            inst.setConditionTaken(true);
+            branch  = true;
+            break;
+
+          case ID_INS_JA:
+          case ID_INS_JAE:
+          case ID_INS_JB:
+          case ID_INS_JBE:
+          case ID_INS_JE:
+          case ID_INS_JG:
+          case ID_INS_JGE:
+          case ID_INS_JL:
+          case ID_INS_JLE:
+          case ID_INS_JNE:
+          case ID_INS_JNO:
+          case ID_INS_JNP:
+          case ID_INS_JNS:
+          case ID_INS_JO:
+          case ID_INS_JP:
+          case ID_INS_JS: {
+            bool cf = !this->architecture->getConcreteRegisterValue(TRITON_X86_REG_CF).is_zero();
+            bool of = !this->architecture->getConcreteRegisterValue(TRITON_X86_REG_OF).is_zero();
+            bool pf = !this->architecture->getConcreteRegisterValue(TRITON_X86_REG_PF).is_zero();
+            bool sf = !this->architecture->getConcreteRegisterValue(TRITON_X86_REG_SF).is_zero();
+            bool zf = !this->architecture->getConcreteRegisterValue(TRITON_X86_REG_ZF).is_zero();
+            bool taken = false;
+
+            /* The program counter is tainted by the flags of the condition */
+            switch (inst.getType()) {
+              case ID_INS_JA:   taken = (!cf && !zf);         tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_CF) | this->taintEngine->isRegisterTainted(TRITON_X86_REG_ZF); break;
+              case ID_INS_JAE:  taken = !cf;                  tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_CF); break;
+              case ID_INS_JB:   taken = cf;                   tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_CF); break;
+              case ID_INS_JBE:  taken = (cf || zf);           tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_CF) | this->taintEngine->isRegisterTainted(TRITON_X86_REG_ZF); break;
+              case ID_INS_JE:   taken = zf;                   tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_ZF); break;
+              case ID_INS_JG:   taken = (!zf && sf == of);    tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_SF) | this->taintEngine->isRegisterTainted(TRITON_X86_REG_OF) | this->taintEngine->isRegisterTainted(TRITON_X86_REG_ZF); break;
+              case ID_INS_JGE:  taken = (sf == of);           tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_SF) | this->taintEngine->isRegisterTainted(TRITON_X86_REG_OF); break;
+              case ID_INS_JL:   taken = (sf != of);           tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_SF) | this->taintEngine->isRegisterTainted(TRITON_X86_REG_OF); break;
+              case ID_INS_JLE:  taken = (zf || sf != of);     tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_SF) | this->taintEngine->isRegisterTainted(TRITON_X86_REG_OF) | this->taintEngine->isRegisterTainted(TRITON_X86_REG_ZF); break;
+              case ID_INS_JNE:  taken = !zf;                  tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_ZF); break;
+              case ID_INS_JNO:  taken = !of;                  tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_OF); break;
+              case ID_INS_JNP:  taken = !pf;                  tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_PF); break;
+              case ID_INS_JNS:  taken = !sf;                  tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_SF); break;
+              case ID_INS_JO:   taken = of;                   tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_OF); break;
+              case ID_INS_JP:   taken = pf;                   tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_PF); break;
+              case ID_INS_JS:   taken = sf;                   tainted = this->taintEngine->isRegisterTainted(TRITON_X86_REG_SF); break;
+            }
+
+            if (taken)
+              inst.setConditionTaken(true);
+
+            tainted = this->taintEngine->setTaintRegister(TRITON_X86_REG_PC, tainted);
+            branch  = true;
+            break;
+          }
+
+          default:
+            return false;
+        }
+
+        /* The status flags are tainted by the result (see af_s, cfAdd_s, ...) */
+        if (flags) {
+          if (arith) {
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_AF, tainted);
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_CF, tainted);
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_OF, tainted);
+          }
+          else {
+            /* The logical operations clear CF and OF (see clearFlag_s) */
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_CF, triton::engines::taint::UNTAINTED);
+            this->taintEngine->setTaintRegister(TRITON_X86_REG_OF, triton::engines::taint::UNTAINTED);
+          }
+          this->taintEngine->setTaintRegister(TRITON_X86_REG_PF, tainted);
+          this->taintEngine->setTaintRegister(TRITON_X86_REG_SF, tainted);
+          this->taintEngine->setTaintRegister(TRITON_X86_REG_ZF, tainted);
+        }
+
+        /* The program counter of a sequential instruction is untainted (see controlFlow_s) */
+        if (!branch) {
+          if (!inst.getAddress())
+            inst.setAddress(this->architecture->getConcreteRegisterValue(pc.getConstRegister()).convert_to<triton::uint64>());
+          this->taintEngine->setTaintRegister(TRITON_X86_REG_PC, triton::engines::taint::UNTAINTED);
+        }
+
+        inst.setTaint(tainted);
+
+        return true;
+      }
+
+
       triton::uint64 x86Semantics::alignAddStack_s(triton::arch::Instruction& inst, triton::uint32 delta) {
         auto dst = triton::arch::OperandWrapper(TRITON_X86_REG_SP.getParent());
 
@@ -678,7 +908,7 @@ namespace triton {
       }
 
 
-      void x86Semantics::clearFlag_s(triton::arch::Instruction& inst, triton::arch::Register& flag, std::string comment) {
+      void x86Semantics::clearFlag_s(triton::arch::Instruction& inst, triton::arch::Register& flag, const char* comment) {
         /* Create the semantics */
         auto node = triton::ast::bv(0, 1);
 
@@ -690,7 +920,7 @@ namespace triton {
       }
 
 
-      void x86Semantics::setFlag_s(triton::arch::Instruction& inst, triton::arch::Register& flag, std::string comment) {
+      void x86Semantics::setFlag_s(triton::arch::Instruction& inst, triton::arch::Register& flag, const char* comment) {
         /* Create the semantics */
         auto node = triton::ast::bv(1, 1);
 
@@ -9867,7 +10097,7 @@ namespace triton {
 
         /* Create symbolic operands */
         auto op1 = triton::ast::bv(0, dst1.getBitSize());
-        auto op2 = triton::ast::bv(this->symbolicEngine->getSymbolicExpressions().size(), dst2.getBitSize());
+        auto op2 = triton::ast::bv(this->symbolicEngine->getNumberOfSymbolicExpressions(), dst2.getBitSize());
 
         /* Create symbolic expression */
         auto expr1 = this->symbolicEngine->createSymbolicExpression(inst, op1, dst1, "RDTSC EDX operation");
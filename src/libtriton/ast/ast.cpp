@@ -7,6 +7,9 @@
 
 #include <cmath>
 #include <new>
+#include <set>
+#include <unordered_set>
+#include <utility>
 
 #include <triton/api.hpp>
 #include <triton/ast.hpp>
@@ -22,36 +25,66 @@ namespace triton {
 
     /* ====== Abstract node */
 
+    AbstractNode::Extension::Extension() {
+      this->knownBits = nullptr;
+      this->wideEval  = 0;
+    }
+
+
+    AbstractNode::Extension::~Extension() {
+      delete this->knownBits;
+    }
+
+
     AbstractNode::AbstractNode(enum kind_e kind) {
+      this->dirty       = false;
       this->eval        = 0;
+      this->extension   = nullptr;
+      this->hash        = 0;
       this->kind        = kind;
+      this->marked      = false;
+      this->recorded    = false;
       this->size        = 0;
       this->symbolized  = false;
     }
 
 
     AbstractNode::AbstractNode() {
+      this->dirty       = false;
       this->eval        = 0;
+      this->extension   = nullptr;
+      this->hash        = 0;
       this->kind        = UNDEFINED_NODE;
+      this->marked      = false;
+      this->recorded    = false;
       this->size        = 0;
       this->symbolized  = false;
     }
 
 
     AbstractNode::AbstractNode(const AbstractNode& copy) {
+      this->dirty       = copy.dirty;
       this->eval        = copy.eval;
+      this->extension   = nullptr;
+      this->hash        = copy.hash;
       this->kind        = copy.kind;
+      this->marked      = false;
       this->parents     = copy.parents;
+      this->recorded    = false;
       this->size        = copy.size;
       this->symbolized  = copy.symbolized;
 
+      /* The known bits are computed again on demand */
+      if (copy.size > 64 && copy.extension != nullptr)
+        this->getExtension()->wideEval = copy.extension->wideEval;
+
       for (triton::uint32 index = 0; index < copy.childs.size(); index++)
         this->childs.push_back(triton::ast::newInstance(copy.childs[index]));
     }
 
 
     AbstractNode::~AbstractNode() {
-      /* virtual */
+      delete this->extension;
     }
 
 
@@ -61,34 +94,179 @@ namespace triton {
 
 
     triton::uint32 AbstractNode::getBitvectorSize(void) const {
+      if (this->dirty)
+        const_cast<AbstractNode*>(this)->refresh();
       return this->size;
     }
 
 
     triton::uint512 AbstractNode::getBitvectorMask(void) const {
       triton::uint512 mask = -1;
-      mask = mask >> (512 - this->size);
+      mask = mask >> (512 - this->getBitvectorSize());
       return mask;
     }
 
 
+    triton::uint64 AbstractNode::getBitvectorMask64(void) const {
+      triton::uint32 size = this->getBitvectorSize();
+      if (size >= 64)
+        return static_cast<triton::uint64>(-1);
+      return ((static_cast<triton::uint64>(1) << size) - 1);
+    }
+
+
     bool AbstractNode::isSigned(void) const {
-      if ((this->eval >> (this->size-1)) & 1)
+      triton::uint32 size = this->getBitvectorSize();
+
+      if (size == 0)
+        return false;
+
+      if (size <= 64)
+        return ((this->evaluate64() >> (size-1)) & 1);
+
+      if ((this->evaluate() >> (size-1)) & 1)
         return true;
       return false;
     }
 
 
     bool AbstractNode::isSymbolized(void) const {
+      if (this->dirty)
+        const_cast<AbstractNode*>(this)->refresh();
       return this->symbolized;
     }
 
 
+    bool AbstractNode::isDirty(void) const {
+      return this->dirty;
+    }
+
+
+    bool AbstractNode::isMarked(void) const {
+      return this->marked;
+    }
+
+
+    void AbstractNode::setMarked(bool flag) {
+      this->marked = flag;
+    }
+
+
+    bool AbstractNode::isRecorded(void) const {
+      return this->recorded;
+    }
+
+
+    void AbstractNode::setRecorded(bool flag) {
+      this->recorded = flag;
+    }
+
+
     triton::uint512 AbstractNode::evaluate(void) const {
+      if (this->dirty)
+        const_cast<AbstractNode*>(this)->refresh();
+      if (this->size > 64)
+        return this->extension->wideEval;
+      return this->eval;
+    }
+
+
+    triton::uint64 AbstractNode::evaluate64(void) const {
+      if (this->dirty)
+        const_cast<AbstractNode*>(this)->refresh();
       return this->eval;
     }
 
 
+    void AbstractNode::setEvaluation(const triton::uint512& value) {
+      /* Nodes up to 64 bits only use the inline storage */
+      this->eval = static_cast<triton::uint64>(value & static_cast<triton::uint64>(-1));
+
+      if (this->size <= 64)
+        return;
+
+      this->getExtension()->wideEval = value;
+    }
+
+
+    AbstractNode::Extension* AbstractNode::getExtension(void) {
+      if (this->extension == nullptr) {
+        this->extension = new(std::nothrow) Extension();
+        if (this->extension == nullptr)
+          throw triton::exceptions::Ast("AbstractNode::getExtension(): Not enough memory.");
+      }
+      return this->extension;
+    }
+
+
+    void AbstractNode::releaseExtension(void) {
+      if (this->extension == nullptr)
+        return;
+
+      /* The known bits are computed again on demand */
+      delete this->extension->knownBits;
+      this->extension->knownBits = nullptr;
+
+      /* Nodes up to 64 bits only use the extension for their known bits */
+      if (this->size <= 64) {
+        delete this->extension;
+        this->extension = nullptr;
+      }
+    }
+
+
+    triton::uint64 AbstractNode::getHash(void) const {
+      if (this->dirty)
+        const_cast<AbstractNode*>(this)->refresh();
+      return this->hash;
+    }
+
+
+    const KnownBits& AbstractNode::getKnownBits(void) {
+      std::vector<std::pair<AbstractNode*, bool>> worklist;
+
+      if (this->dirty)
+        this->refresh();
+
+      if (this->extension != nullptr && this->extension->knownBits != nullptr)
+        return *this->extension->knownBits;
+
+      /* Post-order walk, the facts of a node are computed from the facts of its childs */
+      worklist.push_back(std::make_pair(this, false));
+      while (!worklist.empty()) {
+        AbstractNode* node = worklist.back().first;
+        bool expanded      = worklist.back().second;
+
+        worklist.pop_back();
+        if (node->extension != nullptr && node->extension->knownBits != nullptr)
+          continue;
+
+        if (expanded || !node->isSymbolized()) {
+          Extension* extension = node->getExtension();
+          extension->knownBits = new(std::nothrow) KnownBits(KnownBits::compute(node));
+          if (extension->knownBits == nullptr)
+            throw triton::exceptions::Ast("AbstractNode::getKnownBits(): Not enough memory.");
+          continue;
+        }
+
+        worklist.push_back(std::make_pair(node, true));
+        for (std::vector<AbstractNode*>::iterator it = node->childs.begin(); it != node->childs.end(); it++) {
+          /* Parameters (e.g: the bits of an extract) are not operands */
+          if ((*it)->kind != DECIMAL_NODE && (*it)->kind != STRING_NODE)
+            worklist.push_back(std::make_pair(*it, false));
+        }
+
+        if (node->kind == REFERENCE_NODE) {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(node)->getValue();
+          if (triton::api.isSymbolicExpressionIdExists(id))
+            worklist.push_back(std::make_pair(triton::api.getAstFromId(id), false));
+        }
+      }
+
+      return *this->extension->knownBits;
+    }
+
+
     std::vector<AbstractNode*>& AbstractNode::getChilds(void) {
       return this->childs;
     }
@@ -135,6 +313,9 @@ namespace triton {
 
       /* Setup the child of the parent */
       this->childs[index] = child;
+
+      /* Memoized full ASTs and the dependencies of expressions may use this node */
+      triton::api.invalidateAsts(this);
     }
 
 
@@ -143,6 +324,79 @@ namespace triton {
     }
 
 
+    void AbstractNode::initParents(void) {
+      this->dirty = false;
+
+      /* The known bits are computed again on demand */
+      this->releaseExtension();
+
+      if (this->parents.empty())
+        return;
+
+      /* With the lazy evaluation, parents are only marked dirty */
+      if (triton::api.isAstLazyEvaluationEnabled()) {
+        for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
+          (*it)->setDirty();
+        return;
+      }
+
+      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
+        (*it)->init();
+    }
+
+
+    void AbstractNode::setDirty(void) {
+      std::vector<AbstractNode*> worklist;
+
+      /* If a node is dirty, all its ancestors are already dirty */
+      worklist.push_back(this);
+      while (!worklist.empty()) {
+        AbstractNode* node = worklist.back();
+        worklist.pop_back();
+        if (node->dirty)
+          continue;
+        node->dirty = true;
+        for (std::set<AbstractNode*>::iterator it = node->parents.begin(); it != node->parents.end(); it++)
+          worklist.push_back(*it);
+      }
+    }
+
+
+    void AbstractNode::refresh(void) {
+      std::vector<std::pair<AbstractNode*, bool>> worklist;
+
+      /* Post-order walk over the dirty sub-DAG. Childs are initialized before their parents */
+      worklist.push_back(std::make_pair(this, false));
+      while (!worklist.empty()) {
+        AbstractNode* node = worklist.back().first;
+        bool expanded      = worklist.back().second;
+
+        worklist.pop_back();
+        if (!node->dirty)
+          continue;
+
+        if (expanded) {
+          node->dirty = false;
+          node->init();
+          continue;
+        }
+
+        worklist.push_back(std::make_pair(node, true));
+        for (std::vector<AbstractNode*>::iterator it = node->childs.begin(); it != node->childs.end(); it++) {
+          if ((*it)->dirty)
+            worklist.push_back(std::make_pair(*it, false));
+        }
+
+        /* A reference node depends on the AST of the referenced expression */
+        if (node->kind == REFERENCE_NODE) {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(node)->getValue();
+          if (triton::api.isSymbolicExpressionIdExists(id) && triton::api.getAstFromId(id)->dirty)
+            worklist.push_back(std::make_pair(triton::api.getAstFromId(id), false));
+        }
+      }
+    }
+
+
     /* ====== assert */
 
 
@@ -167,7 +421,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = 0;
+      this->setEvaluation(0);
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -175,9 +429,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -186,12 +442,12 @@ namespace triton {
     }
 
 
-    triton::uint512 AssertNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void AssertNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -223,7 +479,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = ((this->childs[0]->evaluate() + this->childs[1]->evaluate()) & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = ((this->childs[0]->evaluate64() + this->childs[1]->evaluate64()) & this->getBitvectorMask64());
+      else
+        this->setEvaluation((this->childs[0]->evaluate() + this->childs[1]->evaluate()) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -231,9 +490,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -242,12 +503,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvaddNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvaddNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -279,7 +540,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = (this->childs[0]->evaluate() & this->childs[1]->evaluate());
+      if (this->size <= 64)
+        this->eval = (this->childs[0]->evaluate64() & this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() & this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -287,9 +551,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -298,12 +564,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvandNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvandNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -351,23 +617,23 @@ namespace triton {
       }
 
       if (shift >= this->size && this->childs[0]->isSigned()) {
-        this->eval = -1;
-        this->eval &= this->getBitvectorMask();
+        this->setEvaluation(this->getBitvectorMask());
       }
 
       else if (shift >= this->size && !this->childs[0]->isSigned()) {
-        this->eval = 0;
+        this->setEvaluation(0);
       }
 
       else if (shift == 0) {
-        this->eval = value;
+        this->setEvaluation(value);
       }
 
       else {
-        this->eval = value & this->getBitvectorMask();
+        value = value & this->getBitvectorMask();
         for (triton::uint32 index = 0; index < shift; index++) {
-          this->eval = (((this->eval >> 1) | mask) & this->getBitvectorMask());
+          value = (((value >> 1) | mask) & this->getBitvectorMask());
         }
+        this->setEvaluation(value);
       }
 
       /* Init childs and spread information */
@@ -376,9 +642,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -387,12 +655,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvashrNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvashrNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -432,7 +699,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = size;
-      this->eval = 0;
+      this->setEvaluation(0);
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -440,9 +707,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -451,12 +720,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvdeclNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvdeclNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -488,7 +756,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = (this->childs[0]->evaluate() >> this->childs[1]->evaluate().convert_to<triton::uint32>());
+      if (this->size <= 64)
+        this->eval = (this->childs[1]->evaluate64() >= 64 ? 0 : (this->childs[0]->evaluate64() >> this->childs[1]->evaluate64()));
+      else
+        this->setEvaluation(this->childs[0]->evaluate() >> this->childs[1]->evaluate().convert_to<triton::uint32>());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -496,9 +767,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -507,12 +780,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvlshrNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvlshrNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -544,7 +816,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = ((this->childs[0]->evaluate() * this->childs[1]->evaluate()) & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = ((this->childs[0]->evaluate64() * this->childs[1]->evaluate64()) & this->getBitvectorMask64());
+      else
+        this->setEvaluation((this->childs[0]->evaluate() * this->childs[1]->evaluate()) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -552,9 +827,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -563,12 +840,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvmulNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvmulNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -600,7 +877,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = (~(this->childs[0]->evaluate() & this->childs[1]->evaluate()) & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = (~(this->childs[0]->evaluate64() & this->childs[1]->evaluate64()) & this->getBitvectorMask64());
+      else
+        this->setEvaluation(~(this->childs[0]->evaluate() & this->childs[1]->evaluate()) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -608,9 +888,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -619,12 +901,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvnandNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvnandNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -652,7 +934,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = ((-(this->childs[0]->evaluate().convert_to<triton::sint512>())).convert_to<triton::uint512>() & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = ((0 - this->childs[0]->evaluate64()) & this->getBitvectorMask64());
+      else
+        this->setEvaluation((-(this->childs[0]->evaluate().convert_to<triton::sint512>())).convert_to<triton::uint512>() & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -660,9 +945,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -671,12 +958,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvnegNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvnegNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -708,7 +995,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = (~(this->childs[0]->evaluate() | this->childs[1]->evaluate()) & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = (~(this->childs[0]->evaluate64() | this->childs[1]->evaluate64()) & this->getBitvectorMask64());
+      else
+        this->setEvaluation(~(this->childs[0]->evaluate() | this->childs[1]->evaluate()) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -716,9 +1006,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -727,12 +1019,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvnorNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvnorNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -760,7 +1052,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = (~this->childs[0]->evaluate() & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = (~this->childs[0]->evaluate64() & this->getBitvectorMask64());
+      else
+        this->setEvaluation(~this->childs[0]->evaluate() & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -768,9 +1063,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -779,12 +1076,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvnotNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvnotNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -816,7 +1113,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = (this->childs[0]->evaluate() | this->childs[1]->evaluate());
+      if (this->size <= 64)
+        this->eval = (this->childs[0]->evaluate64() | this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() | this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -824,9 +1124,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -835,12 +1137,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvorNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvorNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -888,7 +1190,7 @@ namespace triton {
       /* Init attributes */
       this->size = this->childs[1]->getBitvectorSize();
       rot %= this->size;
-      this->eval = (((value << rot) | (value >> (this->size - rot))) & this->getBitvectorMask());
+      this->setEvaluation(((value << rot) | (value >> (this->size - rot))) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -896,9 +1198,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -907,12 +1211,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvrolNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvrolNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -959,7 +1262,7 @@ namespace triton {
       /* Init attributes */
       this->size = this->childs[1]->getBitvectorSize();
       rot %= this->size;
-      this->eval = (((value >> rot) | (value << (this->size - rot))) & this->getBitvectorMask());
+      this->setEvaluation(((value >> rot) | (value << (this->size - rot))) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -967,9 +1270,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -978,12 +1283,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvrorNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvrorNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1024,11 +1328,10 @@ namespace triton {
       this->size = this->childs[0]->getBitvectorSize();
 
       if (op2Signed == 0) {
-        this->eval = (op1Signed < 0 ? 1 : -1);
-        this->eval &= this->getBitvectorMask();
+        this->setEvaluation(op1Signed < 0 ? 1 : this->getBitvectorMask());
       }
       else
-        this->eval = ((op1Signed / op2Signed).convert_to<triton::uint512>() & this->getBitvectorMask());
+        this->setEvaluation((op1Signed / op2Signed).convert_to<triton::uint512>() & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1036,9 +1339,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1047,12 +1352,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvsdivNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvsdivNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1091,7 +1395,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (op1Signed >= op2Signed);
+      this->setEvaluation(op1Signed >= op2Signed);
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1099,9 +1403,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1110,12 +1416,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvsgeNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvsgeNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1154,7 +1459,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (op1Signed > op2Signed);
+      this->setEvaluation(op1Signed > op2Signed);
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1162,9 +1467,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1173,12 +1480,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvsgtNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvsgtNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1210,7 +1516,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = ((this->childs[0]->evaluate() << this->childs[1]->evaluate().convert_to<triton::uint32>()) & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = (this->childs[1]->evaluate64() >= 64 ? 0 : ((this->childs[0]->evaluate64() << this->childs[1]->evaluate64()) & this->getBitvectorMask64()));
+      else
+        this->setEvaluation((this->childs[0]->evaluate() << this->childs[1]->evaluate().convert_to<triton::uint32>()) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1218,9 +1527,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1229,12 +1540,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvshlNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvshlNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1273,7 +1583,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (op1Signed <= op2Signed);
+      this->setEvaluation(op1Signed <= op2Signed);
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1281,9 +1591,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1292,12 +1604,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvsleNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvsleNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1336,7 +1647,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (op1Signed < op2Signed);
+      this->setEvaluation(op1Signed < op2Signed);
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1344,9 +1655,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1355,12 +1668,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvsltNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvsltNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1401,9 +1713,9 @@ namespace triton {
       this->size = this->childs[0]->getBitvectorSize();
 
       if (this->childs[1]->evaluate() == 0)
-        this->eval = this->childs[0]->evaluate();
+        this->setEvaluation(this->childs[0]->evaluate());
       else
-        this->eval = ((((op1Signed % op2Signed) + op2Signed) % op2Signed).convert_to<triton::uint512>() & this->getBitvectorMask());
+        this->setEvaluation((((op1Signed % op2Signed) + op2Signed) % op2Signed).convert_to<triton::uint512>() & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1411,9 +1723,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1422,12 +1736,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvsmodNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvsmodNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1468,9 +1781,9 @@ namespace triton {
       this->size = this->childs[0]->getBitvectorSize();
 
       if (this->childs[1]->evaluate() == 0)
-        this->eval = this->childs[0]->evaluate();
+        this->setEvaluation(this->childs[0]->evaluate());
       else
-        this->eval = ((op1Signed - ((op1Signed / op2Signed) * op2Signed)).convert_to<triton::uint512>() & this->getBitvectorMask());
+        this->setEvaluation((op1Signed - ((op1Signed / op2Signed) * op2Signed)).convert_to<triton::uint512>() & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1478,9 +1791,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1489,12 +1804,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvsremNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvsremNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1526,7 +1840,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = ((this->childs[0]->evaluate() - this->childs[1]->evaluate()) & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = ((this->childs[0]->evaluate64() - this->childs[1]->evaluate64()) & this->getBitvectorMask64());
+      else
+        this->setEvaluation((this->childs[0]->evaluate() - this->childs[1]->evaluate()) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1534,9 +1851,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1545,12 +1864,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvsubNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvsubNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1584,9 +1902,9 @@ namespace triton {
       this->size = this->childs[0]->getBitvectorSize();
 
       if (this->childs[1]->evaluate() == 0)
-        this->eval = (-1 & this->getBitvectorMask());
+        this->setEvaluation(-1 & this->getBitvectorMask());
       else
-        this->eval = (this->childs[0]->evaluate() / this->childs[1]->evaluate());
+        this->setEvaluation(this->childs[0]->evaluate() / this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1594,9 +1912,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1605,12 +1925,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvudivNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvudivNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1642,7 +1961,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (this->childs[0]->evaluate() >= this->childs[1]->evaluate());
+      if (this->childs[0]->getBitvectorSize() <= 64)
+        this->eval = (this->childs[0]->evaluate64() >= this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() >= this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1650,9 +1972,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1661,12 +1985,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvugeNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvugeNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1698,7 +2021,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (this->childs[0]->evaluate() > this->childs[1]->evaluate());
+      if (this->childs[0]->getBitvectorSize() <= 64)
+        this->eval = (this->childs[0]->evaluate64() > this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() > this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1706,9 +2032,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1717,12 +2045,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvugtNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvugtNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1754,7 +2081,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (this->childs[0]->evaluate() <= this->childs[1]->evaluate());
+      if (this->childs[0]->getBitvectorSize() <= 64)
+        this->eval = (this->childs[0]->evaluate64() <= this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() <= this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1762,9 +2092,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1773,12 +2105,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvuleNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvuleNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1810,7 +2141,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (this->childs[0]->evaluate() < this->childs[1]->evaluate());
+      if (this->childs[0]->getBitvectorSize() <= 64)
+        this->eval = (this->childs[0]->evaluate64() < this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() < this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1818,9 +2152,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1829,12 +2165,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvultNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvultNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1868,9 +2203,9 @@ namespace triton {
       this->size = this->childs[0]->getBitvectorSize();
 
       if (this->childs[1]->evaluate() == 0)
-        this->eval = this->childs[0]->evaluate();
+        this->setEvaluation(this->childs[0]->evaluate());
       else
-        this->eval = (this->childs[0]->evaluate() % this->childs[1]->evaluate());
+        this->setEvaluation(this->childs[0]->evaluate() % this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1878,9 +2213,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1889,12 +2226,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvuremNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvuremNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -1926,7 +2262,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = (~(this->childs[0]->evaluate() ^ this->childs[1]->evaluate()) & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = (~(this->childs[0]->evaluate64() ^ this->childs[1]->evaluate64()) & this->getBitvectorMask64());
+      else
+        this->setEvaluation(~(this->childs[0]->evaluate() ^ this->childs[1]->evaluate()) & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1934,9 +2273,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -1945,12 +2286,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvxnorNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvxnorNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -1982,7 +2323,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[0]->getBitvectorSize();
-      this->eval = (this->childs[0]->evaluate() ^ this->childs[1]->evaluate());
+      if (this->size <= 64)
+        this->eval = (this->childs[0]->evaluate64() ^ this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() ^ this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -1990,9 +2334,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2001,12 +2347,12 @@ namespace triton {
     }
 
 
-    triton::uint512 BvxorNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvxorNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -2050,7 +2396,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = size;
-      this->eval = (value & this->getBitvectorMask());
+      this->setEvaluation(value & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2058,9 +2404,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2069,12 +2417,11 @@ namespace triton {
     }
 
 
-    triton::uint512 BvNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void BvNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -2103,7 +2450,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 0;
-      this->eval = 0;
+      this->setEvaluation(0);
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2111,9 +2458,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2122,12 +2471,12 @@ namespace triton {
     }
 
 
-    triton::uint512 CompoundNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void CompoundNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -2179,9 +2528,17 @@ namespace triton {
       if (this->size > MAX_BITS_SUPPORTED)
         throw triton::exceptions::Ast("ConcatNode::init(): Size connot be greater than MAX_BITS_SUPPORTED.");
 
-      this->eval = this->childs[0]->evaluate();
-      for (triton::uint32 index = 0; index < this->childs.size()-1; index++)
-        this->eval = ((this->eval << this->childs[index+1]->getBitvectorSize()) | this->childs[index+1]->evaluate());
+      if (this->size <= 64) {
+        this->eval = this->childs[0]->evaluate64();
+        for (triton::uint32 index = 0; index < this->childs.size()-1; index++)
+          this->eval = ((this->eval << this->childs[index+1]->getBitvectorSize()) | this->childs[index+1]->evaluate64());
+      }
+      else {
+        triton::uint512 value = this->childs[0]->evaluate();
+        for (triton::uint32 index = 0; index < this->childs.size()-1; index++)
+          value = ((value << this->childs[index+1]->getBitvectorSize()) | this->childs[index+1]->evaluate());
+        this->setEvaluation(value);
+      }
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2189,9 +2546,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2200,12 +2559,11 @@ namespace triton {
     }
 
 
-    triton::uint512 ConcatNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void ConcatNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -2234,9 +2592,11 @@ namespace triton {
       this->size        = 0;
       this->symbolized  = false;
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2250,9 +2610,16 @@ namespace triton {
     }
 
 
-    triton::uint512 DecimalNode::hash(triton::uint32 deep) {
-      triton::uint512 hash = this->kind ^ this->value;
-      return hash;
+    void DecimalNode::initHash(void) {
+      triton::uint512 value = this->value;
+      triton::uint64 h = this->kind;
+
+      do {
+        h = triton::ast::mix(h ^ static_cast<triton::uint64>(value & 0xffffffffffffffffULL));
+        value >>= 64;
+      } while (value);
+
+      this->hash = h;
     }
 
 
@@ -2287,7 +2654,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[1]->getBitvectorSize();
-      this->eval = this->childs[1]->evaluate();
+      this->setEvaluation(this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2295,9 +2662,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2306,12 +2675,11 @@ namespace triton {
     }
 
 
-    triton::uint512 DeclareFunctionNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void DeclareFunctionNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -2340,7 +2708,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (this->childs[0]->evaluate() != this->childs[1]->evaluate());
+      if (this->childs[0]->getBitvectorSize() <= 64)
+        this->eval = (this->childs[0]->evaluate64() != this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() != this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2348,9 +2719,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2359,12 +2732,12 @@ namespace triton {
     }
 
 
-    triton::uint512 DistinctNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void DistinctNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -2393,7 +2766,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (this->childs[0]->evaluate() == this->childs[1]->evaluate());
+      if (this->childs[0]->getBitvectorSize() <= 64)
+        this->eval = (this->childs[0]->evaluate64() == this->childs[1]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() == this->childs[1]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2401,9 +2777,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2412,12 +2790,12 @@ namespace triton {
     }
 
 
-    triton::uint512 EqualNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void EqualNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -2459,7 +2837,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = ((high - low) + 1);
-      this->eval = ((this->childs[2]->evaluate() >> low) & this->getBitvectorMask());
+      if (this->childs[2]->getBitvectorSize() <= 64)
+        this->eval = ((this->childs[2]->evaluate64() >> low) & this->getBitvectorMask64());
+      else
+        this->setEvaluation((this->childs[2]->evaluate() >> low) & this->getBitvectorMask());
 
       if (this->size > this->childs[2]->getBitvectorSize() || high >= this->childs[2]->getBitvectorSize())
         throw triton::exceptions::Ast("ExtractNode::init(): The size of the extraction is higher than the child expression.");
@@ -2470,9 +2851,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2481,12 +2864,11 @@ namespace triton {
     }
 
 
-    triton::uint512 ExtractNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void ExtractNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -2519,7 +2901,10 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[1]->getBitvectorSize();
-      this->eval = this->childs[0]->evaluate() ? this->childs[1]->evaluate() : this->childs[2]->evaluate();
+      if (this->size <= 64)
+        this->eval = (this->childs[0]->evaluate64() ? this->childs[1]->evaluate64() : this->childs[2]->evaluate64());
+      else
+        this->setEvaluation(this->childs[0]->evaluate() ? this->childs[1]->evaluate() : this->childs[2]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2527,9 +2912,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2538,12 +2925,11 @@ namespace triton {
     }
 
 
-    triton::uint512 IteNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void IteNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -2572,7 +2958,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (this->childs[0]->evaluate() && this->childs[1]->evaluate());
+      this->eval = (this->childs[0]->evaluate64() && this->childs[1]->evaluate64());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2580,9 +2966,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2591,12 +2979,12 @@ namespace triton {
     }
 
 
-    triton::uint512 LandNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void LandNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -2629,7 +3017,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = this->childs[2]->getBitvectorSize();
-      this->eval = this->childs[2]->evaluate();
+      this->setEvaluation(this->childs[2]->evaluate());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2637,9 +3025,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2648,12 +3038,11 @@ namespace triton {
     }
 
 
-    triton::uint512 LetNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void LetNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -2681,7 +3070,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = !(this->childs[0]->evaluate());
+      this->eval = !(this->childs[0]->evaluate64());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2689,9 +3078,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2700,12 +3091,12 @@ namespace triton {
     }
 
 
-    triton::uint512 LnotNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void LnotNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -2734,7 +3125,7 @@ namespace triton {
 
       /* Init attributes */
       this->size = 1;
-      this->eval = (this->childs[0]->evaluate() || this->childs[1]->evaluate());
+      this->eval = (this->childs[0]->evaluate64() || this->childs[1]->evaluate64());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2742,9 +3133,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2753,12 +3146,12 @@ namespace triton {
     }
 
 
-    triton::uint512 LorNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void LorNode::initHash(void) {
+      /* The operation is commutative, so is the hash */
+      triton::uint64 h = 0;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * this->childs[index]->hash(deep+1);
-      return triton::ast::rotl(h, deep);
+        h = h + triton::ast::mix(this->childs[index]->getHash());
+      this->hash = triton::ast::mix(h ^ this->kind);
     }
 
 
@@ -2789,16 +3182,18 @@ namespace triton {
         this->symbolized  = false;
       }
       else {
-        this->eval        = triton::api.getAstFromId(this->value)->evaluate();
         this->size        = triton::api.getAstFromId(this->value)->getBitvectorSize();
+        this->setEvaluation(triton::api.getAstFromId(this->value)->evaluate());
         this->symbolized  = triton::api.getAstFromId(this->value)->isSymbolized();
 
         triton::api.getAstFromId(this->value)->setParent(this);
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2812,9 +3207,8 @@ namespace triton {
     }
 
 
-    triton::uint512 ReferenceNode::hash(triton::uint32 deep) {
-      triton::uint512 hash = this->kind ^ this->value;
-      return hash;
+    void ReferenceNode::initHash(void) {
+      this->hash = triton::ast::mix(this->value) ^ this->kind;
     }
 
 
@@ -2843,9 +3237,11 @@ namespace triton {
       this->size        = 0;
       this->symbolized  = false;
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2859,12 +3255,11 @@ namespace triton {
     }
 
 
-    triton::uint512 StringNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind;
-      triton::uint32 index = 1;
+    void StringNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (std::string::iterator it=this->value.begin(); it != this->value.end(); it++)
-        h = h ^ triton::ast::pow(*it, index++);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ static_cast<triton::uint8>(*it));
+      this->hash = h;
     }
 
 
@@ -2903,7 +3298,10 @@ namespace triton {
       if (size > MAX_BITS_SUPPORTED)
         throw triton::exceptions::Ast("SxNode::SxNode(): Size connot be greater than MAX_BITS_SUPPORTED.");
 
-      this->eval = ((((this->childs[1]->evaluate() >> (this->childs[1]->getBitvectorSize()-1)) == 0) ? this->childs[1]->evaluate() : (this->childs[1]->evaluate() | ~(this->childs[1]->getBitvectorMask()))) & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = ((this->childs[1]->isSigned() ? (this->childs[1]->evaluate64() | ~this->childs[1]->getBitvectorMask64()) : this->childs[1]->evaluate64()) & this->getBitvectorMask64());
+      else
+        this->setEvaluation(((((this->childs[1]->evaluate() >> (this->childs[1]->getBitvectorSize()-1)) == 0) ? this->childs[1]->evaluate() : (this->childs[1]->evaluate() | ~(this->childs[1]->getBitvectorMask()))) & this->getBitvectorMask()));
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -2911,9 +3309,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -2922,12 +3322,11 @@ namespace triton {
     }
 
 
-    triton::uint512 SxNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void SxNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
 
@@ -2936,12 +3335,14 @@ namespace triton {
 
     VariableNode::VariableNode(triton::engines::symbolic::SymbolicVariable& symVar) {
       this->kind  = VARIABLE_NODE;
+      this->id    = symVar.getId();
       this->value = symVar.getName();
       this->init();
     }
 
 
     VariableNode::VariableNode(const VariableNode& copy) : AbstractNode(copy) {
+      this->id    = copy.id;
       this->value = copy.value;
     }
 
@@ -2953,18 +3354,25 @@ namespace triton {
     void VariableNode::init(void) {
       triton::engines::symbolic::SymbolicVariable* symVar = nullptr;
 
-      symVar = triton::api.getSymbolicVariableFromName(this->value);
+      symVar = triton::api.getSymbolicVariableFromId(this->id);
       if (symVar) {
         this->size        = symVar->getSize();
-        this->eval        = (symVar->getConcreteValue() & this->getBitvectorMask());
+        this->setEvaluation(symVar->getConcreteValue() & this->getBitvectorMask());
         this->symbolized  = true;
       }
       else
         throw triton::exceptions::Ast("VariableNode::init(): Variable not found.");
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
+    }
+
+
+    triton::usize VariableNode::getId(void) {
+      return this->id;
     }
 
 
@@ -2978,12 +3386,9 @@ namespace triton {
     }
 
 
-    triton::uint512 VariableNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind;
-      triton::uint32 index = 1;
-      for (std::string::iterator it = this->value.begin(); it != this->value.end(); it++)
-        h = h ^ triton::ast::pow(*it, index++);
-      return triton::ast::rotl(h, deep);
+    void VariableNode::initHash(void) {
+      /* Ids are consecutive, so they are mixed over all the bits of the hash */
+      this->hash = triton::ast::mix(this->id) ^ this->kind;
     }
 
 
@@ -3022,7 +3427,10 @@ namespace triton {
       if (size > MAX_BITS_SUPPORTED)
         throw triton::exceptions::Ast("ZxNode::init(): Size connot be greater than MAX_BITS_SUPPORTED.");
 
-      this->eval = (this->childs[1]->evaluate() & this->getBitvectorMask());
+      if (this->size <= 64)
+        this->eval = (this->childs[1]->evaluate64() & this->getBitvectorMask64());
+      else
+        this->setEvaluation(this->childs[1]->evaluate() & this->getBitvectorMask());
 
       /* Init childs and spread information */
       for (triton::uint32 index = 0; index < this->childs.size(); index++) {
@@ -3030,9 +3438,11 @@ namespace triton {
         this->symbolized |= this->childs[index]->isSymbolized();
       }
 
+      /* Init hash */
+      this->initHash();
+
       /* Init parents */
-      for (std::set<AbstractNode*>::iterator it = this->parents.begin(); it != this->parents.end(); it++)
-        (*it)->init();
+      this->initParents();
     }
 
 
@@ -3041,12 +3451,11 @@ namespace triton {
     }
 
 
-    triton::uint512 ZxNode::hash(triton::uint32 deep) {
-      triton::uint512 h = this->kind, s = this->childs.size();
-      if (s) h = h * s;
+    void ZxNode::initHash(void) {
+      triton::uint64 h = this->kind;
       for (triton::uint32 index = 0; index < this->childs.size(); index++)
-        h = h * triton::ast::pow(this->childs[index]->hash(deep+1), index+1);
-      return triton::ast::rotl(h, deep);
+        h = triton::ast::mix(h ^ this->childs[index]->getHash());
+      this->hash = h;
     }
 
   }; /* ast namespace */
@@ -3069,7 +3478,64 @@ namespace triton {
     bool operator==(AbstractNode& node1, AbstractNode& node2) {
       return (node1.evaluate() == node2.evaluate()) &&
              (node1.getBitvectorSize() == node2.getBitvectorSize()) &&
-             (node1.hash(1) == node2.hash(1));
+             (node1.getHash() == node2.getHash());
+    }
+
+
+    /* Compares the structure of two trees */
+    bool isSameTree(AbstractNode* node1, AbstractNode* node2) {
+      std::vector<std::pair<AbstractNode*, AbstractNode*>> worklist(1, std::make_pair(node1, node2));
+      std::set<std::pair<AbstractNode*, AbstractNode*>> visited;
+
+      while (!worklist.empty()) {
+        AbstractNode* a = worklist.back().first;
+        AbstractNode* b = worklist.back().second;
+
+        worklist.pop_back();
+
+        if (a == b || !visited.insert(std::make_pair(a, b)).second)
+          continue;
+
+        /* Hashes are structural, different hashes mean different trees */
+        if (a->getKind() != b->getKind() || a->getBitvectorSize() != b->getBitvectorSize() || a->getHash() != b->getHash())
+          return false;
+
+        switch (a->getKind()) {
+          case DECIMAL_NODE:
+            if (reinterpret_cast<DecimalNode*>(a)->getValue() != reinterpret_cast<DecimalNode*>(b)->getValue())
+              return false;
+            break;
+
+          case REFERENCE_NODE:
+            if (reinterpret_cast<ReferenceNode*>(a)->getValue() != reinterpret_cast<ReferenceNode*>(b)->getValue())
+              return false;
+            break;
+
+          case STRING_NODE:
+            if (reinterpret_cast<StringNode*>(a)->getValue() != reinterpret_cast<StringNode*>(b)->getValue())
+              return false;
+            break;
+
+          case VARIABLE_NODE:
+            if (reinterpret_cast<VariableNode*>(a)->getId() != reinterpret_cast<VariableNode*>(b)->getId())
+              return false;
+            break;
+
+          default:
+            break;
+        }
+
+        std::vector<AbstractNode*>& childs1 = a->getChilds();
+        std::vector<AbstractNode*>& childs2 = b->getChilds();
+
+        if (childs1.size() != childs2.size())
+          return false;
+
+        for (triton::usize index = 0; index < childs1.size(); index++)
+          worklist.push_back(std::make_pair(childs1[index], childs2[index]));
+      }
+
+      return true;
     }
 
 
@@ -3098,6 +3564,15 @@ namespace triton {
     }
 
 
+    triton::uint64 mix(triton::uint64 value) {
+      /* A splitmix64 step */
+      value += 0x9e3779b97f4a7c15ULL;
+      value  = (value ^ (value >> 30)) * 0xbf58476d1ce4e5b9ULL;
+      value  = (value ^ (value >> 27)) * 0x94d049bb133111ebULL;
+      return (value ^ (value >> 31));
+    }
+
+
     triton::sint512 modularSignExtend(AbstractNode* node) {
       triton::sint512 value = 0;
 
@@ -3631,6 +4106,132 @@ namespace triton {
       return newNode;
     }
 
+
+    AbstractNode* newInstance(AbstractNode* node, std::vector<AbstractNode*>& childs) {
+      if (node == nullptr)
+        return nullptr;
+
+      /* Nothing to rebuild */
+      if (node->getChilds() == childs)
+        return node;
+
+      return newInstance(node->getKind(), childs);
+    }
+
+
+    AbstractNode* newInstance(enum kind_e kind, std::vector<AbstractNode*>& childs) {
+      switch (kind) {
+        case ASSERT_NODE:               return assert_(childs[0]);
+        case BVADD_NODE:                return bvadd(childs[0], childs[1]);
+        case BVAND_NODE:                return bvand(childs[0], childs[1]);
+        case BVASHR_NODE:               return bvashr(childs[0], childs[1]);
+        case BVLSHR_NODE:               return bvlshr(childs[0], childs[1]);
+        case BVMUL_NODE:                return bvmul(childs[0], childs[1]);
+        case BVNAND_NODE:               return bvnand(childs[0], childs[1]);
+        case BVNEG_NODE:                return bvneg(childs[0]);
+        case BVNOR_NODE:                return bvnor(childs[0], childs[1]);
+        case BVNOT_NODE:                return bvnot(childs[0]);
+        case BVOR_NODE:                 return bvor(childs[0], childs[1]);
+        case BVROL_NODE:                return bvrol(childs[0], childs[1]);
+        case BVROR_NODE:                return bvror(childs[0], childs[1]);
+        case BVSDIV_NODE:               return bvsdiv(childs[0], childs[1]);
+        case BVSGE_NODE:                return bvsge(childs[0], childs[1]);
+        case BVSGT_NODE:                return bvsgt(childs[0], childs[1]);
+        case BVSHL_NODE:                return bvshl(childs[0], childs[1]);
+        case BVSLE_NODE:                return bvsle(childs[0], childs[1]);
+        case BVSLT_NODE:                return bvslt(childs[0], childs[1]);
+        case BVSMOD_NODE:               return bvsmod(childs[0], childs[1]);
+        case BVSREM_NODE:               return bvsrem(childs[0], childs[1]);
+        case BVSUB_NODE:                return bvsub(childs[0], childs[1]);
+        case BVUDIV_NODE:               return bvudiv(childs[0], childs[1]);
+        case BVUGE_NODE:                return bvuge(childs[0], childs[1]);
+        case BVUGT_NODE:                return bvugt(childs[0], childs[1]);
+        case BVULE_NODE:                return bvule(childs[0], childs[1]);
+        case BVULT_NODE:                return bvult(childs[0], childs[1]);
+        case BVUREM_NODE:               return bvurem(childs[0], childs[1]);
+        case BVXNOR_NODE:               return bvxnor(childs[0], childs[1]);
+        case BVXOR_NODE:                return bvxor(childs[0], childs[1]);
+        case COMPOUND_NODE:             return compound(childs);
+        case CONCAT_NODE:               return concat(childs);
+        case DISTINCT_NODE:             return distinct(childs[0], childs[1]);
+        case EQUAL_NODE:                return equal(childs[0], childs[1]);
+        case ITE_NODE:                  return ite(childs[0], childs[1], childs[2]);
+        case LAND_NODE:                 return land(childs[0], childs[1]);
+        case LNOT_NODE:                 return lnot(childs[0]);
+        case LOR_NODE:                  return lor(childs[0], childs[1]);
+
+        case BV_NODE:
+          return bv(reinterpret_cast<DecimalNode*>(childs[0])->getValue(),
+                    reinterpret_cast<DecimalNode*>(childs[1])->getValue().convert_to<triton::uint32>());
+
+        case BVDECL_NODE:
+          return bvdecl(reinterpret_cast<DecimalNode*>(childs[0])->getValue().convert_to<triton::uint32>());
+
+        case DECLARE_FUNCTION_NODE:
+          return declareFunction(reinterpret_cast<StringNode*>(childs[0])->getValue(), childs[1]);
+
+        case EXTRACT_NODE:
+          return extract(reinterpret_cast<DecimalNode*>(childs[0])->getValue().convert_to<triton::uint32>(),
+                         reinterpret_cast<DecimalNode*>(childs[1])->getValue().convert_to<triton::uint32>(),
+                         childs[2]);
+
+        case LET_NODE:
+          return let(reinterpret_cast<StringNode*>(childs[0])->getValue(), childs[1], childs[2]);
+
+        case SX_NODE:
+          return sx(reinterpret_cast<DecimalNode*>(childs[0])->getValue().convert_to<triton::uint32>(), childs[1]);
+
+        case ZX_NODE:
+          return zx(reinterpret_cast<DecimalNode*>(childs[0])->getValue().convert_to<triton::uint32>(), childs[1]);
+
+        default:
+          throw triton::exceptions::Ast("triton::ast::newInstance(): Invalid kind node.");
+      }
+    }
+
+
+    void nodesExtraction(std::vector<AbstractNode*>& result, AbstractNode* root, bool unroll) {
+      std::unordered_set<AbstractNode*> visited;
+      std::vector<std::pair<AbstractNode*, bool>> worklist;
+
+      if (root == nullptr)
+        return;
+
+      /* The boolean is true once all childs of the node have been pushed */
+      worklist.push_back(std::make_pair(root, false));
+
+      while (!worklist.empty()) {
+        AbstractNode* node = worklist.back().first;
+        bool expanded      = worklist.back().second;
+
+        worklist.pop_back();
+
+        if (expanded) {
+          result.push_back(node);
+          continue;
+        }
+
+        if (visited.find(node) != visited.end())
+          continue;
+
+        visited.insert(node);
+        worklist.push_back(std::make_pair(node, true));
+
+        if (unroll && node->getKind() == REFERENCE_NODE) {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(node)->getValue();
+          if (triton::api.isSymbolicExpressionIdExists(id))
+            worklist.push_back(std::make_pair(triton::api.getAstFromId(id), false));
+        }
+
+        /* Pushed in reverse order, so childs are extracted from left to right */
+        std::vector<AbstractNode*>& childs = node->getChilds();
+        for (auto it = childs.rbegin(); it != childs.rend(); it++) {
+          if (visited.find(*it) == visited.end())
+            worklist.push_back(std::make_pair(*it, false));
+        }
+      }
+    }
+
   }; /* ast namespace */
 }; /* triton namespace */
 
@@ -0,0 +1,257 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <triton/api.hpp>
+#include <triton/astBatchEvaluator.hpp>
+#include <triton/astOperations.hpp>
+#include <triton/exceptions.hpp>
+
+
+
+namespace triton {
+  namespace ast {
+
+    AstBatchEvaluator::AstBatchEvaluator() {
+      this->count = 0;
+    }
+
+
+    AstBatchEvaluator::~AstBatchEvaluator() {
+    }
+
+
+    triton::uint64* AstBatchEvaluator::newColumn(AbstractNode* node) {
+      triton::usize position = this->columns.size();
+
+      this->positions[node] = position;
+      this->columns.push_back(std::vector<triton::uint64>(this->count));
+
+      if (node->getBitvectorSize() > 64)
+        this->wideColumns[position].resize(this->count);
+
+      return this->columns.back().data();
+    }
+
+
+    const triton::uint64* AstBatchEvaluator::getColumn(AbstractNode* node) {
+      return this->columns[this->positions[node]].data();
+    }
+
+
+    triton::uint512 AstBatchEvaluator::getLane(AbstractNode* node, triton::usize lane) {
+      triton::usize position = this->positions[node];
+
+      if (node->getBitvectorSize() > 64)
+        return this->wideColumns[position][lane];
+
+      return this->columns[position][lane];
+    }
+
+
+    void AstBatchEvaluator::broadcast(AbstractNode* node, const triton::uint512& value) {
+      triton::uint64* r = this->newColumn(node);
+
+      for (triton::usize i = 0; i < this->count; i++)
+        r[i] = static_cast<triton::uint64>(value & static_cast<triton::uint64>(-1));
+
+      if (node->getBitvectorSize() > 64) {
+        std::vector<triton::uint512>& wide = this->wideColumns[this->positions[node]];
+        for (triton::usize i = 0; i < this->count; i++)
+          wide[i] = value;
+      }
+    }
+
+
+    void AstBatchEvaluator::evaluateNarrowNode(AbstractNode* node) {
+      const OperationSemantics& operation = getOperationSemantics(node->getKind());
+      std::vector<AbstractNode*>& childs  = node->getChilds();
+      OperationInfo info                  = getOperationInfo(node);
+      triton::uint64* r                   = this->newColumn(node);
+      const triton::uint64* lanes[3]      = {nullptr, nullptr, nullptr};
+      triton::usize count                 = 0;
+
+      /* A concat is computed two operands at a time, into its own column */
+      if (node->getKind() == CONCAT_NODE) {
+        const triton::uint64* first = this->getColumn(childs[0]);
+        for (triton::usize i = 0; i < this->count; i++)
+          r[i] = first[i];
+        for (triton::usize index = 1; index < childs.size(); index++) {
+          lanes[0] = r;
+          lanes[1] = this->getColumn(childs[index]);
+          info.parameter = childs[index]->getBitvectorSize();
+          operation.narrow(r, lanes, this->count, info);
+        }
+        return;
+      }
+
+      for (AbstractNode* child : childs) {
+        if (!isOperationParameter(child) && count < 3)
+          lanes[count++] = this->getColumn(child);
+      }
+
+      operation.narrow(r, lanes, this->count, info);
+    }
+
+
+    void AstBatchEvaluator::evaluateWideNode(AbstractNode* node) {
+      std::vector<AbstractNode*>& childs = node->getChilds();
+      std::vector<triton::uint512> operands;
+      triton::uint64* r                  = this->newColumn(node);
+      std::vector<triton::uint512>* wide = nullptr;
+
+      if (node->getBitvectorSize() > 64)
+        wide = &this->wideColumns[this->positions[node]];
+
+      for (triton::usize lane = 0; lane < this->count; lane++) {
+        operands.clear();
+        for (AbstractNode* child : childs) {
+          if (!isOperationParameter(child))
+            operands.push_back(this->getLane(child, lane));
+        }
+
+        triton::uint512 value = evaluateWideOperation(node, operands.data());
+
+        r[lane] = static_cast<triton::uint64>(value & static_cast<triton::uint64>(-1));
+        if (wide != nullptr)
+          (*wide)[lane] = value;
+      }
+    }
+
+
+    void AstBatchEvaluator::evaluateNode(AbstractNode* node) {
+      /* Operations are computed from the columns of their operands */
+      if (hasOperationSemantics(node->getKind())) {
+        if (!isWideOperation(node))
+          this->evaluateNarrowNode(node);
+        else
+          this->evaluateWideNode(node);
+        return;
+      }
+
+      switch (node->getKind()) {
+        /* A let has the value of its body */
+        case LET_NODE:
+          this->positions[node] = this->positions[node->getChilds()[2]];
+          break;
+
+        /* A reference shares the column of the expression's AST */
+        case REFERENCE_NODE: {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(node)->getValue();
+          if (!triton::api.isSymbolicExpressionIdExists(id))
+            throw triton::exceptions::Ast("AstBatchEvaluator::evaluateNode(): Reference to an unknown symbolic expression.");
+          this->positions[node] = this->positions[triton::api.getAstFromId(id)];
+          break;
+        }
+
+        case VARIABLE_NODE: {
+          auto it = this->variables.find(reinterpret_cast<VariableNode*>(node)->getId());
+          if (it != this->variables.end()) {
+            const std::vector<triton::uint64>& column = *it->second;
+            triton::uint64 mask                       = node->getBitvectorMask64();
+            triton::uint64* r                         = this->newColumn(node);
+            for (triton::usize i = 0; i < this->count; i++)
+              r[i] = column[i] & mask;
+            if (node->getBitvectorSize() > 64) {
+              std::vector<triton::uint512>& wide = this->wideColumns[this->positions[node]];
+              for (triton::usize i = 0; i < this->count; i++)
+                wide[i] = column[i];
+            }
+          }
+          else
+            this->broadcast(node, node->evaluate());
+          break;
+        }
+
+        /* Nodes without a value which depends on the variables */
+        default:
+          this->broadcast(node, node->evaluate());
+          break;
+      }
+    }
+
+
+    void AstBatchEvaluator::run(AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values) {
+      std::vector<std::pair<AbstractNode*, bool>> worklist;
+
+      if (node == nullptr)
+        throw triton::exceptions::Ast("AstBatchEvaluator::run(): node cannot be null.");
+
+      this->count = values.empty() ? 0 : values.begin()->second.size();
+      this->positions.clear();
+      this->columns.clear();
+      this->wideColumns.clear();
+      this->variables.clear();
+
+      for (auto it = values.begin(); it != values.end(); it++) {
+        if (it->second.size() != this->count)
+          throw triton::exceptions::Ast("AstBatchEvaluator::run(): All the columns must have the same length.");
+        this->variables[it->first] = &it->second;
+      }
+
+      /* Post-order walk, each node is evaluated once its childs are evaluated */
+      worklist.push_back(std::make_pair(node, false));
+      while (!worklist.empty()) {
+        AbstractNode* n = worklist.back().first;
+        bool expanded   = worklist.back().second;
+
+        worklist.pop_back();
+
+        if (this->positions.find(n) != this->positions.end())
+          continue;
+
+        if (expanded) {
+          this->evaluateNode(n);
+          continue;
+        }
+
+        /* A tree without variable does not depend on the assignments */
+        if (!n->isSymbolized()) {
+          this->broadcast(n, n->evaluate());
+          continue;
+        }
+
+        worklist.push_back(std::make_pair(n, true));
+
+        for (auto it = n->getChilds().rbegin(); it != n->getChilds().rend(); it++) {
+          /* Parameters are read from the nodes and have no column */
+          if (!isOperationParameter(*it))
+            worklist.push_back(std::make_pair(*it, false));
+        }
+
+        if (n->getKind() == REFERENCE_NODE) {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(n)->getValue();
+          if (triton::api.isSymbolicExpressionIdExists(id))
+            worklist.push_back(std::make_pair(triton::api.getAstFromId(id), false));
+        }
+      }
+    }
+
+
+    std::vector<triton::uint512> AstBatchEvaluator::evaluate(AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values) {
+      std::vector<triton::uint512> ret;
+
+      this->run(node, values);
+
+      ret.reserve(this->count);
+      for (triton::usize i = 0; i < this->count; i++)
+        ret.push_back(this->getLane(node, i));
+
+      return ret;
+    }
+
+
+    std::vector<triton::uint64> AstBatchEvaluator::evaluate64(AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values) {
+      if (node != nullptr && node->getBitvectorSize() > 64)
+        throw triton::exceptions::Ast("AstBatchEvaluator::evaluate64(): node must not be wider than 64 bits.");
+
+      this->run(node, values);
+
+      return this->columns[this->positions[node]];
+    }
+
+  }; /* ast namespace */
+}; /* triton namespace */
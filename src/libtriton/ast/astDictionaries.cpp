@@ -5,6 +5,10 @@
 **  This program is under the terms of the BSD License.
 */
 
+#include <algorithm>
+#include <functional>
+
+#include <triton/api.hpp>
 #include <triton/astDictionaries.hpp>
 
 
@@ -12,11 +16,25 @@
 namespace triton {
   namespace ast {
 
-    AstDictionaries::AstDictionaries(bool isBackup) {
-      this->allocatedNodes  = 0;
-      this->backupFlag      = isBackup;
+    /* Initial capacity of the hash-consing table. Must be a power of two. */
+    const triton::usize AST_DICTIONARIES_INITIAL_CAPACITY = 64;
+
+
+    /* Mixes a word into a key hash */
+    static inline triton::uint64 mixKeyHash(triton::uint64 hash, triton::uint64 value) {
+      return hash ^ (value + 0x9e3779b97f4a7c15ULL + (hash << 6) + (hash >> 2));
+    }
+
 
-      this->linkDictionaries();
+    AstDictionaries::AstDictionaries() {
+      this->allocatedDictionaries = 0;
+      this->allocatedNodes        = 0;
+      this->hits                  = 0;
+      this->misses                = 0;
+
+      this->kinds.resize(triton::ast::ZX_NODE + 1, 0);
+      this->table.resize(AST_DICTIONARIES_INITIAL_CAPACITY, nullptr);
+      this->tableHashes.resize(AST_DICTIONARIES_INITIAL_CAPACITY, 0);
     }
 
 
@@ -26,10 +44,6 @@ namespace triton {
 
 
     AstDictionaries::~AstDictionaries() {
-      if (this->backupFlag == false) {
-        for (auto it = this->allocatedDictionaries.begin(); it != this->allocatedDictionaries.end(); it++)
-          delete *it;
-      }
     }
 
 
@@ -39,243 +53,280 @@ namespace triton {
 
 
     void AstDictionaries::copy(const AstDictionaries& other) {
-      /* Global information */
-      this->allocatedNodes              = other.allocatedNodes;
-      this->allocatedDictionaries       = other.allocatedDictionaries;
-      this->backupFlag                  = true;
-
-      /* Dictionnaries */
-      this->assertDictionary            = other.assertDictionary;
-      this->bvaddDictionary             = other.bvaddDictionary;
-      this->bvandDictionary             = other.bvandDictionary;
-      this->bvashrDictionary            = other.bvashrDictionary;
-      this->bvdeclDictionary            = other.bvdeclDictionary;
-      this->bvlshrDictionary            = other.bvlshrDictionary;
-      this->bvmulDictionary             = other.bvmulDictionary;
-      this->bvnandDictionary            = other.bvnandDictionary;
-      this->bvnegDictionary             = other.bvnegDictionary;
-      this->bvnorDictionary             = other.bvnorDictionary;
-      this->bvnotDictionary             = other.bvnotDictionary;
-      this->bvorDictionary              = other.bvorDictionary;
-      this->bvrolDictionary             = other.bvrolDictionary;
-      this->bvrorDictionary             = other.bvrorDictionary;
-      this->bvsdivDictionary            = other.bvsdivDictionary;
-      this->bvsgeDictionary             = other.bvsgeDictionary;
-      this->bvsgtDictionary             = other.bvsgtDictionary;
-      this->bvshlDictionary             = other.bvshlDictionary;
-      this->bvsleDictionary             = other.bvsleDictionary;
-      this->bvsltDictionary             = other.bvsltDictionary;
-      this->bvsmodDictionary            = other.bvsmodDictionary;
-      this->bvsremDictionary            = other.bvsremDictionary;
-      this->bvsubDictionary             = other.bvsubDictionary;
-      this->bvudivDictionary            = other.bvudivDictionary;
-      this->bvugeDictionary             = other.bvugeDictionary;
-      this->bvugtDictionary             = other.bvugtDictionary;
-      this->bvuleDictionary             = other.bvuleDictionary;
-      this->bvultDictionary             = other.bvultDictionary;
-      this->bvuremDictionary            = other.bvuremDictionary;
-      this->bvxnorDictionary            = other.bvxnorDictionary;
-      this->bvxorDictionary             = other.bvxorDictionary;
-      this->bvDictionary                = other.bvDictionary;
-      this->compoundDictionary          = other.compoundDictionary;
-      this->concatDictionary            = other.concatDictionary;
-      this->decimalDictionary           = other.decimalDictionary;
-      this->declareFunctionDictionary   = other.declareFunctionDictionary;
-      this->distinctDictionary          = other.distinctDictionary;
-      this->equalDictionary             = other.equalDictionary;
-      this->extractDictionary           = other.extractDictionary;
-      this->iteDictionary               = other.iteDictionary;
-      this->landDictionary              = other.landDictionary;
-      this->letDictionary               = other.letDictionary;
-      this->lnotDictionary              = other.lnotDictionary;
-      this->lorDictionary               = other.lorDictionary;
-      this->referenceDictionary         = other.referenceDictionary;
-      this->stringDictionary            = other.stringDictionary;
-      this->sxDictionary                = other.sxDictionary;
-      this->variableDictionary          = other.variableDictionary;
-      this->zxDictionary                = other.zxDictionary;
-
-      this->linkDictionaries();
-    }
-
-
-    void AstDictionaries::linkDictionaries(void) {
-      this->dictionaries[triton::ast::ASSERT_NODE]             = &this->assertDictionary;
-      this->dictionaries[triton::ast::BVADD_NODE]              = &this->bvaddDictionary;
-      this->dictionaries[triton::ast::BVAND_NODE]              = &this->bvandDictionary;
-      this->dictionaries[triton::ast::BVASHR_NODE]             = &this->bvashrDictionary;
-      this->dictionaries[triton::ast::BVDECL_NODE]             = &this->bvdeclDictionary;
-      this->dictionaries[triton::ast::BVLSHR_NODE]             = &this->bvlshrDictionary;
-      this->dictionaries[triton::ast::BVMUL_NODE]              = &this->bvmulDictionary;
-      this->dictionaries[triton::ast::BVNAND_NODE]             = &this->bvnandDictionary;
-      this->dictionaries[triton::ast::BVNEG_NODE]              = &this->bvnegDictionary;
-      this->dictionaries[triton::ast::BVNOR_NODE]              = &this->bvnorDictionary;
-      this->dictionaries[triton::ast::BVNOT_NODE]              = &this->bvnotDictionary;
-      this->dictionaries[triton::ast::BVOR_NODE]               = &this->bvorDictionary;
-      this->dictionaries[triton::ast::BVROL_NODE]              = &this->bvrolDictionary;
-      this->dictionaries[triton::ast::BVROR_NODE]              = &this->bvrorDictionary;
-      this->dictionaries[triton::ast::BVSDIV_NODE]             = &this->bvsdivDictionary;
-      this->dictionaries[triton::ast::BVSGE_NODE]              = &this->bvsgeDictionary;
-      this->dictionaries[triton::ast::BVSGT_NODE]              = &this->bvsgtDictionary;
-      this->dictionaries[triton::ast::BVSHL_NODE]              = &this->bvshlDictionary;
-      this->dictionaries[triton::ast::BVSLE_NODE]              = &this->bvsleDictionary;
-      this->dictionaries[triton::ast::BVSLT_NODE]              = &this->bvsltDictionary;
-      this->dictionaries[triton::ast::BVSMOD_NODE]             = &this->bvsmodDictionary;
-      this->dictionaries[triton::ast::BVSREM_NODE]             = &this->bvsremDictionary;
-      this->dictionaries[triton::ast::BVSUB_NODE]              = &this->bvsubDictionary;
-      this->dictionaries[triton::ast::BVUDIV_NODE]             = &this->bvudivDictionary;
-      this->dictionaries[triton::ast::BVUGE_NODE]              = &this->bvugeDictionary;
-      this->dictionaries[triton::ast::BVUGT_NODE]              = &this->bvugtDictionary;
-      this->dictionaries[triton::ast::BVULE_NODE]              = &this->bvuleDictionary;
-      this->dictionaries[triton::ast::BVULT_NODE]              = &this->bvultDictionary;
-      this->dictionaries[triton::ast::BVUREM_NODE]             = &this->bvuremDictionary;
-      this->dictionaries[triton::ast::BVXNOR_NODE]             = &this->bvxnorDictionary;
-      this->dictionaries[triton::ast::BVXOR_NODE]              = &this->bvxorDictionary;
-      this->dictionaries[triton::ast::BV_NODE]                 = &this->bvDictionary;
-      this->dictionaries[triton::ast::COMPOUND_NODE]           = &this->compoundDictionary;
-      this->dictionaries[triton::ast::CONCAT_NODE]             = &this->concatDictionary;
-      this->dictionaries[triton::ast::DECIMAL_NODE]            = &this->decimalDictionary;
-      this->dictionaries[triton::ast::DECLARE_FUNCTION_NODE]   = &this->declareFunctionDictionary;
-      this->dictionaries[triton::ast::DISTINCT_NODE]           = &this->distinctDictionary;
-      this->dictionaries[triton::ast::EQUAL_NODE]              = &this->equalDictionary;
-      this->dictionaries[triton::ast::EXTRACT_NODE]            = &this->extractDictionary;
-      this->dictionaries[triton::ast::ITE_NODE]                = &this->iteDictionary;
-      this->dictionaries[triton::ast::LAND_NODE]               = &this->landDictionary;
-      this->dictionaries[triton::ast::LET_NODE]                = &this->letDictionary;
-      this->dictionaries[triton::ast::LNOT_NODE]               = &this->lnotDictionary;
-      this->dictionaries[triton::ast::LOR_NODE]                = &this->lorDictionary;
-      this->dictionaries[triton::ast::REFERENCE_NODE]          = &this->referenceDictionary;
-      this->dictionaries[triton::ast::STRING_NODE]             = &this->stringDictionary;
-      this->dictionaries[triton::ast::SX_NODE]                 = &this->sxDictionary;
-      this->dictionaries[triton::ast::VARIABLE_NODE]           = &this->variableDictionary;
-      this->dictionaries[triton::ast::ZX_NODE]                 = &this->zxDictionary;
+      this->allocatedDictionaries = other.allocatedDictionaries;
+      this->allocatedNodes        = other.allocatedNodes;
+      this->hits                  = other.hits;
+      this->kinds                 = other.kinds;
+      this->misses                = other.misses;
+      this->table                 = other.table;
+      this->tableHashes           = other.tableHashes;
     }
 
 
-    triton::ast::AbstractNode* AstDictionaries::browseAstDictionaries(triton::ast::AbstractNode* node) {
-      this->allocatedNodes++;
-      triton::uint32 kind = node->getKind();
-
-      switch (kind) {
+    triton::uint64 AstDictionaries::getKeyHash(triton::ast::AbstractNode* node) const {
+      triton::uint64 hash = mixKeyHash(node->getKind(), node->getBitvectorSize());
 
+      switch (node->getKind()) {
         case triton::ast::DECIMAL_NODE: {
-          auto value       = static_cast<triton::ast::DecimalNode*>(node)->getValue();
-          auto dictionary  = static_cast<std::map<triton::uint512, triton::ast::AbstractNode*>*>((this->dictionaries[kind]));
-          if (dictionary->find(value) != dictionary->end()) {
-            delete node;
-            return (*dictionary)[value];
-          }
-          (*dictionary)[value] = node;
+          triton::uint512 value = static_cast<triton::ast::DecimalNode*>(node)->getValue();
+          do {
+            hash = mixKeyHash(hash, static_cast<triton::uint64>(value & 0xffffffffffffffffULL));
+            value >>= 64;
+          } while (value);
           break;
         }
 
-        case triton::ast::REFERENCE_NODE: {
-          auto value       = static_cast<triton::ast::ReferenceNode*>(node)->getValue();
-          auto dictionary  = static_cast<std::map<triton::usize, triton::ast::AbstractNode*>*>((this->dictionaries[kind]));
-          if (dictionary->find(value) != dictionary->end()) {
-            delete node;
-            return (*dictionary)[value];
-          }
-          (*dictionary)[value] = node;
+        case triton::ast::REFERENCE_NODE:
+          hash = mixKeyHash(hash, static_cast<triton::ast::ReferenceNode*>(node)->getValue());
           break;
-        }
 
-        case triton::ast::STRING_NODE: {
-          auto value       = static_cast<triton::ast::StringNode*>(node)->getValue();
-          auto dictionary  = static_cast<std::map<std::string, triton::ast::AbstractNode*>*>((this->dictionaries[kind]));
-          if (dictionary->find(value) != dictionary->end()) {
-            delete node;
-            return (*dictionary)[value];
-          }
-          (*dictionary)[value] = node;
+        case triton::ast::STRING_NODE:
+          hash = mixKeyHash(hash, std::hash<std::string>()(static_cast<triton::ast::StringNode*>(node)->getValue()));
           break;
-        }
 
-        case triton::ast::VARIABLE_NODE: {
-          auto value       = static_cast<triton::ast::VariableNode*>(node)->getValue();
-          auto dictionary  = static_cast<std::map<std::string, triton::ast::AbstractNode*>*>((this->dictionaries[kind]));
-          if (dictionary->find(value) != dictionary->end()) {
-            delete node;
-            return (*dictionary)[value];
-          }
-          (*dictionary)[value] = node;
+        case triton::ast::VARIABLE_NODE:
+          hash = mixKeyHash(hash, static_cast<triton::ast::VariableNode*>(node)->getId());
           break;
-        }
 
-        default: {
-          auto value       = node->getChilds();
-          auto dictionary  = static_cast<std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*>*>((this->dictionaries[kind]));
-          if (dictionary->find(value) != dictionary->end()) {
-            delete node;
-            return (*dictionary)[value];
-          }
-          (*dictionary)[value] = node;
+        default:
+          for (auto it = node->getChilds().begin(); it != node->getChilds().end(); it++)
+            hash = mixKeyHash(hash, reinterpret_cast<triton::usize>(*it));
           break;
+      }
+
+      return hash;
+    }
+
+
+    bool AstDictionaries::isSameKey(triton::ast::AbstractNode* node1, triton::ast::AbstractNode* node2) const {
+      if (node1->getKind() != node2->getKind() || node1->getBitvectorSize() != node2->getBitvectorSize())
+        return false;
+
+      switch (node1->getKind()) {
+        case triton::ast::DECIMAL_NODE:
+          return static_cast<triton::ast::DecimalNode*>(node1)->getValue() == static_cast<triton::ast::DecimalNode*>(node2)->getValue();
+
+        case triton::ast::REFERENCE_NODE:
+          return static_cast<triton::ast::ReferenceNode*>(node1)->getValue() == static_cast<triton::ast::ReferenceNode*>(node2)->getValue();
+
+        case triton::ast::STRING_NODE:
+          return static_cast<triton::ast::StringNode*>(node1)->getValue() == static_cast<triton::ast::StringNode*>(node2)->getValue();
+
+        case triton::ast::VARIABLE_NODE:
+          return static_cast<triton::ast::VariableNode*>(node1)->getId() == static_cast<triton::ast::VariableNode*>(node2)->getId();
+
+        default:
+          return node1->getChilds() == node2->getChilds();
+      }
+    }
+
+
+    void AstDictionaries::insertIntoTable(triton::ast::AbstractNode* node, triton::uint64 hash) {
+      triton::usize mask  = this->table.size() - 1;
+      triton::usize index = hash & mask;
+
+      while (this->table[index] != nullptr)
+        index = (index + 1) & mask;
+
+      this->table[index]       = node;
+      this->tableHashes[index] = hash;
+    }
+
+
+    void AstDictionaries::growTable(void) {
+      std::vector<triton::ast::AbstractNode*> oldTable;
+      std::vector<triton::uint64> oldHashes;
+
+      oldTable.swap(this->table);
+      oldHashes.swap(this->tableHashes);
+
+      this->table.resize(oldTable.size() * 2, nullptr);
+      this->tableHashes.resize(oldTable.size() * 2, 0);
+
+      for (triton::usize index = 0; index < oldTable.size(); index++) {
+        if (oldTable[index] != nullptr)
+          this->insertIntoTable(oldTable[index], oldHashes[index]);
+      }
+    }
+
+
+    void AstDictionaries::sweepAstDictionaries(void) {
+      std::vector<triton::ast::AbstractNode*> oldTable;
+      std::vector<triton::uint64> oldHashes;
+
+      oldTable.swap(this->table);
+      oldHashes.swap(this->tableHashes);
+
+      /* Linear probing does not support holes, survivors are inserted again */
+      this->table.resize(oldTable.size(), nullptr);
+      this->tableHashes.resize(oldTable.size(), 0);
+
+      for (triton::usize index = 0; index < oldTable.size(); index++) {
+        triton::ast::AbstractNode* node = oldTable[index];
+        if (node == nullptr)
+          continue;
+        if (node->isMarked()) {
+          this->insertIntoTable(node, oldHashes[index]);
+          continue;
+        }
+        this->allocatedDictionaries--;
+        this->kinds[node->getKind()]--;
+        node->setRecorded(false);
+      }
+    }
+
+
+    void AstDictionaries::removeFromAstDictionaries(triton::ast::AbstractNode* node) {
+      triton::usize mask  = this->table.size() - 1;
+      triton::usize index = 0;
+      triton::usize next  = 0;
+
+      if (node->isRecorded() == false)
+        return;
+
+      /* Childs may have been replaced since the node has been recorded, it is then looked up in the whole table */
+      index = this->getKeyHash(node) & mask;
+      while (this->table[index] != nullptr && this->table[index] != node)
+        index = (index + 1) & mask;
+
+      if (this->table[index] == nullptr) {
+        index = std::find(this->table.begin(), this->table.end(), node) - this->table.begin();
+        if (index == this->table.size())
+          return;
+      }
+
+      this->allocatedDictionaries--;
+      this->kinds[node->getKind()]--;
+      node->setRecorded(false);
+
+      /* Backward shift deletion, entries of the probe chain are moved into the hole */
+      next = (index + 1) & mask;
+      while (this->table[next] != nullptr) {
+        triton::usize home = this->tableHashes[next] & mask;
+        if (((next - home) & mask) >= ((next - index) & mask)) {
+          this->table[index]       = this->table[next];
+          this->tableHashes[index] = this->tableHashes[next];
+          index = next;
         }
+        next = (next + 1) & mask;
+      }
+
+      this->table[index]       = nullptr;
+      this->tableHashes[index] = 0;
+    }
 
+
+    void AstDictionaries::clearAstDictionaries(void) {
+      for (auto it = this->table.begin(); it != this->table.end(); it++) {
+        if (*it != nullptr)
+          (*it)->setRecorded(false);
       }
 
-      this->allocatedDictionaries.insert(node);
+      this->allocatedDictionaries = 0;
+      this->table.assign(AST_DICTIONARIES_INITIAL_CAPACITY, nullptr);
+      this->tableHashes.assign(AST_DICTIONARIES_INITIAL_CAPACITY, 0);
+      std::fill(this->kinds.begin(), this->kinds.end(), 0);
+    }
+
+
+    triton::ast::AbstractNode* AstDictionaries::browseAstDictionaries(triton::ast::AbstractNode* node) {
+      this->allocatedNodes++;
+
+      triton::uint64 hash  = this->getKeyHash(node);
+      triton::usize mask   = this->table.size() - 1;
+      triton::usize index  = hash & mask;
+
+      /* Lookup */
+      while (this->table[index] != nullptr) {
+        triton::ast::AbstractNode* other = this->table[index];
+        if (this->tableHashes[index] == hash && this->isSameKey(node, other)) {
+          /* The duplicate must not stay a parent of the shared childs */
+          for (auto it = node->getChilds().begin(); it != node->getChilds().end(); it++)
+            (*it)->removeParent(node);
+          if (node->getKind() == triton::ast::REFERENCE_NODE) {
+            triton::usize id = static_cast<triton::ast::ReferenceNode*>(node)->getValue();
+            if (triton::api.isSymbolicExpressionIdExists(id))
+              triton::api.getAstFromId(id)->removeParent(node);
+          }
+          delete node;
+          this->hits++;
+          return other;
+        }
+        index = (index + 1) & mask;
+      }
+
+      /* Record. The load factor is kept under 3/4 */
+      this->misses++;
+      this->table[index]       = node;
+      this->tableHashes[index] = hash;
+      this->allocatedDictionaries++;
+      this->kinds[node->getKind()]++;
+      node->setRecorded(true);
+
+      if (this->allocatedDictionaries * 4 >= this->table.size() * 3)
+        this->growTable();
+
       return nullptr;
     }
 
 
     std::map<std::string, triton::usize> AstDictionaries::getAstDictionariesStats(void) const {
       std::map<std::string, triton::usize> stats;
-      stats["assert"]                 = this->assertDictionary.size();
-      stats["bvadd"]                  = this->bvaddDictionary.size();
-      stats["bvand"]                  = this->bvandDictionary.size();
-      stats["bvashr"]                 = this->bvashrDictionary.size();
-      stats["bvdecl"]                 = this->bvdeclDictionary.size();
-      stats["bvlshr"]                 = this->bvlshrDictionary.size();
-      stats["bvmul"]                  = this->bvmulDictionary.size();
-      stats["bvnand"]                 = this->bvnandDictionary.size();
-      stats["bvneg"]                  = this->bvnegDictionary.size();
-      stats["bvnor"]                  = this->bvnorDictionary.size();
-      stats["bvnot"]                  = this->bvnotDictionary.size();
-      stats["bvor"]                   = this->bvorDictionary.size();
-      stats["bvrol"]                  = this->bvrolDictionary.size();
-      stats["bvror"]                  = this->bvrorDictionary.size();
-      stats["bvsdiv"]                 = this->bvsdivDictionary.size();
-      stats["bvsge"]                  = this->bvsgeDictionary.size();
-      stats["bvsgt"]                  = this->bvsgtDictionary.size();
-      stats["bvshl"]                  = this->bvshlDictionary.size();
-      stats["bvsle"]                  = this->bvsleDictionary.size();
-      stats["bvslt"]                  = this->bvsltDictionary.size();
-      stats["bvsmod"]                 = this->bvsmodDictionary.size();
-      stats["bvsrem"]                 = this->bvsremDictionary.size();
-      stats["bvsub"]                  = this->bvsubDictionary.size();
-      stats["bvudiv"]                 = this->bvudivDictionary.size();
-      stats["bvuge"]                  = this->bvugeDictionary.size();
-      stats["bvugt"]                  = this->bvugtDictionary.size();
-      stats["bvule"]                  = this->bvuleDictionary.size();
-      stats["bvult"]                  = this->bvultDictionary.size();
-      stats["bvurem"]                 = this->bvuremDictionary.size();
-      stats["bvxnor"]                 = this->bvxnorDictionary.size();
-      stats["bvxor"]                  = this->bvxorDictionary.size();
-      stats["bv"]                     = this->bvDictionary.size();
-      stats["compound"]               = this->compoundDictionary.size();
-      stats["concat"]                 = this->concatDictionary.size();
-      stats["decimal"]                = this->decimalDictionary.size();
-      stats["declareFunction"]        = this->declareFunctionDictionary.size();
-      stats["distinct"]               = this->distinctDictionary.size();
-      stats["equal"]                  = this->equalDictionary.size();
-      stats["extract"]                = this->extractDictionary.size();
-      stats["ite"]                    = this->iteDictionary.size();
-      stats["land"]                   = this->landDictionary.size();
-      stats["let"]                    = this->letDictionary.size();
-      stats["lnot"]                   = this->lnotDictionary.size();
-      stats["lor"]                    = this->lorDictionary.size();
-      stats["reference"]              = this->referenceDictionary.size();
-      stats["string"]                 = this->stringDictionary.size();
-      stats["sx"]                     = this->sxDictionary.size();
-      stats["variable"]               = this->variableDictionary.size();
-      stats["zx"]                     = this->zxDictionary.size();
-      stats["allocatedDictionaries"]  = this->allocatedDictionaries.size();
+      stats["assert"]                 = this->kinds[triton::ast::ASSERT_NODE];
+      stats["bvadd"]                  = this->kinds[triton::ast::BVADD_NODE];
+      stats["bvand"]                  = this->kinds[triton::ast::BVAND_NODE];
+      stats["bvashr"]                 = this->kinds[triton::ast::BVASHR_NODE];
+      stats["bvdecl"]                 = this->kinds[triton::ast::BVDECL_NODE];
+      stats["bvlshr"]                 = this->kinds[triton::ast::BVLSHR_NODE];
+      stats["bvmul"]                  = this->kinds[triton::ast::BVMUL_NODE];
+      stats["bvnand"]                 = this->kinds[triton::ast::BVNAND_NODE];
+      stats["bvneg"]                  = this->kinds[triton::ast::BVNEG_NODE];
+      stats["bvnor"]                  = this->kinds[triton::ast::BVNOR_NODE];
+      stats["bvnot"]                  = this->kinds[triton::ast::BVNOT_NODE];
+      stats["bvor"]                   = this->kinds[triton::ast::BVOR_NODE];
+      stats["bvrol"]                  = this->kinds[triton::ast::BVROL_NODE];
+      stats["bvror"]                  = this->kinds[triton::ast::BVROR_NODE];
+      stats["bvsdiv"]                 = this->kinds[triton::ast::BVSDIV_NODE];
+      stats["bvsge"]                  = this->kinds[triton::ast::BVSGE_NODE];
+      stats["bvsgt"]                  = this->kinds[triton::ast::BVSGT_NODE];
+      stats["bvshl"]                  = this->kinds[triton::ast::BVSHL_NODE];
+      stats["bvsle"]                  = this->kinds[triton::ast::BVSLE_NODE];
+      stats["bvslt"]                  = this->kinds[triton::ast::BVSLT_NODE];
+      stats["bvsmod"]                 = this->kinds[triton::ast::BVSMOD_NODE];
+      stats["bvsrem"]                 = this->kinds[triton::ast::BVSREM_NODE];
+      stats["bvsub"]                  = this->kinds[triton::ast::BVSUB_NODE];
+      stats["bvudiv"]                 = this->kinds[triton::ast::BVUDIV_NODE];
+      stats["bvuge"]                  = this->kinds[triton::ast::BVUGE_NODE];
+      stats["bvugt"]                  = this->kinds[triton::ast::BVUGT_NODE];
+      stats["bvule"]                  = this->kinds[triton::ast::BVULE_NODE];
+      stats["bvult"]                  = this->kinds[triton::ast::BVULT_NODE];
+      stats["bvurem"]                 = this->kinds[triton::ast::BVUREM_NODE];
+      stats["bvxnor"]                 = this->kinds[triton::ast::BVXNOR_NODE];
+      stats["bvxor"]                  = this->kinds[triton::ast::BVXOR_NODE];
+      stats["bv"]                     = this->kinds[triton::ast::BV_NODE];
+      stats["compound"]               = this->kinds[triton::ast::COMPOUND_NODE];
+      stats["concat"]                 = this->kinds[triton::ast::CONCAT_NODE];
+      stats["decimal"]                = this->kinds[triton::ast::DECIMAL_NODE];
+      stats["declareFunction"]        = this->kinds[triton::ast::DECLARE_FUNCTION_NODE];
+      stats["distinct"]               = this->kinds[triton::ast::DISTINCT_NODE];
+      stats["equal"]                  = this->kinds[triton::ast::EQUAL_NODE];
+      stats["extract"]                = this->kinds[triton::ast::EXTRACT_NODE];
+      stats["ite"]                    = this->kinds[triton::ast::ITE_NODE];
+      stats["land"]                   = this->kinds[triton::ast::LAND_NODE];
+      stats["let"]                    = this->kinds[triton::ast::LET_NODE];
+      stats["lnot"]                   = this->kinds[triton::ast::LNOT_NODE];
+      stats["lor"]                    = this->kinds[triton::ast::LOR_NODE];
+      stats["reference"]              = this->kinds[triton::ast::REFERENCE_NODE];
+      stats["string"]                 = this->kinds[triton::ast::STRING_NODE];
+      stats["sx"]                     = this->kinds[triton::ast::SX_NODE];
+      stats["variable"]               = this->kinds[triton::ast::VARIABLE_NODE];
+      stats["zx"]                     = this->kinds[triton::ast::ZX_NODE];
+      stats["allocatedDictionaries"]  = this->allocatedDictionaries;
       stats["allocatedNodes"]         = this->allocatedNodes;
+      stats["hits"]                   = this->hits;
+      stats["misses"]                 = this->misses;
       return stats;
     }
 
   }; /* ast namespace */
 }; /*triton namespace */
-
@@ -0,0 +1,164 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <triton/api.hpp>
+#include <triton/astEvaluator.hpp>
+#include <triton/astOperations.hpp>
+#include <triton/exceptions.hpp>
+
+
+
+namespace triton {
+  namespace ast {
+
+    AstEvaluator::AstEvaluator() {
+    }
+
+
+    AstEvaluator::~AstEvaluator() {
+    }
+
+
+    triton::uint512 AstEvaluator::getValue(AbstractNode* node) {
+      triton::usize position = this->positions[node];
+
+      if (node->getBitvectorSize() > 64)
+        return this->wideValues[position];
+
+      return this->values[position];
+    }
+
+
+    triton::uint64 AstEvaluator::getValue64(AbstractNode* node) {
+      return this->values[this->positions[node]];
+    }
+
+
+    void AstEvaluator::setValue(AbstractNode* node, const triton::uint512& value) {
+      triton::usize position = this->values.size();
+
+      this->positions[node] = position;
+      this->values.push_back(static_cast<triton::uint64>(value & static_cast<triton::uint64>(-1)));
+
+      if (node->getBitvectorSize() > 64)
+        this->wideValues[position] = value;
+    }
+
+
+    void AstEvaluator::setValue64(AbstractNode* node, triton::uint64 value) {
+      this->positions[node] = this->values.size();
+      this->values.push_back(value);
+    }
+
+
+    void AstEvaluator::evaluateNode(AbstractNode* node) {
+      std::vector<AbstractNode*>& childs = node->getChilds();
+
+      /* Operations are computed from the values of their operands */
+      if (hasOperationSemantics(node->getKind())) {
+        if (!isWideOperation(node)) {
+          this->narrowOperands.clear();
+          for (AbstractNode* child : childs) {
+            if (!isOperationParameter(child))
+              this->narrowOperands.push_back(this->getValue64(child));
+          }
+          this->setValue64(node, evaluateNarrowOperation(node, this->narrowOperands.data()));
+        }
+        else {
+          this->wideOperands.clear();
+          for (AbstractNode* child : childs) {
+            if (!isOperationParameter(child))
+              this->wideOperands.push_back(this->getValue(child));
+          }
+          this->setValue(node, evaluateWideOperation(node, this->wideOperands.data()));
+        }
+        return;
+      }
+
+      switch (node->getKind()) {
+        case LET_NODE:
+          this->setValue(node, this->getValue(childs[2]));
+          break;
+
+        case REFERENCE_NODE: {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(node)->getValue();
+          if (!triton::api.isSymbolicExpressionIdExists(id))
+            throw triton::exceptions::Ast("AstEvaluator::evaluateNode(): Reference to an unknown symbolic expression.");
+          this->setValue(node, this->getValue(triton::api.getAstFromId(id)));
+          break;
+        }
+
+        case VARIABLE_NODE: {
+          auto it = this->variables.find(reinterpret_cast<VariableNode*>(node)->getId());
+          if (it != this->variables.end())
+            this->setValue(node, it->second & node->getBitvectorMask());
+          else
+            this->setValue(node, node->evaluate());
+          break;
+        }
+
+        /* Nodes without a value which depends on the variables */
+        default:
+          this->setValue(node, node->evaluate());
+          break;
+      }
+    }
+
+
+    triton::uint512 AstEvaluator::evaluate(AbstractNode* node, const std::map<triton::usize, triton::uint512>& values) {
+      std::vector<std::pair<AbstractNode*, bool>> worklist;
+
+      if (node == nullptr)
+        throw triton::exceptions::Ast("AstEvaluator::evaluate(): node cannot be null.");
+
+      this->positions.clear();
+      this->values.clear();
+      this->wideValues.clear();
+      this->variables.clear();
+
+      for (auto it = values.begin(); it != values.end(); it++)
+        this->variables[it->first] = it->second;
+
+      /* Post-order walk, each node is evaluated once its childs are evaluated */
+      worklist.push_back(std::make_pair(node, false));
+      while (!worklist.empty()) {
+        AbstractNode* n = worklist.back().first;
+        bool expanded   = worklist.back().second;
+
+        worklist.pop_back();
+
+        if (this->positions.find(n) != this->positions.end())
+          continue;
+
+        if (expanded) {
+          this->evaluateNode(n);
+          continue;
+        }
+
+        /* A tree without variable does not depend on the assignment */
+        if (!n->isSymbolized()) {
+          this->setValue(n, n->evaluate());
+          continue;
+        }
+
+        worklist.push_back(std::make_pair(n, true));
+
+        for (auto it = n->getChilds().rbegin(); it != n->getChilds().rend(); it++)
+          worklist.push_back(std::make_pair(*it, false));
+
+        if (n->getKind() == REFERENCE_NODE) {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(n)->getValue();
+          if (triton::api.isSymbolicExpressionIdExists(id))
+            worklist.push_back(std::make_pair(triton::api.getAstFromId(id), false));
+        }
+      }
+
+      return this->getValue(node);
+    }
+
+  }; /* ast namespace */
+}; /* triton namespace */
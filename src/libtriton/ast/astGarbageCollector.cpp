@@ -5,6 +5,8 @@
 **  This program is under the terms of the BSD License.
 */
 
+#include <algorithm>
+#include <triton/api.hpp>
 #include <triton/astGarbageCollector.hpp>
 #include <triton/exceptions.hpp>
 
@@ -13,14 +15,21 @@
 namespace triton {
   namespace ast {
 
+    /* Minimal number of recorded nodes between two collections. */
+    const triton::usize AST_GARBAGE_COLLECTION_THRESHOLD = 0x100000;
+
+
     AstGarbageCollector::AstGarbageCollector(triton::modes::Modes* modes, bool isBackup)
-      : triton::ast::AstDictionaries(isBackup) {
+      : triton::ast::AstDictionaries() {
 
       if (modes == nullptr)
         throw triton::exceptions::AstGarbageCollector("AstGarbageCollector::AstGarbageCollector(): The modes API cannot be null.");
 
-      this->backupFlag = isBackup;
-      this->modes      = modes;
+      this->backupFlag          = isBackup;
+      this->collectionThreshold = AST_GARBAGE_COLLECTION_THRESHOLD;
+      this->modes               = modes;
+      this->recordedNodes       = 0;
+      this->epochs.resize(1);
     }
 
 
@@ -37,15 +46,23 @@ namespace triton {
 
 
     void AstGarbageCollector::copy(const AstGarbageCollector& other) {
+      const std::set<triton::ast::AbstractNode*>& nodes = other.getAllocatedAstNodes();
+
       /* Remove unused nodes before the assignation */
-      for (auto it = this->allocatedNodes.begin(); it != this->allocatedNodes.end(); it++) {
-        if (other.allocatedNodes.find(*it) == other.allocatedNodes.end())
-          delete *it;
+      for (auto epoch = this->epochs.begin(); epoch != this->epochs.end(); epoch++) {
+        for (auto it = epoch->begin(); it != epoch->end(); it++) {
+          if (nodes.find(*it) == nodes.end())
+            delete *it;
+        }
       }
-      this->allocatedNodes  = other.allocatedNodes;
-      this->backupFlag      = true;
-      this->modes           = other.modes;
-      this->variableNodes   = other.variableNodes;
+
+      this->backupFlag          = true;
+      this->collectionThreshold = other.collectionThreshold;
+      this->epochs              = other.epochs;
+      this->modes               = other.modes;
+      this->pinnedNodes         = other.pinnedNodes;
+      this->recordedNodes       = other.recordedNodes;
+      this->variableNodes       = other.variableNodes;
     }
 
 
@@ -55,43 +72,303 @@ namespace triton {
     }
 
 
+    void AstGarbageCollector::unlinkAstNode(triton::ast::AbstractNode* node) {
+      std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+
+      for (auto it = childs.begin(); it != childs.end(); it++)
+        (*it)->removeParent(node);
+
+      if (node->getKind() == triton::ast::REFERENCE_NODE) {
+        triton::usize id = reinterpret_cast<triton::ast::ReferenceNode*>(node)->getValue();
+        if (triton::api.isSymbolicExpressionIdExists(id))
+          triton::api.getAstFromId(id)->removeParent(node);
+      }
+
+      /* The name may be recorded with another node since a snapshot has been restored */
+      if (node->getKind() == triton::ast::VARIABLE_NODE) {
+        auto it = this->variableNodes.find(reinterpret_cast<triton::ast::VariableNode*>(node)->getValue());
+        if (it != this->variableNodes.end() && it->second == node)
+          this->variableNodes.erase(it);
+      }
+
+      this->pinnedNodes.erase(node);
+    }
+
+
     void AstGarbageCollector::freeAllAstNodes(void) {
-      for (auto it = this->allocatedNodes.begin(); it != this->allocatedNodes.end(); it++)
-        delete *it;
+      /* Opened epochs stay opened but become empty */
+      this->clearAstDictionaries();
+
+      for (auto epoch = this->epochs.begin(); epoch != this->epochs.end(); epoch++) {
+        for (auto it = epoch->begin(); it != epoch->end(); it++)
+          delete *it;
+        epoch->clear();
+      }
 
+      this->pinnedNodes.clear();
       this->variableNodes.clear();
-      this->allocatedNodes.clear();
+    }
+
+
+    void AstGarbageCollector::keepSharedAstNodes(std::set<triton::ast::AbstractNode*>& nodes, const std::vector<triton::ast::AbstractNode*>& roots) {
+      std::vector<triton::ast::AbstractNode*>& current = this->epochs.back();
+      std::vector<triton::ast::AbstractNode*> worklist(roots);
+
+      for (auto it = current.begin(); it != current.end(); it++)
+        (*it)->setMarked(true);
+
+      /*
+       * A node is still used if it has been allocated before the current epoch (it
+       * may be the AST of any expression), if it is pinned, if it is a recorded
+       * variable or if one of its parents is not freed.
+       */
+      for (auto it = nodes.begin(); it != nodes.end(); it++) {
+        triton::ast::AbstractNode* node = *it;
+
+        if (!node->isMarked() || this->pinnedNodes.find(node) != this->pinnedNodes.end()) {
+          worklist.push_back(node);
+          continue;
+        }
+
+        if (node->getKind() == triton::ast::VARIABLE_NODE && this->getAstVariableNode(reinterpret_cast<triton::ast::VariableNode*>(node)->getValue()) == node) {
+          worklist.push_back(node);
+          continue;
+        }
+
+        std::set<triton::ast::AbstractNode*>& parents = node->getParents();
+        for (auto parent = parents.begin(); parent != parents.end(); parent++) {
+          if (nodes.find(*parent) == nodes.end()) {
+            worklist.push_back(node);
+            break;
+          }
+        }
+      }
+
+      for (auto it = current.begin(); it != current.end(); it++)
+        (*it)->setMarked(false);
+
+      /* The childs of a kept node are kept too */
+      while (!worklist.empty()) {
+        triton::ast::AbstractNode* node = worklist.back();
+        worklist.pop_back();
+
+        if (nodes.erase(node) == 0)
+          continue;
+
+        std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+        worklist.insert(worklist.end(), childs.begin(), childs.end());
+      }
     }
 
 
     void AstGarbageCollector::freeAstNodes(std::set<triton::ast::AbstractNode*>& nodes) {
       std::set<triton::ast::AbstractNode*>::iterator it;
+      triton::usize remaining = 0;
 
-      /* Do not delete AST nodes if the AST_DICTIONARIES optimization is enabled */
+      /* With the AST_DICTIONARIES optimization, nodes are shared and only the ones which are not used anymore are freed */
       if (this->modes->isModeEnabled(triton::modes::AST_DICTIONARIES))
-        return;
+        this->keepSharedAstNodes(nodes);
+
+      remaining = nodes.size();
+
+      /*
+       * Remove nodes from their epochs. Freed nodes have almost always been
+       * allocated during the current epoch, so we start from the last one and
+       * stop as soon as all nodes have been found.
+       */
+      for (auto epoch = this->epochs.rbegin(); epoch != this->epochs.rend() && remaining; epoch++) {
+        triton::usize kept = 0;
+        for (triton::usize index = 0; index < epoch->size(); index++) {
+          if (nodes.find((*epoch)[index]) == nodes.end())
+            (*epoch)[kept++] = (*epoch)[index];
+          else if (remaining)
+            remaining--;
+        }
+        epoch->resize(kept);
+      }
 
+      /* Unlink all nodes before deleting them, a node may be the child of another one */
       for (it = nodes.begin(); it != nodes.end(); it++) {
-        /* Remove the node from the global set */
-        this->allocatedNodes.erase(*it);
+        this->removeFromAstDictionaries(*it);
+        this->unlinkAstNode(*it);
+      }
+
+      for (it = nodes.begin(); it != nodes.end(); it++)
+        delete *it;
+
+      nodes.clear();
+    }
+
+
+    void AstGarbageCollector::beginAstEpoch(void) {
+      this->epochs.push_back(std::vector<triton::ast::AbstractNode*>());
+    }
+
+
+    void AstGarbageCollector::endAstEpoch(void) {
+      if (this->epochs.size() <= 1)
+        throw triton::exceptions::AstGarbageCollector("AstGarbageCollector::endAstEpoch(): There is no opened epoch.");
+
+      std::vector<triton::ast::AbstractNode*>& current = this->epochs[this->epochs.size() - 1];
+      std::vector<triton::ast::AbstractNode*>& parent  = this->epochs[this->epochs.size() - 2];
 
-        /* Remove the node from the global variables map */
-        if ((*it)->getKind() == triton::ast::VARIABLE_NODE)
-          this->variableNodes.erase(reinterpret_cast<triton::ast::VariableNode*>(*it)->getValue());
+      /* Merge the current epoch into the enclosing one */
+      if (parent.empty())
+        parent.swap(current);
+      else
+        parent.insert(parent.end(), current.begin(), current.end());
 
-        /* Delete the node */
+      this->epochs.pop_back();
+    }
+
+
+    void AstGarbageCollector::freeAstEpoch(const std::vector<triton::ast::AbstractNode*>& roots) {
+      if (this->epochs.size() <= 1)
+        throw triton::exceptions::AstGarbageCollector("AstGarbageCollector::freeAstEpoch(): There is no opened epoch.");
+
+      std::vector<triton::ast::AbstractNode*>& current = this->epochs[this->epochs.size() - 1];
+      std::vector<triton::ast::AbstractNode*>& parent  = this->epochs[this->epochs.size() - 2];
+      std::set<triton::ast::AbstractNode*> nodes(current.begin(), current.end());
+
+      /* Nodes still used (e.g: pinned by a Python object or a child of an older node) are not freed */
+      this->keepSharedAstNodes(nodes, roots);
+
+      /* Kept nodes are merged into the enclosing epoch */
+      for (auto it = current.begin(); it != current.end(); it++) {
+        if (nodes.find(*it) == nodes.end())
+          parent.push_back(*it);
+      }
+
+      /* Unlink all nodes before deleting them, a node may be the child of another one */
+      for (auto it = nodes.begin(); it != nodes.end(); it++) {
+        this->removeFromAstDictionaries(*it);
+        this->unlinkAstNode(*it);
+      }
+
+      for (auto it = nodes.begin(); it != nodes.end(); it++)
         delete *it;
+
+      this->epochs.pop_back();
+    }
+
+
+    triton::usize AstGarbageCollector::getAstEpochsDepth(void) const {
+      return this->epochs.size() - 1;
+    }
+
+
+    triton::usize AstGarbageCollector::freeUnreachableAstNodes(const std::vector<triton::ast::AbstractNode*>& roots) {
+      std::vector<triton::ast::AbstractNode*> worklist(roots);
+      std::vector<triton::ast::AbstractNode*> marked;
+      std::vector<triton::ast::AbstractNode*> dead;
+      triton::usize alive = 0;
+
+      for (auto it = this->variableNodes.begin(); it != this->variableNodes.end(); it++)
+        worklist.push_back(it->second);
+
+      for (auto it = this->pinnedNodes.begin(); it != this->pinnedNodes.end(); it++)
+        worklist.push_back(it->first);
+
+      /* Mark all reachable nodes */
+      while (!worklist.empty()) {
+        triton::ast::AbstractNode* node = worklist.back();
+        worklist.pop_back();
+
+        if (node == nullptr || node->isMarked())
+          continue;
+
+        node->setMarked(true);
+        marked.push_back(node);
+
+        std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+        worklist.insert(worklist.end(), childs.begin(), childs.end());
+
+        if (node->getKind() == triton::ast::REFERENCE_NODE) {
+          triton::usize id = reinterpret_cast<triton::ast::ReferenceNode*>(node)->getValue();
+          if (triton::api.isSymbolicExpressionIdExists(id))
+            worklist.push_back(triton::api.getAstFromId(id));
+        }
       }
 
-      nodes.clear();
+      /* Sweep dictionaries, they only index nodes owned by epochs */
+      this->sweepAstDictionaries();
+
+      /* Sweep epochs */
+      for (auto epoch = this->epochs.begin(); epoch != this->epochs.end(); epoch++) {
+        triton::usize kept = 0;
+        for (triton::usize index = 0; index < epoch->size(); index++) {
+          if ((*epoch)[index]->isMarked())
+            (*epoch)[kept++] = (*epoch)[index];
+          else
+            dead.push_back((*epoch)[index]);
+        }
+        epoch->resize(kept);
+        alive += kept;
+      }
+
+      for (auto it = marked.begin(); it != marked.end(); it++)
+        (*it)->setMarked(false);
+
+      /* Unlink all nodes before deleting them, a node may be the child of another one */
+      for (auto it = dead.begin(); it != dead.end(); it++)
+        this->unlinkAstNode(*it);
+
+      for (auto it = dead.begin(); it != dead.end(); it++)
+        delete *it;
+
+      /* The next collection occurs when the number of nodes has doubled */
+      this->recordedNodes       = 0;
+      this->collectionThreshold = std::max(AST_GARBAGE_COLLECTION_THRESHOLD, alive);
+
+      return dead.size();
+    }
+
+
+    bool AstGarbageCollector::isAstCollectionRequired(void) const {
+      return (this->recordedNodes >= this->collectionThreshold);
+    }
+
+
+    void AstGarbageCollector::pinAstNode(triton::ast::AbstractNode* node) {
+      this->pinnedNodes[node]++;
+    }
+
+
+    void AstGarbageCollector::unpinAstNode(triton::ast::AbstractNode* node) {
+      auto it = this->pinnedNodes.find(node);
+
+      if (it == this->pinnedNodes.end())
+        return;
+
+      if (--it->second == 0)
+        this->pinnedNodes.erase(it);
+    }
+
+
+    std::vector<triton::ast::AbstractNode*> AstGarbageCollector::getPinnedAstNodes(void) const {
+      std::vector<triton::ast::AbstractNode*> ret;
+
+      for (auto it = this->pinnedNodes.begin(); it != this->pinnedNodes.end(); it++)
+        ret.push_back(it->first);
+
+      return ret;
     }
 
 
     void AstGarbageCollector::extractUniqueAstNodes(std::set<triton::ast::AbstractNode*>& uniqueNodes, triton::ast::AbstractNode* root) const {
-      std::vector<triton::ast::AbstractNode*>::const_iterator it;
-      uniqueNodes.insert(root);
-      for (it = root->getChilds().begin(); it != root->getChilds().end(); it++)
-        this->extractUniqueAstNodes(uniqueNodes, *it);
+      std::vector<triton::ast::AbstractNode*> worklist(1, root);
+
+      /* Iterative walk, nodes already in the set (e.g: from a previous call) are not visited again */
+      while (!worklist.empty()) {
+        triton::ast::AbstractNode* node = worklist.back();
+        worklist.pop_back();
+
+        if (!uniqueNodes.insert(node).second)
+          continue;
+
+        std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+        worklist.insert(worklist.end(), childs.begin(), childs.end());
+      }
     }
 
 
@@ -102,10 +379,10 @@ namespace triton {
         if (ret != nullptr)
           return ret;
       }
-      else {
-        /* Record the node */
-        this->allocatedNodes.insert(node);
-      }
+
+      /* Record the node into the current epoch */
+      this->epochs.back().push_back(node);
+      this->recordedNodes++;
       return node;
     }
 
@@ -116,6 +393,11 @@ namespace triton {
 
 
     const std::set<triton::ast::AbstractNode*>& AstGarbageCollector::getAllocatedAstNodes(void) const {
+      this->allocatedNodes.clear();
+
+      for (auto epoch = this->epochs.begin(); epoch != this->epochs.end(); epoch++)
+        this->allocatedNodes.insert(epoch->begin(), epoch->end());
+
       return this->allocatedNodes;
     }
 
@@ -134,11 +416,19 @@ namespace triton {
 
     void AstGarbageCollector::setAllocatedAstNodes(const std::set<triton::ast::AbstractNode*>& nodes) {
       /* Remove unused nodes before the assignation */
-      for (auto it = this->allocatedNodes.begin(); it != this->allocatedNodes.end(); it++) {
-        if (nodes.find(*it) == nodes.end())
-          delete *it;
+      for (auto epoch = this->epochs.begin(); epoch != this->epochs.end(); epoch++) {
+        for (auto it = epoch->begin(); it != epoch->end(); it++) {
+          if (nodes.find(*it) == nodes.end()) {
+            this->removeFromAstDictionaries(*it);
+            this->pinnedNodes.erase(*it);
+            delete *it;
+          }
+        }
+        epoch->clear();
       }
-      this->allocatedNodes = nodes;
+
+      /* Opened epochs stay opened, nodes are recorded into the first one */
+      this->epochs.front().assign(nodes.begin(), nodes.end());
     }
 
 
@@ -146,6 +436,19 @@ namespace triton {
       this->variableNodes = nodes;
     }
 
+
+    AstEpochScope::AstEpochScope(AstGarbageCollector* astGarbageCollector) {
+      this->astGarbageCollector = astGarbageCollector;
+      this->astGarbageCollector->beginAstEpoch();
+      this->depth = this->astGarbageCollector->getAstEpochsDepth();
+    }
+
+
+    AstEpochScope::~AstEpochScope() {
+      /* Epochs opened inside the scope and not closed are closed too */
+      while (this->astGarbageCollector->getAstEpochsDepth() >= this->depth)
+        this->astGarbageCollector->endAstEpoch();
+    }
+
   }; /* ast namespace */
 }; /*triton namespace */
-
@@ -0,0 +1,627 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <algorithm>
+
+#include <triton/api.hpp>
+#include <triton/ast.hpp>
+#include <triton/astKnownBits.hpp>
+#include <triton/astOperations.hpp>
+
+
+
+namespace triton {
+  namespace ast {
+
+    /* Returns the mask of a value of `size` bits */
+    static triton::uint512 getMask(triton::uint32 size) {
+      return (triton::uint512(1) << size) - 1;
+    }
+
+
+    /* Returns the value of a decimal parameter (e.g: the high bit of an extract) */
+    static triton::uint32 getParameter(AbstractNode* node) {
+      return reinterpret_cast<DecimalNode*>(node)->getValue().convert_to<triton::uint32>();
+    }
+
+
+    /* Returns the number of low bits set in `value` */
+    static triton::uint32 countTrailingOnes(const triton::uint512& value, triton::uint32 size) {
+      triton::uint512 inverse = ~value & getMask(size);
+      if (inverse == 0)
+        return size;
+      return boost::multiprecision::lsb(inverse);
+    }
+
+
+    /* Returns the number of high bits set in `value` */
+    static triton::uint32 countLeadingOnes(const triton::uint512& value, triton::uint32 size) {
+      triton::uint512 inverse = ~value & getMask(size);
+      if (inverse == 0)
+        return size;
+      return size - 1 - boost::multiprecision::msb(inverse);
+    }
+
+
+    /* Returns a boolean fact: 1 if the condition always holds, 0 if it never holds, unknown otherwise */
+    static KnownBits getBoolean(bool always, bool never) {
+      if (always)
+        return KnownBits(1, 1);
+      if (never)
+        return KnownBits(1, 0);
+      return KnownBits(1);
+    }
+
+
+    /* Returns the interval of the signed values */
+    static void getSignedRange(const KnownBits& x, triton::sint512& lo, triton::sint512& hi) {
+      triton::uint32 size = x.getBitvectorSize();
+      triton::sint512 two = triton::sint512(1) << size;
+
+      /* The sign bit is known to be zero */
+      if ((x.getKnownZeros() >> (size-1)) & 1) {
+        lo = x.getMin().convert_to<triton::sint512>();
+        hi = x.getMax().convert_to<triton::sint512>();
+      }
+      /* The sign bit is known to be one */
+      else if ((x.getKnownOnes() >> (size-1)) & 1) {
+        lo = x.getMin().convert_to<triton::sint512>() - two;
+        hi = x.getMax().convert_to<triton::sint512>() - two;
+      }
+      else {
+        lo = -(two >> 1);
+        hi = (two >> 1) - 1;
+      }
+    }
+
+
+    static KnownBits bvand(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      return KnownBits(size, a.getKnownZeros() | b.getKnownZeros(), a.getKnownOnes() & b.getKnownOnes(), 0, std::min(a.getMax(), b.getMax()));
+    }
+
+
+    static KnownBits bvor(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      return KnownBits(size, a.getKnownZeros() & b.getKnownZeros(), a.getKnownOnes() | b.getKnownOnes(), std::max(a.getMin(), b.getMin()), getMask(size));
+    }
+
+
+    static KnownBits bvxor(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      triton::uint512 zeros = (a.getKnownZeros() & b.getKnownZeros()) | (a.getKnownOnes() & b.getKnownOnes());
+      triton::uint512 ones  = (a.getKnownZeros() & b.getKnownOnes()) | (a.getKnownOnes() & b.getKnownZeros());
+      return KnownBits(size, zeros, ones, 0, getMask(size));
+    }
+
+
+    static KnownBits bvnot(const KnownBits& a, triton::uint32 size) {
+      triton::uint512 mask = getMask(size);
+      return KnownBits(size, a.getKnownOnes(), a.getKnownZeros(), mask - a.getMax(), mask - a.getMin());
+    }
+
+
+    /* The known bits of an addition are computed from the bounds of the carries */
+    static KnownBits bvadd(const KnownBits& a, const KnownBits& b, bool carry, triton::uint32 size) {
+      triton::uint512 mask           = getMask(size);
+      triton::uint512 sumZero        = ((~a.getKnownZeros() & mask) + (~b.getKnownZeros() & mask) + carry) & mask;
+      triton::uint512 sumOne         = (a.getKnownOnes() + b.getKnownOnes() + carry) & mask;
+      triton::uint512 carryKnownZero = ~(sumZero ^ a.getKnownZeros() ^ b.getKnownZeros()) & mask;
+      triton::uint512 carryKnownOne  = (sumOne ^ a.getKnownOnes() ^ b.getKnownOnes()) & mask;
+      triton::uint512 known          = (a.getKnownZeros() | a.getKnownOnes()) & (b.getKnownZeros() | b.getKnownOnes()) & (carryKnownZero | carryKnownOne);
+      triton::uint512 lo             = 0;
+      triton::uint512 hi             = mask;
+
+      /* The interval holds if all the sums overflow the same number of times */
+      if (size < 512) {
+        triton::uint512 low  = a.getMin() + b.getMin() + carry;
+        triton::uint512 high = a.getMax() + b.getMax() + carry;
+        if (high <= mask) {
+          lo = low;
+          hi = high;
+        }
+        else if (low > mask) {
+          lo = low - mask - 1;
+          hi = high - mask - 1;
+        }
+      }
+
+      return KnownBits(size, ~sumZero & known, sumOne & known, lo, hi);
+    }
+
+
+    static KnownBits bvsub(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      return bvadd(a, bvnot(b, size), true, size);
+    }
+
+
+    static KnownBits bvmul(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      triton::uint512 mask  = getMask(size);
+      triton::uint32 tz     = std::min(size, countTrailingOnes(a.getKnownZeros(), size) + countTrailingOnes(b.getKnownZeros(), size));
+      triton::uint32 known  = std::min(countTrailingOnes(a.getKnownZeros() | a.getKnownOnes(), size), countTrailingOnes(b.getKnownZeros() | b.getKnownOnes(), size));
+      triton::uint512 low   = (a.getKnownOnes() * b.getKnownOnes()) & getMask(known);
+      triton::uint512 zeros = getMask(tz) | (~low & getMask(known));
+      triton::uint512 ones  = low;
+
+      /* The low bits of a product only depend on the low bits of the operands, the interval holds without overflow */
+      if (size < 256 && a.getMax() * b.getMax() <= mask)
+        return KnownBits(size, zeros, ones, a.getMin() * b.getMin(), a.getMax() * b.getMax());
+
+      return KnownBits(size, zeros, ones, 0, mask);
+    }
+
+
+    static KnownBits bvudiv(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      triton::uint512 mask = getMask(size);
+
+      /* A division by zero is the mask */
+      if (b.getMax() == 0)
+        return KnownBits(size, mask);
+
+      return KnownBits(size, 0, 0, a.getMin() / b.getMax(), b.getMin() == 0 ? mask : a.getMax() / b.getMin());
+    }
+
+
+    static KnownBits bvurem(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      /* A remainder by zero or by a greater value is the dividend */
+      if (b.getMax() == 0 || a.getMax() < b.getMin())
+        return a;
+
+      return KnownBits(size, 0, 0, 0, b.getMin() == 0 ? a.getMax() : std::min(a.getMax(), b.getMax() - 1));
+    }
+
+
+    static KnownBits bvshl(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      triton::uint512 mask = getMask(size);
+
+      if (b.getMin() >= size)
+        return KnownBits(size, 0);
+
+      triton::uint32 shift = b.getMin().convert_to<triton::uint32>();
+
+      /* A constant shift moves the known bits */
+      if (b.isConstant()) {
+        triton::uint512 zeros = ((a.getKnownZeros() << shift) | getMask(shift)) & mask;
+        triton::uint512 ones  = (a.getKnownOnes() << shift) & mask;
+        if ((a.getMax() >> (size - shift)) == 0)
+          return KnownBits(size, zeros, ones, a.getMin() << shift, a.getMax() << shift);
+        return KnownBits(size, zeros, ones, 0, mask);
+      }
+
+      return KnownBits(size, getMask(std::min(size, countTrailingOnes(a.getKnownZeros(), size) + shift)), 0, 0, mask);
+    }
+
+
+    static KnownBits bvlshr(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      triton::uint512 mask = getMask(size);
+
+      if (b.getMin() >= size)
+        return KnownBits(size, 0);
+
+      triton::uint32 shift = b.getMin().convert_to<triton::uint32>();
+      triton::uint512 lo   = b.getMax() >= size ? triton::uint512(0) : (a.getMin() >> b.getMax().convert_to<triton::uint32>());
+      triton::uint512 hi   = a.getMax() >> shift;
+
+      /* A constant shift moves the known bits */
+      if (b.isConstant())
+        return KnownBits(size, (a.getKnownZeros() >> shift) | (mask & ~(mask >> shift)), a.getKnownOnes() >> shift, lo, hi);
+
+      triton::uint32 lz = std::min(size, countLeadingOnes(a.getKnownZeros(), size) + shift);
+      return KnownBits(size, mask & ~(mask >> lz), 0, lo, hi);
+    }
+
+
+    static KnownBits bvashr(const KnownBits& a, const KnownBits& b, triton::uint32 size) {
+      triton::uint512 mask = getMask(size);
+
+      if (!b.isConstant())
+        return KnownBits(size);
+
+      triton::uint32 shift   = b.getMin() >= size ? size - 1 : b.getMin().convert_to<triton::uint32>();
+      triton::uint512 high   = mask & ~(mask >> shift);
+      bool signZero          = ((a.getKnownZeros() >> (size-1)) & 1) != 0;
+      bool signOne           = ((a.getKnownOnes() >> (size-1)) & 1) != 0;
+      triton::uint512 zeros  = (a.getKnownZeros() >> shift) | (signZero ? high : triton::uint512(0));
+      triton::uint512 ones   = (a.getKnownOnes() >> shift) | (signOne ? high : triton::uint512(0));
+
+      if (signZero)
+        return KnownBits(size, zeros, ones, a.getMin() >> shift, a.getMax() >> shift);
+
+      if (signOne)
+        return KnownBits(size, zeros, ones, (a.getMin() >> shift) | high, (a.getMax() >> shift) | high);
+
+      return KnownBits(size, zeros, ones, 0, mask);
+    }
+
+
+    static KnownBits bvrol(const KnownBits& a, triton::uint32 rot, triton::uint32 size) {
+      triton::uint512 mask = getMask(size);
+
+      if (rot == 0)
+        return a;
+
+      return KnownBits(size,
+                       ((a.getKnownZeros() << rot) | (a.getKnownZeros() >> (size - rot))) & mask,
+                       ((a.getKnownOnes() << rot) | (a.getKnownOnes() >> (size - rot))) & mask,
+                       0, mask);
+    }
+
+
+    static KnownBits bvult(const KnownBits& a, const KnownBits& b) {
+      return getBoolean(a.getMax() < b.getMin(), a.getMin() >= b.getMax());
+    }
+
+
+    static KnownBits bvule(const KnownBits& a, const KnownBits& b) {
+      return getBoolean(a.getMax() <= b.getMin(), a.getMin() > b.getMax());
+    }
+
+
+    static KnownBits bvslt(const KnownBits& a, const KnownBits& b) {
+      triton::sint512 alo, ahi, blo, bhi;
+      getSignedRange(a, alo, ahi);
+      getSignedRange(b, blo, bhi);
+      return getBoolean(ahi < blo, alo >= bhi);
+    }
+
+
+    static KnownBits bvsle(const KnownBits& a, const KnownBits& b) {
+      triton::sint512 alo, ahi, blo, bhi;
+      getSignedRange(a, alo, ahi);
+      getSignedRange(b, blo, bhi);
+      return getBoolean(ahi <= blo, alo > bhi);
+    }
+
+
+    static KnownBits equal(const KnownBits& a, const KnownBits& b) {
+      bool different = ((a.getKnownOnes() & b.getKnownZeros()) | (a.getKnownZeros() & b.getKnownOnes())) != 0;
+      bool disjoint  = (a.getMax() < b.getMin() || b.getMax() < a.getMin());
+      return getBoolean(a.isConstant() && b.isConstant() && a.getMin() == b.getMin(), different || disjoint);
+    }
+
+
+    static KnownBits lnot(const KnownBits& a) {
+      return getBoolean(a.isFalse(), a.isTrue());
+    }
+
+
+    static bool isPositive(const KnownBits& a) {
+      return ((a.getKnownZeros() >> (a.getBitvectorSize()-1)) & 1) != 0;
+    }
+
+
+    KnownBits::KnownBits(triton::uint32 size) {
+      this->size  = size;
+      this->zeros = 0;
+      this->ones  = 0;
+      this->min   = 0;
+      this->max   = getMask(size);
+    }
+
+
+    KnownBits::KnownBits(triton::uint32 size, const triton::uint512& value) {
+      triton::uint512 mask = getMask(size);
+
+      this->size  = size;
+      this->ones  = value & mask;
+      this->zeros = ~value & mask;
+      this->min   = value & mask;
+      this->max   = value & mask;
+    }
+
+
+    KnownBits::KnownBits(triton::uint32 size, const triton::uint512& zeros, const triton::uint512& ones, const triton::uint512& min, const triton::uint512& max) {
+      this->size  = size;
+      this->zeros = zeros;
+      this->ones  = ones;
+      this->min   = min;
+      this->max   = max;
+      this->normalize();
+    }
+
+
+    void KnownBits::normalize(void) {
+      triton::uint512 mask = getMask(this->size);
+      triton::uint512 diff = 0;
+
+      this->zeros &= mask;
+      this->ones  &= mask;
+      this->min   &= mask;
+      this->max   &= mask;
+
+      /* The interval is bounded by the known bits */
+      if (this->min < this->ones)
+        this->min = this->ones;
+
+      if (this->max > (~this->zeros & mask))
+        this->max = (~this->zeros & mask);
+
+      /* The tree has no value (e.g: dead branch), nothing more to learn */
+      if (this->min > this->max)
+        return;
+
+      /* The high bits shared by the bounds are known */
+      diff = this->min ^ this->max;
+      if (diff == 0) {
+        this->ones  = this->min;
+        this->zeros = ~this->min & mask;
+        return;
+      }
+
+      diff = mask & ~getMask(boost::multiprecision::msb(diff) + 1);
+      this->ones  |= this->min & diff;
+      this->zeros |= ~this->min & diff;
+    }
+
+
+    triton::uint32 KnownBits::getBitvectorSize(void) const {
+      return this->size;
+    }
+
+
+    const triton::uint512& KnownBits::getKnownZeros(void) const {
+      return this->zeros;
+    }
+
+
+    const triton::uint512& KnownBits::getKnownOnes(void) const {
+      return this->ones;
+    }
+
+
+    const triton::uint512& KnownBits::getMin(void) const {
+      return this->min;
+    }
+
+
+    const triton::uint512& KnownBits::getMax(void) const {
+      return this->max;
+    }
+
+
+    bool KnownBits::isConstant(void) const {
+      return (this->min == this->max);
+    }
+
+
+    bool KnownBits::isTrue(void) const {
+      return (this->min != 0);
+    }
+
+
+    bool KnownBits::isFalse(void) const {
+      return (this->max == 0);
+    }
+
+
+    KnownBits KnownBits::compute(AbstractNode* node) {
+      std::vector<AbstractNode*>& childs = node->getChilds();
+      triton::uint32 size                = node->getBitvectorSize();
+
+      /* A tree without variable has a single value */
+      if (!node->isSymbolized())
+        return KnownBits(size, node->evaluate());
+
+      /* Operands which have a single value are folded by the concrete semantics of the node */
+      if (hasOperationSemantics(node->getKind())) {
+        std::vector<triton::uint512> operands;
+        bool constant = true;
+
+        for (AbstractNode* child : childs) {
+          if (isOperationParameter(child))
+            continue;
+          const KnownBits& bits = child->getKnownBits();
+          if (!bits.isConstant()) {
+            constant = false;
+            break;
+          }
+          operands.push_back(bits.getMin());
+        }
+
+        if (constant)
+          return KnownBits(size, evaluateWideOperation(node, operands.data()));
+      }
+
+      switch (node->getKind()) {
+        case ASSERT_NODE:
+          return childs[0]->getKnownBits();
+
+        case BVADD_NODE:
+          return bvadd(childs[0]->getKnownBits(), childs[1]->getKnownBits(), false, size);
+
+        case BVAND_NODE:
+          return bvand(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVASHR_NODE:
+          return bvashr(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVLSHR_NODE:
+          return bvlshr(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVMUL_NODE:
+          return bvmul(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVNAND_NODE:
+          return bvnot(bvand(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size), size);
+
+        case BVNEG_NODE:
+          return bvsub(KnownBits(size, 0), childs[0]->getKnownBits(), size);
+
+        case BVNOR_NODE:
+          return bvnot(bvor(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size), size);
+
+        case BVNOT_NODE:
+          return bvnot(childs[0]->getKnownBits(), size);
+
+        case BVOR_NODE:
+          return bvor(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVROL_NODE:
+          return bvrol(childs[1]->getKnownBits(), getParameter(childs[0]) % size, size);
+
+        case BVROR_NODE:
+          return bvrol(childs[1]->getKnownBits(), (size - (getParameter(childs[0]) % size)) % size, size);
+
+        /* Signed divisions of positive values are unsigned divisions */
+        case BVSDIV_NODE:
+          if (isPositive(childs[0]->getKnownBits()) && isPositive(childs[1]->getKnownBits()))
+            return bvudiv(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+          return KnownBits(size);
+
+        case BVSMOD_NODE:
+        case BVSREM_NODE:
+          if (isPositive(childs[0]->getKnownBits()) && isPositive(childs[1]->getKnownBits()))
+            return bvurem(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+          return KnownBits(size);
+
+        case BVSGE_NODE:
+          return bvsle(childs[1]->getKnownBits(), childs[0]->getKnownBits());
+
+        case BVSGT_NODE:
+          return bvslt(childs[1]->getKnownBits(), childs[0]->getKnownBits());
+
+        case BVSHL_NODE:
+          return bvshl(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVSLE_NODE:
+          return bvsle(childs[0]->getKnownBits(), childs[1]->getKnownBits());
+
+        case BVSLT_NODE:
+          return bvslt(childs[0]->getKnownBits(), childs[1]->getKnownBits());
+
+        case BVSUB_NODE:
+          return bvsub(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVUDIV_NODE:
+          return bvudiv(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVUGE_NODE:
+          return bvule(childs[1]->getKnownBits(), childs[0]->getKnownBits());
+
+        case BVUGT_NODE:
+          return bvult(childs[1]->getKnownBits(), childs[0]->getKnownBits());
+
+        case BVULE_NODE:
+          return bvule(childs[0]->getKnownBits(), childs[1]->getKnownBits());
+
+        case BVULT_NODE:
+          return bvult(childs[0]->getKnownBits(), childs[1]->getKnownBits());
+
+        case BVUREM_NODE:
+          return bvurem(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case BVXNOR_NODE:
+          return bvnot(bvxor(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size), size);
+
+        case BVXOR_NODE:
+          return bvxor(childs[0]->getKnownBits(), childs[1]->getKnownBits(), size);
+
+        case CONCAT_NODE: {
+          triton::uint512 zeros = 0;
+          triton::uint512 ones  = 0;
+          triton::uint512 lo    = 0;
+          triton::uint512 hi    = 0;
+
+          /* The high part dominates the order, so the bounds are the concatenations of the bounds */
+          for (AbstractNode* child : childs) {
+            const KnownBits& bits = child->getKnownBits();
+            triton::uint32 shift  = child->getBitvectorSize();
+            zeros = (zeros << shift) | bits.getKnownZeros();
+            ones  = (ones << shift) | bits.getKnownOnes();
+            lo    = (lo << shift) | bits.getMin();
+            hi    = (hi << shift) | bits.getMax();
+          }
+
+          return KnownBits(size, zeros, ones, lo, hi);
+        }
+
+        case DISTINCT_NODE:
+          return lnot(equal(childs[0]->getKnownBits(), childs[1]->getKnownBits()));
+
+        case EQUAL_NODE:
+          return equal(childs[0]->getKnownBits(), childs[1]->getKnownBits());
+
+        case EXTRACT_NODE: {
+          const KnownBits& bits = childs[2]->getKnownBits();
+          triton::uint32 high   = getParameter(childs[0]);
+          triton::uint32 low    = getParameter(childs[1]);
+
+          /* Without bits above the extraction, the order is kept */
+          if ((bits.getMax() >> (high + 1)) == 0)
+            return KnownBits(size, bits.getKnownZeros() >> low, bits.getKnownOnes() >> low, bits.getMin() >> low, bits.getMax() >> low);
+
+          return KnownBits(size, bits.getKnownZeros() >> low, bits.getKnownOnes() >> low, 0, getMask(size));
+        }
+
+        case ITE_NODE: {
+          const KnownBits& cond = childs[0]->getKnownBits();
+          const KnownBits& a    = childs[1]->getKnownBits();
+          const KnownBits& b    = childs[2]->getKnownBits();
+
+          if (cond.isTrue())
+            return a;
+
+          if (cond.isFalse())
+            return b;
+
+          return KnownBits(size,
+                           a.getKnownZeros() & b.getKnownZeros(),
+                           a.getKnownOnes() & b.getKnownOnes(),
+                           std::min(a.getMin(), b.getMin()),
+                           std::max(a.getMax(), b.getMax()));
+        }
+
+        case LAND_NODE: {
+          const KnownBits& a = childs[0]->getKnownBits();
+          const KnownBits& b = childs[1]->getKnownBits();
+          return getBoolean(a.isTrue() && b.isTrue(), a.isFalse() || b.isFalse());
+        }
+
+        case LET_NODE:
+          return childs[2]->getKnownBits();
+
+        case LNOT_NODE:
+          return lnot(childs[0]->getKnownBits());
+
+        case LOR_NODE: {
+          const KnownBits& a = childs[0]->getKnownBits();
+          const KnownBits& b = childs[1]->getKnownBits();
+          return getBoolean(a.isTrue() || b.isTrue(), a.isFalse() && b.isFalse());
+        }
+
+        case REFERENCE_NODE: {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(node)->getValue();
+          if (triton::api.isSymbolicExpressionIdExists(id))
+            return triton::api.getAstFromId(id)->getKnownBits();
+          return KnownBits(size);
+        }
+
+        case SX_NODE: {
+          const KnownBits& bits = childs[1]->getKnownBits();
+          triton::uint32 csize  = childs[1]->getBitvectorSize();
+          triton::uint512 high  = getMask(size) & ~getMask(csize);
+
+          if (isPositive(bits))
+            return KnownBits(size, bits.getKnownZeros() | high, bits.getKnownOnes(), bits.getMin(), bits.getMax());
+
+          if ((bits.getKnownOnes() >> (csize-1)) & 1)
+            return KnownBits(size, bits.getKnownZeros(), bits.getKnownOnes() | high, bits.getMin() | high, bits.getMax() | high);
+
+          return KnownBits(size, bits.getKnownZeros(), bits.getKnownOnes(), 0, getMask(size));
+        }
+
+        case ZX_NODE: {
+          const KnownBits& bits = childs[1]->getKnownBits();
+          triton::uint512 high  = getMask(size) & ~getMask(childs[1]->getBitvectorSize());
+          return KnownBits(size, bits.getKnownZeros() | high, bits.getKnownOnes(), bits.getMin(), bits.getMax());
+        }
+
+        /* Variables and unknown nodes may take any value */
+        default:
+          return KnownBits(size);
+      }
+    }
+
+  }; /* ast namespace */
+}; /* triton namespace */
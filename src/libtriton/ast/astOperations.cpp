@@ -0,0 +1,837 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <vector>
+
+#include <triton/astOperations.hpp>
+#include <triton/exceptions.hpp>
+
+
+
+namespace triton {
+  namespace ast {
+
+    /* Kinds of node are lower than this value, see triton::ast::kind_e */
+    const triton::uint32 OPERATION_TABLE_SIZE = 256;
+
+
+    /* Returns the mask of a value of `size` bits */
+    static triton::uint512 getMask(triton::uint32 size) {
+      return (triton::uint512(1) << size) - 1;
+    }
+
+
+    /* Returns the value of a decimal parameter (e.g: the high bit of an extract) */
+    static triton::uint32 getParameter(AbstractNode* node) {
+      return reinterpret_cast<DecimalNode*>(node)->getValue().convert_to<triton::uint32>();
+    }
+
+
+    /* Sign extends a value of `size` bits to 64 bits */
+    static triton::sint64 toSigned64(triton::uint64 value, triton::uint32 size) {
+      return static_cast<triton::sint64>(value << (64 - size)) >> (64 - size);
+    }
+
+
+    /* Returns a value of `size` bits as a signed integer */
+    static triton::sint512 toSigned(const triton::uint512& value, triton::uint32 size) {
+      triton::sint512 ret = value;
+
+      if ((value >> (size-1)) & 1) {
+        ret = -1;
+        ret = ((ret << size) | value);
+      }
+
+      return ret;
+    }
+
+
+    /* Returns the two's complement of a signed integer on `size` bits */
+    static triton::uint512 fromSigned(const triton::sint512& value, triton::uint32 size) {
+      if (value < 0)
+        return getMask(size) - (-value - 1).convert_to<triton::uint512>();
+      return value.convert_to<triton::uint512>() & getMask(size);
+    }
+
+
+    static void narrowBvadd(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = (a[i] + b[i]) & info.mask;
+    }
+
+
+    static void narrowBvand(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] & b[i];
+    }
+
+
+    static void narrowBvashr(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = static_cast<triton::uint64>(toSigned64(a[i], info.size) >> (b[i] >= info.size ? info.size - 1 : b[i])) & info.mask;
+    }
+
+
+    static void narrowBvlshr(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = b[i] >= 64 ? 0 : (a[i] >> b[i]);
+    }
+
+
+    static void narrowBvmul(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = (a[i] * b[i]) & info.mask;
+    }
+
+
+    static void narrowBvnand(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = ~(a[i] & b[i]) & info.mask;
+    }
+
+
+    static void narrowBvneg(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = (0 - a[i]) & info.mask;
+    }
+
+
+    static void narrowBvnor(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = ~(a[i] | b[i]) & info.mask;
+    }
+
+
+    static void narrowBvnot(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = ~a[i] & info.mask;
+    }
+
+
+    static void narrowBvor(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] | b[i];
+    }
+
+
+    static void narrowBvrol(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = info.parameter == 0 ? a[i] : (((a[i] << info.parameter) | (a[i] >> (info.size - info.parameter))) & info.mask);
+    }
+
+
+    static void narrowBvror(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = info.parameter == 0 ? a[i] : (((a[i] >> info.parameter) | (a[i] << (info.size - info.parameter))) & info.mask);
+    }
+
+
+    static void narrowBvsdiv(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++) {
+        triton::sint64 op1 = toSigned64(a[i], info.size);
+        triton::sint64 op2 = toSigned64(b[i], info.size);
+        /* The quotient of the lowest value by -1 overflows, it is the negation */
+        if (op2 == 0)
+          r[i] = op1 < 0 ? 1 : info.mask;
+        else if (op2 == -1)
+          r[i] = (0 - a[i]) & info.mask;
+        else
+          r[i] = static_cast<triton::uint64>(op1 / op2) & info.mask;
+      }
+    }
+
+
+    static void narrowBvsge(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = toSigned64(a[i], info.operandSize) >= toSigned64(b[i], info.operandSize);
+    }
+
+
+    static void narrowBvsgt(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = toSigned64(a[i], info.operandSize) > toSigned64(b[i], info.operandSize);
+    }
+
+
+    static void narrowBvshl(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = b[i] >= 64 ? 0 : ((a[i] << b[i]) & info.mask);
+    }
+
+
+    static void narrowBvsle(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = toSigned64(a[i], info.operandSize) <= toSigned64(b[i], info.operandSize);
+    }
+
+
+    static void narrowBvslt(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = toSigned64(a[i], info.operandSize) < toSigned64(b[i], info.operandSize);
+    }
+
+
+    static void narrowBvsmod(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++) {
+        triton::sint64 op1 = toSigned64(a[i], info.size);
+        triton::sint64 op2 = toSigned64(b[i], info.size);
+        if (op2 == 0)
+          r[i] = a[i];
+        else if (op2 == -1)
+          r[i] = 0;
+        else {
+          /* The remainder takes the sign of the divisor */
+          triton::sint64 rem = op1 % op2;
+          if (rem != 0 && ((rem < 0) != (op2 < 0)))
+            rem += op2;
+          r[i] = static_cast<triton::uint64>(rem) & info.mask;
+        }
+      }
+    }
+
+
+    static void narrowBvsrem(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++) {
+        triton::sint64 op1 = toSigned64(a[i], info.size);
+        triton::sint64 op2 = toSigned64(b[i], info.size);
+        if (op2 == 0)
+          r[i] = a[i];
+        else if (op2 == -1)
+          r[i] = 0;
+        else
+          r[i] = static_cast<triton::uint64>(op1 % op2) & info.mask;
+      }
+    }
+
+
+    static void narrowBvsub(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = (a[i] - b[i]) & info.mask;
+    }
+
+
+    static void narrowBvudiv(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = b[i] == 0 ? info.mask : (a[i] / b[i]);
+    }
+
+
+    static void narrowBvuge(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] >= b[i];
+    }
+
+
+    static void narrowBvugt(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] > b[i];
+    }
+
+
+    static void narrowBvule(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] <= b[i];
+    }
+
+
+    static void narrowBvult(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] < b[i];
+    }
+
+
+    static void narrowBvurem(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = b[i] == 0 ? a[i] : (a[i] % b[i]);
+    }
+
+
+    static void narrowBvxnor(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = ~(a[i] ^ b[i]) & info.mask;
+    }
+
+
+    static void narrowBvxor(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] ^ b[i];
+    }
+
+
+    static void narrowConcat(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = (a[i] << info.parameter) | b[i];
+    }
+
+
+    static void narrowDistinct(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] != b[i];
+    }
+
+
+    static void narrowEqual(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] == b[i];
+    }
+
+
+    static void narrowExtract(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = (a[i] >> info.parameter) & info.mask;
+    }
+
+
+    static void narrowIte(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+      const triton::uint64* c = operands[2];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] ? b[i] : c[i];
+    }
+
+
+    static void narrowLand(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] && b[i];
+    }
+
+
+    static void narrowLnot(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = !a[i];
+    }
+
+
+    static void narrowLor(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+      const triton::uint64* b = operands[1];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i] || b[i];
+    }
+
+
+    static void narrowSx(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = static_cast<triton::uint64>(toSigned64(a[i], info.operandSize)) & info.mask;
+    }
+
+
+    static void narrowZx(triton::uint64* r, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info) {
+      const triton::uint64* a = operands[0];
+
+      for (triton::usize i = 0; i < count; i++)
+        r[i] = a[i];
+    }
+
+
+    static triton::uint512 wideBvadd(const triton::uint512* op, const OperationInfo& info) {
+      return (op[0] + op[1]) & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideBvand(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] & op[1];
+    }
+
+
+    static triton::uint512 wideBvashr(const triton::uint512* op, const OperationInfo& info) {
+      triton::uint512 mask = getMask(info.size);
+      bool sign            = (((op[0] >> (info.size-1)) & 1) != 0);
+
+      if (op[1] >= info.size)
+        return sign ? mask : triton::uint512(0);
+
+      triton::uint32 shift = op[1].convert_to<triton::uint32>();
+      return (op[0] >> shift) | (sign ? (mask & ~(mask >> shift)) : triton::uint512(0));
+    }
+
+
+    static triton::uint512 wideBvlshr(const triton::uint512* op, const OperationInfo& info) {
+      return op[1] >= info.size ? triton::uint512(0) : (op[0] >> op[1].convert_to<triton::uint32>());
+    }
+
+
+    static triton::uint512 wideBvmul(const triton::uint512* op, const OperationInfo& info) {
+      return (op[0] * op[1]) & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideBvnand(const triton::uint512* op, const OperationInfo& info) {
+      return ~(op[0] & op[1]) & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideBvneg(const triton::uint512* op, const OperationInfo& info) {
+      return (~op[0] + 1) & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideBvnor(const triton::uint512* op, const OperationInfo& info) {
+      return ~(op[0] | op[1]) & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideBvnot(const triton::uint512* op, const OperationInfo& info) {
+      return ~op[0] & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideBvor(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] | op[1];
+    }
+
+
+    static triton::uint512 wideBvrol(const triton::uint512* op, const OperationInfo& info) {
+      return info.parameter == 0 ? op[0] : (((op[0] << info.parameter) | (op[0] >> (info.size - info.parameter))) & getMask(info.size));
+    }
+
+
+    static triton::uint512 wideBvror(const triton::uint512* op, const OperationInfo& info) {
+      return info.parameter == 0 ? op[0] : (((op[0] >> info.parameter) | (op[0] << (info.size - info.parameter))) & getMask(info.size));
+    }
+
+
+    static triton::uint512 wideBvsdiv(const triton::uint512* op, const OperationInfo& info) {
+      triton::sint512 op1 = toSigned(op[0], info.size);
+      triton::sint512 op2 = toSigned(op[1], info.size);
+
+      if (op2 == 0)
+        return op1 < 0 ? triton::uint512(1) : getMask(info.size);
+
+      return fromSigned(op1 / op2, info.size);
+    }
+
+
+    static triton::uint512 wideBvsge(const triton::uint512* op, const OperationInfo& info) {
+      return toSigned(op[0], info.operandSize) >= toSigned(op[1], info.operandSize);
+    }
+
+
+    static triton::uint512 wideBvsgt(const triton::uint512* op, const OperationInfo& info) {
+      return toSigned(op[0], info.operandSize) > toSigned(op[1], info.operandSize);
+    }
+
+
+    static triton::uint512 wideBvshl(const triton::uint512* op, const OperationInfo& info) {
+      return op[1] >= info.size ? triton::uint512(0) : ((op[0] << op[1].convert_to<triton::uint32>()) & getMask(info.size));
+    }
+
+
+    static triton::uint512 wideBvsle(const triton::uint512* op, const OperationInfo& info) {
+      return toSigned(op[0], info.operandSize) <= toSigned(op[1], info.operandSize);
+    }
+
+
+    static triton::uint512 wideBvslt(const triton::uint512* op, const OperationInfo& info) {
+      return toSigned(op[0], info.operandSize) < toSigned(op[1], info.operandSize);
+    }
+
+
+    static triton::uint512 wideBvsmod(const triton::uint512* op, const OperationInfo& info) {
+      triton::sint512 op1 = toSigned(op[0], info.size);
+      triton::sint512 op2 = toSigned(op[1], info.size);
+
+      if (op2 == 0)
+        return op[0];
+
+      /* The remainder takes the sign of the divisor */
+      triton::sint512 rem = op1 % op2;
+      if (rem != 0 && ((rem < 0) != (op2 < 0)))
+        rem += op2;
+
+      return fromSigned(rem, info.size);
+    }
+
+
+    static triton::uint512 wideBvsrem(const triton::uint512* op, const OperationInfo& info) {
+      triton::sint512 op1 = toSigned(op[0], info.size);
+      triton::sint512 op2 = toSigned(op[1], info.size);
+
+      if (op2 == 0)
+        return op[0];
+
+      return fromSigned(op1 % op2, info.size);
+    }
+
+
+    static triton::uint512 wideBvsub(const triton::uint512* op, const OperationInfo& info) {
+      return (op[0] - op[1]) & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideBvudiv(const triton::uint512* op, const OperationInfo& info) {
+      return op[1] == 0 ? getMask(info.size) : (op[0] / op[1]);
+    }
+
+
+    static triton::uint512 wideBvuge(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] >= op[1];
+    }
+
+
+    static triton::uint512 wideBvugt(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] > op[1];
+    }
+
+
+    static triton::uint512 wideBvule(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] <= op[1];
+    }
+
+
+    static triton::uint512 wideBvult(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] < op[1];
+    }
+
+
+    static triton::uint512 wideBvurem(const triton::uint512* op, const OperationInfo& info) {
+      return op[1] == 0 ? op[0] : (op[0] % op[1]);
+    }
+
+
+    static triton::uint512 wideBvxnor(const triton::uint512* op, const OperationInfo& info) {
+      return ~(op[0] ^ op[1]) & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideBvxor(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] ^ op[1];
+    }
+
+
+    static triton::uint512 wideConcat(const triton::uint512* op, const OperationInfo& info) {
+      return (op[0] << info.parameter) | op[1];
+    }
+
+
+    static triton::uint512 wideDistinct(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] != op[1];
+    }
+
+
+    static triton::uint512 wideEqual(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] == op[1];
+    }
+
+
+    static triton::uint512 wideExtract(const triton::uint512* op, const OperationInfo& info) {
+      return (op[0] >> info.parameter) & getMask(info.size);
+    }
+
+
+    static triton::uint512 wideIte(const triton::uint512* op, const OperationInfo& info) {
+      return op[0] != 0 ? op[1] : op[2];
+    }
+
+
+    static triton::uint512 wideLand(const triton::uint512* op, const OperationInfo& info) {
+      return (op[0] != 0 && op[1] != 0);
+    }
+
+
+    static triton::uint512 wideLnot(const triton::uint512* op, const OperationInfo& info) {
+      return (op[0] == 0);
+    }
+
+
+    static triton::uint512 wideLor(const triton::uint512* op, const OperationInfo& info) {
+      return (op[0] != 0 || op[1] != 0);
+    }
+
+
+    static triton::uint512 wideSx(const triton::uint512* op, const OperationInfo& info) {
+      return fromSigned(toSigned(op[0], info.operandSize), info.size);
+    }
+
+
+    static triton::uint512 wideZx(const triton::uint512* op, const OperationInfo& info) {
+      return op[0];
+    }
+
+
+    /* Builds the table of the semantics indexed by kind */
+    static std::vector<OperationSemantics> buildOperationTable(void) {
+      std::vector<OperationSemantics> table(OPERATION_TABLE_SIZE, OperationSemantics{nullptr, nullptr});
+
+      table[BVADD_NODE] = {narrowBvadd, wideBvadd};
+      table[BVAND_NODE] = {narrowBvand, wideBvand};
+      table[BVASHR_NODE] = {narrowBvashr, wideBvashr};
+      table[BVLSHR_NODE] = {narrowBvlshr, wideBvlshr};
+      table[BVMUL_NODE] = {narrowBvmul, wideBvmul};
+      table[BVNAND_NODE] = {narrowBvnand, wideBvnand};
+      table[BVNEG_NODE] = {narrowBvneg, wideBvneg};
+      table[BVNOR_NODE] = {narrowBvnor, wideBvnor};
+      table[BVNOT_NODE] = {narrowBvnot, wideBvnot};
+      table[BVOR_NODE] = {narrowBvor, wideBvor};
+      table[BVROL_NODE] = {narrowBvrol, wideBvrol};
+      table[BVROR_NODE] = {narrowBvror, wideBvror};
+      table[BVSDIV_NODE] = {narrowBvsdiv, wideBvsdiv};
+      table[BVSGE_NODE] = {narrowBvsge, wideBvsge};
+      table[BVSGT_NODE] = {narrowBvsgt, wideBvsgt};
+      table[BVSHL_NODE] = {narrowBvshl, wideBvshl};
+      table[BVSLE_NODE] = {narrowBvsle, wideBvsle};
+      table[BVSLT_NODE] = {narrowBvslt, wideBvslt};
+      table[BVSMOD_NODE] = {narrowBvsmod, wideBvsmod};
+      table[BVSREM_NODE] = {narrowBvsrem, wideBvsrem};
+      table[BVSUB_NODE] = {narrowBvsub, wideBvsub};
+      table[BVUDIV_NODE] = {narrowBvudiv, wideBvudiv};
+      table[BVUGE_NODE] = {narrowBvuge, wideBvuge};
+      table[BVUGT_NODE] = {narrowBvugt, wideBvugt};
+      table[BVULE_NODE] = {narrowBvule, wideBvule};
+      table[BVULT_NODE] = {narrowBvult, wideBvult};
+      table[BVUREM_NODE] = {narrowBvurem, wideBvurem};
+      table[BVXNOR_NODE] = {narrowBvxnor, wideBvxnor};
+      table[BVXOR_NODE] = {narrowBvxor, wideBvxor};
+      table[CONCAT_NODE] = {narrowConcat, wideConcat};
+      table[DISTINCT_NODE] = {narrowDistinct, wideDistinct};
+      table[EQUAL_NODE] = {narrowEqual, wideEqual};
+      table[EXTRACT_NODE] = {narrowExtract, wideExtract};
+      table[ITE_NODE] = {narrowIte, wideIte};
+      table[LAND_NODE] = {narrowLand, wideLand};
+      table[LNOT_NODE] = {narrowLnot, wideLnot};
+      table[LOR_NODE] = {narrowLor, wideLor};
+      table[SX_NODE] = {narrowSx, wideSx};
+      table[ZX_NODE] = {narrowZx, wideZx};
+
+      return table;
+    }
+
+
+    /* Returns the table of the semantics, built on first use */
+    static const std::vector<OperationSemantics>& getOperationTable(void) {
+      static const std::vector<OperationSemantics> table = buildOperationTable();
+      return table;
+    }
+
+
+    bool isOperationParameter(AbstractNode* node) {
+      return (node->getKind() == DECIMAL_NODE || node->getKind() == STRING_NODE);
+    }
+
+
+    bool hasOperationSemantics(triton::uint32 kind) {
+      return (kind < OPERATION_TABLE_SIZE && getOperationTable()[kind].narrow != nullptr);
+    }
+
+
+    const OperationSemantics& getOperationSemantics(triton::uint32 kind) {
+      if (!hasOperationSemantics(kind))
+        throw triton::exceptions::Ast("triton::ast::getOperationSemantics(): Invalid kind of node.");
+      return getOperationTable()[kind];
+    }
+
+
+    OperationInfo getOperationInfo(AbstractNode* node) {
+      std::vector<AbstractNode*>& childs = node->getChilds();
+      OperationInfo info;
+
+      info.size        = node->getBitvectorSize();
+      info.operandSize = 0;
+      info.parameter   = 0;
+      info.mask        = node->getBitvectorMask64();
+
+      for (AbstractNode* child : childs) {
+        if (!isOperationParameter(child)) {
+          info.operandSize = child->getBitvectorSize();
+          break;
+        }
+      }
+
+      switch (node->getKind()) {
+        case BVROL_NODE:
+        case BVROR_NODE:
+          info.parameter = getParameter(childs[0]) % info.size;
+          break;
+
+        case CONCAT_NODE:
+          info.parameter = childs[1]->getBitvectorSize();
+          break;
+
+        case EXTRACT_NODE:
+          info.parameter = getParameter(childs[1]);
+          break;
+
+        default:
+          break;
+      }
+
+      return info;
+    }
+
+
+    bool isWideOperation(AbstractNode* node) {
+      if (node->getBitvectorSize() > 64)
+        return true;
+
+      for (AbstractNode* child : node->getChilds()) {
+        if (!isOperationParameter(child) && child->getBitvectorSize() > 64)
+          return true;
+      }
+
+      return false;
+    }
+
+
+    triton::uint64 evaluateNarrowOperation(AbstractNode* node, const triton::uint64* operands) {
+      const OperationSemantics& operation = getOperationSemantics(node->getKind());
+      std::vector<AbstractNode*>& childs  = node->getChilds();
+      OperationInfo info                  = getOperationInfo(node);
+      const triton::uint64* lanes[3]      = {operands, operands, operands};
+      triton::uint64 result               = 0;
+
+      /* A concat is computed two operands at a time */
+      if (node->getKind() == CONCAT_NODE) {
+        result = operands[0];
+        for (triton::usize index = 1; index < childs.size(); index++) {
+          lanes[0] = &result;
+          lanes[1] = &operands[index];
+          info.parameter = childs[index]->getBitvectorSize();
+          operation.narrow(&result, lanes, 1, info);
+        }
+        return result;
+      }
+
+      /* Operands are the childs which are not parameters, there are at most three of them */
+      triton::usize count = 0;
+      for (AbstractNode* child : childs) {
+        if (!isOperationParameter(child) && count < 3) {
+          lanes[count] = &operands[count];
+          count++;
+        }
+      }
+
+      operation.narrow(&result, lanes, 1, info);
+      return result;
+    }
+
+
+    triton::uint512 evaluateWideOperation(AbstractNode* node, const triton::uint512* operands) {
+      const OperationSemantics& operation = getOperationSemantics(node->getKind());
+      std::vector<AbstractNode*>& childs  = node->getChilds();
+      OperationInfo info                  = getOperationInfo(node);
+      triton::uint512 values[2];
+
+      /* A concat is computed two operands at a time */
+      if (node->getKind() == CONCAT_NODE) {
+        values[0] = operands[0];
+        for (triton::usize index = 1; index < childs.size(); index++) {
+          values[1] = operands[index];
+          info.parameter = childs[index]->getBitvectorSize();
+          values[0] = operation.wide(values, info);
+        }
+        return values[0];
+      }
+
+      return operation.wide(operands, info);
+    }
+
+  }; /* ast namespace */
+}; /* triton namespace */
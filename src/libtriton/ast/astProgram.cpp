@@ -0,0 +1,276 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <algorithm>
+
+#include <triton/api.hpp>
+#include <triton/astOperations.hpp>
+#include <triton/astProgram.hpp>
+#include <triton/exceptions.hpp>
+
+
+
+namespace triton {
+  namespace ast {
+
+    /* Returns the mask of a value of `size` bits */
+    static triton::uint512 getMask(triton::uint32 size) {
+      return (triton::uint512(1) << size) - 1;
+    }
+
+
+    AstProgram::AstProgram(AbstractNode* node) {
+      this->result = 0;
+      this->compile(node);
+    }
+
+
+    AstProgram::~AstProgram() {
+    }
+
+
+    triton::uint32 AstProgram::newRegister(triton::uint32 size) {
+      triton::uint32 reg = static_cast<triton::uint32>(this->registers.size());
+
+      this->registers.push_back(0);
+      this->wideRegisters.push_back(0);
+      this->sizes.push_back(size);
+
+      return reg;
+    }
+
+
+    triton::uint32 AstProgram::newConstant(triton::uint32 size, const triton::uint512& value) {
+      triton::uint32 reg = this->newRegister(size);
+      this->setRegister(reg, value);
+      return reg;
+    }
+
+
+    triton::uint512 AstProgram::getRegister(triton::uint32 reg) const {
+      if (this->sizes[reg] > 64)
+        return this->wideRegisters[reg];
+      return this->registers[reg];
+    }
+
+
+    void AstProgram::setRegister(triton::uint32 reg, const triton::uint512& value) {
+      this->registers[reg] = static_cast<triton::uint64>(value & static_cast<triton::uint64>(-1));
+      if (this->sizes[reg] > 64)
+        this->wideRegisters[reg] = value;
+    }
+
+
+    void AstProgram::compileNode(AbstractNode* node) {
+      std::vector<AbstractNode*>& childs = node->getChilds();
+      triton::usize operands             = 0;
+      Instruction inst;
+
+      switch (node->getKind()) {
+        /* A let has the value of its body */
+        case LET_NODE:
+          this->compiled[node] = this->compiled[childs[2]];
+          return;
+
+        /* A reference is unrolled on the AST of its expression */
+        case REFERENCE_NODE: {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(node)->getValue();
+          if (!triton::api.isSymbolicExpressionIdExists(id))
+            throw triton::exceptions::Ast("AstProgram::compileNode(): Reference to an unknown symbolic expression.");
+          this->compiled[node] = this->compiled[triton::api.getAstFromId(id)];
+          return;
+        }
+
+        /* A variable is an input of the program */
+        case VARIABLE_NODE: {
+          triton::usize id = reinterpret_cast<VariableNode*>(node)->getId();
+          auto it          = std::find(this->variables.begin(), this->variables.end(), id);
+
+          if (it != this->variables.end()) {
+            this->compiled[node] = this->inputs[it - this->variables.begin()];
+          }
+          else {
+            this->compiled[node] = this->newRegister(node->getBitvectorSize());
+            this->variables.push_back(id);
+            this->inputs.push_back(this->compiled[node]);
+          }
+          return;
+        }
+
+        /* A concatenation is compiled into a chain of concatenations of two operands */
+        case CONCAT_NODE: {
+          triton::uint32 acc  = this->compiled[childs[0]];
+          triton::uint32 size = childs[0]->getBitvectorSize();
+
+          for (triton::usize index = 1; index < childs.size(); index++) {
+            size += childs[index]->getBitvectorSize();
+
+            inst.semantics        = &getOperationSemantics(CONCAT_NODE);
+            inst.wide             = (size > 64);
+            inst.info.size        = size;
+            inst.info.operandSize = size - childs[index]->getBitvectorSize();
+            inst.info.parameter   = childs[index]->getBitvectorSize();
+            inst.info.mask        = static_cast<triton::uint64>(getMask(size) & static_cast<triton::uint64>(-1));
+            inst.src[0]           = acc;
+            inst.src[1]           = this->compiled[childs[index]];
+            inst.src[2]           = 0;
+            inst.dst              = this->newRegister(size);
+            acc                   = inst.dst;
+
+            this->instructions.push_back(inst);
+          }
+
+          this->compiled[node] = acc;
+          return;
+        }
+
+        default:
+          if (!hasOperationSemantics(node->getKind()))
+            throw triton::exceptions::Ast("AstProgram::compileNode(): Unsupported kind of node.");
+          break;
+      }
+
+      inst.semantics = &getOperationSemantics(node->getKind());
+      inst.wide      = isWideOperation(node);
+      inst.info      = getOperationInfo(node);
+      inst.src[0]    = 0;
+      inst.src[1]    = 0;
+      inst.src[2]    = 0;
+
+      /* Operands are the childs which are not parameters */
+      for (AbstractNode* child : childs) {
+        if (!isOperationParameter(child) && operands < 3)
+          inst.src[operands++] = this->compiled[child];
+      }
+
+      inst.dst = this->newRegister(inst.info.size);
+      this->compiled[node] = inst.dst;
+      this->instructions.push_back(inst);
+    }
+
+
+    void AstProgram::compile(AbstractNode* node) {
+      std::vector<std::pair<AbstractNode*, bool>> worklist;
+
+      if (node == nullptr)
+        throw triton::exceptions::Ast("AstProgram::compile(): node cannot be null.");
+
+      /* Post-order walk, each node is compiled once its childs are compiled */
+      worklist.push_back(std::make_pair(node, false));
+      while (!worklist.empty()) {
+        AbstractNode* n = worklist.back().first;
+        bool expanded   = worklist.back().second;
+
+        worklist.pop_back();
+
+        if (this->compiled.find(n) != this->compiled.end())
+          continue;
+
+        if (expanded) {
+          this->compileNode(n);
+          continue;
+        }
+
+        /* A tree without variable is folded into a constant */
+        if (!n->isSymbolized()) {
+          this->compiled[n] = this->newConstant(n->getBitvectorSize(), n->evaluate());
+          continue;
+        }
+
+        worklist.push_back(std::make_pair(n, true));
+
+        for (auto it = n->getChilds().rbegin(); it != n->getChilds().rend(); it++) {
+          if (!isOperationParameter(*it))
+            worklist.push_back(std::make_pair(*it, false));
+        }
+
+        if (n->getKind() == REFERENCE_NODE) {
+          triton::usize id = reinterpret_cast<ReferenceNode*>(n)->getValue();
+          if (triton::api.isSymbolicExpressionIdExists(id))
+            worklist.push_back(std::make_pair(triton::api.getAstFromId(id), false));
+        }
+      }
+
+      this->result = this->compiled[node];
+
+      /* The program does not depend on the nodes anymore */
+      this->compiled.clear();
+    }
+
+
+    void AstProgram::executeWide(const Instruction& inst) {
+      triton::uint512 operands[3];
+
+      operands[0] = this->getRegister(inst.src[0]);
+      operands[1] = this->getRegister(inst.src[1]);
+      operands[2] = this->getRegister(inst.src[2]);
+
+      this->setRegister(inst.dst, inst.semantics->wide(operands, inst.info));
+    }
+
+
+    triton::uint512 AstProgram::execute(void) {
+      triton::uint64* r = this->registers.data();
+
+      for (const Instruction& inst : this->instructions) {
+        if (inst.wide) {
+          this->executeWide(inst);
+          continue;
+        }
+
+        const triton::uint64* operands[3] = {&r[inst.src[0]], &r[inst.src[1]], &r[inst.src[2]]};
+        inst.semantics->narrow(&r[inst.dst], operands, 1, inst.info);
+      }
+
+      return this->getRegister(this->result);
+    }
+
+
+    triton::uint32 AstProgram::getBitvectorSize(void) const {
+      return this->sizes[this->result];
+    }
+
+
+    triton::usize AstProgram::getSize(void) const {
+      return this->instructions.size();
+    }
+
+
+    const std::vector<triton::usize>& AstProgram::getVariables(void) const {
+      return this->variables;
+    }
+
+
+    triton::uint512 AstProgram::evaluate(const std::vector<triton::uint512>& values) {
+      if (values.size() != this->inputs.size())
+        throw triton::exceptions::Ast("AstProgram::evaluate(): Invalid number of values.");
+
+      for (triton::usize index = 0; index < values.size(); index++) {
+        triton::uint32 reg = this->inputs[index];
+        this->setRegister(reg, values[index] & getMask(this->sizes[reg]));
+      }
+
+      return this->execute();
+    }
+
+
+    triton::uint512 AstProgram::evaluate(const std::map<triton::usize, triton::uint512>& values) {
+      for (triton::usize index = 0; index < this->variables.size(); index++) {
+        triton::uint32 reg = this->inputs[index];
+        auto it            = values.find(this->variables[index]);
+
+        if (it != values.end())
+          this->setRegister(reg, it->second & getMask(this->sizes[reg]));
+        else
+          this->setRegister(reg, triton::api.getSymbolicVariableFromId(this->variables[index])->getConcreteValue() & getMask(this->sizes[reg]));
+      }
+
+      return this->execute();
+    }
+
+  }; /* ast namespace */
+}; /* triton namespace */
@@ -6,6 +6,8 @@
 */
 
 #include <new>
+#include <sstream>
+#include <unordered_set>
 
 #include <triton/astRepresentation.hpp>
 #include <triton/exceptions.hpp>
@@ -22,23 +24,29 @@ namespace triton {
 
       AstRepresentation::AstRepresentation() {
         /* Set the default representation */
-        this->mode = triton::ast::representations::SMT_REPRESENTATION;
+        this->mode   = triton::ast::representations::SMT_REPRESENTATION;
+        this->nested = false;
 
         /* Init representations interface */
         this->representations[triton::ast::representations::SMT_REPRESENTATION] = new(std::nothrow) triton::ast::representations::AstSmtRepresentation();
         this->representations[triton::ast::representations::PYTHON_REPRESENTATION] = new(std::nothrow) triton::ast::representations::AstPythonRepresentation();
+        this->representations[triton::ast::representations::SMT_DAG_REPRESENTATION] = new(std::nothrow) triton::ast::representations::AstSmtRepresentation();
 
         if (this->representations[triton::ast::representations::SMT_REPRESENTATION] == nullptr)
           throw triton::exceptions::AstRepresentation("AstRepresentation::AstRepresentation(): Cannot allocate a new representation instance.");
 
         if (this->representations[triton::ast::representations::PYTHON_REPRESENTATION] == nullptr)
           throw triton::exceptions::AstRepresentation("AstRepresentation::AstRepresentation(): Cannot allocate a new representation instance.");
+
+        if (this->representations[triton::ast::representations::SMT_DAG_REPRESENTATION] == nullptr)
+          throw triton::exceptions::AstRepresentation("AstRepresentation::AstRepresentation(): Cannot allocate a new representation instance.");
       }
 
 
       AstRepresentation::~AstRepresentation() {
         delete this->representations[triton::ast::representations::SMT_REPRESENTATION];
         delete this->representations[triton::ast::representations::PYTHON_REPRESENTATION];
+        delete this->representations[triton::ast::representations::SMT_DAG_REPRESENTATION];
       }
 
 
@@ -54,8 +62,169 @@ namespace triton {
       }
 
 
+      void AstRepresentation::display(AbstractNode* node, std::string& text, std::vector<std::pair<triton::usize, AbstractNode*>>& childs) {
+        std::ostringstream stream;
+
+        this->nested = true;
+        this->childs.clear();
+
+        try {
+          this->representations[this->mode]->print(stream, node);
+        }
+        catch (...) {
+          this->nested = false;
+          throw;
+        }
+
+        this->nested = false;
+        text = stream.str();
+        childs.swap(this->childs);
+      }
+
+
       std::ostream& AstRepresentation::print(std::ostream& stream, AbstractNode* node) {
-        return this->representations[this->mode]->print(stream, node);
+        /* A child written while a node is displayed, it will be displayed later */
+        if (this->nested) {
+          if (this->aliases.find(node) != this->aliases.end())
+            stream << this->aliases[node];
+          else
+            this->childs.push_back(std::make_pair(static_cast<triton::usize>(stream.tellp()), node));
+          return stream;
+        }
+
+        if (this->mode == triton::ast::representations::SMT_DAG_REPRESENTATION && this->aliases.empty())
+          return this->printDag(stream, node);
+
+        return this->printTree(stream, node);
+      }
+
+
+      std::ostream& AstRepresentation::printTree(std::ostream& stream, AbstractNode* node) {
+        std::vector<std::string> texts;
+        std::vector<std::vector<std::pair<triton::usize, AbstractNode*>>> childs;
+        std::vector<triton::usize> offsets;
+        std::vector<triton::usize> indexes;
+
+        texts.resize(1);
+        childs.resize(1);
+        offsets.push_back(0);
+        indexes.push_back(0);
+        this->display(node, texts.back(), childs.back());
+
+        while (!texts.empty()) {
+          /* The node is entirely displayed */
+          if (indexes.back() == childs.back().size()) {
+            stream << texts.back().substr(offsets.back());
+            texts.pop_back();
+            childs.pop_back();
+            offsets.pop_back();
+            indexes.pop_back();
+            continue;
+          }
+
+          /* Display the text until the next child, then the child */
+          std::pair<triton::usize, AbstractNode*> child = childs.back()[indexes.back()++];
+          stream << texts.back().substr(offsets.back(), child.first - offsets.back());
+          offsets.back() = child.first;
+
+          texts.resize(texts.size() + 1);
+          childs.resize(childs.size() + 1);
+          offsets.push_back(0);
+          indexes.push_back(0);
+          this->display(child.second, texts.back(), childs.back());
+        }
+
+        return stream;
+      }
+
+
+      std::ostream& AstRepresentation::printDag(std::ostream& stream, AbstractNode* node) {
+        std::unordered_map<AbstractNode*, triton::usize> references;
+        std::unordered_set<AbstractNode*> scoped;
+        std::vector<AbstractNode*> nodes;
+        std::vector<AbstractNode*> shared;
+
+        /* Commands are displayed one by one, a let cannot be shared between them */
+        switch (node->getKind()) {
+          case COMPOUND_NODE:
+            for (AbstractNode* child : node->getChilds())
+              this->printDag(stream, child);
+            return stream;
+
+          case ASSERT_NODE:
+            stream << "(assert ";
+            this->printDag(stream, node->getChilds()[0]);
+            stream << ")";
+            return stream;
+
+          default:
+            break;
+        }
+
+        triton::ast::nodesExtraction(nodes, node);
+
+        for (AbstractNode* n : nodes) {
+          /* A sub-term which uses an alias of a let node cannot be moved out of it */
+          if (n->getKind() == STRING_NODE)
+            scoped.insert(n);
+
+          for (AbstractNode* child : n->getChilds()) {
+            references[child]++;
+            if (scoped.find(child) != scoped.end())
+              scoped.insert(n);
+          }
+        }
+
+        /* Nodes come after their childs, so a binding only uses the previous ones */
+        for (AbstractNode* n : nodes) {
+          if (n == node || references[n] < 2 || scoped.find(n) != scoped.end())
+            continue;
+
+          switch (n->getKind()) {
+            case BV_NODE:
+            case BVDECL_NODE:
+            case DECIMAL_NODE:
+            case DECLARE_FUNCTION_NODE:
+            case REFERENCE_NODE:
+            case VARIABLE_NODE:
+              break;
+
+            default:
+              shared.push_back(n);
+              break;
+          }
+        }
+
+        try {
+          for (AbstractNode* n : shared) {
+            std::string alias = "dag!" + std::to_string(this->aliases.size());
+            stream << "(let ((" << alias << " ";
+            this->printTree(stream, n);
+            stream << ")) ";
+            this->aliases[n] = alias;
+          }
+
+          this->printTree(stream, node);
+          stream << std::string(shared.size(), ')');
+        }
+        catch (...) {
+          this->aliases.clear();
+          throw;
+        }
+
+        this->aliases.clear();
+        return stream;
+      }
+
+
+      AstRepresentationScope::AstRepresentationScope(triton::uint32 mode) {
+        this->mode = astRepresentation.getMode();
+        astRepresentation.setMode(mode);
+      }
+
+
+      AstRepresentationScope::~AstRepresentationScope() {
+        astRepresentation.setMode(this->mode);
       }
 
     };
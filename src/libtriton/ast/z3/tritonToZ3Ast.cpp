@@ -460,8 +460,7 @@ namespace triton {
 
 
     void TritonToZ3Ast::operator()(triton::ast::VariableNode& e) {
-      std::string varName = e.getValue();
-      triton::engines::symbolic::SymbolicVariable* symVar = this->symbolicEngine->getSymbolicVariableFromName(varName);
+      triton::engines::symbolic::SymbolicVariable* symVar = this->symbolicEngine->getSymbolicVariableFromId(e.getId());
 
       if (symVar == nullptr)
         throw triton::exceptions::AstTranslations("TritonToZ3Ast::VariableNode(): Can't get the symbolic variable (nullptr).");
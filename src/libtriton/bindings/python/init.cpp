@@ -118,11 +118,23 @@ namespace triton {
         triton::bindings::python::prefixesDict = xPyDict_New();
         PyObject* idPrefixesClass = xPyClass_New(nullptr, triton::bindings::python::prefixesDict, xPyString_FromString("PREFIX"));
 
+        /* Create the PRESOLVE namespace ============================================================= */
+
+        PyObject* presolveDict = xPyDict_New();
+        initPresolveNamespace(presolveDict);
+        PyObject* idPresolveClass = xPyClass_New(nullptr, presolveDict, xPyString_FromString("PRESOLVE"));
+
         /* Create the REG namespace ================================================================== */
 
         triton::bindings::python::registersDict = xPyDict_New();
         PyObject* idRegClass = xPyClass_New(nullptr, triton::bindings::python::registersDict, xPyString_FromString("REG"));
 
+        /* Create the SIMPLIFICATION namespace ======================================================= */
+
+        PyObject* simplificationDict = xPyDict_New();
+        initSimplificationNamespace(simplificationDict);
+        PyObject* idSimplificationClass = xPyClass_New(nullptr, simplificationDict, xPyString_FromString("SIMPLIFICATION"));
+
         /* Create the SYMEXPR namespace ============================================================== */
 
         PyObject* symExprDict = xPyDict_New();
@@ -156,7 +168,9 @@ namespace triton {
         PyModule_AddObject(triton::bindings::python::tritonModule, "OPERAND",             idOperandClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "PE",                  idPeDictClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "PREFIX",              idPrefixesClass);           /* Empty: filled on the fly */
+        PyModule_AddObject(triton::bindings::python::tritonModule, "PRESOLVE",            idPresolveClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "REG",                 idRegClass);                /* Empty: filled on the fly */
+        PyModule_AddObject(triton::bindings::python::tritonModule, "SIMPLIFICATION",      idSimplificationClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "SYMEXPR",             idSymExprClass);
         #if defined(__unix__) || defined(__APPLE__)
         PyModule_AddObject(triton::bindings::python::tritonModule, "SYSCALL",             idSyscallsClass);           /* Empty: filled on the fly */
@@ -5,6 +5,9 @@
 **  This program is under the terms of the BSD License.
 */
 
+#include <cctype>
+#include <sstream>
+
 #include <triton/api.hpp>
 #include <triton/exceptions.hpp>
 #include <triton/bitsVector.hpp>
@@ -43,6 +46,7 @@ If you want to use the libTriton without Python bindings, recompile the project
 \subsection triton_py_api_classes Classes
 
 - \ref py_AstNode_page
+- \ref py_AstProgram_page
 - \ref py_Bitvector_page
 - \ref py_Elf_page
 - \ref py_ElfDynamicTable_page
@@ -78,6 +82,10 @@ If you want to use the libTriton without Python bindings, recompile the project
 - <b>void addCallback(function cb, \ref py_CALLBACK_page kind)</b><br>
 Adds a callback at specific internal points. Your callback will be called each time the point is reached.
 
+- <b>void addSimplificationRule(string rule)</b><br>
+Compiles and records a rewrite rule written as `<pattern> -> <replacement>` (e.g: `"(bvxor x x) -> 0"`). Rules are applied
+natively on every new node when the `MODE.AST_NATIVE_SIMPLIFICATIONS` mode is enabled. See \ref SMT_simplification_page for the syntax.
+
 - <b>void assignSymbolicExpressionToMemory(\ref py_SymbolicExpression_page symExpr, \ref py_MemoryAccess_page mem)</b><br>
 Assigns a \ref py_SymbolicExpression_page to a \ref py_MemoryAccess_page area. **Be careful**, use this function only if you know what you are doing.
 The symbolic expression (`symExpr`) must be aligned to the memory access.
@@ -88,6 +96,11 @@ The symbolic expression (`symExpr`) must be aligned to the targeted size registe
 to 128-bits. Otherwise, you will probably get a sort mismatch error when you will solve the expression. If you want to assign an
 expression to a sub-register like `AX`, `AH` or `AL`, please, craft your expression with the `concat()` and `extract()` ast functions.
 
+- <b>void beginAstEpoch(void)</b><br>
+Opens a new epoch of AST nodes. All nodes allocated from now are recorded into this epoch until it is closed
+via endAstEpoch() or freed via freeAstEpoch(). Note that the processing of an instruction uses its own epoch.
+With the `AST_DICTIONARIES` \ref py_MODE_page, a node already recorded in a previous epoch is shared and stays in its own epoch.
+
 - <b>bool buildSemantics(\ref py_Instruction_page inst)</b><br>
 Builds the instruction semantics. Returns true if the instruction is supported. You must define an architecture before.
 
@@ -103,6 +116,9 @@ Builds a symbolic register from a \ref py_REG_page with the SSA form.
 - <b>void clearPathConstraints(void)</b><br>
 Clears the logical conjunction vector of path constraints.
 
+- <b>\ref py_AstProgram_page compileAst(\ref py_AstNode_page node)</b><br>
+Compiles a node (references are unrolled) into a program which is much faster to evaluate many times with new inputs.
+
 - <b>void concretizeAllMemory(void)</b><br>
 Concretizes all symbolic memory references.
 
@@ -151,9 +167,46 @@ Enables or disables the symbolic execution engine.
 - <b>void enableTaintEngine(bool flag)</b><br>
 Enables or disables the taint engine.
 
+- <b>void endAstEpoch(void)</b><br>
+Closes the current epoch of AST nodes. Its nodes are kept and merged into the enclosing epoch.
+
+- <b>integer evaluateAst(\ref py_AstNode_page node, dict values)</b><br>
+Evaluates a node where symbolic variables are assigned by id as {integer SymVarId : integer value}. Variables which are
+not assigned use their concrete value. The evaluation is done in a single pass over the DAG and neither the nodes nor the
+variables are modified, so this is the way to evaluate an expression on many inputs.
+
+- <b>array evaluateAstBatch(\ref py_AstNode_page node, dict values)</b><br>
+Evaluates a node over a batch of assignments where symbolic variables are assigned by id as {integer SymVarId : column}.
+All columns must have the same length and are NumPy arrays or any object supporting the buffer protocol (integers up to
+64 bits), or sequences of integers. Variables which are not assigned use their concrete value. Each node of the DAG is
+evaluated once for the whole batch. If the node is not wider than 64 bits, the results are returned as a NumPy array of
+`uint64` (or a list of integers if NumPy is not available), otherwise as a list of integers.<br>
+e.g: `evaluateAstBatch(node, {x.getId(): numpy.random.randint(0, 2**32, 10000, dtype=numpy.uint64)})`
+
 - <b>integer evaluateAstViaZ3(\ref py_AstNode_page node)</b><br>
 Evaluates an AST via Z3 and returns the symbolic value.
 
+- <b>integer fork(void)</b><br>
+Forks the CPU state, the symbolic engine and the taint engine, and returns the id of the fork. The fork is copy-on-write:
+its cost does not depend on the number of symbolic expressions nor on the size of the memory, so both sides of a branch
+may be explored without replaying the trace. See `restoreFork()`.
+
+- <b>void freeAstEpoch(void)</b><br>
+Frees the AST nodes allocated during the current epoch and closes it. Nodes which are still used by a symbolic expression,
+a path constraint, a variable, a \ref py_AstNode_page object or a node of a previous epoch are kept and merged into the
+enclosing epoch.
+
+- <b>integer freeUnreachableAstNodes(void)</b><br>
+Frees all AST nodes which are not reachable anymore from a symbolic expression, a path constraint, a symbolic variable
+or a \ref py_AstNode_page object, including nodes recorded into the AST dictionaries. Returns the number of freed nodes.
+See also the `AST_GARBAGE_COLLECTION` \ref py_MODE_page.
+
+- <b>integer freeUnreachableSymbolicExpressions(void)</b><br>
+Frees all symbolic expressions which are not reachable anymore from a register, the memory, a path constraint or a
+\ref py_SymbolicExpression_page object, together with their AST nodes. An expression is reachable if it is referenced
+by the AST of a reachable expression. Returns the number of freed expressions. See also the `SYMBOLIC_GARBAGE_COLLECTION`
+\ref py_MODE_page.
+
 - <b>[\ref py_Register_page, ...] getAllRegisters(void)</b><br>
 Returns the list of all registers. Each item of this list is a \ref py_Register_page.
 
@@ -162,6 +215,7 @@ Returns the current architecture used.
 
 - <b>dict getAstDictionariesStats(void)</b><br>
 Returns a dictionary which contains all information about number of nodes allocated via AST dictionaries.
+The `hits` and `misses` keys count the lookups which respectively returned an already allocated node and recorded a new one.
 
 - <b>\ref py_AstNode_page getAstFromId(integer symExprId)</b><br>
 Returns the partial AST from a symbolic expression id.
@@ -181,8 +235,12 @@ Returns the concrete value of memory cells.
 - <b>integer getConcreteRegisterValue(\ref py_REG_page reg)</b><br>
 Returns the concrete value of a register.
 
+- <b>[integer, ...] getForks(void)</b><br>
+Returns the ids of the forks.
+
 - <b>\ref py_AstNode_page getFullAst(\ref py_AstNode_page node)</b><br>
-Returns the full AST without SSA form from a given root node.
+Returns the full AST without SSA form from a given root node. The given AST is not modified, a new AST is built and
+the full ASTs of the referenced expressions are memoized for the next calls.
 
 - <b>\ref py_AstNode_page getFullAstFromId(integer symExprId)</b><br>
 Returns the full AST without SSA form from a symbolic expression id.
@@ -208,6 +266,12 @@ Returns the max size (in bit) of the CPU register (GPR).
 - <b>integer getRegisterSize(void)</b><br>
 Returns the max size (in byte) of the CPU register (GPR).
 
+- <b>[\ref py_SIMPLIFICATION_page, ...] getSimplificationPasses(void)</b><br>
+Returns the native simplification passes in the order they are applied when the `MODE.AST_NATIVE_SIMPLIFICATIONS` mode is enabled.
+
+- <b>[string, ...] getSimplificationRules(void)</b><br>
+Returns all recorded rewrite rules.
+
 - <b>\ref py_SymbolicExpression_page getSymbolicExpressionFromId(intger symExprId)</b><br>
 Returns the symbolic expression corresponding to an id.
 
@@ -298,24 +362,59 @@ Returns true if the symbolic expression id exists.
 - <b>bool isTaintEngineEnabled(void)</b><br>
 Returns true if the taint engine is enabled.
 
+- <b>\ref py_AstNode_page loadAst(string data)</b><br>
+Loads an AST DAG saved by saveAst(). Symbolic variables and expressions used by the AST are created with new ids.
+
+- <b>[\ref py_SymbolicExpression_page, ...] loadSymbolicExpressions(string data)</b><br>
+Loads symbolic expressions saved by saveSymbolicExpressions(). Expressions and variables are created with new ids
+and references between the loaded expressions are remapped on these ids.
+
+- <b>[\ref py_SymbolicVariable_page, ...] loadSymbolicVariables(string data)</b><br>
+Loads symbolic variables saved by saveSymbolicVariables(). Variables are created with new ids.
+
 - <b>\ref py_SymbolicExpression_page newSymbolicExpression(\ref py_AstNode_page node, string comment="")</b><br>
 Returns a new symbolic expression. Note that if there are simplification passes recorded, simplifications will be applied.
 
 - <b>\ref py_SymbolicVariable_page newSymbolicVariable(intger varSize, string comment="")</b><br>
 Returns a new symbolic variable.
 
+- <b>\ref py_PRESOLVE_page preSolve(\ref py_AstNode_page node)</b><br>
+Decides a constraint from the known bits and the unsigned intervals of its nodes, without calling the solver. Returns
+`PRESOLVE.SAT` if the constraint is always true, `PRESOLVE.UNSAT` if it is always false and `PRESOLVE.UNKNOWN` otherwise.
+The facts are cached on the nodes. `getModel()` and `getModels()` do not call the solver on constraints found UNSAT.
+
 - <b>bool processing(\ref py_Instruction_page inst)</b><br>
 Processes an instruction and updates engines according to the instruction semantics. Returns true if the instruction is supported. You must define an architecture before.
 
 - <b>void removeAllCallbacks(void)</b><br>
 Removes all recorded callbacks.
 
+- <b>void removeAllSimplificationRules(void)</b><br>
+Removes all recorded rewrite rules.
+
 - <b>void removeCallback(function cb, \ref py_CALLBACK_page kind)</b><br>
 Removes a recorded callback.
 
+- <b>void removeFork(integer id)</b><br>
+Removes a fork.
+
 - <b>void resetEngines(void)</b><br>
 Resets everything.
 
+- <b>void restoreFork(integer id)</b><br>
+Restores the state saved by a fork. The fork is kept and may be restored again.
+
+- <b>string saveAst(\ref py_AstNode_page node)</b><br>
+Saves an AST DAG (and the symbolic variables and expressions it uses) in a compact binary format. Shared nodes are saved once.
+See \ref engine_SymbolicSerialization_page.
+
+- <b>string saveSymbolicExpressions([\ref py_SymbolicExpression_page, ...] exprs)</b><br>
+Saves symbolic expressions (and the symbolic variables they use) in a compact binary format. The expressions they
+reference are saved too, so the loaded expressions never refer to the expressions of this engine.
+
+- <b>string saveSymbolicVariables([\ref py_SymbolicVariable_page, ...] vars)</b><br>
+Saves symbolic variables in a compact binary format.
+
 - <b>void setArchitecture(\ref py_ARCH_page arch)</b><br>
 Initializes an architecture. This function must be called before any call to the rest of the API.
 
@@ -342,6 +441,9 @@ the symbolic state (if it exists). You should probably use the concretize functi
 Sets the concrete value of a register. Note that by setting a concrete value will probably imply a desynchronization with
 the symbolic state (if it exists). You should probably use the concretize functions after this.
 
+- <b>void setSimplificationPasses([\ref py_SIMPLIFICATION_page, ...] passes)</b><br>
+Defines the native simplification passes and their order. They are applied when the `MODE.AST_NATIVE_SIMPLIFICATIONS` mode is enabled.
+
 - <b>bool setTaintMemory(\ref py_MemoryAccess_page mem, bool flag)</b><br>
 Sets the targeted memory as tainted or not. Returns true if the memory is still tainted.
 
@@ -433,7 +535,9 @@ Untaints a register. Returns true if the register is still tainted.
 - \ref py_OPCODE_page
 - \ref py_OPERAND_page
 - \ref py_PE_page
+- \ref py_PRESOLVE_page
 - \ref py_REG_page
+- \ref py_SIMPLIFICATION_page
 - \ref py_SYMEXPR_page
 - \ref py_SYSCALL_page
 - \ref py_VERSION_page
@@ -837,6 +941,26 @@ namespace triton {
       }
 
 
+      static PyObject* triton_addSimplificationRule(PyObject* self, PyObject* rule) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "addSimplificationRule(): Architecture is not defined.");
+
+        if (!PyString_Check(rule))
+          return PyErr_Format(PyExc_TypeError, "addSimplificationRule(): Expects a string as argument.");
+
+        try {
+          triton::api.addSimplificationRule(PyString_AsString(rule));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* triton_assignSymbolicExpressionToMemory(PyObject* self, PyObject* args) {
         PyObject* se  = nullptr;
         PyObject* mem = nullptr;
@@ -901,6 +1025,23 @@ namespace triton {
       }
 
 
+      static PyObject* triton_beginAstEpoch(PyObject* self, PyObject* noarg) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "beginAstEpoch(): Architecture is not defined.");
+
+        try {
+          triton::api.beginAstEpoch();
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* triton_buildSemantics(PyObject* self, PyObject* inst) {
         /* Check if the architecture is definied */
         if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
@@ -981,6 +1122,23 @@ namespace triton {
       }
 
 
+      static PyObject* triton_compileAst(PyObject* self, PyObject* node) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "compileAst(): Architecture is not defined.");
+
+        if (!PyAstNode_Check(node))
+          return PyErr_Format(PyExc_TypeError, "compileAst(): Expects a AstNode as argument.");
+
+        try {
+          return PyAstProgram(triton::api.compileAst(PyAstNode_AsAstNode(node)));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* triton_concretizeAllMemory(PyObject* self, PyObject* noarg) {
         /* Check if the architecture is definied */
         if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
@@ -1401,6 +1559,201 @@ namespace triton {
       }
 
 
+      static PyObject* triton_endAstEpoch(PyObject* self, PyObject* noarg) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "endAstEpoch(): Architecture is not defined.");
+
+        try {
+          triton::api.endAstEpoch();
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
+      static PyObject* triton_evaluateAst(PyObject* self, PyObject* args) {
+        std::map<triton::usize, triton::uint512> vv;
+        PyObject* node      = nullptr;
+        PyObject* values    = nullptr;
+        PyObject* key       = nullptr;
+        PyObject* value     = nullptr;
+        Py_ssize_t pos      = 0;
+
+        /* Extract arguments */
+        PyArg_ParseTuple(args, "|OO", &node, &values);
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "evaluateAst(): Architecture is not defined.");
+
+        if (node == nullptr || !PyAstNode_Check(node))
+          return PyErr_Format(PyExc_TypeError, "evaluateAst(): Expects a AstNode as first argument.");
+
+        if (values == nullptr || !PyDict_Check(values))
+          return PyErr_Format(PyExc_TypeError, "evaluateAst(): Expects a dict as second argument.");
+
+        while (PyDict_Next(values, &pos, &key, &value)) {
+          if ((!PyLong_Check(key) && !PyInt_Check(key)) || (!PyLong_Check(value) && !PyInt_Check(value)))
+            return PyErr_Format(PyExc_TypeError, "evaluateAst(): Expects a dict of {integer : integer}.");
+          vv[PyLong_AsUsize(key)] = PyLong_AsUint512(value);
+        }
+
+        try {
+          return PyLong_FromUint512(triton::api.evaluateAst(PyAstNode_AsAstNode(node), vv));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      /* Converts a column of integers (buffer or sequence) to a vector. Returns false if the column is invalid, a Python error is set if a value cannot be converted. */
+      static bool getBatchColumn(PyObject* obj, std::vector<triton::uint64>& column) {
+        if (PyObject_CheckBuffer(obj)) {
+          Py_buffer view;
+          const char* format = nullptr;
+          bool ret           = true;
+
+          if (PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+            PyErr_Clear();
+            return false;
+          }
+
+          format = view.format != nullptr ? view.format : "B";
+          if (*format == '@' || *format == '=' || *format == '<')
+            format++;
+
+          if (format[0] == '\0' || format[1] != '\0' || std::string("bBhHiIlLqQ?").find(format[0]) == std::string::npos || view.itemsize > 8)
+            ret = false;
+
+          else {
+            bool sign          = (std::islower(format[0]) != 0);
+            Py_ssize_t length  = view.len / view.itemsize;
+            const char* data   = reinterpret_cast<const char*>(view.buf);
+
+            column.resize(length);
+            for (Py_ssize_t index = 0; index < length; index++) {
+              switch (view.itemsize) {
+                case 1: column[index] = sign ? static_cast<triton::uint64>(reinterpret_cast<const triton::sint8*>(data)[index])  : reinterpret_cast<const triton::uint8*>(data)[index];  break;
+                case 2: column[index] = sign ? static_cast<triton::uint64>(reinterpret_cast<const triton::sint16*>(data)[index]) : reinterpret_cast<const triton::uint16*>(data)[index]; break;
+                case 4: column[index] = sign ? static_cast<triton::uint64>(reinterpret_cast<const triton::sint32*>(data)[index]) : reinterpret_cast<const triton::uint32*>(data)[index]; break;
+                case 8: column[index] = reinterpret_cast<const triton::uint64*>(data)[index]; break;
+                default: ret = false; break;
+              }
+            }
+          }
+
+          PyBuffer_Release(&view);
+          return ret;
+        }
+
+        if (PyList_Check(obj) || PyTuple_Check(obj)) {
+          Py_ssize_t length = PySequence_Size(obj);
+
+          column.resize(length);
+          for (Py_ssize_t index = 0; index < length; index++) {
+            PyObject* item = PySequence_Fast_GET_ITEM(obj, index);
+            if (!PyLong_Check(item) && !PyInt_Check(item))
+              return false;
+
+            if (PyInt_Check(item)) {
+              if (PyInt_AS_LONG(item) < 0) {
+                PyErr_Format(PyExc_OverflowError, "evaluateAstBatch(): Cannot convert negative value to unsigned integer.");
+                return false;
+              }
+              column[index] = static_cast<triton::uint64>(PyInt_AS_LONG(item));
+              continue;
+            }
+
+            /* Negative values and values wider than 64 bits raise an OverflowError */
+            column[index] = PyLong_AsUnsignedLongLong(item);
+            if (PyErr_Occurred() != nullptr)
+              return false;
+          }
+          return true;
+        }
+
+        return false;
+      }
+
+
+      static PyObject* triton_evaluateAstBatch(PyObject* self, PyObject* args) {
+        std::map<triton::usize, std::vector<triton::uint64>> columns;
+        triton::ast::AbstractNode* ast = nullptr;
+        PyObject* node                 = nullptr;
+        PyObject* values               = nullptr;
+        PyObject* key                  = nullptr;
+        PyObject* value                = nullptr;
+        PyObject* ret                  = nullptr;
+        Py_ssize_t pos                 = 0;
+
+        /* Extract arguments */
+        PyArg_ParseTuple(args, "|OO", &node, &values);
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "evaluateAstBatch(): Architecture is not defined.");
+
+        if (node == nullptr || !PyAstNode_Check(node))
+          return PyErr_Format(PyExc_TypeError, "evaluateAstBatch(): Expects a AstNode as first argument.");
+
+        if (values == nullptr || !PyDict_Check(values))
+          return PyErr_Format(PyExc_TypeError, "evaluateAstBatch(): Expects a dict as second argument.");
+
+        try {
+          while (PyDict_Next(values, &pos, &key, &value)) {
+            if (!PyLong_Check(key) && !PyInt_Check(key))
+              return PyErr_Format(PyExc_TypeError, "evaluateAstBatch(): Expects integers as keys.");
+            if (!getBatchColumn(value, columns[PyLong_AsUsize(key)])) {
+              if (PyErr_Occurred() != nullptr)
+                return nullptr;
+              return PyErr_Format(PyExc_TypeError, "evaluateAstBatch(): Expects arrays or sequences of integers up to 64 bits as values.");
+            }
+          }
+
+          ast = PyAstNode_AsAstNode(node);
+
+          /* Wide results are returned as a list of integers */
+          if (ast->getBitvectorSize() > 64) {
+            std::vector<triton::uint512> results = triton::api.evaluateAstBatch(ast, columns);
+            ret = xPyList_New(results.size());
+            for (triton::usize index = 0; index < results.size(); index++)
+              PyList_SetItem(ret, index, PyLong_FromUint512(results[index]));
+            return ret;
+          }
+
+          std::vector<triton::uint64> results = triton::api.evaluateAstBatch64(ast, columns);
+          PyObject* numpy = PyImport_ImportModule("numpy");
+
+          /* Without NumPy, results are returned as a list of integers */
+          if (numpy == nullptr) {
+            PyErr_Clear();
+            ret = xPyList_New(results.size());
+            for (triton::usize index = 0; index < results.size(); index++)
+              PyList_SetItem(ret, index, PyLong_FromUint64(results[index]));
+            return ret;
+          }
+
+          PyObject* buffer = PyByteArray_FromStringAndSize(reinterpret_cast<const char*>(results.data()), results.size() * sizeof(triton::uint64));
+          if (buffer != nullptr) {
+            ret = PyObject_CallMethod(numpy, const_cast<char*>("frombuffer"), const_cast<char*>("Os"), buffer, "uint64");
+            Py_DECREF(buffer);
+          }
+          Py_DECREF(numpy);
+
+          return ret;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* triton_evaluateAstViaZ3(PyObject* self, PyObject* node) {
         /* Check if the architecture is definied */
         if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
@@ -1424,6 +1777,65 @@ namespace triton {
       }
 
 
+      static PyObject* triton_fork(PyObject* self, PyObject* noarg) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "fork(): Architecture is not defined.");
+
+        try {
+          return PyLong_FromUsize(triton::api.fork());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* triton_freeAstEpoch(PyObject* self, PyObject* noarg) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "freeAstEpoch(): Architecture is not defined.");
+
+        try {
+          triton::api.freeAstEpoch();
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
+      static PyObject* triton_freeUnreachableAstNodes(PyObject* self, PyObject* noarg) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "freeUnreachableAstNodes(): Architecture is not defined.");
+
+        try {
+          return PyLong_FromUsize(triton::api.freeUnreachableAstNodes());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* triton_freeUnreachableSymbolicExpressions(PyObject* self, PyObject* noarg) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "freeUnreachableSymbolicExpressions(): Architecture is not defined.");
+
+        try {
+          return PyLong_FromUsize(triton::api.freeUnreachableSymbolicExpressions());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* triton_getAllRegisters(PyObject* self, PyObject* noarg) {
         PyObject* ret = nullptr;
 
@@ -1568,6 +1980,28 @@ namespace triton {
       }
 
 
+      static PyObject* triton_getForks(PyObject* self, PyObject* noarg) {
+        PyObject* ret = nullptr;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "getForks(): Architecture is not defined.");
+
+        try {
+          std::vector<triton::usize> forks = triton::api.getForks();
+          ret = xPyList_New(forks.size());
+
+          for (triton::usize index = 0; index < forks.size(); index++)
+            PyList_SetItem(ret, index, PyLong_FromUsize(forks[index]));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        return ret;
+      }
+
+
       static PyObject* triton_getFullAst(PyObject* self, PyObject* node) {
         /* Check if the architecture is definied */
         if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
@@ -1739,6 +2173,52 @@ namespace triton {
       }
 
 
+      static PyObject* triton_getSimplificationPasses(PyObject* self, PyObject* noarg) {
+        PyObject* ret = nullptr;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "getSimplificationPasses(): Architecture is not defined.");
+
+        try {
+          triton::uint32 index = 0;
+          const std::vector<triton::engines::symbolic::simplification_e>& passes = triton::api.getSimplificationPasses();
+          ret = xPyList_New(passes.size());
+
+          for (auto it = passes.begin(); it != passes.end(); it++)
+            PyList_SetItem(ret, index++, PyLong_FromUint32(*it));
+
+          return ret;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* triton_getSimplificationRules(PyObject* self, PyObject* noarg) {
+        PyObject* ret = nullptr;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "getSimplificationRules(): Architecture is not defined.");
+
+        try {
+          triton::uint32 index = 0;
+          std::vector<std::string> rules = triton::api.getSimplificationRules();
+          ret = xPyList_New(rules.size());
+
+          for (auto it = rules.begin(); it != rules.end(); it++)
+            PyList_SetItem(ret, index++, PyString_FromString(it->c_str()));
+
+          return ret;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* triton_getSymbolicExpressionFromId(PyObject* self, PyObject* symExprId) {
         /* Check if the architecture is definied */
         if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
@@ -2230,6 +2710,88 @@ namespace triton {
       }
 
 
+      static PyObject* triton_loadAst(PyObject* self, PyObject* data) {
+        char* buffer = nullptr;
+        Py_ssize_t size = 0;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "loadAst(): Architecture is not defined.");
+
+        if (!PyString_Check(data))
+          return PyErr_Format(PyExc_TypeError, "loadAst(): Expects a string as argument.");
+
+        try {
+          PyString_AsStringAndSize(data, &buffer, &size);
+          std::istringstream stream(std::string(buffer, size));
+          return PyAstNode(triton::api.loadAst(stream));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* triton_loadSymbolicExpressions(PyObject* self, PyObject* data) {
+        PyObject* ret = nullptr;
+        char* buffer = nullptr;
+        Py_ssize_t size = 0;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "loadSymbolicExpressions(): Architecture is not defined.");
+
+        if (!PyString_Check(data))
+          return PyErr_Format(PyExc_TypeError, "loadSymbolicExpressions(): Expects a string as argument.");
+
+        try {
+          triton::uint32 index = 0;
+          PyString_AsStringAndSize(data, &buffer, &size);
+          std::istringstream stream(std::string(buffer, size));
+          auto exprs = triton::api.loadSymbolicExpressions(stream);
+
+          ret = xPyList_New(exprs.size());
+          for (auto it = exprs.begin(); it != exprs.end(); it++)
+            PyList_SetItem(ret, index++, PySymbolicExpression(*it));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        return ret;
+      }
+
+
+      static PyObject* triton_loadSymbolicVariables(PyObject* self, PyObject* data) {
+        PyObject* ret = nullptr;
+        char* buffer = nullptr;
+        Py_ssize_t size = 0;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "loadSymbolicVariables(): Architecture is not defined.");
+
+        if (!PyString_Check(data))
+          return PyErr_Format(PyExc_TypeError, "loadSymbolicVariables(): Expects a string as argument.");
+
+        try {
+          triton::uint32 index = 0;
+          PyString_AsStringAndSize(data, &buffer, &size);
+          std::istringstream stream(std::string(buffer, size));
+          auto vars = triton::api.loadSymbolicVariables(stream);
+
+          ret = xPyList_New(vars.size());
+          for (auto it = vars.begin(); it != vars.end(); it++)
+            PyList_SetItem(ret, index++, PySymbolicVariable(*it));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        return ret;
+      }
+
+
       static PyObject* triton_newSymbolicExpression(PyObject* self, PyObject* args) {
         PyObject* node          = nullptr;
         PyObject* comment       = nullptr;
@@ -2290,6 +2852,23 @@ namespace triton {
       }
 
 
+      static PyObject* triton_preSolve(PyObject* self, PyObject* node) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "preSolve(): Architecture is not defined.");
+
+        if (!PyAstNode_Check(node))
+          return PyErr_Format(PyExc_TypeError, "preSolve(): Expects a AstNode as argument.");
+
+        try {
+          return PyLong_FromUint32(triton::api.preSolve(PyAstNode_AsAstNode(node)));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* triton_processing(PyObject* self, PyObject* inst) {
         /* Check if the architecture is definied */
         if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
@@ -2322,6 +2901,23 @@ namespace triton {
       }
 
 
+      static PyObject* triton_removeAllSimplificationRules(PyObject* self, PyObject* noarg) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "removeAllSimplificationRules(): Architecture is not defined.");
+
+        try {
+          triton::api.removeAllSimplificationRules();
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* triton_removeCallback(PyObject* self, PyObject* args) {
         PyObject* function = nullptr;
         PyObject* mode     = nullptr;
@@ -2363,6 +2959,26 @@ namespace triton {
       }
 
 
+      static PyObject* triton_removeFork(PyObject* self, PyObject* id) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "removeFork(): Architecture is not defined.");
+
+        if (!PyLong_Check(id) && !PyInt_Check(id))
+          return PyErr_Format(PyExc_TypeError, "removeFork(): Expects an integer as argument.");
+
+        try {
+          triton::api.removeFork(PyLong_AsUsize(id));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* triton_resetEngines(PyObject* self, PyObject* noarg) {
         /* Check if the architecture is definied */
         if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
@@ -2380,6 +2996,105 @@ namespace triton {
       }
 
 
+      static PyObject* triton_restoreFork(PyObject* self, PyObject* id) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "restoreFork(): Architecture is not defined.");
+
+        if (!PyLong_Check(id) && !PyInt_Check(id))
+          return PyErr_Format(PyExc_TypeError, "restoreFork(): Expects an integer as argument.");
+
+        try {
+          triton::api.restoreFork(PyLong_AsUsize(id));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
+      static PyObject* triton_saveAst(PyObject* self, PyObject* node) {
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "saveAst(): Architecture is not defined.");
+
+        if (!PyAstNode_Check(node))
+          return PyErr_Format(PyExc_TypeError, "saveAst(): Expects a AstNode as argument.");
+
+        try {
+          std::ostringstream stream;
+          triton::api.saveAst(stream, PyAstNode_AsAstNode(node));
+          return PyString_FromStringAndSize(stream.str().data(), stream.str().size());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* triton_saveSymbolicExpressions(PyObject* self, PyObject* exprs) {
+        std::vector<triton::engines::symbolic::SymbolicExpression*> vv;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "saveSymbolicExpressions(): Architecture is not defined.");
+
+        if (exprs == nullptr || !PyList_Check(exprs))
+          return PyErr_Format(PyExc_TypeError, "saveSymbolicExpressions(): Expects a list of SymbolicExpression as argument.");
+
+        for (Py_ssize_t i = 0; i < PyList_Size(exprs); i++) {
+          PyObject* item = PyList_GetItem(exprs, i);
+
+          if (!PySymbolicExpression_Check(item))
+            return PyErr_Format(PyExc_TypeError, "saveSymbolicExpressions(): Each item of the list must be a SymbolicExpression.");
+
+          vv.push_back(PySymbolicExpression_AsSymbolicExpression(item));
+        }
+
+        try {
+          std::ostringstream stream;
+          triton::api.saveSymbolicExpressions(stream, vv);
+          return PyString_FromStringAndSize(stream.str().data(), stream.str().size());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* triton_saveSymbolicVariables(PyObject* self, PyObject* vars) {
+        std::vector<triton::engines::symbolic::SymbolicVariable*> vv;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "saveSymbolicVariables(): Architecture is not defined.");
+
+        if (vars == nullptr || !PyList_Check(vars))
+          return PyErr_Format(PyExc_TypeError, "saveSymbolicVariables(): Expects a list of SymbolicVariable as argument.");
+
+        for (Py_ssize_t i = 0; i < PyList_Size(vars); i++) {
+          PyObject* item = PyList_GetItem(vars, i);
+
+          if (!PySymbolicVariable_Check(item))
+            return PyErr_Format(PyExc_TypeError, "saveSymbolicVariables(): Each item of the list must be a SymbolicVariable.");
+
+          vv.push_back(PySymbolicVariable_AsSymbolicVariable(item));
+        }
+
+        try {
+          std::ostringstream stream;
+          triton::api.saveSymbolicVariables(stream, vv);
+          return PyString_FromStringAndSize(stream.str().data(), stream.str().size());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* triton_setArchitecture(PyObject* self, PyObject* arg) {
         if (!PyLong_Check(arg) && !PyInt_Check(arg))
           return PyErr_Format(PyExc_TypeError, "setArchitecture(): Expects an ARCH as argument.");
@@ -2565,6 +3280,37 @@ namespace triton {
       }
 
 
+      static PyObject* triton_setSimplificationPasses(PyObject* self, PyObject* passes) {
+        std::vector<triton::engines::symbolic::simplification_e> vv;
+
+        /* Check if the architecture is definied */
+        if (triton::api.getArchitecture() == triton::arch::ARCH_INVALID)
+          return PyErr_Format(PyExc_TypeError, "setSimplificationPasses(): Architecture is not defined.");
+
+        if (passes == nullptr || !PyList_Check(passes))
+          return PyErr_Format(PyExc_TypeError, "setSimplificationPasses(): Expects a list of SIMPLIFICATION as argument.");
+
+        for (Py_ssize_t i = 0; i < PyList_Size(passes); i++) {
+          PyObject* item = PyList_GetItem(passes, i);
+
+          if (!PyLong_Check(item) && !PyInt_Check(item))
+            return PyErr_Format(PyExc_TypeError, "setSimplificationPasses(): Each item of the list must be a SIMPLIFICATION.");
+
+          vv.push_back(static_cast<triton::engines::symbolic::simplification_e>(PyLong_AsUint32(item)));
+        }
+
+        try {
+          triton::api.setSimplificationPasses(vv);
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* triton_setTaintMemory(PyObject* self, PyObject* args) {
         PyObject* mem    = nullptr;
         PyObject* flag   = nullptr;
@@ -3107,13 +3853,16 @@ namespace triton {
         {"Pe",                                  (PyCFunction)triton_Pe,                                     METH_O,             ""},
         {"Register",                            (PyCFunction)triton_Register,                               METH_VARARGS,       ""},
         {"addCallback",                         (PyCFunction)triton_addCallback,                            METH_VARARGS,       ""},
+        {"addSimplificationRule",               (PyCFunction)triton_addSimplificationRule,                  METH_O,             ""},
         {"assignSymbolicExpressionToMemory",    (PyCFunction)triton_assignSymbolicExpressionToMemory,       METH_VARARGS,       ""},
         {"assignSymbolicExpressionToRegister",  (PyCFunction)triton_assignSymbolicExpressionToRegister,     METH_VARARGS,       ""},
+        {"beginAstEpoch",                       (PyCFunction)triton_beginAstEpoch,                          METH_NOARGS,        ""},
         {"buildSemantics",                      (PyCFunction)triton_buildSemantics,                         METH_O,             ""},
         {"buildSymbolicImmediate",              (PyCFunction)triton_buildSymbolicImmediate,                 METH_O,             ""},
         {"buildSymbolicMemory",                 (PyCFunction)triton_buildSymbolicMemory,                    METH_O,             ""},
         {"buildSymbolicRegister",               (PyCFunction)triton_buildSymbolicRegister,                  METH_O,             ""},
         {"clearPathConstraints",                (PyCFunction)triton_clearPathConstraints,                   METH_NOARGS,        ""},
+        {"compileAst",                          (PyCFunction)triton_compileAst,                             METH_O,             ""},
         {"concretizeAllMemory",                 (PyCFunction)triton_concretizeAllMemory,                    METH_NOARGS,        ""},
         {"concretizeAllRegister",               (PyCFunction)triton_concretizeAllRegister,                  METH_NOARGS,        ""},
         {"concretizeMemory",                    (PyCFunction)triton_concretizeMemory,                       METH_O,             ""},
@@ -3129,7 +3878,14 @@ namespace triton {
         {"enableMode",                          (PyCFunction)triton_enableMode,                             METH_VARARGS,       ""},
         {"enableSymbolicEngine",                (PyCFunction)triton_enableSymbolicEngine,                   METH_O,             ""},
         {"enableTaintEngine",                   (PyCFunction)triton_enableTaintEngine,                      METH_O,             ""},
+        {"endAstEpoch",                         (PyCFunction)triton_endAstEpoch,                            METH_NOARGS,        ""},
+        {"evaluateAst",                         (PyCFunction)triton_evaluateAst,                            METH_VARARGS,       ""},
+        {"evaluateAstBatch",                    (PyCFunction)triton_evaluateAstBatch,                       METH_VARARGS,       ""},
         {"evaluateAstViaZ3",                    (PyCFunction)triton_evaluateAstViaZ3,                       METH_O,             ""},
+        {"fork",                                (PyCFunction)triton_fork,                                   METH_NOARGS,        ""},
+        {"freeAstEpoch",                        (PyCFunction)triton_freeAstEpoch,                           METH_NOARGS,        ""},
+        {"freeUnreachableAstNodes",             (PyCFunction)triton_freeUnreachableAstNodes,                METH_NOARGS,        ""},
+        {"freeUnreachableSymbolicExpressions",  (PyCFunction)triton_freeUnreachableSymbolicExpressions,     METH_NOARGS,        ""},
         {"getAllRegisters",                     (PyCFunction)triton_getAllRegisters,                        METH_NOARGS,        ""},
         {"getArchitecture",                     (PyCFunction)triton_getArchitecture,                        METH_NOARGS,        ""},
         {"getAstDictionariesStats",             (PyCFunction)triton_getAstDictionariesStats,                METH_NOARGS,        ""},
@@ -3138,6 +3894,7 @@ namespace triton {
         {"getConcreteMemoryAreaValue",          (PyCFunction)triton_getConcreteMemoryAreaValue,             METH_VARARGS,       ""},
         {"getConcreteMemoryValue",              (PyCFunction)triton_getConcreteMemoryValue,                 METH_O,             ""},
         {"getConcreteRegisterValue",            (PyCFunction)triton_getConcreteRegisterValue,               METH_O,             ""},
+        {"getForks",                            (PyCFunction)triton_getForks,                               METH_NOARGS,        ""},
         {"getFullAst",                          (PyCFunction)triton_getFullAst,                             METH_O,             ""},
         {"getFullAstFromId",                    (PyCFunction)triton_getFullAstFromId,                       METH_O,             ""},
         {"getModel",                            (PyCFunction)triton_getModel,                               METH_O,             ""},
@@ -3147,6 +3904,8 @@ namespace triton {
         {"getPathConstraintsAst",               (PyCFunction)triton_getPathConstraintsAst,                  METH_NOARGS,        ""},
         {"getRegisterBitSize",                  (PyCFunction)triton_getRegisterBitSize,                     METH_NOARGS,        ""},
         {"getRegisterSize",                     (PyCFunction)triton_getRegisterSize,                        METH_NOARGS,        ""},
+        {"getSimplificationPasses",             (PyCFunction)triton_getSimplificationPasses,                METH_NOARGS,        ""},
+        {"getSimplificationRules",              (PyCFunction)triton_getSimplificationRules,                 METH_NOARGS,        ""},
         {"getSymbolicExpressionFromId",         (PyCFunction)triton_getSymbolicExpressionFromId,            METH_O,             ""},
         {"getSymbolicExpressions",              (PyCFunction)triton_getSymbolicExpressions,                 METH_NOARGS,        ""},
         {"getSymbolicMemory",                   (PyCFunction)triton_getSymbolicMemory,                      METH_NOARGS,        ""},
@@ -3174,17 +3933,28 @@ namespace triton {
         {"isSymbolicEngineEnabled",             (PyCFunction)triton_isSymbolicEngineEnabled,                METH_NOARGS,        ""},
         {"isSymbolicExpressionIdExists",        (PyCFunction)triton_isSymbolicExpressionIdExists,           METH_O,             ""},
         {"isTaintEngineEnabled",                (PyCFunction)triton_isTaintEngineEnabled,                   METH_NOARGS,        ""},
+        {"loadAst",                             (PyCFunction)triton_loadAst,                                METH_O,             ""},
+        {"loadSymbolicExpressions",             (PyCFunction)triton_loadSymbolicExpressions,                METH_O,             ""},
+        {"loadSymbolicVariables",               (PyCFunction)triton_loadSymbolicVariables,                  METH_O,             ""},
         {"newSymbolicExpression",               (PyCFunction)triton_newSymbolicExpression,                  METH_VARARGS,       ""},
         {"newSymbolicVariable",                 (PyCFunction)triton_newSymbolicVariable,                    METH_VARARGS,       ""},
+        {"preSolve",                            (PyCFunction)triton_preSolve,                               METH_O,             ""},
         {"processing",                          (PyCFunction)triton_processing,                             METH_O,             ""},
         {"removeAllCallbacks",                  (PyCFunction)triton_removeAllCallbacks,                     METH_NOARGS,        ""},
+        {"removeAllSimplificationRules",        (PyCFunction)triton_removeAllSimplificationRules,           METH_NOARGS,        ""},
         {"removeCallback",                      (PyCFunction)triton_removeCallback,                         METH_VARARGS,       ""},
+        {"removeFork",                          (PyCFunction)triton_removeFork,                             METH_O,             ""},
         {"resetEngines",                        (PyCFunction)triton_resetEngines,                           METH_NOARGS,        ""},
+        {"restoreFork",                         (PyCFunction)triton_restoreFork,                            METH_O,             ""},
+        {"saveAst",                             (PyCFunction)triton_saveAst,                                METH_O,             ""},
+        {"saveSymbolicExpressions",             (PyCFunction)triton_saveSymbolicExpressions,                METH_O,             ""},
+        {"saveSymbolicVariables",               (PyCFunction)triton_saveSymbolicVariables,                  METH_O,             ""},
         {"setArchitecture",                     (PyCFunction)triton_setArchitecture,                        METH_O,             ""},
         {"setAstRepresentationMode",            (PyCFunction)triton_setAstRepresentationMode,               METH_O,             ""},
         {"setConcreteMemoryAreaValue",          (PyCFunction)triton_setConcreteMemoryAreaValue,             METH_VARARGS,       ""},
         {"setConcreteMemoryValue",              (PyCFunction)triton_setConcreteMemoryValue,                 METH_VARARGS,       ""},
         {"setConcreteRegisterValue",            (PyCFunction)triton_setConcreteRegisterValue,               METH_O,             ""},
+        {"setSimplificationPasses",             (PyCFunction)triton_setSimplificationPasses,                METH_O,             ""},
         {"setTaintMemory",                      (PyCFunction)triton_setTaintMemory,                         METH_VARARGS,       ""},
         {"setTaintRegister",                    (PyCFunction)triton_setTaintRegister,                       METH_VARARGS,       ""},
         {"simplify",                            (PyCFunction)triton_simplify,                               METH_VARARGS,       ""},
@@ -36,6 +36,12 @@ Enabled, all prints of AST expressions will be represented into the SMT2-Lib syn
 - **AST_REPRESENTATION.PYTHON**<br>
 Enabled, all prints of AST expressions will be represented into the Python syntax.
 
+- **AST_REPRESENTATION.SMT_DAG**<br>
+Enabled, all prints of AST expressions will be represented into the SMT2-Lib syntax where sub-terms used
+several times are bound once with a `let` and then referenced by their alias (e.g: `dag!0`). The printed text
+grows with the number of unique nodes instead of the size of the unrolled tree. This mode is used for the
+queries sent to the solver.
+
 
 */
 
@@ -46,8 +52,9 @@ namespace triton {
     namespace python {
 
       void initAstRepresentationNamespace(PyObject* astRepresentationDict) {
-        PyDict_SetItemString(astRepresentationDict, "SMT",    PyLong_FromUint32(triton::ast::representations::SMT_REPRESENTATION));
-        PyDict_SetItemString(astRepresentationDict, "PYTHON", PyLong_FromUint32(triton::ast::representations::PYTHON_REPRESENTATION));
+        PyDict_SetItemString(astRepresentationDict, "SMT",     PyLong_FromUint32(triton::ast::representations::SMT_REPRESENTATION));
+        PyDict_SetItemString(astRepresentationDict, "PYTHON",  PyLong_FromUint32(triton::ast::representations::PYTHON_REPRESENTATION));
+        PyDict_SetItemString(astRepresentationDict, "SMT_DAG", PyLong_FromUint32(triton::ast::representations::SMT_DAG_REPRESENTATION));
       }
 
     }; /* python namespace */
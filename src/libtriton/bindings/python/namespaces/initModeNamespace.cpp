@@ -34,7 +34,23 @@ The MODE namespace contains all kinds of mode.
 Enabled, Triton will keep a map of aligned memory to reduce the symbolic memory explosion of `LOAD` and `STORE` acceess.
 
 - **MODE.AST_DICTIONARIES**<br>
-Enabled, Triton will record all AST nodes into several dictionaries and try to return node already allocated instead of allocate twice the same node.
+Enabled, Triton will record all AST nodes into a hash-consing table and return the node already allocated instead of allocate twice the same node.
+As nodes are shared, modifying a node via `setChild()` affects every expression which uses it, so this mode is disabled by default.
+
+- **MODE.AST_LAZY_EVALUATION**<br>
+Enabled, modifying a node (e.g: `setChild()` or a new concrete value of a symbolic variable) only marks its ancestors
+as dirty instead of re-evaluating them. They are re-evaluated in a single pass the next time their value, size or
+symbolized state is requested.
+
+- **MODE.AST_GARBAGE_COLLECTION**<br>
+Enabled, Triton will periodically free (mark and sweep) the AST nodes which are not reachable anymore from a symbolic
+expression, a path constraint, a symbolic variable or an \ref py_AstNode_page object, including nodes recorded into
+the AST dictionaries. Note that the ASTs attached to a processed \ref py_Instruction_page (e.g: its read registers)
+are only valid until the next instruction is processed.
+
+- **MODE.AST_NATIVE_SIMPLIFICATIONS**<br>
+Enabled, Triton will apply its native simplification passes (see \ref py_SIMPLIFICATION_page) on every AST node when it is built,
+without calling any Python callback. The passes and their order are defined with `setSimplificationPasses()`.
 
 - **MODE.ONLY_ON_SYMBOLIZED**<br>
 Enabled, Triton will perform symbolic execution only on symbolized expressions.
@@ -42,9 +58,34 @@ Enabled, Triton will perform symbolic execution only on symbolized expressions.
 - **MODE.ONLY_ON_TAINTED**<br>
 Enabled, Triton will perform symbolic execution only on tainted instructions.
 
+- **MODE.PACKED_MEMORY**<br>
+Enabled, Triton will assign a single symbolic expression to all the bytes of a memory write instead of one expression
+per byte. A load reads consecutive bytes of a same write with a single node and only extracts bytes when it is unaligned
+or partially overlaps a write. Note that `getSymbolicMemoryId()` and `getSymbolicMemory()` then return the expression of
+the whole write (see its origin memory access), not an expression of one byte.
+
 - **MODE.PC_TRACKING_SYMBOLIC**<br>
 Enabled, Triton will track path constraints only if they are symbolized. This mode is enabled by default.
 
+- **MODE.SYMBOLIC_COMMENTS**<br>
+Enabled, Triton will keep the comments of symbolic expressions (e.g: "ADD operation"). Comments are shared between
+expressions, each distinct comment being stored once. Disabled, expressions are created without comment and no comment
+string is built while processing instructions. This mode is enabled by default.
+
+- **MODE.SYMBOLIC_GARBAGE_COLLECTION**<br>
+Enabled, Triton will periodically free the symbolic expressions which are not reachable anymore from a register, the
+memory, a path constraint or a \ref py_SymbolicExpression_page object, together with their AST nodes (see
+`freeUnreachableSymbolicExpressions()`). This bounds the memory used by long traces. Note that the expressions of a
+processed \ref py_Instruction_page are only valid until the next instruction is processed, and an id of a freed
+expression is not valid anymore.
+
+- **MODE.TAINT_ONLY**<br>
+Enabled and when the symbolic engine is disabled, Triton spreads the taint of the supported instructions (data
+transfers, arithmetic and logical operations, comparisons and branches) straight from their operands, without building
+their symbolic expressions nor their AST nodes. The other instructions are processed as usual. As no expression is built,
+the concrete context is not updated by the semantics and must be provided by the tracer, and the read and written
+registers and memory accesses of the instruction are not recorded.
+
 */
 
 
@@ -54,11 +95,18 @@ namespace triton {
     namespace python {
 
       void initModeNamespace(PyObject* modeDict) {
-        PyDict_SetItemString(modeDict, "ALIGNED_MEMORY",         PyLong_FromUint32(triton::modes::ALIGNED_MEMORY));
-        PyDict_SetItemString(modeDict, "AST_DICTIONARIES",       PyLong_FromUint32(triton::modes::AST_DICTIONARIES));
-        PyDict_SetItemString(modeDict, "ONLY_ON_SYMBOLIZED",     PyLong_FromUint32(triton::modes::ONLY_ON_SYMBOLIZED));
-        PyDict_SetItemString(modeDict, "ONLY_ON_TAINTED",        PyLong_FromUint32(triton::modes::ONLY_ON_TAINTED));
-        PyDict_SetItemString(modeDict, "PC_TRACKING_SYMBOLIC",   PyLong_FromUint32(triton::modes::PC_TRACKING_SYMBOLIC));
+        PyDict_SetItemString(modeDict, "ALIGNED_MEMORY",             PyLong_FromUint32(triton::modes::ALIGNED_MEMORY));
+        PyDict_SetItemString(modeDict, "AST_DICTIONARIES",           PyLong_FromUint32(triton::modes::AST_DICTIONARIES));
+        PyDict_SetItemString(modeDict, "AST_GARBAGE_COLLECTION",     PyLong_FromUint32(triton::modes::AST_GARBAGE_COLLECTION));
+        PyDict_SetItemString(modeDict, "AST_LAZY_EVALUATION",        PyLong_FromUint32(triton::modes::AST_LAZY_EVALUATION));
+        PyDict_SetItemString(modeDict, "AST_NATIVE_SIMPLIFICATIONS", PyLong_FromUint32(triton::modes::AST_NATIVE_SIMPLIFICATIONS));
+        PyDict_SetItemString(modeDict, "ONLY_ON_SYMBOLIZED",         PyLong_FromUint32(triton::modes::ONLY_ON_SYMBOLIZED));
+        PyDict_SetItemString(modeDict, "ONLY_ON_TAINTED",            PyLong_FromUint32(triton::modes::ONLY_ON_TAINTED));
+        PyDict_SetItemString(modeDict, "PACKED_MEMORY",              PyLong_FromUint32(triton::modes::PACKED_MEMORY));
+        PyDict_SetItemString(modeDict, "PC_TRACKING_SYMBOLIC",       PyLong_FromUint32(triton::modes::PC_TRACKING_SYMBOLIC));
+        PyDict_SetItemString(modeDict, "SYMBOLIC_COMMENTS",          PyLong_FromUint32(triton::modes::SYMBOLIC_COMMENTS));
+        PyDict_SetItemString(modeDict, "SYMBOLIC_GARBAGE_COLLECTION", PyLong_FromUint32(triton::modes::SYMBOLIC_GARBAGE_COLLECTION));
+        PyDict_SetItemString(modeDict, "TAINT_ONLY",                 PyLong_FromUint32(triton::modes::TAINT_ONLY));
       }
 
     }; /* python namespace */
@@ -0,0 +1,60 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <triton/pythonBindings.hpp>
+#include <triton/pythonUtils.hpp>
+#include <triton/solverEngine.hpp>
+
+
+
+/*! \page py_PRESOLVE_page PRESOLVE
+    \brief [**python api**] All information about the PRESOLVE python namespace.
+
+\tableofcontents
+
+\section PRESOLVE_py_description Description
+<hr>
+
+The PRESOLVE namespace contains all the results of the `preSolve()` function.
+
+\subsection PRESOLVE_py_example Example
+
+~~~~~~~~~~~~~{.py}
+>>> x = variable(newSymbolicVariable(32))
+>>> preSolve(equal(bvand(x, bv(0xff00, 32)), bv(1, 32))) == PRESOLVE.UNSAT
+True
+~~~~~~~~~~~~~
+
+\section PRESOLVE_py_api Python API - Items of the PRESOLVE namespace
+<hr>
+
+- **PRESOLVE.SAT**<br>
+The constraint is true whatever the values of the symbolic variables.
+
+- **PRESOLVE.UNKNOWN**<br>
+The constraint cannot be decided without the solver.
+
+- **PRESOLVE.UNSAT**<br>
+The constraint is false whatever the values of the symbolic variables.
+
+*/
+
+
+
+namespace triton {
+  namespace bindings {
+    namespace python {
+
+      void initPresolveNamespace(PyObject* presolveDict) {
+        PyDict_SetItemString(presolveDict, "SAT",     PyLong_FromUint32(triton::engines::solver::PRESOLVE_SAT));
+        PyDict_SetItemString(presolveDict, "UNKNOWN", PyLong_FromUint32(triton::engines::solver::PRESOLVE_UNKNOWN));
+        PyDict_SetItemString(presolveDict, "UNSAT",   PyLong_FromUint32(triton::engines::solver::PRESOLVE_UNSAT));
+      }
+
+    }; /* python namespace */
+  }; /* bindings namespace */
+}; /* triton namespace */
@@ -0,0 +1,63 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <triton/pythonBindings.hpp>
+#include <triton/pythonUtils.hpp>
+#include <triton/symbolicEnums.hpp>
+
+
+
+/*! \page py_SIMPLIFICATION_page SIMPLIFICATION
+    \brief [**python api**] All information about the SIMPLIFICATION python namespace.
+
+\tableofcontents
+
+\section SIMPLIFICATION_py_description Description
+<hr>
+
+The SIMPLIFICATION namespace contains all native simplification passes. They are applied when
+the `MODE.AST_NATIVE_SIMPLIFICATIONS` mode is enabled (see \ref SMT_simplification_page).
+
+\subsection SIMPLIFICATION_py_example Example
+
+~~~~~~~~~~~~~{.py}
+>>> setSimplificationPasses([SIMPLIFICATION.CONSTANT_FOLDING, SIMPLIFICATION.SELF_OPERATIONS])
+>>> enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, True)
+~~~~~~~~~~~~~
+
+\section SIMPLIFICATION_py_api Python API - Items of the SIMPLIFICATION namespace
+<hr>
+
+- **SIMPLIFICATION.CONSTANT_CONDITION**
+- **SIMPLIFICATION.CONSTANT_FOLDING**
+- **SIMPLIFICATION.DOUBLE_NEGATION**
+- **SIMPLIFICATION.EXTRACT_REDUCTION**
+- **SIMPLIFICATION.NEUTRAL_ELEMENTS**
+- **SIMPLIFICATION.REWRITE_RULES**
+- **SIMPLIFICATION.SELF_OPERATIONS**
+
+*/
+
+
+
+namespace triton {
+  namespace bindings {
+    namespace python {
+
+      void initSimplificationNamespace(PyObject* simplificationDict) {
+        PyDict_SetItemString(simplificationDict, "CONSTANT_CONDITION", PyLong_FromUint32(triton::engines::symbolic::CONSTANT_CONDITION));
+        PyDict_SetItemString(simplificationDict, "CONSTANT_FOLDING",   PyLong_FromUint32(triton::engines::symbolic::CONSTANT_FOLDING));
+        PyDict_SetItemString(simplificationDict, "DOUBLE_NEGATION",    PyLong_FromUint32(triton::engines::symbolic::DOUBLE_NEGATION));
+        PyDict_SetItemString(simplificationDict, "EXTRACT_REDUCTION",  PyLong_FromUint32(triton::engines::symbolic::EXTRACT_REDUCTION));
+        PyDict_SetItemString(simplificationDict, "NEUTRAL_ELEMENTS",   PyLong_FromUint32(triton::engines::symbolic::NEUTRAL_ELEMENTS));
+        PyDict_SetItemString(simplificationDict, "REWRITE_RULES",      PyLong_FromUint32(triton::engines::symbolic::REWRITE_RULES));
+        PyDict_SetItemString(simplificationDict, "SELF_OPERATIONS",    PyLong_FromUint32(triton::engines::symbolic::SELF_OPERATIONS));
+      }
+
+    }; /* python namespace */
+  }; /* bindings namespace */
+}; /* triton namespace */
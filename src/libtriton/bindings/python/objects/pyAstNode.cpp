@@ -5,6 +5,7 @@
 **  This program is under the terms of the BSD License.
 */
 
+#include <triton/api.hpp>
 #include <triton/ast.hpp>
 #include <triton/exceptions.hpp>
 #include <triton/pythonObjects.hpp>
@@ -57,7 +58,7 @@ Returns the node vector size.
 Returns the list of child nodes.
 
 - <b>integer getHash(void)</b><br>
-Returns the hash (signature) of the AST .
+Returns the hash (signature) of the AST. The hash is computed once when the node is built and cached on the node.
 
 - <b>\ref py_AST_NODE_page getKind(void)</b><br>
 Returns the kind of the node.<br>
@@ -115,6 +116,9 @@ namespace triton {
       //! AstNode destructor.
       void AstNode_dealloc(PyObject* self) {
         std::cout << std::flush;
+        /* The node may be freed by the AST garbage collector once no handle is held, the engines it is pinned in may have been reset */
+        if (triton::api.isArchitectureValid() && ((AstNode_Object*)self)->generation == triton::api.getEnginesGeneration())
+          triton::api.unpinAstNode(PyAstNode_AsAstNode(self));
         Py_DECREF(self);
       }
 
@@ -169,7 +173,7 @@ namespace triton {
 
       static PyObject* AstNode_getHash(PyObject* self, PyObject* noarg) {
         try {
-          return PyLong_FromUint512(PyAstNode_AsAstNode(self)->hash(1));
+          return PyLong_FromUint64(PyAstNode_AsAstNode(self)->getHash());
         }
         catch (const triton::exceptions::Exception& e) {
           return PyErr_Format(PyExc_TypeError, "%s", e.what());
@@ -287,7 +291,7 @@ namespace triton {
 
 
       static int AstNode_cmp(AstNode_Object* a, AstNode_Object* b) {
-        return !(a->node->hash(1) == b->node->hash(1));
+        return !(a->node->getHash() == b->node->getHash());
       }
 
 
@@ -646,8 +650,15 @@ namespace triton {
 
         PyType_Ready(&AstNode_Type);
         object = PyObject_NEW(AstNode_Object, &AstNode_Type);
-        if (object != NULL)
-          object->node = node;
+        if (object != NULL) {
+          object->node       = node;
+          object->generation = 0;
+          /* A Python handle keeps its node alive (see freeUnreachableAstNodes()) */
+          if (triton::api.isArchitectureValid()) {
+            triton::api.pinAstNode(node);
+            object->generation = triton::api.getEnginesGeneration();
+          }
+        }
 
         return (PyObject*)object;
       }
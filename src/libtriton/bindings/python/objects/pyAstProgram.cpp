@@ -0,0 +1,224 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <triton/astProgram.hpp>
+#include <triton/exceptions.hpp>
+#include <triton/pythonObjects.hpp>
+#include <triton/pythonUtils.hpp>
+#include <triton/pythonXFunctions.hpp>
+
+
+
+/*! \page py_AstProgram_page AstProgram
+    \brief [**python api**] All information about the AstProgram python object.
+
+\tableofcontents
+
+\section py_AstProgram_description Description
+<hr>
+
+This object is a linear register-based program compiled from an AST by the `compileAst()` function. References are
+unrolled, constant sub-trees are folded and symbolic variables are the inputs of the program. Once compiled, the program
+is evaluated without walking the AST, which is much faster when the same expression is evaluated many times with new
+inputs (e.g: brute-forcing a hash function). The object is callable and takes either a dictionary of
+{integer SymVarId : integer value} (variables which are not assigned use their concrete value), or the values of all
+the inputs in the order of `getVariables()`.
+
+~~~~~~~~~~~~~{.py}
+>>> from triton import *
+>>> from triton.ast import *
+
+>>> setArchitecture(ARCH.X86_64)
+>>> x = newSymbolicVariable(32)
+>>> y = newSymbolicVariable(32)
+>>> program = compileAst(bvadd(bvmul(variable(x), bv(31, 32)), variable(y)))
+
+>>> program.getVariables()
+[0L, 1L]
+>>> program(2, 3)
+65L
+>>> program({x.getId(): 1})
+31L
+~~~~~~~~~~~~~
+
+\section AstProgram_py_api Python API - Methods of the AstProgram class
+<hr>
+
+- <b>integer getBitvectorSize(void)</b><br>
+Returns the size of the result.
+
+- <b>integer getSize(void)</b><br>
+Returns the number of instructions of the program.
+
+- <b>[integer, ...] getVariables(void)</b><br>
+Returns the ids of the symbolic variables which are the inputs of the program.
+
+*/
+
+
+
+namespace triton {
+  namespace bindings {
+    namespace python {
+
+      //! AstProgram destructor.
+      void AstProgram_dealloc(PyObject* self) {
+        std::cout << std::flush;
+        delete PyAstProgram_AsAstProgram(self);
+        Py_DECREF(self);
+      }
+
+
+      static PyObject* AstProgram_call(PyObject* self, PyObject* args, PyObject* kwargs) {
+        try {
+          triton::ast::AstProgram* program = PyAstProgram_AsAstProgram(self);
+          Py_ssize_t size                  = PyTuple_Size(args);
+
+          /* Variables assigned by id */
+          if (size == 1 && PyDict_Check(PyTuple_GetItem(args, 0))) {
+            std::map<triton::usize, triton::uint512> values;
+            PyObject* key   = nullptr;
+            PyObject* value = nullptr;
+            Py_ssize_t pos  = 0;
+
+            while (PyDict_Next(PyTuple_GetItem(args, 0), &pos, &key, &value)) {
+              if ((!PyLong_Check(key) && !PyInt_Check(key)) || (!PyLong_Check(value) && !PyInt_Check(value)))
+                return PyErr_Format(PyExc_TypeError, "AstProgram::__call__(): Expects a dict of {integer : integer}.");
+              values[PyLong_AsUsize(key)] = PyLong_AsUint512(value);
+            }
+
+            return PyLong_FromUint512(program->evaluate(values));
+          }
+
+          /* Values of the inputs in order */
+          std::vector<triton::uint512> values;
+          for (Py_ssize_t index = 0; index < size; index++) {
+            PyObject* value = PyTuple_GetItem(args, index);
+            if (!PyLong_Check(value) && !PyInt_Check(value))
+              return PyErr_Format(PyExc_TypeError, "AstProgram::__call__(): Expects integers or a dict as arguments.");
+            values.push_back(PyLong_AsUint512(value));
+          }
+
+          return PyLong_FromUint512(program->evaluate(values));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* AstProgram_getBitvectorSize(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUint32(PyAstProgram_AsAstProgram(self)->getBitvectorSize());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* AstProgram_getSize(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUsize(PyAstProgram_AsAstProgram(self)->getSize());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* AstProgram_getVariables(PyObject* self, PyObject* noarg) {
+        try {
+          const std::vector<triton::usize>& variables = PyAstProgram_AsAstProgram(self)->getVariables();
+          PyObject* ret = xPyList_New(variables.size());
+
+          for (triton::usize index = 0; index < variables.size(); index++)
+            PyList_SetItem(ret, index, PyLong_FromUsize(variables[index]));
+
+          return ret;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      //! AstProgram methods.
+      PyMethodDef AstProgram_callbacks[] = {
+        {"getBitvectorSize",  AstProgram_getBitvectorSize,  METH_NOARGS,    ""},
+        {"getSize",           AstProgram_getSize,           METH_NOARGS,    ""},
+        {"getVariables",      AstProgram_getVariables,      METH_NOARGS,    ""},
+        {nullptr,             nullptr,                      0,              nullptr}
+      };
+
+
+      PyTypeObject AstProgram_Type = {
+        PyObject_HEAD_INIT(&PyType_Type)
+        0,                                          /* ob_size */
+        "AstProgram",                               /* tp_name */
+        sizeof(AstProgram_Object),                  /* tp_basicsize */
+        0,                                          /* tp_itemsize */
+        (destructor)AstProgram_dealloc,             /* tp_dealloc */
+        0,                                          /* tp_print */
+        0,                                          /* tp_getattr */
+        0,                                          /* tp_setattr */
+        0,                                          /* tp_compare */
+        0,                                          /* tp_repr */
+        0,                                          /* tp_as_number */
+        0,                                          /* tp_as_sequence */
+        0,                                          /* tp_as_mapping */
+        0,                                          /* tp_hash */
+        (ternaryfunc)AstProgram_call,               /* tp_call */
+        0,                                          /* tp_str */
+        0,                                          /* tp_getattro */
+        0,                                          /* tp_setattro */
+        0,                                          /* tp_as_buffer */
+        Py_TPFLAGS_DEFAULT,                         /* tp_flags */
+        "AstProgram objects",                       /* tp_doc */
+        0,                                          /* tp_traverse */
+        0,                                          /* tp_clear */
+        0,                                          /* tp_richcompare */
+        0,                                          /* tp_weaklistoffset */
+        0,                                          /* tp_iter */
+        0,                                          /* tp_iternext */
+        AstProgram_callbacks,                       /* tp_methods */
+        0,                                          /* tp_members */
+        0,                                          /* tp_getset */
+        0,                                          /* tp_base */
+        0,                                          /* tp_dict */
+        0,                                          /* tp_descr_get */
+        0,                                          /* tp_descr_set */
+        0,                                          /* tp_dictoffset */
+        0,                                          /* tp_init */
+        0,                                          /* tp_alloc */
+        0,                                          /* tp_new */
+        0,                                          /* tp_free */
+        0,                                          /* tp_is_gc */
+        0,                                          /* tp_bases */
+        0,                                          /* tp_mro */
+        0,                                          /* tp_cache */
+        0,                                          /* tp_subclasses */
+        0,                                          /* tp_weaklist */
+        0,                                          /* tp_del */
+        0                                           /* tp_version_tag */
+      };
+
+
+      PyObject* PyAstProgram(const triton::ast::AstProgram& program) {
+        AstProgram_Object* object;
+
+        PyType_Ready(&AstProgram_Type);
+        object = PyObject_NEW(AstProgram_Object, &AstProgram_Type);
+        if (object != NULL)
+          object->program = new triton::ast::AstProgram(program);
+
+        return (PyObject*)object;
+      }
+
+    }; /* python namespace */
+  }; /* bindings namespace */
+}; /* triton namespace */
@@ -5,6 +5,7 @@
 **  This program is under the terms of the BSD License.
 */
 
+#include <triton/api.hpp>
 #include <triton/exceptions.hpp>
 #include <triton/pythonObjects.hpp>
 #include <triton/pythonUtils.hpp>
@@ -86,6 +87,10 @@ Returns the AST root node of the symbolic expression.
 - <b>string getComment(void)</b><br>
 Returns the comment (if exists) of the symbolic expression.
 
+- <b>[integer, ...] getDependencies(void)</b><br>
+Returns the ids of the symbolic expressions directly referenced by the AST of the symbolic expression. They are
+computed once and kept until the AST is set again, and `sliceExpressions()` follows them.
+
 - <b>integer getId(void)</b><br>
 Returns the if of the symbolic expression. This id is always unique.<br>
 e.g: `2387`
@@ -132,6 +137,9 @@ namespace triton {
       //! SymbolicExpression destructor.
       void SymbolicExpression_dealloc(PyObject* self) {
         std::cout << std::flush;
+        /* The expression may be freed by freeUnreachableSymbolicExpressions() once no handle is held, the id may belong to engines which have been reset */
+        if (triton::api.isArchitectureValid() && ((SymbolicExpression_Object*)self)->generation == triton::api.getEnginesGeneration())
+          triton::api.unpinSymbolicExpression(((SymbolicExpression_Object*)self)->id);
         Py_DECREF(self);
       }
 
@@ -156,6 +164,22 @@ namespace triton {
       }
 
 
+      static PyObject* SymbolicExpression_getDependencies(PyObject* self, PyObject* noarg) {
+        try {
+          const std::vector<triton::usize>& dependencies = PySymbolicExpression_AsSymbolicExpression(self)->getDependencies();
+          PyObject* ret = xPyList_New(dependencies.size());
+
+          for (triton::usize index = 0; index < dependencies.size(); index++)
+            PyList_SetItem(ret, index, PyLong_FromUsize(dependencies[index]));
+
+          return ret;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* SymbolicExpression_getId(PyObject* self, PyObject* noarg) {
         try {
           return PyLong_FromUsize(PySymbolicExpression_AsSymbolicExpression(self)->getId());
@@ -304,6 +328,7 @@ namespace triton {
       PyMethodDef SymbolicExpression_callbacks[] = {
         {"getAst",            SymbolicExpression_getAst,            METH_NOARGS,    ""},
         {"getComment",        SymbolicExpression_getComment,        METH_NOARGS,    ""},
+        {"getDependencies",   SymbolicExpression_getDependencies,   METH_NOARGS,    ""},
         {"getId",             SymbolicExpression_getId,             METH_NOARGS,    ""},
         {"getKind",           SymbolicExpression_getKind,           METH_NOARGS,    ""},
         {"getNewAst",         SymbolicExpression_getNewAst,         METH_NOARGS,    ""},
@@ -381,8 +406,16 @@ namespace triton {
 
         PyType_Ready(&SymbolicExpression_Type);
         object = PyObject_NEW(SymbolicExpression_Object, &SymbolicExpression_Type);
-        if (object != NULL)
-          object->symExpr = symExpr;
+        if (object != NULL) {
+          object->symExpr    = symExpr;
+          object->id         = symExpr->getId();
+          object->generation = 0;
+          /* A Python handle keeps its expression alive (see freeUnreachableSymbolicExpressions()) */
+          if (triton::api.isArchitectureValid()) {
+            triton::api.pinSymbolicExpression(object->id);
+            object->generation = triton::api.getEnginesGeneration();
+          }
+        }
 
         return (PyObject*)object;
       }
@@ -121,22 +121,27 @@ namespace triton {
         std::ostringstream formula;
         z3::context ctx;
         z3::solver solver(ctx);
-        triton::uint32 representationMode = triton::ast::representations::astRepresentation.getMode();
 
         if (node == nullptr)
           throw triton::exceptions::SolverEngine("SolverEngine::getModels(): node cannot be null.");
 
-        /* Switch into the SMT mode */
-        triton::ast::representations::astRepresentation.setMode(triton::ast::representations::SMT_REPRESENTATION);
+        /* A constraint which is always false has no model */
+        if (this->preSolve(node) == PRESOLVE_UNSAT)
+          return ret;
 
-        /* First, set the QF_AUFBV flag  */
-        formula << "(set-logic QF_BV)";
+        /* Write the formula in the SMT mode, shared sub-terms are bound once so the formula grows with the DAG */
+        {
+          triton::ast::representations::AstRepresentationScope representation(triton::ast::representations::SMT_DAG_REPRESENTATION);
 
-        /* Then, delcare all symbolic variables */
-        formula << this->symbolicEngine->getVariablesDeclaration();
+          /* First, set the QF_AUFBV flag  */
+          formula << "(set-logic QF_BV)";
 
-        /* And concat the user expression */
-        formula << this->symbolicEngine->getFullAst(node);
+          /* Then, delcare all symbolic variables */
+          formula << this->symbolicEngine->getVariablesDeclaration();
+
+          /* And concat the user expression */
+          formula << this->symbolicEngine->getFullAst(node);
+        }
 
         /* Create the context and AST */
         Z3_ast ast = Z3_parse_smtlib2_string(ctx, formula.str().c_str(), 0, 0, 0, 0, 0, 0);
@@ -197,13 +202,26 @@ namespace triton {
           limit--;
         }
 
-        /* Restore the representation mode */
-        triton::ast::representations::astRepresentation.setMode(representationMode);
-
         return ret;
       }
 
 
+      enum presolve_e SolverEngine::preSolve(triton::ast::AbstractNode* node) const {
+        if (node == nullptr)
+          throw triton::exceptions::SolverEngine("SolverEngine::preSolve(): node cannot be null.");
+
+        const triton::ast::KnownBits& bits = node->getKnownBits();
+
+        if (bits.isTrue())
+          return PRESOLVE_SAT;
+
+        if (bits.isFalse())
+          return PRESOLVE_UNSAT;
+
+        return PRESOLVE_UNKNOWN;
+      }
+
+
       std::map<triton::uint32, SolverModel> SolverEngine::getModel(triton::ast::AbstractNode* node) const {
         std::map<triton::uint32, SolverModel> ret;
         std::list<std::map<triton::uint32, SolverModel>> allModels;
@@ -0,0 +1,56 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <triton/memoryReferenceTable.hpp>
+#include <triton/symbolicEnums.hpp>
+
+
+
+namespace triton {
+  namespace engines {
+    namespace symbolic {
+
+      MemoryReferenceTable::MemoryReferenceTable()
+        : triton::arch::PagedMemory<triton::usize, 8>(triton::engines::symbolic::UNSET) {
+      }
+
+
+      MemoryReferenceTable::MemoryReferenceTable(const MemoryReferenceTable& copy)
+        : triton::arch::PagedMemory<triton::usize, 8>(copy) {
+      }
+
+
+      MemoryReferenceTable::~MemoryReferenceTable() {
+      }
+
+
+      void MemoryReferenceTable::operator=(const MemoryReferenceTable& copy) {
+        triton::arch::PagedMemory<triton::usize, 8>::operator=(copy);
+      }
+
+
+      void MemoryReferenceTable::set(triton::uint64 addr, triton::usize id) {
+        if (id == triton::engines::symbolic::UNSET) {
+          this->remove(addr);
+          return;
+        }
+        triton::arch::PagedMemory<triton::usize, 8>::set(addr, id);
+      }
+
+
+      std::map<triton::uint64, triton::usize> MemoryReferenceTable::getReferences(void) const {
+        return this->getItems();
+      }
+
+
+      std::vector<std::pair<triton::uint64, triton::usize>> MemoryReferenceTable::getReferences(triton::uint64 addr, triton::usize size) const {
+        return this->getItems(addr, size);
+      }
+
+    }; /* symbolic namespace */
+  }; /* engines namespace */
+}; /* triton namespace */
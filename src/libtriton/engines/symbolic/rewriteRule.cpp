@@ -0,0 +1,532 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <algorithm>
+#include <cctype>
+#include <map>
+#include <utility>
+
+#include <triton/exceptions.hpp>
+#include <triton/rewriteRule.hpp>
+
+
+
+namespace triton {
+  namespace engines {
+    namespace symbolic {
+
+      /* Operators of the rule syntax: name -> <kind:arity>, an arity of 0 means two or more operands */
+      static const std::map<std::string, std::pair<triton::ast::kind_e, triton::uint32>>& getOperators(void) {
+        static const std::map<std::string, std::pair<triton::ast::kind_e, triton::uint32>> operators = {
+          {"=",             {triton::ast::EQUAL_NODE,    2}},
+          {"and",           {triton::ast::LAND_NODE,     2}},
+          {"bvadd",         {triton::ast::BVADD_NODE,    2}},
+          {"bvand",         {triton::ast::BVAND_NODE,    2}},
+          {"bvashr",        {triton::ast::BVASHR_NODE,   2}},
+          {"bvlshr",        {triton::ast::BVLSHR_NODE,   2}},
+          {"bvmul",         {triton::ast::BVMUL_NODE,    2}},
+          {"bvnand",        {triton::ast::BVNAND_NODE,   2}},
+          {"bvneg",         {triton::ast::BVNEG_NODE,    1}},
+          {"bvnor",         {triton::ast::BVNOR_NODE,    2}},
+          {"bvnot",         {triton::ast::BVNOT_NODE,    1}},
+          {"bvor",          {triton::ast::BVOR_NODE,     2}},
+          {"bvsdiv",        {triton::ast::BVSDIV_NODE,   2}},
+          {"bvsge",         {triton::ast::BVSGE_NODE,    2}},
+          {"bvsgt",         {triton::ast::BVSGT_NODE,    2}},
+          {"bvshl",         {triton::ast::BVSHL_NODE,    2}},
+          {"bvsle",         {triton::ast::BVSLE_NODE,    2}},
+          {"bvslt",         {triton::ast::BVSLT_NODE,    2}},
+          {"bvsmod",        {triton::ast::BVSMOD_NODE,   2}},
+          {"bvsrem",        {triton::ast::BVSREM_NODE,   2}},
+          {"bvsub",         {triton::ast::BVSUB_NODE,    2}},
+          {"bvudiv",        {triton::ast::BVUDIV_NODE,   2}},
+          {"bvuge",         {triton::ast::BVUGE_NODE,    2}},
+          {"bvugt",         {triton::ast::BVUGT_NODE,    2}},
+          {"bvule",         {triton::ast::BVULE_NODE,    2}},
+          {"bvult",         {triton::ast::BVULT_NODE,    2}},
+          {"bvurem",        {triton::ast::BVUREM_NODE,   2}},
+          {"bvxnor",        {triton::ast::BVXNOR_NODE,   2}},
+          {"bvxor",         {triton::ast::BVXOR_NODE,    2}},
+          {"concat",        {triton::ast::CONCAT_NODE,   0}},
+          {"distinct",      {triton::ast::DISTINCT_NODE, 2}},
+          {"ite",           {triton::ast::ITE_NODE,      3}},
+          {"not",           {triton::ast::LNOT_NODE,     1}},
+          {"or",            {triton::ast::LOR_NODE,      2}},
+        };
+        return operators;
+      }
+
+
+      /* Indexed operators of the rule syntax: name -> <kind:number of parameters> */
+      static const std::map<std::string, std::pair<triton::ast::kind_e, triton::uint32>>& getIndexedOperators(void) {
+        static const std::map<std::string, std::pair<triton::ast::kind_e, triton::uint32>> operators = {
+          {"extract",       {triton::ast::EXTRACT_NODE,  2}},
+          {"rotate_left",   {triton::ast::BVROL_NODE,    1}},
+          {"rotate_right",  {triton::ast::BVROR_NODE,    1}},
+          {"sign_extend",   {triton::ast::SX_NODE,       1}},
+          {"zero_extend",   {triton::ast::ZX_NODE,       1}},
+        };
+        return operators;
+      }
+
+
+      /* Returns true if all the operands of a node of this kind have the same size */
+      static bool isSameSizeOperator(triton::ast::kind_e kind) {
+        switch (kind) {
+          case triton::ast::BVADD_NODE:
+          case triton::ast::BVAND_NODE:
+          case triton::ast::BVASHR_NODE:
+          case triton::ast::BVLSHR_NODE:
+          case triton::ast::BVMUL_NODE:
+          case triton::ast::BVNAND_NODE:
+          case triton::ast::BVNOR_NODE:
+          case triton::ast::BVOR_NODE:
+          case triton::ast::BVSDIV_NODE:
+          case triton::ast::BVSGE_NODE:
+          case triton::ast::BVSGT_NODE:
+          case triton::ast::BVSHL_NODE:
+          case triton::ast::BVSLE_NODE:
+          case triton::ast::BVSLT_NODE:
+          case triton::ast::BVSMOD_NODE:
+          case triton::ast::BVSREM_NODE:
+          case triton::ast::BVSUB_NODE:
+          case triton::ast::BVUDIV_NODE:
+          case triton::ast::BVUGE_NODE:
+          case triton::ast::BVUGT_NODE:
+          case triton::ast::BVULE_NODE:
+          case triton::ast::BVULT_NODE:
+          case triton::ast::BVUREM_NODE:
+          case triton::ast::BVXNOR_NODE:
+          case triton::ast::BVXOR_NODE:
+          case triton::ast::DISTINCT_NODE:
+          case triton::ast::EQUAL_NODE:
+            return true;
+          default:
+            return false;
+        }
+      }
+
+
+      /* Splits a rule into parenthesis and atoms */
+      static std::vector<std::string> tokenize(const std::string& str) {
+        std::vector<std::string> tokens;
+        std::string atom;
+
+        for (auto it = str.begin(); it != str.end(); it++) {
+          if (*it == '(' || *it == ')' || std::isspace(static_cast<unsigned char>(*it))) {
+            if (!atom.empty())
+              tokens.push_back(atom);
+            atom.clear();
+            if (*it == '(' || *it == ')')
+              tokens.push_back(std::string(1, *it));
+          }
+          else
+            atom += *it;
+        }
+
+        if (!atom.empty())
+          tokens.push_back(atom);
+
+        return tokens;
+      }
+
+
+      /* Returns the token at the given position or throws an exception at the end of the rule */
+      static const std::string& getToken(const std::vector<std::string>& tokens, triton::usize pos) {
+        if (pos >= tokens.size())
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Unexpected end of rule.");
+        return tokens[pos];
+      }
+
+
+      /* Returns true if the token is a decimal or hexadecimal number */
+      static bool isNumber(const std::string& token) {
+        triton::usize start = 0;
+        bool hex = false;
+
+        if (token.size() > 2 && token[0] == '0' && (token[1] == 'x' || token[1] == 'X')) {
+          start = 2;
+          hex = true;
+        }
+
+        if (token.size() == start)
+          return false;
+
+        for (triton::usize i = start; i < token.size(); i++) {
+          if (hex && !std::isxdigit(static_cast<unsigned char>(token[i])))
+            return false;
+          if (!hex && !std::isdigit(static_cast<unsigned char>(token[i])))
+            return false;
+        }
+
+        return true;
+      }
+
+
+      /* Converts a token into a 32-bits number */
+      static triton::uint32 toUint32(const std::string& token) {
+        if (!isNumber(token))
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Expected a number instead of '" + token + "'.");
+        return triton::uint512(token).convert_to<triton::uint32>();
+      }
+
+
+      RewriteRule::RewriteRule(const std::string& rule) {
+        std::vector<std::string> pattern;
+        std::vector<std::string> replacement;
+        triton::usize arrow = rule.find("->");
+
+        if (arrow == std::string::npos)
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: A rule must be written '<pattern> -> <replacement>'.");
+
+        this->rule  = rule;
+        pattern     = tokenize(rule.substr(0, arrow));
+        replacement = tokenize(rule.substr(arrow + 2));
+
+        if (this->compilePattern(pattern, 0) != pattern.size())
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Unexpected tokens after the pattern.");
+
+        if (this->matcher.front().opcode != MATCH_NODE)
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: The root of a pattern must be a node.");
+
+        if (this->compileReplacement(replacement, 0) != replacement.size())
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Unexpected tokens after the replacement.");
+
+        this->kind = this->matcher.front().kind;
+      }
+
+
+      RewriteRule::RewriteRule(const RewriteRule& copy) {
+        *this = copy;
+      }
+
+
+      RewriteRule::~RewriteRule() {
+      }
+
+
+      void RewriteRule::operator=(const RewriteRule& other) {
+        this->builder   = other.builder;
+        this->kind      = other.kind;
+        this->matcher   = other.matcher;
+        this->rule      = other.rule;
+        this->variables = other.variables;
+      }
+
+
+      triton::usize RewriteRule::compileOperator(const std::vector<std::string>& tokens, triton::usize pos, Instruction& ins) const {
+        /* Indexed operator, e.g: (_ extract 7 0) */
+        if (getToken(tokens, pos) == "(") {
+          if (getToken(tokens, pos + 1) != "_")
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Expected '_' in an indexed operator.");
+
+          auto it = getIndexedOperators().find(getToken(tokens, pos + 2));
+          if (it == getIndexedOperators().end())
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Unknown operator '" + tokens[pos + 2] + "'.");
+
+          pos += 3;
+          for (triton::uint32 i = 0; i < it->second.second; i++)
+            ins.parameters.push_back(toUint32(getToken(tokens, pos++)));
+
+          if (getToken(tokens, pos) != ")")
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Too many parameters for '" + it->first + "'.");
+
+          ins.kind  = it->second.first;
+          ins.arity = 1;
+          return pos + 1;
+        }
+
+        auto it = getOperators().find(getToken(tokens, pos));
+        if (it == getOperators().end())
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Unknown operator '" + tokens[pos] + "'.");
+
+        ins.kind  = it->second.first;
+        ins.arity = it->second.second;
+        return pos + 1;
+      }
+
+
+      void RewriteRule::compileAtom(const std::string& token, Instruction& ins, bool replacement) {
+        triton::usize colon = token.find(':');
+        std::string name    = token.substr(0, colon);
+
+        ins.size     = (colon == std::string::npos) ? 0 : toUint32(token.substr(colon + 1));
+        ins.variable = 0;
+        ins.value    = 0;
+
+        if (name.empty())
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Invalid atom '" + token + "'.");
+
+        /* Constant */
+        if (std::isdigit(static_cast<unsigned char>(name[0]))) {
+          if (!isNumber(name))
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Invalid number '" + name + "'.");
+          ins.opcode = replacement ? BUILD_CONSTANT : MATCH_CONSTANT;
+          ins.value  = triton::uint512(name);
+          return;
+        }
+
+        /* Variable */
+        for (ins.variable = 0; ins.variable < this->variables.size(); ins.variable++) {
+          if (this->variables[ins.variable] == name)
+            break;
+        }
+
+        if (replacement) {
+          if (ins.variable == this->variables.size())
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Variable '" + name + "' is not bound by the pattern.");
+          if (ins.size != 0)
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Size conditions are only allowed in the pattern.");
+          ins.opcode = BUILD_VARIABLE;
+          return;
+        }
+
+        if (ins.variable == this->variables.size())
+          this->variables.push_back(name);
+
+        ins.opcode = MATCH_VARIABLE;
+      }
+
+
+      triton::usize RewriteRule::compilePattern(const std::vector<std::string>& tokens, triton::usize pos) {
+        Instruction ins;
+        triton::uint32 arity = 0;
+        triton::usize index  = 0;
+
+        ins.size = 0;
+
+        if (getToken(tokens, pos) == ")")
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Unexpected ')'.");
+
+        /* Variable or constant */
+        if (tokens[pos] != "(") {
+          this->compileAtom(tokens[pos], ins, false);
+          this->matcher.push_back(ins);
+          return pos + 1;
+        }
+
+        /* Constant, e.g: (_ bv1 8) */
+        if (getToken(tokens, pos + 1) == "_") {
+          const std::string& value = getToken(tokens, pos + 2);
+          if (value.size() < 3 || value.compare(0, 2, "bv") != 0 || !isNumber(value.substr(2)))
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Invalid constant '" + value + "'.");
+          ins.opcode = MATCH_CONSTANT;
+          ins.value  = triton::uint512(value.substr(2));
+          ins.size   = toUint32(getToken(tokens, pos + 3));
+          if (getToken(tokens, pos + 4) != ")")
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Expected ')' after a constant.");
+          this->matcher.push_back(ins);
+          return pos + 5;
+        }
+
+        /* Node, its childs are matched after it */
+        ins.opcode = MATCH_NODE;
+        pos = this->compileOperator(tokens, pos + 1, ins);
+        index = this->matcher.size();
+        this->matcher.push_back(ins);
+
+        while (getToken(tokens, pos) != ")") {
+          pos = this->compilePattern(tokens, pos);
+          arity++;
+        }
+
+        if ((ins.arity == 0 && arity < 2) || (ins.arity != 0 && arity != ins.arity))
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Invalid number of operands in the pattern.");
+
+        this->matcher[index].arity = arity;
+        return pos + 1;
+      }
+
+
+      triton::usize RewriteRule::compileReplacement(const std::vector<std::string>& tokens, triton::usize pos) {
+        std::vector<bool> unsized;
+        Instruction ins;
+        triton::uint32 arity = 0;
+        triton::uint32 first = 0;
+
+        ins.size = 0;
+
+        if (getToken(tokens, pos) == ")")
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Unexpected ')'.");
+
+        /* Variable or constant */
+        if (tokens[pos] != "(") {
+          this->compileAtom(tokens[pos], ins, true);
+          this->builder.push_back(ins);
+          return pos + 1;
+        }
+
+        /* Constant, e.g: (_ bv1 8) */
+        if (getToken(tokens, pos + 1) == "_") {
+          const std::string& value = getToken(tokens, pos + 2);
+          if (value.size() < 3 || value.compare(0, 2, "bv") != 0 || !isNumber(value.substr(2)))
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Invalid constant '" + value + "'.");
+          ins.opcode = BUILD_CONSTANT;
+          ins.value  = triton::uint512(value.substr(2));
+          ins.size   = toUint32(getToken(tokens, pos + 3));
+          if (getToken(tokens, pos + 4) != ")")
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: Expected ')' after a constant.");
+          this->builder.push_back(ins);
+          return pos + 5;
+        }
+
+        /* Node, its operands are built before it */
+        ins.opcode = BUILD_NODE;
+        pos = this->compileOperator(tokens, pos + 1, ins);
+
+        while (getToken(tokens, pos) != ")") {
+          pos = this->compileReplacement(tokens, pos);
+          unsized.push_back(this->builder.back().opcode == BUILD_CONSTANT && this->builder.back().size == 0);
+          arity++;
+        }
+
+        if ((ins.arity == 0 && arity < 2) || (ins.arity != 0 && arity != ins.arity))
+          throw triton::exceptions::SymbolicSimplification("RewriteRule: Invalid number of operands in the replacement.");
+
+        /*
+         * An operand which is a constant without size takes the size of its sibling operands.
+         * For an ite, the siblings are the two branches.
+         */
+        first = (ins.kind == triton::ast::ITE_NODE) ? 1 : 0;
+        for (triton::uint32 index = 0; index < arity; index++) {
+          if (!unsized[index])
+            continue;
+          if (index < first || (ins.kind != triton::ast::ITE_NODE && !isSameSizeOperator(ins.kind)) || std::find(unsized.begin() + first, unsized.end(), false) == unsized.end())
+            throw triton::exceptions::SymbolicSimplification("RewriteRule: The size of a constant cannot be derived from its operator, it must be written 'value:size'.");
+        }
+
+        ins.arity = arity;
+        this->builder.push_back(ins);
+        return pos + 1;
+      }
+
+
+      const std::string& RewriteRule::getRule(void) const {
+        return this->rule;
+      }
+
+
+      triton::ast::kind_e RewriteRule::getKind(void) const {
+        return this->kind;
+      }
+
+
+      triton::ast::AbstractNode* RewriteRule::apply(triton::ast::AbstractNode* node) const {
+        std::vector<triton::ast::AbstractNode*> bindings(this->variables.size(), nullptr);
+        std::vector<triton::ast::AbstractNode*> stack;
+        std::vector<triton::uint512> unsized;
+
+        /* Match the pattern in pre-order */
+        stack.push_back(node);
+        for (auto ins = this->matcher.begin(); ins != this->matcher.end(); ins++) {
+          triton::ast::AbstractNode* current = stack.back();
+          stack.pop_back();
+
+          switch (ins->opcode) {
+            case MATCH_NODE: {
+              std::vector<triton::ast::AbstractNode*>& childs = current->getChilds();
+              if (current->getKind() != ins->kind || childs.size() != ins->parameters.size() + ins->arity)
+                return nullptr;
+              for (triton::uint32 index = 0; index < ins->parameters.size(); index++) {
+                if (childs[index]->getKind() != triton::ast::DECIMAL_NODE)
+                  return nullptr;
+                if (reinterpret_cast<triton::ast::DecimalNode*>(childs[index])->getValue() != ins->parameters[index])
+                  return nullptr;
+              }
+              for (triton::usize index = childs.size(); index > ins->parameters.size(); index--)
+                stack.push_back(childs[index - 1]);
+              break;
+            }
+
+            case MATCH_VARIABLE:
+              if (ins->size != 0 && current->getBitvectorSize() != ins->size)
+                return nullptr;
+              if (bindings[ins->variable] == nullptr)
+                bindings[ins->variable] = current;
+              else if (!triton::ast::isSameTree(bindings[ins->variable], current))
+                return nullptr;
+              break;
+
+            case MATCH_CONSTANT:
+              if (current->getKind() != triton::ast::BV_NODE || current->evaluate() != ins->value)
+                return nullptr;
+              if (ins->size != 0 && current->getBitvectorSize() != ins->size)
+                return nullptr;
+              break;
+
+            default:
+              throw triton::exceptions::SymbolicSimplification("RewriteRule::apply(): Invalid match instruction.");
+          }
+        }
+
+        /*
+         * Build the replacement in post-order. Operands which do not fit (e.g: different sizes) make the rule not applicable.
+         * A constant without size is pushed as a nullptr and built by its parent, once the size of its siblings is known.
+         */
+        try {
+          for (auto ins = this->builder.begin(); ins != this->builder.end(); ins++) {
+            switch (ins->opcode) {
+              case BUILD_VARIABLE:
+                stack.push_back(bindings[ins->variable]);
+                break;
+
+              case BUILD_CONSTANT:
+                if (ins->size == 0) {
+                  stack.push_back(nullptr);
+                  unsized.push_back(ins->value);
+                }
+                else
+                  stack.push_back(triton::ast::bv(ins->value, ins->size));
+                break;
+
+              case BUILD_NODE: {
+                std::vector<triton::ast::AbstractNode*> childs;
+                std::vector<triton::ast::AbstractNode*> operands(stack.end() - ins->arity, stack.end());
+                triton::usize pending = std::count(operands.begin(), operands.end(), nullptr);
+                triton::usize index   = unsized.size() - pending;
+                triton::uint32 size   = 0;
+
+                stack.resize(stack.size() - ins->arity);
+
+                /* The compilation ensures that a sibling has a size */
+                for (auto it = operands.begin() + (ins->kind == triton::ast::ITE_NODE ? 1 : 0); it != operands.end() && size == 0; it++) {
+                  if (*it != nullptr)
+                    size = (*it)->getBitvectorSize();
+                }
+
+                for (auto it = operands.begin(); it != operands.end(); it++) {
+                  if (*it == nullptr)
+                    *it = triton::ast::bv(unsized[index++], size);
+                }
+                unsized.resize(unsized.size() - pending);
+
+                for (auto it = ins->parameters.begin(); it != ins->parameters.end(); it++)
+                  childs.push_back(triton::ast::decimal(*it));
+                childs.insert(childs.end(), operands.begin(), operands.end());
+                stack.push_back(triton::ast::newInstance(ins->kind, childs));
+                break;
+              }
+
+              default:
+                throw triton::exceptions::SymbolicSimplification("RewriteRule::apply(): Invalid build instruction.");
+            }
+          }
+        }
+        catch (const triton::exceptions::Ast& e) {
+          return nullptr;
+        }
+
+        /* The whole replacement is a constant, it takes the size of the rewritten node */
+        if (stack.back() == nullptr)
+          return triton::ast::bv(unsized.back(), node->getBitvectorSize());
+
+        return stack.back();
+      }
+
+    }; /* symbolic namespace */
+  }; /* engines namespace */
+}; /* triton namespace */
@@ -5,8 +5,13 @@
 **  This program is under the terms of the BSD License.
 */
 
+#include <algorithm>
+#include <cstdlib>
 #include <cstring>
 #include <new>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
 
 #include <triton/exceptions.hpp>
 #include <triton/coreUtils.hpp>
@@ -70,10 +75,31 @@ namespace triton {
   namespace engines {
     namespace symbolic {
 
+      /* Minimal number of created symbolic expressions between two collections. */
+      const triton::usize SYMBOLIC_GARBAGE_COLLECTION_THRESHOLD = 0x40000;
+
+      /* Maximal number of memoized full ASTs. The cache is dropped once it is full. */
+      const triton::usize UNROLLED_ASTS_CAPACITY = 0x10000;
+
+
+      /* Returns the locations of an expression to be modified. The set is duplicated if it is shared with a copy of the engine. */
+      template <typename T>
+      static std::set<T>& getWritableLocations(triton::arch::PagedMemory<std::shared_ptr<std::set<T>>>& locations, triton::usize id) {
+        if (!locations.isMapped(id))
+          locations.set(id, std::make_shared<std::set<T>>());
+
+        /* The page is duplicated first, so a set of a shared page is seen as shared */
+        std::shared_ptr<std::set<T>>& set = locations.getWritable(id);
+        if (set.use_count() > 1)
+          set = std::make_shared<std::set<T>>(*set);
+
+        return *set;
+      }
+
+
       SymbolicEngine::SymbolicEngine(triton::arch::Architecture* architecture,
                                      triton::modes::Modes* modes,
-                                     triton::callbacks::Callbacks* callbacks,
-                                     bool isBackup)
+                                     triton::callbacks::Callbacks* callbacks)
 
         : triton::engines::symbolic::SymbolicSimplification(callbacks),
           triton::engines::symbolic::PathManager(modes) {
@@ -93,11 +119,13 @@ namespace triton {
           this->symbolicReg[i] = triton::engines::symbolic::UNSET;
 
         this->callbacks       = callbacks;
-        this->backupFlag      = isBackup;
         this->enableFlag      = true;
         this->modes           = modes;
         this->uniqueSymExprId = 0;
         this->uniqueSymVarId  = 0;
+
+        this->collectionThreshold = SYMBOLIC_GARBAGE_COLLECTION_THRESHOLD;
+        this->createdExpressions  = 0;
       }
 
 
@@ -109,20 +137,28 @@ namespace triton {
           this->symbolicReg[i] = other.symbolicReg[i];
 
         /*
-         * The backup flag cannot be spread. once a class is tagged as
-         * backup, it always be a backup class.
+         * Expressions, variables and their tables are shared with the other
+         * engine until they are written (copy-on-write), so a copy is a cheap
+         * fork. The memoized full ASTs are a cache and are not copied.
          */
         this->alignedMemoryReference      = other.alignedMemoryReference;
         this->architecture                = other.architecture;
-        this->backupFlag                  = true;
         this->callbacks                   = other.callbacks;
+        this->collectionThreshold         = other.collectionThreshold;
+        this->comments                    = other.comments;
+        this->createdExpressions          = other.createdExpressions;
         this->enableFlag                  = other.enableFlag;
+        this->memoryLocations             = other.memoryLocations;
         this->memoryReference             = other.memoryReference;
         this->modes                       = other.modes;
+        this->pinnedExpressions           = other.pinnedExpressions;
+        this->registerLocations           = other.registerLocations;
         this->symbolicExpressions         = other.symbolicExpressions;
         this->symbolicVariables           = other.symbolicVariables;
         this->uniqueSymExprId             = other.uniqueSymExprId;
         this->uniqueSymVarId              = other.uniqueSymVarId;
+        this->dependencies.clear();
+        this->unrolledAsts.clear();
       }
 
 
@@ -137,44 +173,33 @@ namespace triton {
         triton::engines::symbolic::SymbolicSimplification::operator=(other);
         triton::engines::symbolic::PathManager::operator=(other);
 
-        /* Delete unused expressions */
-        std::map<triton::usize, SymbolicExpression*>::iterator it1;
-        for (it1 = this->symbolicExpressions.begin(); it1 != this->symbolicExpressions.end(); it1++) {
-          if (other.symbolicExpressions.find(it1->first) == other.symbolicExpressions.end())
-            delete this->symbolicExpressions[it1->first];
-        }
-
-        /* Delete unused variables */
-        std::map<triton::usize, SymbolicVariable*>::iterator it2;
-        for (it2 = this->symbolicVariables.begin(); it2 != this->symbolicVariables.end(); it2++) {
-          if (other.symbolicVariables.find(it2->first) == other.symbolicVariables.end())
-            delete this->symbolicVariables[it2->first];
-        }
-
+        /* Expressions and variables which are not shared anymore are released with the tables */
         delete[] this->symbolicReg;
         this->copy(other);
       }
 
 
-      SymbolicEngine::~SymbolicEngine() {
-        std::map<triton::usize, SymbolicExpression*>::iterator it1 = this->symbolicExpressions.begin();
-        std::map<triton::usize, SymbolicVariable*>::iterator it2 = this->symbolicVariables.begin();
+      void SymbolicEngine::restore(const SymbolicEngine& other) {
+        /* Expressions and variables created since the copy keep their ids (e.g: in Python objects or in memoized ASTs) */
+        triton::usize uniqueSymExprId = std::max(this->uniqueSymExprId, other.uniqueSymExprId);
+        triton::usize uniqueSymVarId  = std::max(this->uniqueSymVarId, other.uniqueSymVarId);
+
+        /* The pins are held by the handles which are alive, not by the copy */
+        std::map<triton::usize, triton::usize> pinnedExpressions = this->pinnedExpressions;
+
+        *this = other;
+
+        this->pinnedExpressions = pinnedExpressions;
+        this->uniqueSymExprId   = uniqueSymExprId;
+        this->uniqueSymVarId    = uniqueSymVarId;
+      }
+
 
+      SymbolicEngine::~SymbolicEngine() {
         /*
-         * Don't delete symbolic expressions and symbolic variables
-         * if this class is used as backup engine. Otherwise that may
-         * result in a double-free bug if the original symbolic engine
-         * is deleted too (cf: #385).
+         * Symbolic expressions and symbolic variables are shared with the
+         * copies of the engine, the last owner deletes them (cf: #385).
          */
-        if (this->backupFlag == false) {
-          /* Delete all symbolic expressions */
-          for (; it1 != this->symbolicExpressions.end(); ++it1)
-            delete it1->second;
-
-          /* Delete all symbolic variables */
-          for (; it2 != this->symbolicVariables.end(); ++it2)
-            delete it2->second;
-        }
 
         /* Delete all symbolic register */
         delete[] this->symbolicReg;
@@ -192,7 +217,7 @@ namespace triton {
         if (!this->architecture->isRegisterValid(parentId))
           return;
 
-        this->symbolicReg[parentId] = triton::engines::symbolic::UNSET;
+        this->setRegisterReference(parentId, triton::engines::symbolic::UNSET);
       }
 
 
@@ -200,6 +225,7 @@ namespace triton {
       void SymbolicEngine::concretizeAllRegister(void) {
         for (triton::uint32 i = 0; i < this->numberOfRegisters; i++)
           this->symbolicReg[i] = triton::engines::symbolic::UNSET;
+        this->registerLocations.clear();
       }
 
 
@@ -223,7 +249,13 @@ namespace triton {
        * before symbolic processing.
        */
       void SymbolicEngine::concretizeMemory(triton::uint64 addr) {
-        this->memoryReference.erase(addr);
+        triton::usize id = this->memoryReference.get(addr);
+
+        if (id != triton::engines::symbolic::UNSET) {
+          this->removeMemoryLocation(id, addr);
+          this->memoryReference.remove(addr);
+        }
+
         if (this->modes->isModeEnabled(triton::modes::ALIGNED_MEMORY))
           this->removeAlignedMemory(addr, BYTE_SIZE);
       }
@@ -232,6 +264,7 @@ namespace triton {
       /* Same as concretizeMemory but with all address memory */
       void SymbolicEngine::concretizeAllMemory(void) {
         this->memoryReference.clear();
+        this->memoryLocations.clear();
         this->alignedMemoryReference.clear();
       }
 
@@ -292,12 +325,7 @@ namespace triton {
 
       /* Returns the reference memory if it's referenced otherwise returns UNSET */
       triton::usize SymbolicEngine::getSymbolicMemoryId(triton::uint64 addr) const {
-        std::map<triton::uint64, triton::usize>::const_iterator it;
-
-        if ((it = this->memoryReference.find(addr)) != this->memoryReference.end())
-          return it->second;
-
-        return triton::engines::symbolic::UNSET;
+        return this->memoryReference.get(addr);
       }
 
 
@@ -305,26 +333,34 @@ namespace triton {
       SymbolicVariable* SymbolicEngine::getSymbolicVariableFromId(triton::usize symVarId) const {
         if (this->symbolicVariables.find(symVarId) == this->symbolicVariables.end())
           return nullptr;
-        return this->symbolicVariables.at(symVarId);
+        return this->symbolicVariables.at(symVarId).get();
       }
 
 
       /* Returns the symbolic variable otherwise returns nullptr */
       SymbolicVariable* SymbolicEngine::getSymbolicVariableFromName(const std::string& symVarName) const {
-        std::map<triton::usize, SymbolicVariable*>::const_iterator it;
+        SymbolicVariable* symVar = nullptr;
 
-        for (it = this->symbolicVariables.begin(); it != this->symbolicVariables.end(); it++) {
-          if (it->second->getName() == symVarName)
-            return it->second;
-        }
+        /* The name of a variable is built from its id (see SymbolicVariable::SymbolicVariable()) */
+        if (symVarName.compare(0, TRITON_SYMVAR_NAME_SIZE, TRITON_SYMVAR_NAME) != 0)
+          return nullptr;
 
-        return nullptr;
+        symVar = this->getSymbolicVariableFromId(std::strtoull(symVarName.c_str() + TRITON_SYMVAR_NAME_SIZE, nullptr, 10));
+        if (symVar == nullptr || symVar->getName() != symVarName)
+          return nullptr;
+
+        return symVar;
       }
 
 
       /* Returns all symbolic variables */
       const std::map<triton::usize, SymbolicVariable*>& SymbolicEngine::getSymbolicVariables(void) const {
-        return this->symbolicVariables;
+        this->symbolicVariablesView.clear();
+
+        for (auto it = this->symbolicVariables.begin(); it != this->symbolicVariables.end(); it++)
+          this->symbolicVariablesView.insert(this->symbolicVariablesView.end(), std::make_pair(it->first, it->second.get()));
+
+        return this->symbolicVariablesView;
       }
 
 
@@ -391,102 +427,415 @@ namespace triton {
       SymbolicExpression* SymbolicEngine::newSymbolicExpression(triton::ast::AbstractNode* node, triton::engines::symbolic::symkind_e kind, const std::string& comment) {
         triton::usize id = this->getUniqueSymExprId();
         node = this->processSimplification(node);
-        SymbolicExpression* expr = new(std::nothrow) SymbolicExpression(node, id, kind, comment);
+        SymbolicExpression* expr = new(std::nothrow) SymbolicExpression(node, id, kind);
         if (expr == nullptr)
           throw triton::exceptions::SymbolicEngine("SymbolicEngine::newSymbolicExpression(): not enough memory");
-        this->symbolicExpressions[id] = expr;
+        if (this->modes->isModeEnabled(triton::modes::SYMBOLIC_COMMENTS))
+          expr->setComment(this->internComment(comment));
+        this->symbolicExpressions.set(id, std::shared_ptr<SymbolicExpression>(expr));
+        this->createdExpressions++;
         return expr;
       }
 
 
+      /* Returns the shared copy of a comment */
+      std::shared_ptr<const std::string> SymbolicEngine::internComment(const std::string& comment) {
+        if (comment.empty())
+          return nullptr;
+
+        std::shared_ptr<const std::string>& shared = this->comments[comment];
+        if (shared == nullptr)
+          shared = std::make_shared<const std::string>(comment);
+
+        return shared;
+      }
+
+
       /* Removes the symbolic expression corresponding to the id */
       void SymbolicEngine::removeSymbolicExpression(triton::usize symExprId) {
-        std::map<triton::uint64, triton::usize>::iterator it;
-
-        if (this->symbolicExpressions.find(symExprId) != this->symbolicExpressions.end()) {
-          /* Delete and remove the pointer */
-          delete this->symbolicExpressions[symExprId];
-          this->symbolicExpressions.erase(symExprId);
-
-          /* Concretize the register if it exists */
-          for (triton::uint32 i = 0; i < this->numberOfRegisters; i++) {
-            if (this->symbolicReg[i] == symExprId) {
-              this->symbolicReg[i] = triton::engines::symbolic::UNSET;
-              return;
-            }
+        if (this->symbolicExpressions.isMapped(symExprId)) {
+          /* The AST may be freed, so its cached dependencies are dropped */
+          this->dependencies.erase(this->symbolicExpressions.get(symExprId)->getAst());
+
+          /* Remove the pointer, the expression is deleted if it is not shared */
+          this->symbolicExpressions.remove(symExprId);
+          this->unrolledAsts.erase(symExprId);
+
+          /* Concretize the registers assigned to the expression */
+          if (this->registerLocations.isMapped(symExprId)) {
+            for (triton::uint32 regId : *this->registerLocations.get(symExprId))
+              this->symbolicReg[regId] = triton::engines::symbolic::UNSET;
+            this->registerLocations.remove(symExprId);
           }
 
-          /* Concretize the memory if it exists */
-          for (it = this->memoryReference.begin(); it != memoryReference.end(); it++) {
-            if (it->second == symExprId) {
-              this->concretizeMemory(it->first);
-              return;
+          /* Concretize the memory assigned to the expression, each address is removed from its page */
+          if (this->memoryLocations.isMapped(symExprId)) {
+            for (triton::uint64 addr : *this->memoryLocations.get(symExprId)) {
+              this->memoryReference.remove(addr);
+              if (this->modes->isModeEnabled(triton::modes::ALIGNED_MEMORY))
+                this->removeAlignedMemory(addr, BYTE_SIZE);
             }
+            this->memoryLocations.remove(symExprId);
           }
         }
 
       }
 
 
+      /* Frees all symbolic expressions which are not reachable anymore */
+      std::vector<triton::usize> SymbolicEngine::freeUnreachableSymbolicExpressions(const std::vector<triton::ast::AbstractNode*>& roots) {
+        std::unordered_set<triton::usize> live;
+        std::unordered_set<triton::ast::AbstractNode*> visited;
+        std::vector<triton::ast::AbstractNode*> nodes(roots);
+        std::vector<triton::usize> worklist;
+        std::vector<triton::usize> freed;
+
+        /* Expressions assigned to registers and memory, and pinned expressions */
+        for (triton::uint32 regId = 0; regId < this->numberOfRegisters; regId++) {
+          if (this->symbolicReg[regId] != triton::engines::symbolic::UNSET)
+            worklist.push_back(this->symbolicReg[regId]);
+        }
+
+        auto references = this->memoryReference.getReferences();
+        for (auto it = references.begin(); it != references.end(); it++)
+          worklist.push_back(it->second);
+
+        for (auto it = this->pinnedExpressions.begin(); it != this->pinnedExpressions.end(); it++)
+          worklist.push_back(it->first);
+
+        /* Expressions referenced by the root nodes, the path constraints and the aligned memory */
+        for (auto it = this->pathConstraints.begin(); it != this->pathConstraints.end(); it++) {
+          const auto& branches = it->getBranchConstraints();
+          for (auto branch = branches.begin(); branch != branches.end(); branch++)
+            nodes.push_back(std::get<3>(*branch));
+        }
+
+        for (auto it = this->alignedMemoryReference.begin(); it != this->alignedMemoryReference.end(); it++)
+          nodes.push_back(it->second);
+
+        /* Mark all reachable expressions */
+        while (!worklist.empty() || !nodes.empty()) {
+          if (!nodes.empty()) {
+            triton::ast::AbstractNode* node = nodes.back();
+            nodes.pop_back();
+
+            if (node == nullptr || !visited.insert(node).second)
+              continue;
+
+            if (node->getKind() == triton::ast::REFERENCE_NODE)
+              worklist.push_back(reinterpret_cast<triton::ast::ReferenceNode*>(node)->getValue());
+
+            std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+            nodes.insert(nodes.end(), childs.begin(), childs.end());
+            continue;
+          }
+
+          triton::usize id = worklist.back();
+          worklist.pop_back();
+
+          if (!live.insert(id).second)
+            continue;
+
+          /* The dependencies of the expressions which stay alive are not computed again */
+          if (this->symbolicExpressions.isMapped(id)) {
+            const std::vector<triton::usize>& dependencies = this->getDependencies(this->symbolicExpressions.get(id).get());
+            worklist.insert(worklist.end(), dependencies.begin(), dependencies.end());
+          }
+        }
+
+        /* Sweep */
+        auto expressions = this->symbolicExpressions.getItems();
+        for (auto it = expressions.begin(); it != expressions.end(); it++) {
+          if (live.find(it->first) == live.end())
+            freed.push_back(it->first);
+        }
+
+        for (auto it = freed.begin(); it != freed.end(); it++)
+          this->removeSymbolicExpression(*it);
+
+        /* The next collection occurs when the number of expressions has doubled */
+        this->createdExpressions  = 0;
+        this->collectionThreshold = std::max(SYMBOLIC_GARBAGE_COLLECTION_THRESHOLD, static_cast<triton::usize>(this->symbolicExpressions.size()));
+
+        return freed;
+      }
+
+
+      /* Forgets symbolic expressions without deleting them */
+      void SymbolicEngine::forgetSymbolicExpressions(const std::vector<triton::usize>& symExprIds) {
+        for (auto it = symExprIds.begin(); it != symExprIds.end(); it++) {
+          if (this->symbolicExpressions.isMapped(*it))
+            this->dependencies.erase(this->symbolicExpressions.get(*it)->getAst());
+          this->symbolicExpressions.remove(*it);
+          this->unrolledAsts.erase(*it);
+        }
+      }
+
+
+      /* Returns true if enough symbolic expressions have been created since the last collection */
+      bool SymbolicEngine::isSymbolicCollectionRequired(void) const {
+        return (this->createdExpressions >= this->collectionThreshold);
+      }
+
+
+      /* Pins a symbolic expression */
+      void SymbolicEngine::pinSymbolicExpression(triton::usize symExprId) {
+        this->pinnedExpressions[symExprId]++;
+      }
+
+
+      /* Unpins a symbolic expression */
+      void SymbolicEngine::unpinSymbolicExpression(triton::usize symExprId) {
+        auto it = this->pinnedExpressions.find(symExprId);
+
+        if (it == this->pinnedExpressions.end())
+          return;
+
+        if (--it->second == 0)
+          this->pinnedExpressions.erase(it);
+      }
+
+
+      /* Assigns a symbolic reference id to a parent register and updates the reverse index */
+      void SymbolicEngine::setRegisterReference(triton::uint32 regId, triton::usize id) {
+        triton::usize previous = this->symbolicReg[regId];
+
+        if (previous == id)
+          return;
+
+        if (previous != triton::engines::symbolic::UNSET && this->registerLocations.isMapped(previous)) {
+          std::set<triton::uint32>& regs = getWritableLocations(this->registerLocations, previous);
+          regs.erase(regId);
+          if (regs.empty())
+            this->registerLocations.remove(previous);
+        }
+
+        this->symbolicReg[regId] = id;
+        if (id != triton::engines::symbolic::UNSET)
+          getWritableLocations(this->registerLocations, id).insert(regId);
+      }
+
+
+      /* Removes a memory address from the reverse index of a symbolic reference id */
+      void SymbolicEngine::removeMemoryLocation(triton::usize id, triton::uint64 addr) {
+        if (!this->memoryLocations.isMapped(id))
+          return;
+
+        std::set<triton::uint64>& addrs = getWritableLocations(this->memoryLocations, id);
+        addrs.erase(addr);
+        if (addrs.empty())
+          this->memoryLocations.remove(id);
+      }
+
+
       /* Gets the symbolic expression pointer from a symbolic id */
       SymbolicExpression* SymbolicEngine::getSymbolicExpressionFromId(triton::usize symExprId) const {
-        if (this->symbolicExpressions.find(symExprId) == this->symbolicExpressions.end())
+        if (!this->symbolicExpressions.isMapped(symExprId))
           throw triton::exceptions::SymbolicEngine("SymbolicEngine::getSymbolicExpressionFromId(): symbolic expression id not found");
-        return this->symbolicExpressions.at(symExprId);
+        return this->symbolicExpressions.get(symExprId).get();
+      }
+
+
+      SymbolicExpression* SymbolicEngine::getWritableSymbolicExpression(triton::usize symExprId) {
+        if (!this->symbolicExpressions.isMapped(symExprId))
+          throw triton::exceptions::SymbolicEngine("SymbolicEngine::getWritableSymbolicExpression(): symbolic expression id not found");
+
+        /* The page is duplicated first, so an expression of a shared page is seen as shared */
+        std::shared_ptr<SymbolicExpression>& expr = this->symbolicExpressions.getWritable(symExprId);
+        if (expr.use_count() > 1) {
+          std::shared_ptr<SymbolicExpression> copy(new(std::nothrow) SymbolicExpression(*expr));
+          if (copy == nullptr)
+            throw triton::exceptions::SymbolicEngine("SymbolicEngine::getWritableSymbolicExpression(): Not enough memory.");
+          expr = copy;
+        }
+
+        return expr.get();
       }
 
 
       /* Returns all symbolic expressions */
       const std::map<triton::usize, SymbolicExpression*>& SymbolicEngine::getSymbolicExpressions(void) const {
-        return this->symbolicExpressions;
+        auto expressions = this->symbolicExpressions.getItems();
+
+        this->symbolicExpressionsView.clear();
+
+        for (auto it = expressions.begin(); it != expressions.end(); it++)
+          this->symbolicExpressionsView.insert(this->symbolicExpressionsView.end(), std::make_pair(it->first, it->second.get()));
+
+        return this->symbolicExpressionsView;
       }
 
 
-      /* Returns the full symbolic expression backtracked. */
-      triton::ast::AbstractNode* SymbolicEngine::getFullAst(triton::ast::AbstractNode* node, std::set<triton::usize>& processed) {
-        std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
-
-        for (triton::uint32 index = 0; index < childs.size(); index++) {
-          if (childs[index]->getKind() == triton::ast::REFERENCE_NODE) {
-            triton::usize id = reinterpret_cast<triton::ast::ReferenceNode*>(childs[index])->getValue();
-            triton::ast::AbstractNode* ref = this->getSymbolicExpressionFromId(id)->getAst();
-            childs[index] = ref;
-            if (processed.find(id) != processed.end())
-              continue;
-            processed.insert(id);
-          }
-          this->getFullAst(childs[index], processed);
+      /* Returns the number of symbolic expressions */
+      triton::usize SymbolicEngine::getNumberOfSymbolicExpressions(void) const {
+        return this->symbolicExpressions.size();
+      }
+
+
+      /* Returns all AST nodes directly held by the engine */
+      void SymbolicEngine::getAstRoots(std::vector<triton::ast::AbstractNode*>& roots) const {
+        auto expressions = this->symbolicExpressions.getItems();
+
+        for (auto it = expressions.begin(); it != expressions.end(); it++) {
+          if (it->second->getAst() != nullptr)
+            roots.push_back(it->second->getAst());
         }
 
-        return node;
+        for (auto it = this->pathConstraints.begin(); it != this->pathConstraints.end(); it++) {
+          const auto& branches = it->getBranchConstraints();
+          for (auto branch = branches.begin(); branch != branches.end(); branch++)
+            roots.push_back(std::get<3>(*branch));
+        }
+
+        for (auto it = this->alignedMemoryReference.begin(); it != this->alignedMemoryReference.end(); it++)
+          roots.push_back(it->second);
+
+        for (auto it = this->unrolledAsts.begin(); it != this->unrolledAsts.end(); it++)
+          roots.push_back(it->second.second);
       }
 
 
       /* Returns the full symbolic expression backtracked. */
       triton::ast::AbstractNode* SymbolicEngine::getFullAst(triton::ast::AbstractNode* node) {
-        std::set<triton::usize> processed;
-        return this->getFullAst(node, processed);
-      }
+        std::unordered_map<triton::ast::AbstractNode*, triton::ast::AbstractNode*> unrolled;
+        std::unordered_set<triton::ast::AbstractNode*> visited;
+        std::vector<std::pair<triton::ast::AbstractNode*, bool>> worklist;
+
+        if (node == nullptr)
+          return nullptr;
+
+        /* Iterative post-order walk, the boolean is true once all childs of the node have been pushed */
+        worklist.push_back(std::make_pair(node, false));
+
+        while (!worklist.empty()) {
+          triton::ast::AbstractNode* current = worklist.back().first;
+          bool expanded                      = worklist.back().second;
+
+          worklist.pop_back();
+
+          if (expanded) {
+            /* A reference is replaced by the full AST of its expression, which is memoized */
+            if (current->getKind() == triton::ast::REFERENCE_NODE) {
+              triton::usize id = reinterpret_cast<triton::ast::ReferenceNode*>(current)->getValue();
+              triton::ast::AbstractNode* ast = this->getSymbolicExpressionFromId(id)->getAst();
+              /* The memoized ASTs are kept alive by the AST garbage collection, so their number is bounded */
+              if (this->unrolledAsts.size() >= UNROLLED_ASTS_CAPACITY)
+                this->unrolledAsts.clear();
+              this->unrolledAsts[id] = std::make_pair(ast, unrolled[ast]);
+              unrolled[current] = unrolled[ast];
+            }
+            /* Other nodes are rebuilt only if one of their childs has been unrolled */
+            else {
+              std::vector<triton::ast::AbstractNode*> childs;
+              for (auto it = current->getChilds().begin(); it != current->getChilds().end(); it++)
+                childs.push_back(unrolled[*it]);
+              unrolled[current] = triton::ast::newInstance(current, childs);
+            }
+            continue;
+          }
 
+          if (visited.find(current) != visited.end())
+            continue;
+
+          visited.insert(current);
 
-      /* [private method] Slices all expressions from a given node */
-      void SymbolicEngine::sliceExpressions(triton::ast::AbstractNode* node, std::map<triton::usize, SymbolicExpression*>& exprs) {
-        std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+          if (current->getKind() == triton::ast::REFERENCE_NODE) {
+            triton::usize id = reinterpret_cast<triton::ast::ReferenceNode*>(current)->getValue();
+            triton::ast::AbstractNode* ast = this->getSymbolicExpressionFromId(id)->getAst();
+            auto cached = this->unrolledAsts.find(id);
 
-        for (triton::uint32 index = 0; index < childs.size(); index++) {
-          if (childs[index]->getKind() == triton::ast::REFERENCE_NODE) {
-            triton::usize id = reinterpret_cast<triton::ast::ReferenceNode*>(childs[index])->getValue();
-            if (exprs.find(id) == exprs.end()) {
-              SymbolicExpression* expr = this->getSymbolicExpressionFromId(id);
-              exprs[id] = expr;
-              this->sliceExpressions(expr->getAst(), exprs);
+            /* Already unrolled, and the expression has not been assigned a new AST since */
+            if (cached != this->unrolledAsts.end() && cached->second.first == ast) {
+              unrolled[current] = cached->second.second;
+              continue;
             }
+
+            worklist.push_back(std::make_pair(current, true));
+            if (visited.find(ast) == visited.end())
+              worklist.push_back(std::make_pair(ast, false));
+            continue;
           }
-          this->sliceExpressions(childs[index], exprs);
+
+          worklist.push_back(std::make_pair(current, true));
+
+          /* Pushed in reverse order, so childs are unrolled from left to right */
+          std::vector<triton::ast::AbstractNode*>& childs = current->getChilds();
+          for (auto it = childs.rbegin(); it != childs.rend(); it++) {
+            if (visited.find(*it) == visited.end())
+              worklist.push_back(std::make_pair(*it, false));
+          }
+        }
+
+        return unrolled[node];
+      }
+
+
+      /* Drops all memoized full ASTs and cached dependencies */
+      void SymbolicEngine::invalidateFullAsts(void) {
+        this->dependencies.clear();
+        this->unrolledAsts.clear();
+      }
+
+
+      /* Drops the memoized full ASTs and the cached dependencies which use nodes about to be freed */
+      void SymbolicEngine::invalidateFullAsts(const std::set<triton::ast::AbstractNode*>& nodes) {
+        if (nodes.empty())
+          return;
+
+        if (!this->dependencies.empty()) {
+          for (auto it = nodes.begin(); it != nodes.end(); it++)
+            this->dependencies.erase(*it);
+        }
+
+        for (auto it = this->unrolledAsts.begin(); it != this->unrolledAsts.end();) {
+          if (nodes.find(it->second.first) != nodes.end() || nodes.find(it->second.second) != nodes.end())
+            it = this->unrolledAsts.erase(it);
+          else
+            it++;
         }
       }
 
 
+      /* Drops the memoized full ASTs and the cached dependencies which reach a modified node */
+      void SymbolicEngine::invalidateAsts(triton::ast::AbstractNode* node) {
+        std::set<triton::ast::AbstractNode*> ancestors;
+        std::vector<triton::ast::AbstractNode*> worklist(1, node);
+
+        if (this->dependencies.empty() && this->unrolledAsts.empty())
+          return;
+
+        /*
+         * Reference nodes are parents of the ASTs they point to, so the walk
+         * also reaches the ASTs of the expressions which use a modified one.
+         */
+        while (!worklist.empty()) {
+          triton::ast::AbstractNode* current = worklist.back();
+          worklist.pop_back();
+
+          if (!ancestors.insert(current).second)
+            continue;
+
+          std::set<triton::ast::AbstractNode*>& parents = current->getParents();
+          worklist.insert(worklist.end(), parents.begin(), parents.end());
+        }
+
+        this->invalidateFullAsts(ancestors);
+      }
+
+
+      /* Returns the cached dependencies of an expression */
+      const std::vector<triton::usize>& SymbolicEngine::getDependencies(SymbolicExpression* expr) {
+        triton::ast::AbstractNode* ast = expr->getAst();
+        auto it = this->dependencies.find(ast);
+
+        /* Entries are dropped when their AST is modified, so a new AST is computed again */
+        if (it == this->dependencies.end())
+          it = this->dependencies.insert(std::make_pair(ast, expr->getDependencies())).first;
+
+        return it->second;
+      }
+
+
       /* Slices all expressions from a given one */
       std::map<triton::usize, SymbolicExpression*> SymbolicEngine::sliceExpressions(SymbolicExpression* expr) {
         std::map<triton::usize, SymbolicExpression*> exprs;
@@ -494,8 +843,22 @@ namespace triton {
         if (expr == nullptr)
           throw triton::exceptions::SymbolicEngine("SymbolicEngine::sliceExpressions(): expr cannot be null.");
 
+        /* Each expression of the slice is visited once, its dependencies are cached */
+        std::vector<SymbolicExpression*> worklist(1, expr);
         exprs[expr->getId()] = expr;
-        this->sliceExpressions(expr->getAst(), exprs);
+
+        while (!worklist.empty()) {
+          const std::vector<triton::usize>& dependencies = this->getDependencies(worklist.back());
+          worklist.pop_back();
+
+          for (auto it = dependencies.begin(); it != dependencies.end(); it++) {
+            if (exprs.find(*it) != exprs.end())
+              continue;
+            SymbolicExpression* dependency = this->getSymbolicExpressionFromId(*it);
+            exprs[*it] = dependency;
+            worklist.push_back(dependency);
+          }
+        }
 
         return exprs;
       }
@@ -503,12 +866,13 @@ namespace triton {
 
       /* Returns a list which contains all tainted expressions */
       std::list<SymbolicExpression*> SymbolicEngine::getTaintedSymbolicExpressions(void) const {
-        std::map<triton::usize, SymbolicExpression*>::const_iterator it;
+        std::map<triton::usize, std::shared_ptr<SymbolicExpression>> expressions = this->symbolicExpressions.getItems();
+        std::map<triton::usize, std::shared_ptr<SymbolicExpression>>::const_iterator it;
         std::list<SymbolicExpression*> taintedExprs;
 
-        for (it = this->symbolicExpressions.begin(); it != this->symbolicExpressions.end(); it++) {
+        for (it = expressions.begin(); it != expressions.end(); it++) {
           if (it->second->isTainted == true)
-            taintedExprs.push_back(it->second);
+            taintedExprs.push_back(it->second.get());
         }
         return taintedExprs;
       }
@@ -516,7 +880,7 @@ namespace triton {
 
       /* Returns the list of the symbolic variables declared in the trace */
       std::string SymbolicEngine::getVariablesDeclaration(void) const {
-        std::map<triton::usize, SymbolicVariable*>::const_iterator it;
+        std::map<triton::usize, std::shared_ptr<SymbolicVariable>>::const_iterator it;
         std::stringstream stream;
 
         for(it = this->symbolicVariables.begin(); it != this->symbolicVariables.end(); it++)
@@ -544,10 +908,11 @@ namespace triton {
       /* Returns the map of symbolic memory defined */
       std::map<triton::uint64, SymbolicExpression*> SymbolicEngine::getSymbolicMemory(void) const {
         std::map<triton::uint64, SymbolicExpression*> ret;
+        std::map<triton::uint64, triton::usize> references = this->memoryReference.getReferences();
         std::map<triton::uint64, triton::usize>::const_iterator it;
 
-        for (it = this->memoryReference.begin(); it != this->memoryReference.end(); it++)
-          ret[it->first] = this->getSymbolicExpressionFromId(it->second);
+        for (it = references.begin(); it != references.end(); it++)
+          ret.insert(ret.end(), std::make_pair(it->first, this->getSymbolicExpressionFromId(it->second)));
 
         return ret;
       }
@@ -563,7 +928,7 @@ namespace triton {
       SymbolicVariable* SymbolicEngine::convertExpressionToSymbolicVariable(triton::usize exprId, triton::uint32 symVarSize, const std::string& symVarComment) {
         triton::ast::AbstractNode* tmp  = nullptr;
         SymbolicVariable* symVar = nullptr;
-        SymbolicExpression* expression = this->getSymbolicExpressionFromId(exprId);
+        SymbolicExpression* expression = this->getWritableSymbolicExpression(exprId);
 
         symVar = this->newSymbolicVariable(triton::engines::symbolic::UNDEF, 0, symVarSize, symVarComment);
         if (expression->getAst())
@@ -572,7 +937,6 @@ namespace triton {
         tmp = triton::ast::variable(*symVar);
         tmp->setParent(expression->getAst()->getParents());
         expression->setAst(tmp);
-        tmp->init();
 
         return symVar;
       }
@@ -597,6 +961,12 @@ namespace triton {
         /* Create the AST node */
         triton::ast::AbstractNode* symVarNode = triton::ast::variable(*symVar);
 
+        /* Packed memory is converted by ranges of bytes */
+        if (this->modes->isModeEnabled(triton::modes::PACKED_MEMORY)) {
+          this->convertPackedMemoryToSymbolicVariable(mem, symVarNode);
+          return symVar;
+        }
+
         /*  Split expression in bytes */
         for (triton::sint32 index = symVarSize-1; index >= 0; index--) {
 
@@ -610,10 +980,9 @@ namespace triton {
             se->setOriginMemory(triton::arch::MemoryAccess(memAddr+index, BYTE_SIZE, tmp->evaluate()));
           }
           else {
-            se = this->getSymbolicExpressionFromId(memSymId);
+            se = this->getWritableSymbolicExpression(memSymId);
             tmp->setParent(se->getAst()->getParents());
             se->setAst(tmp);
-            tmp->init();
             se->setOriginMemory(triton::arch::MemoryAccess(memAddr+index, BYTE_SIZE, tmp->evaluate()));
           }
 
@@ -627,6 +996,83 @@ namespace triton {
       }
 
 
+      /*
+       * Converts a packed memory to a symbolic variable. Expressions which hold some
+       * of the converted bytes are rewritten (so that previous references see the
+       * variable) and the bytes which are not assigned get new expressions.
+       */
+      void SymbolicEngine::convertPackedMemoryToSymbolicVariable(const triton::arch::MemoryAccess& mem, triton::ast::AbstractNode* symVarNode) {
+        std::set<triton::usize> ids;
+        triton::uint64 memAddr = mem.getAddress();
+        triton::uint32 size    = mem.getSize();
+
+        /* Collect the expressions which hold some of the converted bytes */
+        for (triton::uint32 index = 0; index < size; index++) {
+          triton::usize id = this->getSymbolicMemoryId(memAddr + index);
+          if (id == triton::engines::symbolic::UNSET)
+            continue;
+          if (this->getPackedMemoryExpression(memAddr + index) != nullptr)
+            ids.insert(id);
+          else
+            this->concretizeMemory(memAddr + index);
+        }
+
+        /* Rewrite them with the bytes of the variable */
+        for (triton::usize id : ids) {
+          SymbolicExpression* se = this->getWritableSymbolicExpression(id);
+          triton::uint64 base    = se->getOriginMemory().getAddress();
+          triton::uint32 high    = se->getOriginMemory().getSize();
+          std::list<triton::ast::AbstractNode*> pieces;
+          std::vector<bool> converted(high);
+
+          for (triton::uint32 index = 0; index < high; index++) {
+            triton::uint64 addr = base + index;
+            converted[index] = (addr >= memAddr && addr - memAddr < size && this->getSymbolicMemoryId(addr) == id);
+          }
+
+          while (high) {
+            triton::uint32 low = high - 1;
+            while (low && converted[low - 1] == converted[high - 1])
+              low--;
+            if (converted[high - 1])
+              pieces.push_back(this->extractBytes(symVarNode, (base + low) - memAddr, high - low));
+            else
+              pieces.push_back(this->extractBytes(se->getAst(), low, high - low));
+            high = low;
+          }
+
+          triton::ast::AbstractNode* tmp = (pieces.size() == 1) ? pieces.front() : triton::ast::concat(pieces);
+          tmp->setParent(se->getAst()->getParents());
+          se->setAst(tmp);
+          se->setOriginMemory(triton::arch::MemoryAccess(base, se->getOriginMemory().getSize(), tmp->evaluate()));
+        }
+
+        /* Assign the bytes which are not assigned yet, one expression per range */
+        triton::uint32 high = size;
+        while (high) {
+          if (this->getSymbolicMemoryId(memAddr + high - 1) != triton::engines::symbolic::UNSET) {
+            high--;
+            continue;
+          }
+
+          triton::uint32 low = high - 1;
+          while (low && this->getSymbolicMemoryId(memAddr + low - 1) == triton::engines::symbolic::UNSET)
+            low--;
+
+          triton::ast::AbstractNode* tmp = this->extractBytes(symVarNode, low, high - low);
+          SymbolicExpression* se = this->newSymbolicExpression(tmp, triton::engines::symbolic::MEM, "Memory reference");
+          se->setOriginMemory(triton::arch::MemoryAccess(memAddr + low, high - low, tmp->evaluate()));
+          for (triton::uint32 index = low; index < high; index++)
+            this->addMemoryReference(memAddr + index, se->getId());
+
+          high = low;
+        }
+
+        if (this->modes->isModeEnabled(triton::modes::ALIGNED_MEMORY))
+          this->removeAlignedMemory(memAddr, size);
+      }
+
+
       SymbolicVariable* SymbolicEngine::convertRegisterToSymbolicVariable(const triton::arch::Register& reg, const std::string& symVarComment) {
         SymbolicVariable* symVar        = nullptr;
         SymbolicExpression* expression  = nullptr;
@@ -649,22 +1095,21 @@ namespace triton {
           /* Create the symbolic expression */
           SymbolicExpression* se = this->newSymbolicExpression(tmp, triton::engines::symbolic::REG);
           se->setOriginRegister(reg);
-          this->symbolicReg[parentId] = se->getId();
+          this->setRegisterReference(parentId, se->getId());
         }
 
         else {
           /* Get the symbolic expression */
-          expression = this->getSymbolicExpressionFromId(regSymId);
+          expression = this->getWritableSymbolicExpression(regSymId);
           /* Create the symbolic variable */
           symVar = this->newSymbolicVariable(triton::engines::symbolic::REG, parentId, symVarSize, symVarComment);
           /* Setup the concrete value to the symbolic variable */
           symVar->setConcreteValue(cv);
           /* Create the AST node */
           triton::ast::AbstractNode* tmp = triton::ast::variable(*symVar);
-          /* Set the AST node */
+          /* Set the AST node. Parents are initialized (or marked dirty) by setAst() */
           tmp->setParent(expression->getAst()->getParents());
           expression->setAst(tmp);
-          tmp->init();
         }
 
         return symVar;
@@ -679,11 +1124,17 @@ namespace triton {
         if (symVar == nullptr)
           throw triton::exceptions::SymbolicEngine("SymbolicEngine::newSymbolicVariable(): Cannot allocate a new symbolic variable");
 
-        this->symbolicVariables[uniqueId] = symVar;
+        this->symbolicVariables[uniqueId] = std::shared_ptr<SymbolicVariable>(symVar);
         return symVar;
       }
 
 
+      /* Removes the symbolic variable corresponding to the id */
+      void SymbolicEngine::removeSymbolicVariable(triton::usize symVarId) {
+        this->symbolicVariables.erase(symVarId);
+      }
+
+
       /* Returns a symbolic operand based on the abstract wrapper. */
       triton::ast::AbstractNode* SymbolicEngine::buildSymbolicOperand(triton::arch::OperandWrapper& op) {
         switch (op.getType()) {
@@ -743,6 +1194,10 @@ namespace triton {
         if (this->modes->isModeEnabled(triton::modes::ALIGNED_MEMORY) && this->isAlignedMemory(address, size))
           return this->getAlignedMemory(address, size);
 
+        /* Bytes of a same write are loaded at once */
+        if (this->modes->isModeEnabled(triton::modes::PACKED_MEMORY))
+          return this->buildSymbolicPackedMemory(mem);
+
         /* Iterate on every memory cells to use their symbolic or concrete values */
         while (size) {
           symMem = this->getSymbolicMemoryId(address + size - 1);
@@ -778,6 +1233,88 @@ namespace triton {
       }
 
 
+      /* Returns `size` bytes of a node from the byte `offset` */
+      triton::ast::AbstractNode* SymbolicEngine::extractBytes(triton::ast::AbstractNode* node, triton::uint32 offset, triton::uint32 size) const {
+        if (offset == 0 && size * BYTE_SIZE_BIT == node->getBitvectorSize())
+          return node;
+        return triton::ast::extract(((offset + size) * BYTE_SIZE_BIT) - 1, offset * BYTE_SIZE_BIT, node);
+      }
+
+
+      /* Returns the expression assigned to an address if it holds the byte at its offset, otherwise returns nullptr */
+      SymbolicExpression* SymbolicEngine::getPackedMemoryExpression(triton::uint64 addr) const {
+        triton::usize id = this->getSymbolicMemoryId(addr);
+
+        if (id == triton::engines::symbolic::UNSET)
+          return nullptr;
+
+        SymbolicExpression* se = this->getSymbolicExpressionFromId(id);
+        const triton::arch::MemoryAccess& origin = se->getOriginMemory();
+
+        if (addr < origin.getAddress() || addr - origin.getAddress() >= origin.getSize())
+          return nullptr;
+
+        if (se->getAst()->getBitvectorSize() != origin.getBitSize())
+          return nullptr;
+
+        return se;
+      }
+
+
+      /* Returns a symbolic memory where consecutive bytes of a same expression are loaded with a single node */
+      triton::ast::AbstractNode* SymbolicEngine::buildSymbolicPackedMemory(const triton::arch::MemoryAccess& mem) {
+        std::list<triton::ast::AbstractNode*> opVec;
+
+        triton::uint64 address = mem.getAddress();
+        triton::uint32 size    = mem.getSize();
+        triton::uint512 value  = this->architecture->getConcreteMemoryValue(mem);
+
+        /* Iterate on ranges of memory cells from the most significant one */
+        while (size) {
+          triton::usize symMem   = this->getSymbolicMemoryId(address + size - 1);
+          SymbolicExpression* se = this->getPackedMemoryExpression(address + size - 1);
+          triton::uint32 low     = size - 1;
+
+          /* A range of concrete cells */
+          if (symMem == triton::engines::symbolic::UNSET) {
+            while (low && this->getSymbolicMemoryId(address + low - 1) == triton::engines::symbolic::UNSET)
+              low--;
+            triton::uint512 cv = (value >> (low * BYTE_SIZE_BIT));
+            if (size - low < DQQWORD_SIZE)
+              cv &= ((triton::uint512(1) << ((size - low) * BYTE_SIZE_BIT)) - 1);
+            opVec.push_back(triton::ast::bv(cv, (size - low) * BYTE_SIZE_BIT));
+          }
+
+          /* A cell whose expression is not a whole write, its byte is extracted at its offset from the origin of the expression */
+          else if (se == nullptr) {
+            SymbolicExpression* expr                 = this->getSymbolicExpressionFromId(symMem);
+            const triton::arch::MemoryAccess& origin = expr->getOriginMemory();
+            triton::uint64 offset                    = (address + size - 1) - origin.getAddress();
+
+            /* Out of its origin, the cell is the low byte of the expression */
+            if (address + size - 1 < origin.getAddress() || (offset + 1) * BYTE_SIZE_BIT > expr->getAst()->getBitvectorSize())
+              offset = 0;
+
+            opVec.push_back(this->extractBytes(triton::ast::reference(symMem), static_cast<triton::uint32>(offset), BYTE_SIZE));
+          }
+
+          /* A range of cells of a same expression */
+          else {
+            while (low && this->getPackedMemoryExpression(address + low - 1) == se)
+              low--;
+            opVec.push_back(this->extractBytes(triton::ast::reference(symMem), (address + low) - se->getOriginMemory().getAddress(), size - low));
+          }
+
+          size = low;
+        }
+
+        if (opVec.size() == 1)
+          return opVec.front();
+
+        return triton::ast::concat(opVec);
+      }
+
+
       /* Returns a symbolic memory and defines the memory as input of the instruction */
       triton::ast::AbstractNode* SymbolicEngine::buildSymbolicMemory(triton::arch::Instruction& inst, triton::arch::MemoryAccess& mem) {
         triton::ast::AbstractNode* node = this->buildSymbolicMemory(mem);
@@ -836,19 +1373,40 @@ namespace triton {
         SymbolicExpression* se   = nullptr;
         triton::uint64 address   = mem.getAddress();
         triton::uint32 writeSize = mem.getSize();
+        bool withComments        = this->modes->isModeEnabled(triton::modes::SYMBOLIC_COMMENTS);
 
         /* Record the aligned memory for a symbolic optimization */
         if (this->modes->isModeEnabled(triton::modes::ALIGNED_MEMORY))
           this->addAlignedMemory(address, writeSize, node);
 
+        /* A single expression is assigned to all the bytes of the memory */
+        if (this->modes->isModeEnabled(triton::modes::PACKED_MEMORY)) {
+          se = this->newSymbolicExpression(node, triton::engines::symbolic::MEM, comment);
+          /* Synchronize the memory operand */
+          mem.setConcreteValue(node->evaluate());
+          /* Synchronize the concrete state */
+          this->architecture->setConcreteMemoryValue(mem);
+          se->setOriginMemory(triton::arch::MemoryAccess(address, writeSize, mem.getConcreteValue()));
+          for (triton::uint32 index = 0; index < writeSize; index++)
+            this->addMemoryReference(address + index, se->getId());
+          /* Define the memory store */
+          inst.setStoreAccess(mem, node);
+          inst.addSymbolicExpression(se);
+          return se;
+        }
+
         /*
          * As the x86's memory can be accessed without alignment, each byte of the
          * memory must be assigned to an unique reference.
          */
+        /* The comment of the bytes is built once for the whole write */
+        std::shared_ptr<const std::string> byteComment = withComments ? this->internComment("Byte reference - " + comment) : nullptr;
+
         while (writeSize) {
           /* Extract each byte of the memory */
           tmp = triton::ast::extract(((writeSize * BYTE_SIZE_BIT) - 1), ((writeSize * BYTE_SIZE_BIT) - BYTE_SIZE_BIT), node);
-          se = this->newSymbolicExpression(tmp, triton::engines::symbolic::MEM, "Byte reference - " + comment);
+          se = this->newSymbolicExpression(tmp, triton::engines::symbolic::MEM);
+          se->setComment(byteComment);
           se->setOriginMemory(triton::arch::MemoryAccess(((address + writeSize) - 1), BYTE_SIZE, tmp->evaluate()));
           ret.push_back(tmp);
           inst.addSymbolicExpression(se);
@@ -878,7 +1436,7 @@ namespace triton {
         /* Synchronize the concrete state */
         this->architecture->setConcreteMemoryValue(mem);
 
-        se  = this->newSymbolicExpression(tmp, triton::engines::symbolic::UNDEF, "Temporary concatenation reference - " + comment);
+        se  = this->newSymbolicExpression(tmp, triton::engines::symbolic::UNDEF, withComments ? "Temporary concatenation reference - " + comment : "");
         se->setOriginMemory(triton::arch::MemoryAccess(address, mem.getSize(), tmp->evaluate()));
 
         /* Define the memory store */
@@ -967,9 +1525,67 @@ namespace triton {
       }
 
 
+      /* Returns the new symbolic abstract expression with a literal comment */
+      SymbolicExpression* SymbolicEngine::createSymbolicExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::OperandWrapper& dst, const char* comment) {
+        switch (dst.getType()) {
+          case triton::arch::OP_MEM: return this->createSymbolicMemoryExpression(inst, node, dst.getMemory(), comment);
+          case triton::arch::OP_REG: return this->createSymbolicRegisterExpression(inst, node, dst.getRegister(), comment);
+          default:
+            throw triton::exceptions::SymbolicEngine("SymbolicEngine::createSymbolicExpression(): Invalid operand.");
+        }
+        return nullptr;
+      }
+
+
+      /* Returns the new symbolic memory expression with a literal comment */
+      SymbolicExpression* SymbolicEngine::createSymbolicMemoryExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::MemoryAccess& mem, const char* comment) {
+        /* The comments of the bytes are built from the comment, so it is copied once for the whole write */
+        if (this->modes->isModeEnabled(triton::modes::SYMBOLIC_COMMENTS))
+          return this->createSymbolicMemoryExpression(inst, node, mem, std::string(comment));
+        return this->createSymbolicMemoryExpression(inst, node, mem);
+      }
+
+
+      /* Returns the new symbolic register expression with a literal comment */
+      SymbolicExpression* SymbolicEngine::createSymbolicRegisterExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::Register& reg, const char* comment) {
+        SymbolicExpression* se = this->createSymbolicRegisterExpression(inst, node, reg);
+        if (this->modes->isModeEnabled(triton::modes::SYMBOLIC_COMMENTS))
+          se->setLiteralComment(comment);
+        return se;
+      }
+
+
+      /* Returns the new symbolic flag expression with a literal comment */
+      SymbolicExpression* SymbolicEngine::createSymbolicFlagExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::Register& flag, const char* comment) {
+        SymbolicExpression* se = this->createSymbolicFlagExpression(inst, node, flag);
+        if (this->modes->isModeEnabled(triton::modes::SYMBOLIC_COMMENTS))
+          se->setLiteralComment(comment);
+        return se;
+      }
+
+
+      /* Returns the new symbolic volatile expression with a literal comment */
+      SymbolicExpression* SymbolicEngine::createSymbolicVolatileExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, const char* comment) {
+        SymbolicExpression* se = this->createSymbolicVolatileExpression(inst, node);
+        if (this->modes->isModeEnabled(triton::modes::SYMBOLIC_COMMENTS))
+          se->setLiteralComment(comment);
+        return se;
+      }
+
+
       /* Adds and assign a new memory reference */
       void SymbolicEngine::addMemoryReference(triton::uint64 mem, triton::usize id) {
-        this->memoryReference[mem] = id;
+        triton::usize previous = this->memoryReference.get(mem);
+
+        if (previous == id)
+          return;
+
+        if (previous != triton::engines::symbolic::UNSET)
+          this->removeMemoryLocation(previous, mem);
+
+        this->memoryReference.set(mem, id);
+        if (id != triton::engines::symbolic::UNSET)
+          getWritableLocations(this->memoryLocations, id).insert(mem);
       }
 
 
@@ -987,9 +1603,13 @@ namespace triton {
         if (node->getBitvectorSize() != reg.getBitSize())
           throw triton::exceptions::SymbolicEngine("SymbolicEngine::assignSymbolicExpressionToRegister(): The size of the symbolic expression is not equal to the target register.");
 
+        /* The expression may be shared with a copy of the engine */
+        if (this->isSymbolicExpressionIdExists(se->getId()))
+          se = this->getWritableSymbolicExpression(se->getId());
+
         se->setKind(triton::engines::symbolic::REG);
         se->setOriginRegister(reg);
-        this->symbolicReg[id] = se->getId();
+        this->setRegisterReference(id, se->getId());
 
         /* Synchronize the concrete state */
         this->architecture->setConcreteRegisterValue(reg);
@@ -1010,6 +1630,15 @@ namespace triton {
         if (this->modes->isModeEnabled(triton::modes::ALIGNED_MEMORY))
           this->addAlignedMemory(address, writeSize, node);
 
+        /* The AST is wrapped into a new expression assigned to all the bytes of the memory, the given expression is left untouched */
+        if (this->modes->isModeEnabled(triton::modes::PACKED_MEMORY)) {
+          SymbolicExpression* packed = this->newSymbolicExpression(node, triton::engines::symbolic::MEM, "Packed memory reference");
+          packed->setOriginMemory(triton::arch::MemoryAccess(address, writeSize, node->evaluate()));
+          for (triton::uint32 index = 0; index < writeSize; index++)
+            this->addMemoryReference(address + index, packed->getId());
+          return;
+        }
+
         /*
          * As the x86's memory can be accessed without alignment, each byte of the
          * memory must be assigned to an unique reference.
@@ -1034,9 +1663,7 @@ namespace triton {
 
       /* Returns true if the symbolic expression ID exists */
       bool SymbolicEngine::isSymbolicExpressionIdExists(triton::usize symExprId) const {
-        if (this->symbolicExpressions.find(symExprId) != this->symbolicExpressions.end())
-          return true;
-        return false;
+        return this->symbolicExpressions.isMapped(symExprId);
       }
 
 
@@ -1051,14 +1678,16 @@ namespace triton {
 
       /* Returns true if memory cell expressions contain symbolic variables. */
       bool SymbolicEngine::isMemorySymbolized(triton::uint64 addr, triton::uint32 size) const {
-        for (triton::uint32 i = 0; i < size; i++) {
-          triton::usize symId = this->getSymbolicMemoryId(addr+i);
+        triton::usize previous = triton::engines::symbolic::UNSET;
 
-          if (symId == triton::engines::symbolic::UNSET)
+        /* Only the mapped bytes of the allocated pages are visited */
+        for (const auto& reference : this->memoryReference.getReferences(addr, size)) {
+          /* The bytes of a same write share their expression */
+          if (reference.second == previous)
             continue;
 
-          triton::engines::symbolic::SymbolicExpression* symExp = this->getSymbolicExpressionFromId(symId);
-          if (symExp->isSymbolized())
+          previous = reference.second;
+          if (this->getSymbolicExpressionFromId(reference.second)->isSymbolized())
             return true;
         }
 
@@ -1085,6 +1714,24 @@ namespace triton {
 
 
       /* Initializes the memory access AST (LOAD and STORE) */
+      /* Returns the size of the effective address of a memory access */
+      triton::uint32 SymbolicEngine::getLeaBitSize(const triton::arch::MemoryAccess& mem) const {
+        const triton::arch::Register& base  = mem.getConstBaseRegister();
+        const triton::arch::Register& index = mem.getConstIndexRegister();
+
+        if (this->architecture->isRegisterValid(index))
+          return index.getBitSize();
+
+        if (this->architecture->isRegisterValid(base))
+          return base.getBitSize();
+
+        if (mem.getConstDisplacement().getBitSize())
+          return mem.getConstDisplacement().getBitSize();
+
+        return this->architecture->registerBitSize();
+      }
+
+
       void SymbolicEngine::initLeaAst(triton::arch::MemoryAccess& mem, bool force) {
         if (mem.getBitSize() >= BYTE_SIZE_BIT) {
           const triton::arch::Register& base  = mem.getConstBaseRegister();
@@ -1093,13 +1740,7 @@ namespace triton {
           triton::uint64 segmentValue         = (this->architecture->isRegisterValid(seg) ? this->architecture->getConcreteRegisterValue(seg).convert_to<triton::uint64>() : 0);
           triton::uint64 scaleValue           = mem.getConstScale().getValue();
           triton::uint64 dispValue            = mem.getConstDisplacement().getValue();
-          triton::uint32 bitSize              = (this->architecture->isRegisterValid(index) ? index.getBitSize() :
-                                                  (this->architecture->isRegisterValid(base) ? base.getBitSize() :
-                                                    (mem.getConstDisplacement().getBitSize() ? mem.getConstDisplacement().getBitSize() :
-                                                      this->architecture->registerBitSize()
-                                                    )
-                                                  )
-                                                );
+          triton::uint32 bitSize              = this->getLeaBitSize(mem);
 
 
           /* Initialize the AST of the memory access (LEA) -> ((pc + base) + (index * scale) + disp) */
@@ -1130,11 +1771,42 @@ namespace triton {
           mem.setLeaAst(leaAst);
 
           /* Initialize the address only if it is not already defined */
-          if (!mem.getAddress() || force)
-            mem.setAddress(leaAst->evaluate().convert_to<triton::uint64>());
+          this->initLeaAddress(mem, force);
         }
       }
 
+
+      void SymbolicEngine::initLeaAddress(triton::arch::MemoryAccess& mem, bool force) const {
+        if (mem.getBitSize() < BYTE_SIZE_BIT || (mem.getAddress() && !force))
+          return;
+
+        const triton::arch::Register& base  = mem.getConstBaseRegister();
+        const triton::arch::Register& index = mem.getConstIndexRegister();
+        const triton::arch::Register& seg   = mem.getConstSegmentRegister();
+        triton::uint64 segmentValue         = (this->architecture->isRegisterValid(seg) ? this->architecture->getConcreteRegisterValue(seg).convert_to<triton::uint64>() : 0);
+        triton::uint64 baseValue            = (this->architecture->isRegisterValid(base) ? this->architecture->getConcreteRegisterValue(base).convert_to<triton::uint64>() : 0);
+        triton::uint64 indexValue           = (this->architecture->isRegisterValid(index) ? this->architecture->getConcreteRegisterValue(index).convert_to<triton::uint64>() : 0);
+        triton::uint64 scaleValue           = mem.getConstScale().getValue();
+        triton::uint64 dispValue            = mem.getConstDisplacement().getValue();
+        triton::uint32 bitSize              = this->getLeaBitSize(mem);
+
+        /* Same computation as the LEA AST (see initLeaAst()) -> ((pc + base) + (index * scale) + disp) */
+        triton::uint64 address = ((mem.getPcRelative() ? mem.getPcRelative() : baseValue) + (indexValue * scaleValue) + dispValue);
+        if (bitSize < QWORD_SIZE_BIT)
+          address &= ((1ULL << bitSize) - 1);
+
+        /* Use segments as base address instead of selector into the GDT. */
+        if (segmentValue) {
+          if (bitSize < seg.getBitSize() && ((address >> (bitSize - 1)) & 1))
+            address |= (~0ULL << bitSize);
+          address += segmentValue;
+          if (seg.getBitSize() < QWORD_SIZE_BIT)
+            address &= ((1ULL << seg.getBitSize()) - 1);
+        }
+
+        mem.setAddress(address);
+      }
+
     }; /* symbolic namespace */
   }; /* engines namespace */
 }; /*triton namespace */
@@ -5,6 +5,10 @@
 **  This program is under the terms of the BSD License.
 */
 
+#include <algorithm>
+#include <unordered_set>
+
+#include <triton/api.hpp>
 #include <triton/exceptions.hpp>
 #include <triton/astRepresentation.hpp>
 #include <triton/symbolicExpression.hpp>
@@ -16,11 +20,12 @@ namespace triton {
     namespace symbolic {
 
       SymbolicExpression::SymbolicExpression(triton::ast::AbstractNode* node, triton::usize id, symkind_e kind, const std::string& comment) : originRegister() {
-        this->comment       = comment;
-        this->ast           = node;
-        this->id            = id;
-        this->isTainted     = false;
-        this->kind          = kind;
+        this->ast                  = node;
+        this->id                   = id;
+        this->isTainted            = false;
+        this->kind                 = kind;
+        this->literalComment       = nullptr;
+        this->setComment(comment);
       }
 
 
@@ -43,7 +48,48 @@ namespace triton {
 
 
       const std::string& SymbolicExpression::getComment(void) const {
-        return this->comment;
+        static const std::string empty;
+
+        /* A literal comment is only copied when it is read */
+        if (this->comment == nullptr && this->literalComment != nullptr)
+          this->comment = triton::api.internComment(this->literalComment);
+
+        if (this->comment == nullptr)
+          return empty;
+
+        return *this->comment;
+      }
+
+
+      std::vector<triton::usize> SymbolicExpression::getDependencies(void) const {
+        std::unordered_set<triton::ast::AbstractNode*> visited;
+        std::vector<triton::ast::AbstractNode*> worklist;
+        std::vector<triton::usize> dependencies;
+
+        worklist.push_back(this->getAst());
+
+        /* References are leaves, so only the nodes of this expression are visited */
+        while (!worklist.empty()) {
+          triton::ast::AbstractNode* node = worklist.back();
+          worklist.pop_back();
+
+          if (!visited.insert(node).second)
+            continue;
+
+          if (node->getKind() == triton::ast::REFERENCE_NODE) {
+            dependencies.push_back(reinterpret_cast<triton::ast::ReferenceNode*>(node)->getValue());
+            continue;
+          }
+
+          std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+          worklist.insert(worklist.end(), childs.begin(), childs.end());
+        }
+
+        std::sort(dependencies.begin(), dependencies.end());
+        dependencies.erase(std::unique(dependencies.begin(), dependencies.end()), dependencies.end());
+        dependencies.shrink_to_fit();
+
+        return dependencies;
       }
 
 
@@ -53,7 +99,8 @@ namespace triton {
 
 
       std::string SymbolicExpression::getFormattedId(void) const {
-        if (triton::ast::representations::astRepresentation.getMode() == triton::ast::representations::SMT_REPRESENTATION)
+        if (triton::ast::representations::astRepresentation.getMode() == triton::ast::representations::SMT_REPRESENTATION ||
+            triton::ast::representations::astRepresentation.getMode() == triton::ast::representations::SMT_DAG_REPRESENTATION)
           return "ref!" + std::to_string(this->id);
 
         else if (triton::ast::representations::astRepresentation.getMode() == triton::ast::representations::PYTHON_REPRESENTATION)
@@ -68,7 +115,8 @@ namespace triton {
         if (this->getComment().empty())
           return "";
 
-        else if (triton::ast::representations::astRepresentation.getMode() == triton::ast::representations::SMT_REPRESENTATION)
+        else if (triton::ast::representations::astRepresentation.getMode() == triton::ast::representations::SMT_REPRESENTATION ||
+                 triton::ast::representations::astRepresentation.getMode() == triton::ast::representations::SMT_DAG_REPRESENTATION)
           return "; " + this->getComment();
 
         else if (triton::ast::representations::astRepresentation.getMode() == triton::ast::representations::PYTHON_REPRESENTATION)
@@ -95,6 +143,9 @@ namespace triton {
 
 
       void SymbolicExpression::setAst(triton::ast::AbstractNode* node) {
+        /* Memoized full ASTs and cached dependencies may use the previous AST */
+        triton::api.invalidateAsts(this->ast);
+
         node->setParent(this->ast->getParents());
         this->ast = node;
         this->ast->init();
@@ -102,7 +153,20 @@ namespace triton {
 
 
       void SymbolicExpression::setComment(const std::string& comment) {
-        this->comment = comment;
+        this->comment        = triton::api.internComment(comment);
+        this->literalComment = nullptr;
+      }
+
+
+      void SymbolicExpression::setComment(const std::shared_ptr<const std::string>& comment) {
+        this->comment        = comment;
+        this->literalComment = nullptr;
+      }
+
+
+      void SymbolicExpression::setLiteralComment(const char* comment) {
+        this->comment        = nullptr;
+        this->literalComment = (comment != nullptr && comment[0] != '\0') ? comment : nullptr;
       }
 
 
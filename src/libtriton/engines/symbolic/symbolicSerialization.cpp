@@ -0,0 +1,660 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#include <algorithm>
+#include <unordered_map>
+#include <unordered_set>
+
+#include <triton/exceptions.hpp>
+#include <triton/symbolicSerialization.hpp>
+
+
+
+/*! \page engine_SymbolicSerialization_page Symbolic serialization
+    \brief [**internal**] All information about the binary format of serialized AST DAGs.
+
+\tableofcontents
+
+\section engine_SymbolicSerialization_description Description
+<hr>
+
+AST DAGs, symbolic expressions and symbolic variables may be saved into a compact binary format and loaded
+back later, in another process or in another Triton instance (e.g: to ship path constraints to workers).
+Shared sub-trees are written once, so the size of a serialized DAG is linear with the number of unique
+nodes and not with the size of the unrolled tree.
+
+All integers are unsigned varints (7 bits per byte, least significant group first, the high bit set
+on every byte but the last one). Strings are written as their length followed by their bytes.
+
+ Section     | Content
+-------------|---------------------------------------------------------------------------------------------
+ header      | the magic `TRDG` and the version of the format
+ variables   | the count, then for each variable: `id`, `kind`, `kindValue`, `size`, `comment`, `concreteValue`
+ expressions | the count, then for each expression: `id`, `kind`, the index of its root node, `comment`, `isTainted` and its origin (the register id or the memory address and size)
+ nodes       | the count, then for each node: its `kind` followed by its payload
+ roots       | the count, then the index of each saved node
+
+Nodes are written in post-order, so the childs of a node are always before it in the table. The payload
+of a node depends on its kind:
+
+- `DECIMAL_NODE`: its value
+- `STRING_NODE`: its string
+- `REFERENCE_NODE`: the id of the referenced symbolic expression
+- `VARIABLE_NODE`: the index of the variable in the variable table
+- other nodes: the number of childs, then for each child the distance between the node and the child in the table
+
+Expressions referenced by the saved nodes and expressions are saved too, so a stream never refers to
+the state of the engine which wrote it. Expressions are written after the expressions they reference.
+
+When loading, the whole stream is read and checked before the symbolic engine is modified. Variables and
+expressions are then created with new ids and references are remapped on these new ids. Nodes are rebuilt
+through the AST builders, so they go through the AST dictionaries and the native simplifications if these
+modes are enabled. If a builder rejects a node, the variables and expressions already created by the load
+are removed.
+
+*/
+
+
+
+namespace triton {
+  namespace engines {
+    namespace symbolic {
+
+      /*! A variable read from a stream, created once the whole stream is checked. */
+      struct VariableRecord {
+        symkind_e kind;
+        triton::uint64 kindValue;
+        triton::uint32 size;
+        std::string comment;
+        triton::uint512 value;
+      };
+
+
+      /*! An expression read from a stream, created when its root node is built. */
+      struct ExpressionRecord {
+        triton::usize id;
+        symkind_e kind;
+        triton::usize root;
+        std::string comment;
+        bool isTainted;
+        triton::uint64 origin;
+        triton::uint32 originSize;
+      };
+
+
+      /*! A node read from a stream, `value` is the payload of decimal, reference and variable nodes. */
+      struct NodeRecord {
+        triton::ast::kind_e kind;
+        triton::uint512 value;
+        std::string string;
+        std::vector<triton::usize> childs;
+      };
+
+
+      /* Returns the ids of the expressions referenced by a DAG */
+      static std::vector<triton::usize> extractReferences(triton::ast::AbstractNode* root) {
+        std::vector<triton::ast::AbstractNode*> nodes;
+        std::vector<triton::usize> ids;
+
+        if (root == nullptr)
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::save(): Cannot save a null node.");
+
+        triton::ast::nodesExtraction(nodes, root);
+
+        for (triton::ast::AbstractNode* node : nodes) {
+          if (node->getKind() == triton::ast::REFERENCE_NODE)
+            ids.push_back(reinterpret_cast<triton::ast::ReferenceNode*>(node)->getValue());
+        }
+
+        return ids;
+      }
+
+
+      /* Extracts the nodes of a DAG which are not already in the table */
+      static void extractNodes(triton::ast::AbstractNode* root, std::vector<triton::ast::AbstractNode*>& table, std::unordered_map<triton::ast::AbstractNode*, triton::usize>& indexes) {
+        std::vector<triton::ast::AbstractNode*> nodes;
+
+        if (root == nullptr)
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::save(): Cannot save a null node.");
+
+        triton::ast::nodesExtraction(nodes, root);
+
+        for (triton::ast::AbstractNode* node : nodes) {
+          if (indexes.find(node) == indexes.end()) {
+            indexes[node] = table.size();
+            table.push_back(node);
+          }
+        }
+      }
+
+
+      /* Checks the childs of a node read from a stream before building it */
+      static void checkChilds(triton::ast::kind_e kind, const std::vector<triton::ast::kind_e>& childs) {
+        triton::usize arity = 2;
+
+        switch (kind) {
+          case triton::ast::ASSERT_NODE:
+          case triton::ast::BVDECL_NODE:
+          case triton::ast::BVNEG_NODE:
+          case triton::ast::BVNOT_NODE:
+          case triton::ast::LNOT_NODE:
+            arity = 1;
+            break;
+
+          case triton::ast::EXTRACT_NODE:
+          case triton::ast::ITE_NODE:
+          case triton::ast::LET_NODE:
+            arity = 3;
+            break;
+
+          case triton::ast::COMPOUND_NODE:
+          case triton::ast::CONCAT_NODE:
+            arity = childs.size();
+            break;
+
+          default:
+            break;
+        }
+
+        if (childs.size() != arity || childs.size() == 0)
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid number of childs.");
+
+        switch (kind) {
+          case triton::ast::BVDECL_NODE:
+          case triton::ast::SX_NODE:
+          case triton::ast::ZX_NODE:
+            if (childs[0] != triton::ast::DECIMAL_NODE)
+              throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid parameter.");
+            break;
+
+          case triton::ast::BV_NODE:
+          case triton::ast::EXTRACT_NODE:
+            if (childs[0] != triton::ast::DECIMAL_NODE || childs[1] != triton::ast::DECIMAL_NODE)
+              throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid parameter.");
+            break;
+
+          case triton::ast::DECLARE_FUNCTION_NODE:
+          case triton::ast::LET_NODE:
+            if (childs[0] != triton::ast::STRING_NODE)
+              throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid parameter.");
+            break;
+
+          default:
+            break;
+        }
+      }
+
+
+      SymbolicSerialization::SymbolicSerialization(triton::engines::symbolic::SymbolicEngine* symbolic) {
+        if (symbolic == nullptr)
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::SymbolicSerialization(): The symbolic API cannot be null.");
+
+        this->symbolic = symbolic;
+      }
+
+
+      void SymbolicSerialization::writeVarint(std::ostream& stream, triton::uint512 value) const {
+        do {
+          triton::uint8 byte = static_cast<triton::uint8>((value & 0x7f).convert_to<triton::uint32>());
+          value >>= 7;
+          if (value != 0)
+            byte |= 0x80;
+          stream.put(static_cast<char>(byte));
+        } while (value != 0);
+      }
+
+
+      void SymbolicSerialization::writeString(std::ostream& stream, const std::string& value) const {
+        this->writeVarint(stream, value.size());
+        stream.write(value.data(), value.size());
+      }
+
+
+      triton::uint512 SymbolicSerialization::readVarint(std::istream& stream) const {
+        triton::uint512 value = 0;
+        triton::uint32 shift  = 0;
+
+        while (true) {
+          int byte = stream.get();
+
+          if (byte == std::char_traits<char>::eof())
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::readVarint(): Unexpected end of stream.");
+
+          if (shift >= 512)
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::readVarint(): Varint too large.");
+
+          value |= (triton::uint512(byte & 0x7f) << shift);
+          shift += 7;
+
+          if ((byte & 0x80) == 0)
+            break;
+        }
+
+        return value;
+      }
+
+
+      triton::uint64 SymbolicSerialization::readVarint(std::istream& stream, triton::uint32 bits) const {
+        triton::uint512 value = this->readVarint(stream);
+
+        if ((value >> bits) != 0)
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::readVarint(): Value out of range.");
+
+        return value.convert_to<triton::uint64>();
+      }
+
+
+      std::string SymbolicSerialization::readString(std::istream& stream) const {
+        triton::usize size = this->readVarint(stream, 32);
+        std::string value(size, '\0');
+
+        if (size && !stream.read(&value[0], size))
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::readString(): Unexpected end of stream.");
+
+        return value;
+      }
+
+
+      SymbolicExpression* SymbolicSerialization::getReferencedExpression(triton::usize id) const {
+        if (!this->symbolic->isSymbolicExpressionIdExists(id))
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::save(): Reference to an unknown symbolic expression.");
+        return this->symbolic->getSymbolicExpressionFromId(id);
+      }
+
+
+      std::vector<SymbolicExpression*> SymbolicSerialization::sortExpressions(const std::vector<triton::ast::AbstractNode*>& nodes, const std::vector<SymbolicExpression*>& exprs) const {
+        std::vector<std::pair<SymbolicExpression*, bool>> worklist;
+        std::unordered_set<triton::usize> visited;
+        std::unordered_set<triton::usize> sorted;
+        std::vector<SymbolicExpression*> expressions;
+        std::vector<SymbolicExpression*> seeds;
+
+        for (SymbolicExpression* expr : exprs) {
+          if (expr == nullptr)
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::save(): Cannot save a null expression.");
+          seeds.push_back(expr);
+        }
+
+        for (triton::ast::AbstractNode* node : nodes) {
+          for (triton::usize id : extractReferences(node))
+            seeds.push_back(this->getReferencedExpression(id));
+        }
+
+        /* The worklist is a stack, so the seeds are pushed from the highest id to the lowest one */
+        std::sort(seeds.begin(), seeds.end(), [](SymbolicExpression* a, SymbolicExpression* b) {
+          return a->getId() > b->getId();
+        });
+
+        for (SymbolicExpression* expr : seeds)
+          worklist.push_back(std::make_pair(expr, false));
+
+        /* Post-order on the references, an expression is written once all its references are */
+        while (!worklist.empty()) {
+          SymbolicExpression* expr = worklist.back().first;
+          bool expanded = worklist.back().second;
+          worklist.pop_back();
+
+          if (sorted.find(expr->getId()) != sorted.end())
+            continue;
+
+          if (expanded) {
+            sorted.insert(expr->getId());
+            expressions.push_back(expr);
+            continue;
+          }
+
+          /* Visited but not written yet, the expression is one of its own references */
+          if (visited.find(expr->getId()) != visited.end())
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::save(): Cyclic references between symbolic expressions.");
+
+          visited.insert(expr->getId());
+          worklist.push_back(std::make_pair(expr, true));
+
+          for (triton::usize id : extractReferences(expr->getAst())) {
+            if (sorted.find(id) == sorted.end())
+              worklist.push_back(std::make_pair(this->getReferencedExpression(id), false));
+          }
+        }
+
+        return expressions;
+      }
+
+
+      void SymbolicSerialization::save(std::ostream& stream,
+                                       const std::vector<triton::ast::AbstractNode*>& nodes,
+                                       const std::vector<SymbolicExpression*>& exprs,
+                                       const std::vector<SymbolicVariable*>& vars) const {
+        std::unordered_map<triton::ast::AbstractNode*, triton::usize> indexes;
+        std::unordered_map<triton::usize, triton::usize> varIndexes;
+        std::vector<triton::ast::AbstractNode*> table;
+        std::vector<SymbolicExpression*> expressions = this->sortExpressions(nodes, exprs);
+        std::vector<SymbolicVariable*> variables;
+
+        for (SymbolicExpression* expr : expressions)
+          extractNodes(expr->getAst(), table, indexes);
+
+        for (triton::ast::AbstractNode* node : nodes)
+          extractNodes(node, table, indexes);
+
+        /* Variables asked by the user, then the ones used by the nodes */
+        for (SymbolicVariable* var : vars) {
+          if (var == nullptr)
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::save(): Cannot save a null variable.");
+          if (varIndexes.find(var->getId()) == varIndexes.end()) {
+            varIndexes[var->getId()] = variables.size();
+            variables.push_back(var);
+          }
+        }
+
+        for (triton::ast::AbstractNode* node : table) {
+          if (node->getKind() == triton::ast::VARIABLE_NODE) {
+            SymbolicVariable* var = this->symbolic->getSymbolicVariableFromId(reinterpret_cast<triton::ast::VariableNode*>(node)->getId());
+            if (var == nullptr)
+              throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::save(): Unknown symbolic variable.");
+            if (varIndexes.find(var->getId()) == varIndexes.end()) {
+              varIndexes[var->getId()] = variables.size();
+              variables.push_back(var);
+            }
+          }
+        }
+
+        /* Header */
+        stream.write(SERIALIZATION_MAGIC, 4);
+        this->writeVarint(stream, SERIALIZATION_VERSION);
+
+        /* Variables */
+        this->writeVarint(stream, variables.size());
+        for (SymbolicVariable* var : variables) {
+          this->writeVarint(stream, var->getId());
+          this->writeVarint(stream, var->getKind());
+          this->writeVarint(stream, var->getKindValue());
+          this->writeVarint(stream, var->getSize());
+          this->writeString(stream, var->getComment());
+          this->writeVarint(stream, var->getConcreteValue());
+        }
+
+        /* Expressions */
+        this->writeVarint(stream, expressions.size());
+        for (SymbolicExpression* expr : expressions) {
+          this->writeVarint(stream, expr->getId());
+          this->writeVarint(stream, expr->getKind());
+          this->writeVarint(stream, indexes[expr->getAst()]);
+          this->writeString(stream, expr->getComment());
+          this->writeVarint(stream, expr->isTainted);
+          if (expr->getKind() == triton::engines::symbolic::REG) {
+            this->writeVarint(stream, expr->getOriginRegister().getId());
+          }
+          else if (expr->getKind() == triton::engines::symbolic::MEM) {
+            this->writeVarint(stream, expr->getOriginMemory().getAddress());
+            this->writeVarint(stream, expr->getOriginMemory().getSize());
+          }
+        }
+
+        /* Nodes */
+        this->writeVarint(stream, table.size());
+        for (triton::usize index = 0; index < table.size(); index++) {
+          triton::ast::AbstractNode* node = table[index];
+
+          this->writeVarint(stream, node->getKind());
+
+          switch (node->getKind()) {
+            case triton::ast::DECIMAL_NODE:
+              this->writeVarint(stream, reinterpret_cast<triton::ast::DecimalNode*>(node)->getValue());
+              break;
+
+            case triton::ast::STRING_NODE:
+              this->writeString(stream, reinterpret_cast<triton::ast::StringNode*>(node)->getValue());
+              break;
+
+            case triton::ast::REFERENCE_NODE:
+              this->writeVarint(stream, reinterpret_cast<triton::ast::ReferenceNode*>(node)->getValue());
+              break;
+
+            case triton::ast::VARIABLE_NODE:
+              this->writeVarint(stream, varIndexes[reinterpret_cast<triton::ast::VariableNode*>(node)->getId()]);
+              break;
+
+            default:
+              this->writeVarint(stream, node->getChilds().size());
+              for (triton::ast::AbstractNode* child : node->getChilds())
+                this->writeVarint(stream, index - indexes[child]);
+              break;
+          }
+        }
+
+        /* Roots */
+        this->writeVarint(stream, nodes.size());
+        for (triton::ast::AbstractNode* node : nodes)
+          this->writeVarint(stream, indexes[node]);
+
+        if (!stream)
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::save(): Cannot write into the stream.");
+      }
+
+
+      void SymbolicSerialization::load(std::istream& stream,
+                                       std::vector<triton::ast::AbstractNode*>& nodes,
+                                       std::vector<SymbolicExpression*>& exprs,
+                                       std::vector<SymbolicVariable*>& vars) {
+        std::unordered_map<triton::usize, std::vector<triton::usize>> rootsToExprs;
+        std::unordered_map<triton::usize, triton::usize> recordIndexes;
+        std::unordered_map<triton::usize, triton::usize> exprIds;
+        std::vector<VariableRecord> varRecords;
+        std::vector<ExpressionRecord> exprRecords;
+        std::vector<NodeRecord> nodeRecords;
+        std::vector<triton::usize> roots;
+        std::vector<SymbolicExpression*> expressions;
+        std::vector<SymbolicVariable*> variables;
+        std::vector<triton::ast::AbstractNode*> table;
+        char magic[4];
+
+        /* Header */
+        if (!stream.read(magic, 4) || !std::equal(magic, magic + 4, SERIALIZATION_MAGIC))
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid magic number.");
+
+        if (this->readVarint(stream, 32) != SERIALIZATION_VERSION)
+          throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Unsupported version.");
+
+        /* Variables */
+        triton::usize count = this->readVarint(stream, 64);
+        for (triton::usize i = 0; i < count; i++) {
+          VariableRecord record;
+
+          this->readVarint(stream, 64); /* The old id is only informative */
+          record.kind      = static_cast<symkind_e>(this->readVarint(stream, 2));
+          record.kindValue = this->readVarint(stream, 64);
+          record.size      = this->readVarint(stream, 32);
+          record.comment   = this->readString(stream);
+          record.value     = this->readVarint(stream);
+
+          if (record.kind > triton::engines::symbolic::MEM)
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid variable kind.");
+
+          if (record.size == 0 || record.size > MAX_BITS_SUPPORTED)
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid variable size.");
+
+          varRecords.push_back(record);
+        }
+
+        /* Expressions */
+        count = this->readVarint(stream, 64);
+        for (triton::usize i = 0; i < count; i++) {
+          ExpressionRecord record;
+
+          record.id         = this->readVarint(stream, 64);
+          record.kind       = static_cast<symkind_e>(this->readVarint(stream, 2));
+          record.root       = this->readVarint(stream, 64);
+          record.comment    = this->readString(stream);
+          record.isTainted  = this->readVarint(stream, 1);
+          record.origin     = 0;
+          record.originSize = 0;
+
+          if (record.kind == triton::engines::symbolic::REG) {
+            record.origin = this->readVarint(stream, 32);
+          }
+          else if (record.kind == triton::engines::symbolic::MEM) {
+            record.origin     = this->readVarint(stream, 64);
+            record.originSize = this->readVarint(stream, 32);
+          }
+          else if (record.kind != triton::engines::symbolic::UNDEF) {
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid expression kind.");
+          }
+
+          if (recordIndexes.find(record.id) != recordIndexes.end())
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Duplicated expression.");
+
+          recordIndexes[record.id] = exprRecords.size();
+          rootsToExprs[record.root].push_back(exprRecords.size());
+          exprRecords.push_back(record);
+        }
+
+        /* Nodes */
+        count = this->readVarint(stream, 64);
+        for (triton::usize index = 0; index < count; index++) {
+          NodeRecord record;
+
+          record.kind  = static_cast<triton::ast::kind_e>(this->readVarint(stream, 32));
+          record.value = 0;
+
+          switch (record.kind) {
+            case triton::ast::DECIMAL_NODE:
+              record.value = this->readVarint(stream);
+              break;
+
+            case triton::ast::STRING_NODE:
+              record.string = this->readString(stream);
+              break;
+
+            case triton::ast::REFERENCE_NODE: {
+              triton::usize id = this->readVarint(stream, 64);
+              if (recordIndexes.find(id) == recordIndexes.end())
+                throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Reference to an expression which has not been saved.");
+              if (exprRecords[recordIndexes[id]].root >= index)
+                throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Reference to an expression not loaded yet.");
+              record.value = id;
+              break;
+            }
+
+            case triton::ast::VARIABLE_NODE:
+              record.value = this->readVarint(stream, 64);
+              if (record.value >= varRecords.size())
+                throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid variable index.");
+              break;
+
+            default: {
+              std::vector<triton::ast::kind_e> kinds;
+              triton::usize size = this->readVarint(stream, 64);
+              for (triton::usize i = 0; i < size; i++) {
+                triton::usize distance = this->readVarint(stream, 64);
+                if (distance == 0 || distance > index)
+                  throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid child index.");
+                record.childs.push_back(index - distance);
+                kinds.push_back(nodeRecords[index - distance].kind);
+              }
+              checkChilds(record.kind, kinds);
+              break;
+            }
+          }
+
+          nodeRecords.push_back(record);
+        }
+
+        for (const ExpressionRecord& record : exprRecords) {
+          if (record.root >= nodeRecords.size())
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid expression root.");
+        }
+
+        /* Roots */
+        count = this->readVarint(stream, 64);
+        for (triton::usize i = 0; i < count; i++) {
+          triton::usize index = this->readVarint(stream, 64);
+          if (index >= nodeRecords.size())
+            throw triton::exceptions::SymbolicSerialization("SymbolicSerialization::load(): Invalid root index.");
+          roots.push_back(index);
+        }
+
+        /* The whole stream is valid, the symbolic engine is only modified from here */
+        expressions.resize(exprRecords.size(), nullptr);
+
+        try {
+          for (const VariableRecord& record : varRecords) {
+            SymbolicVariable* var = this->symbolic->newSymbolicVariable(record.kind, record.kindValue, record.size, record.comment);
+            variables.push_back(var);
+            var->setConcreteValue(record.value);
+          }
+
+          for (triton::usize index = 0; index < nodeRecords.size(); index++) {
+            const NodeRecord& record = nodeRecords[index];
+            triton::ast::AbstractNode* node = nullptr;
+
+            switch (record.kind) {
+              case triton::ast::DECIMAL_NODE:
+                node = triton::ast::decimal(record.value);
+                break;
+
+              case triton::ast::STRING_NODE:
+                node = triton::ast::string(record.string);
+                break;
+
+              case triton::ast::REFERENCE_NODE:
+                node = triton::ast::reference(exprIds[record.value.convert_to<triton::usize>()]);
+                break;
+
+              case triton::ast::VARIABLE_NODE:
+                node = triton::ast::variable(*variables[record.value.convert_to<triton::usize>()]);
+                break;
+
+              default: {
+                std::vector<triton::ast::AbstractNode*> childs;
+                for (triton::usize child : record.childs)
+                  childs.push_back(table[child]);
+                node = triton::ast::newInstance(record.kind, childs);
+                break;
+              }
+            }
+
+            table.push_back(node);
+
+            /* Creates the expressions rooted on this node */
+            if (rootsToExprs.find(index) != rootsToExprs.end()) {
+              for (triton::usize i : rootsToExprs[index]) {
+                const ExpressionRecord& expression = exprRecords[i];
+                SymbolicExpression* expr = this->symbolic->newSymbolicExpression(node, expression.kind, expression.comment);
+
+                expressions[i] = expr;
+                expr->isTainted = expression.isTainted;
+                if (expression.kind == triton::engines::symbolic::REG)
+                  expr->setOriginRegister(triton::arch::Register(static_cast<triton::uint32>(expression.origin)));
+                else if (expression.kind == triton::engines::symbolic::MEM)
+                  expr->setOriginMemory(triton::arch::MemoryAccess(expression.origin, expression.originSize));
+
+                exprIds[expression.id] = expr->getId();
+              }
+            }
+          }
+        }
+        catch (...) {
+          /* A node has been rejected by its builder, the load leaves the engine as it was */
+          for (SymbolicExpression* expr : expressions) {
+            if (expr != nullptr)
+              this->symbolic->removeSymbolicExpression(expr->getId());
+          }
+          for (SymbolicVariable* var : variables)
+            this->symbolic->removeSymbolicVariable(var->getId());
+          throw;
+        }
+
+        for (triton::usize index : roots)
+          nodes.push_back(table[index]);
+
+        exprs.insert(exprs.end(), expressions.begin(), expressions.end());
+        vars.insert(vars.end(), variables.begin(), variables.end());
+      }
+
+    }; /* symbolic namespace */
+  }; /* engines namespace */
+}; /*triton namespace */
@@ -5,6 +5,8 @@
 **  This program is under the terms of the BSD License.
 */
 
+#include <unordered_map>
+
 #include <triton/exceptions.hpp>
 #include <triton/symbolicSimplification.hpp>
 
@@ -39,7 +41,7 @@ Below, a little example which replaces all \f$ A \oplus A \rightarrow A = 0\f$.
 triton::ast::AbstractNode* xor_simplification(triton::ast::AbstractNode* node) {
 
   if (node->getKind() == triton::ast::BVXOR_NODE) {
-    if (*(node->getChilds()[0]) == *(node->getChilds()[1]))
+    if (triton::ast::isSameTree(node->getChilds()[0], node->getChilds()[1]))
       return triton::ast::bv(0, node->getBitvectorSize());
   }
 
@@ -107,6 +109,59 @@ if __name__ == "__main__":
     print 'Simp: ', c
 ~~~~~~~~~~~~~
 
+\subsection SMT_simplification_native Native simplification passes
+<hr>
+
+Triton also ships native simplification passes which do not need any callback. They are enabled with the
+triton::modes::AST_NATIVE_SIMPLIFICATIONS mode and are applied when a node is built, so its childs are always
+already simplified. By default all passes are applied in the order below, the list and the order can be
+defined with the triton::API::setSimplificationPasses() function.
+
+- triton::engines::symbolic::CONSTANT_FOLDING: \f$ (bvadd\ 1\ 2) \rightarrow 3 \f$
+- triton::engines::symbolic::NEUTRAL_ELEMENTS: \f$ A + 0 \rightarrow A \f$, \f$ A \land 0 \rightarrow 0 \f$, \f$ A \times 1 \rightarrow A \f$
+- triton::engines::symbolic::DOUBLE_NEGATION: \f$ \lnot{\lnot{A}} \rightarrow A \f$, \f$ -(-A) \rightarrow A \f$
+- triton::engines::symbolic::SELF_OPERATIONS: \f$ A \oplus A \rightarrow 0 \f$, \f$ A - A \rightarrow 0 \f$, \f$ A \land A \rightarrow A \f$
+- triton::engines::symbolic::EXTRACT_REDUCTION: \f$ ((\_\ extract\ 7\ 0)\ ((\_\ zero\_extend\ 24)\ A_8)) \rightarrow A_8 \f$, extractions of a concatenation
+- triton::engines::symbolic::CONSTANT_CONDITION: \f$ (ite\ true\ A\ B) \rightarrow A \f$
+- triton::engines::symbolic::REWRITE_RULES: applies the rewrite rules recorded by the user (see below).
+
+~~~~~~~~~~~~~{.py}
+>>> enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, True)
+>>> setSimplificationPasses([SIMPLIFICATION.SELF_OPERATIONS, SIMPLIFICATION.CONSTANT_FOLDING])
+>>> a = variable(newSymbolicVariable(8))
+>>> print (a ^ a) + bv(1, 8)
+(_ bv1 8)
+~~~~~~~~~~~~~
+
+\subsection SMT_simplification_rules Simplification via rewrite rules
+<hr>
+
+Instead of walking the AST in a callback, rules can be written as `<pattern> -> <replacement>` S-expressions and
+recorded with the triton::API::addSimplificationRule() function. A rule is compiled once into native match and
+build instructions, and rules are dispatched on the kind of the root node of their pattern. They are applied by the
+triton::engines::symbolic::REWRITE_RULES pass, so the triton::modes::AST_NATIVE_SIMPLIFICATIONS mode must be enabled.
+The first recorded rule which matches a node replaces it.
+
+- Operators use the SMT-LIB names (`bvadd`, `bvnot`, `=`, `ite`, `concat`, ...) and indexed operators are written
+`(_ extract 7 0)`, `(_ zero_extend 8)`, `(_ sign_extend 8)`, `(_ rotate_left 1)` or `(_ rotate_right 1)`.
+- An identifier is a variable. Using the same variable twice requires the same sub-expressions.
+- `x:8` is a variable which only matches 8-bit nodes.
+- A number (`0`, `0xff`) is a constant. In a pattern it matches any size. In a replacement it takes the size of the
+rewritten node if it is the whole replacement, or the size of its sibling operands (e.g: `(bvsub x 1)`, the branches
+of an `ite`). Otherwise the rule is rejected and the size must be explicit: `0xff:8` and `(_ bv255 8)` are constants
+with an explicit size.
+- A replacement whose operands do not fit (e.g: different sizes) is not applied.
+
+~~~~~~~~~~~~~{.py}
+>>> enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, True)
+>>> addSimplificationRule("(bvor (bvand a (bvnot b)) (bvand (bvnot a) b)) -> (bvxor a b)")
+>>> addSimplificationRule("(bvadd (bvxor x y) (bvshl (bvand x y) 1)) -> (bvadd x y)")
+>>> a = variable(newSymbolicVariable(8))
+>>> b = variable(newSymbolicVariable(8))
+>>> print (a & ~b) | (~a & b)
+(bvxor SymVar_0 SymVar_1)
+~~~~~~~~~~~~~
+
 \subsection SMT_simplification_z3 Simplification via Z3
 <hr>
 
@@ -162,6 +217,14 @@ namespace triton {
 
       SymbolicSimplification::SymbolicSimplification(triton::callbacks::Callbacks* callbacks) {
         this->callbacks = callbacks;
+        this->passes.push_back(triton::engines::symbolic::CONSTANT_FOLDING);
+        this->passes.push_back(triton::engines::symbolic::NEUTRAL_ELEMENTS);
+        this->passes.push_back(triton::engines::symbolic::DOUBLE_NEGATION);
+        this->passes.push_back(triton::engines::symbolic::SELF_OPERATIONS);
+        this->passes.push_back(triton::engines::symbolic::EXTRACT_REDUCTION);
+        this->passes.push_back(triton::engines::symbolic::CONSTANT_CONDITION);
+        this->passes.push_back(triton::engines::symbolic::REWRITE_RULES);
+        this->rewriteDepth = 0;
       }
 
 
@@ -175,7 +238,11 @@ namespace triton {
 
 
       void SymbolicSimplification::copy(const SymbolicSimplification& other) {
-        this->callbacks = other.callbacks;
+        this->callbacks    = other.callbacks;
+        this->passes       = other.passes;
+        this->rewriteDepth = 0;
+        this->rules        = other.rules;
+        this->rulesByKind  = other.rulesByKind;
       }
 
 
@@ -191,6 +258,390 @@ namespace triton {
       }
 
 
+      /* Returns true if the node is a constant bitvector */
+      static bool isConstant(triton::ast::AbstractNode* node) {
+        return (node->getKind() == triton::ast::BV_NODE);
+      }
+
+
+      /* Returns true if the node is a constant bitvector equal to value */
+      static bool isConstant(triton::ast::AbstractNode* node, triton::uint512 value) {
+        return (node->getKind() == triton::ast::BV_NODE && node->evaluate() == value);
+      }
+
+
+      /* Returns true if the node is a constant bitvector with all bits set */
+      static bool isAllOnes(triton::ast::AbstractNode* node) {
+        return (node->getKind() == triton::ast::BV_NODE && node->evaluate() == node->getBitvectorMask());
+      }
+
+
+      /* Returns true if the value of the AST cannot change (no variable nor reference) */
+      static bool isConstantTree(triton::ast::AbstractNode* node) {
+        std::vector<triton::ast::AbstractNode*> nodes;
+
+        if (node->isSymbolized())
+          return false;
+
+        triton::ast::nodesExtraction(nodes, node);
+        for (auto it = nodes.begin(); it != nodes.end(); it++) {
+          if ((*it)->getKind() == triton::ast::REFERENCE_NODE)
+            return false;
+        }
+
+        return true;
+      }
+
+
+      /* Returns the index of the first child which is an expression (and not a parameter of the node) */
+      static triton::uint32 getFirstExpressionIndex(triton::ast::AbstractNode* node) {
+        switch (node->getKind()) {
+          case triton::ast::EXTRACT_NODE:
+            return 2;
+          case triton::ast::BVROL_NODE:
+          case triton::ast::BVROR_NODE:
+          case triton::ast::SX_NODE:
+          case triton::ast::ZX_NODE:
+            return 1;
+          default:
+            return 0;
+        }
+      }
+
+
+      /* Returns true if the node is a bitvector operation which can be folded */
+      static bool isFoldable(triton::ast::AbstractNode* node) {
+        switch (node->getKind()) {
+          case triton::ast::BVADD_NODE:
+          case triton::ast::BVAND_NODE:
+          case triton::ast::BVASHR_NODE:
+          case triton::ast::BVLSHR_NODE:
+          case triton::ast::BVMUL_NODE:
+          case triton::ast::BVNAND_NODE:
+          case triton::ast::BVNEG_NODE:
+          case triton::ast::BVNOR_NODE:
+          case triton::ast::BVNOT_NODE:
+          case triton::ast::BVOR_NODE:
+          case triton::ast::BVROL_NODE:
+          case triton::ast::BVROR_NODE:
+          case triton::ast::BVSDIV_NODE:
+          case triton::ast::BVSHL_NODE:
+          case triton::ast::BVSMOD_NODE:
+          case triton::ast::BVSREM_NODE:
+          case triton::ast::BVSUB_NODE:
+          case triton::ast::BVUDIV_NODE:
+          case triton::ast::BVUREM_NODE:
+          case triton::ast::BVXNOR_NODE:
+          case triton::ast::BVXOR_NODE:
+          case triton::ast::CONCAT_NODE:
+          case triton::ast::EXTRACT_NODE:
+          case triton::ast::SX_NODE:
+          case triton::ast::ZX_NODE:
+            return true;
+          default:
+            return false;
+        }
+      }
+
+
+      /* Rule: (op c1 c2 ...) -> c */
+      static triton::ast::AbstractNode* constantFolding(triton::ast::AbstractNode* node) {
+        std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+
+        if (!isFoldable(node))
+          return node;
+
+        for (triton::uint32 index = getFirstExpressionIndex(node); index < childs.size(); index++) {
+          if (!isConstant(childs[index]))
+            return node;
+        }
+
+        return triton::ast::bv(node->evaluate(), node->getBitvectorSize());
+      }
+
+
+      /* Rules: (x + 0) -> x, (x * 1) -> x, (x & 0) -> 0, (x | ~0) -> ~0, ... */
+      static triton::ast::AbstractNode* neutralElements(triton::ast::AbstractNode* node) {
+        std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+
+        switch (node->getKind()) {
+          case triton::ast::BVADD_NODE:
+          case triton::ast::BVXOR_NODE:
+            if (isConstant(childs[1], 0)) return childs[0];
+            if (isConstant(childs[0], 0)) return childs[1];
+            break;
+
+          case triton::ast::BVOR_NODE:
+            if (isConstant(childs[1], 0)) return childs[0];
+            if (isConstant(childs[0], 0)) return childs[1];
+            if (isAllOnes(childs[0]))     return childs[0];
+            if (isAllOnes(childs[1]))     return childs[1];
+            break;
+
+          case triton::ast::BVAND_NODE:
+            if (isAllOnes(childs[1]))     return childs[0];
+            if (isAllOnes(childs[0]))     return childs[1];
+            if (isConstant(childs[0], 0)) return childs[0];
+            if (isConstant(childs[1], 0)) return childs[1];
+            break;
+
+          case triton::ast::BVMUL_NODE:
+            if (isConstant(childs[1], 1)) return childs[0];
+            if (isConstant(childs[0], 1)) return childs[1];
+            if (isConstant(childs[0], 0)) return childs[0];
+            if (isConstant(childs[1], 0)) return childs[1];
+            break;
+
+          case triton::ast::BVSUB_NODE:
+          case triton::ast::BVASHR_NODE:
+            if (isConstant(childs[1], 0)) return childs[0];
+            break;
+
+          case triton::ast::BVSHL_NODE:
+          case triton::ast::BVLSHR_NODE:
+            if (isConstant(childs[1], 0)) return childs[0];
+            if (isConstant(childs[0], 0)) return childs[0];
+            break;
+
+          case triton::ast::BVSDIV_NODE:
+          case triton::ast::BVUDIV_NODE:
+            if (isConstant(childs[1], 1)) return childs[0];
+            break;
+
+          case triton::ast::BVUREM_NODE:
+            if (isConstant(childs[1], 1)) return triton::ast::bv(0, node->getBitvectorSize());
+            break;
+
+          default:
+            break;
+        }
+
+        return node;
+      }
+
+
+      /* Rules: (bvnot (bvnot x)) -> x, (bvneg (bvneg x)) -> x, (not (not x)) -> x */
+      static triton::ast::AbstractNode* doubleNegation(triton::ast::AbstractNode* node) {
+        switch (node->getKind()) {
+          case triton::ast::BVNEG_NODE:
+          case triton::ast::BVNOT_NODE:
+          case triton::ast::LNOT_NODE:
+            if (node->getChilds()[0]->getKind() == node->getKind())
+              return node->getChilds()[0]->getChilds()[0];
+            break;
+
+          default:
+            break;
+        }
+
+        return node;
+      }
+
+
+      /* Rules: (x ^ x) -> 0, (x - x) -> 0, (x & x) -> x, (x | x) -> x */
+      static triton::ast::AbstractNode* selfOperations(triton::ast::AbstractNode* node) {
+        std::vector<triton::ast::AbstractNode*>& childs = node->getChilds();
+
+        switch (node->getKind()) {
+          case triton::ast::BVSUB_NODE:
+          case triton::ast::BVXOR_NODE:
+            if (triton::ast::isSameTree(childs[0], childs[1]))
+              return triton::ast::bv(0, node->getBitvectorSize());
+            break;
+
+          case triton::ast::BVXNOR_NODE:
+            if (triton::ast::isSameTree(childs[0], childs[1]))
+              return triton::ast::bv(node->getBitvectorMask(), node->getBitvectorSize());
+            break;
+
+          case triton::ast::BVAND_NODE:
+          case triton::ast::BVOR_NODE:
+            if (triton::ast::isSameTree(childs[0], childs[1]))
+              return childs[0];
+            break;
+
+          default:
+            break;
+        }
+
+        return node;
+      }
+
+
+      /* Rules: extract of the whole node, of a zero extension, of a concatenation and of an extraction */
+      static triton::ast::AbstractNode* extractReduction(triton::ast::AbstractNode* node) {
+        triton::uint32 high             = 0;
+        triton::uint32 low              = 0;
+        triton::ast::AbstractNode* expr = nullptr;
+
+        if (node->getKind() != triton::ast::EXTRACT_NODE)
+          return node;
+
+        high = reinterpret_cast<triton::ast::DecimalNode*>(node->getChilds()[0])->getValue().convert_to<triton::uint32>();
+        low  = reinterpret_cast<triton::ast::DecimalNode*>(node->getChilds()[1])->getValue().convert_to<triton::uint32>();
+        expr = node->getChilds()[2];
+
+        /* ((_ extract size-1 0) x) -> x */
+        if (low == 0 && high == expr->getBitvectorSize() - 1)
+          return expr;
+
+        switch (expr->getKind()) {
+          /* ((_ extract h l) ((_ zero_extend n) x)) -> ((_ extract h l) x) or zeros */
+          case triton::ast::ZX_NODE: {
+            triton::ast::AbstractNode* inner = expr->getChilds()[1];
+            if (high < inner->getBitvectorSize())
+              return triton::ast::extract(high, low, inner);
+            if (low >= inner->getBitvectorSize())
+              return triton::ast::bv(0, high - low + 1);
+            break;
+          }
+
+          /* ((_ extract h l) (concat ... x ...)) -> ((_ extract h-o l-o) x) if x holds all bits */
+          case triton::ast::CONCAT_NODE: {
+            std::vector<triton::ast::AbstractNode*>& childs = expr->getChilds();
+            triton::uint32 offset = 0;
+            for (auto it = childs.rbegin(); it != childs.rend(); it++) {
+              triton::uint32 size = (*it)->getBitvectorSize();
+              if (low >= offset && high < offset + size)
+                return triton::ast::extract(high - offset, low - offset, *it);
+              offset += size;
+            }
+            break;
+          }
+
+          /* ((_ extract h l) ((_ extract h' l') x)) -> ((_ extract h+l' l+l') x) */
+          case triton::ast::EXTRACT_NODE: {
+            triton::uint32 innerLow = reinterpret_cast<triton::ast::DecimalNode*>(expr->getChilds()[1])->getValue().convert_to<triton::uint32>();
+            return triton::ast::extract(high + innerLow, low + innerLow, expr->getChilds()[2]);
+          }
+
+          default:
+            break;
+        }
+
+        return node;
+      }
+
+
+      /* Rule: (ite c x y) -> x or y if c is constant */
+      static triton::ast::AbstractNode* constantCondition(triton::ast::AbstractNode* node) {
+        if (node->getKind() != triton::ast::ITE_NODE)
+          return node;
+
+        if (!isConstantTree(node->getChilds()[0]))
+          return node;
+
+        if (node->getChilds()[0]->evaluate())
+          return node->getChilds()[1];
+
+        return node->getChilds()[2];
+      }
+
+
+      triton::ast::AbstractNode* SymbolicSimplification::applyRewriteRules(triton::ast::AbstractNode* node) const {
+        triton::ast::AbstractNode* rewritten = nullptr;
+
+        /* Nodes built by a rule are simplified when they are built, which may apply other rules */
+        if (this->rewriteDepth >= triton::engines::symbolic::REWRITE_RULES_MAX_DEPTH)
+          return node;
+
+        auto it = this->rulesByKind.find(node->getKind());
+        if (it == this->rulesByKind.end())
+          return node;
+
+        this->rewriteDepth++;
+        for (auto index = it->second.begin(); index != it->second.end() && rewritten == nullptr; index++)
+          rewritten = this->rules[*index].apply(node);
+        this->rewriteDepth--;
+
+        return (rewritten != nullptr) ? rewritten : node;
+      }
+
+
+      triton::ast::AbstractNode* SymbolicSimplification::applyNativeSimplification(triton::engines::symbolic::simplification_e pass, triton::ast::AbstractNode* node) const {
+        switch (pass) {
+          case triton::engines::symbolic::CONSTANT_FOLDING:   return constantFolding(node);
+          case triton::engines::symbolic::NEUTRAL_ELEMENTS:   return neutralElements(node);
+          case triton::engines::symbolic::DOUBLE_NEGATION:    return doubleNegation(node);
+          case triton::engines::symbolic::SELF_OPERATIONS:    return selfOperations(node);
+          case triton::engines::symbolic::EXTRACT_REDUCTION:  return extractReduction(node);
+          case triton::engines::symbolic::CONSTANT_CONDITION: return constantCondition(node);
+          case triton::engines::symbolic::REWRITE_RULES:      return this->applyRewriteRules(node);
+          default:
+            throw triton::exceptions::SymbolicSimplification("SymbolicSimplification::applyNativeSimplification(): Invalid simplification pass.");
+        }
+      }
+
+
+      triton::ast::AbstractNode* SymbolicSimplification::applyNativeSimplifications(triton::ast::AbstractNode* node) const {
+        if (node == nullptr)
+          throw triton::exceptions::SymbolicSimplification("SymbolicSimplification::applyNativeSimplifications(): node cannot be null.");
+
+        for (auto it = this->passes.begin(); it != this->passes.end(); it++)
+          node = this->applyNativeSimplification(*it, node);
+
+        return node;
+      }
+
+
+      triton::ast::AbstractNode* SymbolicSimplification::processNativeSimplifications(triton::ast::AbstractNode* node) const {
+        std::unordered_map<triton::ast::AbstractNode*, triton::ast::AbstractNode*> simplified;
+        std::vector<triton::ast::AbstractNode*> nodes;
+
+        if (node == nullptr)
+          throw triton::exceptions::SymbolicSimplification("SymbolicSimplification::processNativeSimplifications(): node cannot be null.");
+
+        /* Childs come before their parents, so each node is simplified with simplified childs */
+        triton::ast::nodesExtraction(nodes, node);
+
+        for (auto it = nodes.begin(); it != nodes.end(); it++) {
+          std::vector<triton::ast::AbstractNode*> childs;
+          for (auto child = (*it)->getChilds().begin(); child != (*it)->getChilds().end(); child++)
+            childs.push_back(simplified[*child]);
+          simplified[*it] = this->applyNativeSimplifications(triton::ast::newInstance(*it, childs));
+        }
+
+        return simplified[node];
+      }
+
+
+      void SymbolicSimplification::setNativeSimplificationPasses(const std::vector<triton::engines::symbolic::simplification_e>& passes) {
+        for (auto it = passes.begin(); it != passes.end(); it++) {
+          if (static_cast<triton::uint32>(*it) > triton::engines::symbolic::REWRITE_RULES)
+            throw triton::exceptions::SymbolicSimplification("SymbolicSimplification::setNativeSimplificationPasses(): Invalid simplification pass.");
+        }
+        this->passes = passes;
+      }
+
+
+      const std::vector<triton::engines::symbolic::simplification_e>& SymbolicSimplification::getNativeSimplificationPasses(void) const {
+        return this->passes;
+      }
+
+
+      void SymbolicSimplification::addSimplificationRule(const std::string& rule) {
+        RewriteRule compiled(rule);
+        this->rulesByKind[compiled.getKind()].push_back(this->rules.size());
+        this->rules.push_back(compiled);
+      }
+
+
+      std::vector<std::string> SymbolicSimplification::getSimplificationRules(void) const {
+        std::vector<std::string> ret;
+
+        for (auto it = this->rules.begin(); it != this->rules.end(); it++)
+          ret.push_back(it->getRule());
+
+        return ret;
+      }
+
+
+      void SymbolicSimplification::removeAllSimplificationRules(void) {
+        this->rules.clear();
+        this->rulesByKind.clear();
+      }
+
+
       void SymbolicSimplification::operator=(const SymbolicSimplification& other) {
         this->copy(other);
       }
@@ -132,7 +132,14 @@ namespace triton {
 
       /* Returns the tainted addresses */
       const std::set<triton::uint64>& TaintEngine::getTaintedMemory(void) const {
-        return this->taintedMemory;
+        std::map<triton::uint64, bool> items = this->taintedMemory.getItems();
+
+        this->taintedMemoryView.clear();
+
+        for (auto it = items.begin(); it != items.end(); it++)
+          this->taintedMemoryView.insert(this->taintedMemoryView.end(), it->first);
+
+        return this->taintedMemoryView;
       }
 
 
@@ -148,7 +155,7 @@ namespace triton {
         triton::uint32 size = mem.getSize();
 
         for (triton::uint32 index = 0; index < size; index++) {
-          if (this->taintedMemory.find(addr+index) != this->taintedMemory.end())
+          if (this->taintedMemory.isMapped(addr+index))
             return TAINTED;
         }
 
@@ -159,7 +166,7 @@ namespace triton {
       /* Returns true of false if the address is currently tainted */
       bool TaintEngine::isMemoryTainted(triton::uint64 addr, triton::uint32 size) const {
         for (triton::uint32 index = 0; index < size; index++) {
-          if (this->taintedMemory.find(addr+index) != this->taintedMemory.end())
+          if (this->taintedMemory.isMapped(addr+index))
             return TAINTED;
         }
 
@@ -267,7 +274,7 @@ namespace triton {
           return this->isMemoryTainted(mem);
 
         for (triton::uint32 index = 0; index < size; index++)
-          this->taintedMemory.insert(addr+index);
+          this->taintedMemory.set(addr+index, TAINTED);
 
         return TAINTED;
       }
@@ -277,7 +284,7 @@ namespace triton {
       bool TaintEngine::taintMemory(triton::uint64 addr) {
         if (!this->isEnabled())
           return this->isMemoryTainted(addr);
-        this->taintedMemory.insert(addr);
+        this->taintedMemory.set(addr, TAINTED);
         return TAINTED;
       }
 
@@ -291,7 +298,7 @@ namespace triton {
           return this->isMemoryTainted(mem);
 
         for (triton::uint32 index = 0; index < size; index++)
-          this->taintedMemory.erase(addr+index);
+          this->taintedMemory.remove(addr+index);
 
         return !TAINTED;
       }
@@ -301,7 +308,7 @@ namespace triton {
       bool TaintEngine::untaintMemory(triton::uint64 addr) {
         if (!this->isEnabled())
           return this->isMemoryTainted(addr);
-        this->taintedMemory.erase(addr);
+        this->taintedMemory.remove(addr);
         return !TAINTED;
       }
 
@@ -368,13 +375,8 @@ namespace triton {
         flag = this->unionMemoryImmediate(memDst);
 
         /* Taint each byte of reference expression */
-        for (triton::uint32 i = 0; i != writeSize; i++) {
-          triton::usize byteId = this->symbolicEngine->getSymbolicMemoryId(memAddrDst + i);
-          if (byteId == triton::engines::symbolic::UNSET)
-            continue;
-          triton::engines::symbolic::SymbolicExpression* byte = this->symbolicEngine->getSymbolicExpressionFromId(byteId);
-          byte->isTainted = flag;
-        }
+        for (triton::uint32 i = 0; i != writeSize; i++)
+          this->setTaintMemoryExpression(memAddrDst + i, flag);
 
         return flag;
       }
@@ -389,13 +391,8 @@ namespace triton {
         flag = this->unionMemoryMemory(memDst, memSrc);
 
         /* Taint each byte of reference expression */
-        for (triton::uint32 i = 0; i != writeSize; i++) {
-          triton::usize byteId = this->symbolicEngine->getSymbolicMemoryId(memAddrDst + i);
-          if (byteId == triton::engines::symbolic::UNSET)
-            continue;
-          triton::engines::symbolic::SymbolicExpression* byte = this->symbolicEngine->getSymbolicExpressionFromId(byteId);
-          byte->isTainted = this->isMemoryTainted(memAddrDst + i) | this->isMemoryTainted(memAddrSrc + i);
-        }
+        for (triton::uint32 i = 0; i != writeSize; i++)
+          this->setTaintMemoryExpression(memAddrDst + i, this->isMemoryTainted(memAddrDst + i) | this->isMemoryTainted(memAddrSrc + i));
 
         return flag;
       }
@@ -409,13 +406,8 @@ namespace triton {
         flag = this->unionMemoryRegister(memDst, regSrc);
 
         /* Taint each byte of reference expression */
-        for (triton::uint32 i = 0; i != writeSize; i++) {
-          triton::usize byteId = this->symbolicEngine->getSymbolicMemoryId(memAddrDst + i);
-          if (byteId == triton::engines::symbolic::UNSET)
-            continue;
-          triton::engines::symbolic::SymbolicExpression* byte = this->symbolicEngine->getSymbolicExpressionFromId(byteId);
-          byte->isTainted = flag;
-        }
+        for (triton::uint32 i = 0; i != writeSize; i++)
+          this->setTaintMemoryExpression(memAddrDst + i, flag);
 
         return flag;
       }
@@ -444,13 +436,8 @@ namespace triton {
         flag = this->assignmentMemoryImmediate(memDst);
 
         /* Taint each byte of reference expression */
-        for (triton::uint32 i = 0; i != writeSize; i++) {
-          triton::usize byteId = this->symbolicEngine->getSymbolicMemoryId(memAddrDst + i);
-          if (byteId == triton::engines::symbolic::UNSET)
-            continue;
-          triton::engines::symbolic::SymbolicExpression* byte = this->symbolicEngine->getSymbolicExpressionFromId(byteId);
-          byte->isTainted = flag;
-        }
+        for (triton::uint32 i = 0; i != writeSize; i++)
+          this->setTaintMemoryExpression(memAddrDst + i, flag);
 
         return flag;
       }
@@ -465,13 +452,8 @@ namespace triton {
         flag = this->assignmentMemoryMemory(memDst, memSrc);
 
         /* Taint each byte of reference expression */
-        for (triton::uint32 i = 0; i != writeSize; i++) {
-          triton::usize byteId = this->symbolicEngine->getSymbolicMemoryId(memAddrDst + i);
-          if (byteId == triton::engines::symbolic::UNSET)
-            continue;
-          triton::engines::symbolic::SymbolicExpression* byte = this->symbolicEngine->getSymbolicExpressionFromId(byteId);
-          byte->isTainted = this->isMemoryTainted(memAddrSrc + i);
-        }
+        for (triton::uint32 i = 0; i != writeSize; i++)
+          this->setTaintMemoryExpression(memAddrDst + i, this->isMemoryTainted(memAddrSrc + i));
 
         return flag;
       }
@@ -485,13 +467,8 @@ namespace triton {
         flag = this->assignmentMemoryRegister(memDst, regSrc);
 
         /* Taint each byte of reference expression */
-        for (triton::uint32 i = 0; i != writeSize; i++) {
-          triton::usize byteId = this->symbolicEngine->getSymbolicMemoryId(memAddrDst + i);
-          if (byteId == triton::engines::symbolic::UNSET)
-            continue;
-          triton::engines::symbolic::SymbolicExpression* byte = this->symbolicEngine->getSymbolicExpressionFromId(byteId);
-          byte->isTainted = flag;
-        }
+        for (triton::uint32 i = 0; i != writeSize; i++)
+          this->setTaintMemoryExpression(memAddrDst + i, flag);
 
         return flag;
       }
@@ -692,6 +669,18 @@ namespace triton {
         return !TAINTED;
       }
 
+
+      /* Sets the taint of the expression assigned to a memory byte. The expression may be shared with a copy of the engines, so it is only duplicated if its taint changes. */
+      void TaintEngine::setTaintMemoryExpression(triton::uint64 addr, bool flag) {
+        triton::usize id = this->symbolicEngine->getSymbolicMemoryId(addr);
+
+        if (id == triton::engines::symbolic::UNSET)
+          return;
+
+        if (this->symbolicEngine->getSymbolicExpressionFromId(id)->isTainted != flag)
+          this->symbolicEngine->getWritableSymbolicExpression(id)->isTainted = flag;
+      }
+
     }; /* taint namespace */
   }; /* engines namespace */
 }; /* triton namespace */
@@ -10,7 +10,10 @@
 
 #include <triton/architecture.hpp>
 #include <triton/ast.hpp>
+#include <triton/astBatchEvaluator.hpp>
+#include <triton/astEvaluator.hpp>
 #include <triton/astGarbageCollector.hpp>
+#include <triton/astProgram.hpp>
 #include <triton/astRepresentation.hpp>
 #include <triton/callbacks.hpp>
 #include <triton/immediate.hpp>
@@ -23,6 +26,7 @@
 #include <triton/registerSpecification.hpp>
 #include <triton/solverEngine.hpp>
 #include <triton/symbolicEngine.hpp>
+#include <triton/symbolicSerialization.hpp>
 #include <triton/taintEngine.hpp>
 #include <triton/tritonTypes.hpp>
 #include <triton/z3Interface.hpp>
@@ -67,6 +71,18 @@ namespace triton {
         //! The Z3 interface between Triton and Z3
         triton::ast::Z3Interface* z3Interface = nullptr;
 
+        //! The AST evaluator.
+        triton::ast::AstEvaluator astEvaluator;
+
+        //! The AST batch evaluator.
+        triton::ast::AstBatchEvaluator astBatchEvaluator;
+
+        //! The generation of the engines, incremented each time the engines are initialized.
+        triton::usize enginesGeneration = 0;
+
+        //! True if the `AST_LAZY_EVALUATION` mode is enabled. Cached as it is read each time a node is initialized.
+        bool astLazyEvaluation = false;
+
 
       public:
         //! Constructor of the API.
@@ -85,6 +101,9 @@ namespace triton {
         //! [**architecture api**] - Returns the architecture as triton::arch::architectures_e.
         triton::uint32 getArchitecture(void) const;
 
+        //! [**architecture api**] - Returns the generation of the engines. It changes each time the engines are initialized (e.g: setArchitecture() or resetEngines()), so handles on expressions and nodes can tell which engines they belong to.
+        triton::usize getEnginesGeneration(void) const;
+
         //! [**architecture api**] - Raises an exception if the architecture is not initialized.
         void checkArchitecture(void) const;
 
@@ -220,6 +239,18 @@ namespace triton {
         //! [**IR builder api**] - Builds the instruction semantics. Returns true if the instruction is supported. You must define an architecture before. \sa processing().
         bool buildSemantics(triton::arch::Instruction& inst);
 
+        //! [**IR builder api**] - Forks the CPU state, the symbolic engine and the taint engine (copy-on-write). Returns the id of the fork.
+        triton::usize fork(void);
+
+        //! [**IR builder api**] - Restores the state saved by a fork. The fork is kept and may be restored again.
+        void restoreFork(triton::usize id);
+
+        //! [**IR builder api**] - Removes a fork.
+        void removeFork(triton::usize id);
+
+        //! [**IR builder api**] - Returns the ids of the forks.
+        std::vector<triton::usize> getForks(void) const;
+
 
 
         /* AST Garbage Collector API ===================================================================== */
@@ -233,10 +264,32 @@ namespace triton {
         //! [**AST garbage collector api**] - Frees a set of nodes and removes them from the global container.
         void freeAstNodes(std::set<triton::ast::AbstractNode*>& nodes);
 
+        //! [**AST garbage collector api**] - Opens a new epoch. All nodes allocated from now are recorded into this epoch.
+        void beginAstEpoch(void);
+
+        //! [**AST garbage collector api**] - Closes the current epoch. Its nodes are kept and merged into the enclosing epoch.
+        void endAstEpoch(void);
+
+        //! [**AST garbage collector api**] - Frees the nodes allocated during the current epoch and closes it. Nodes still used by a symbolic expression, a path constraint, a variable, a pinned node or an older node are kept.
+        void freeAstEpoch(void);
+
+        //! [**AST garbage collector api**] - Frees all nodes which are not reachable from a symbolic expression, a path constraint, a variable or a pinned node. Returns the number of freed nodes.
+        triton::usize freeUnreachableAstNodes(void);
+
+        //! [**AST garbage collector api**] - Pins a node. A pinned node is never freed by freeUnreachableAstNodes().
+        void pinAstNode(triton::ast::AbstractNode* node);
+
+        //! [**AST garbage collector api**] - Unpins a node.
+        void unpinAstNode(triton::ast::AbstractNode* node);
+
         //! [**AST garbage collector api**] - Extracts all unique nodes from a partial AST into the uniqueNodes set.
         void extractUniqueAstNodes(std::set<triton::ast::AbstractNode*>& uniqueNodes, triton::ast::AbstractNode* root) const;
 
-        //! [**AST garbage collector api**] - Records the allocated node or returns the same node if it already exists inside the dictionaries.
+        /*!
+         * \brief [**AST garbage collector api**] - Records the allocated node or returns the same node if it already exists inside the dictionaries.
+         *
+         * \details If the triton::modes::AST_NATIVE_SIMPLIFICATIONS mode is enabled, the returned node is simplified.
+         */
         triton::ast::AbstractNode* recordAstNode(triton::ast::AbstractNode* node);
 
         //! [**AST garbage collector api**] - Records a variable AST node.
@@ -272,6 +325,22 @@ namespace triton {
 
 
 
+        /* AST Evaluation API ============================================================================ */
+
+        //! [**AST evaluation api**] - Evaluates `node` where symbolic variables are assigned by id. Neither the nodes nor the variables are modified. \sa triton::ast::AstEvaluator
+        triton::uint512 evaluateAst(triton::ast::AbstractNode* node, const std::map<triton::usize, triton::uint512>& values);
+
+        //! [**AST evaluation api**] - Evaluates `node` over a batch of assignments where symbolic variables are assigned by id to columns of values. \sa triton::ast::AstBatchEvaluator
+        std::vector<triton::uint512> evaluateAstBatch(triton::ast::AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values);
+
+        //! [**AST evaluation api**] - Evaluates `node` like evaluateAstBatch() where `node` is not wider than 64 bits.
+        std::vector<triton::uint64> evaluateAstBatch64(triton::ast::AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values);
+
+        //! [**AST evaluation api**] - Compiles `node` (references are unrolled) into a program which may be evaluated many times. \sa triton::ast::AstProgram
+        triton::ast::AstProgram compileAst(triton::ast::AbstractNode* node) const;
+
+
+
         /* Callbacks API ================================================================================= */
 
         //! [**callbacks api**] - Adds a GET_CONCRETE_MEMORY_VALUE callback.
@@ -317,6 +386,9 @@ namespace triton {
         //! [**modes api**] - Returns true if the mode is enabled.
         bool isModeEnabled(enum triton::modes::mode_e mode) const;
 
+        //! [**modes api**] - Returns true if the `AST_LAZY_EVALUATION` mode is enabled. Unlike isModeEnabled(), the mode is not looked up and no exception is raised.
+        bool isAstLazyEvaluationEnabled(void) const;
+
 
 
         /* Symbolic engine API =========================================================================== */
@@ -393,6 +465,15 @@ namespace triton {
         //! [**symbolic api**] - Removes the symbolic expression corresponding to the id.
         void removeSymbolicExpression(triton::usize symExprId);
 
+        //! [**symbolic api**] - Frees all symbolic expressions (and their AST nodes) which are not reachable from a register, the memory, a path constraint or a pinned expression. Returns the number of freed expressions.
+        triton::usize freeUnreachableSymbolicExpressions(void);
+
+        //! [**symbolic api**] - Pins a symbolic expression. A pinned expression is never freed by freeUnreachableSymbolicExpressions().
+        void pinSymbolicExpression(triton::usize symExprId);
+
+        //! [**symbolic api**] - Unpins a symbolic expression.
+        void unpinSymbolicExpression(triton::usize symExprId);
+
         //! [**symbolic api**] - Returns the new symbolic abstract expression and links this expression to the instruction.
         triton::engines::symbolic::SymbolicExpression* createSymbolicExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::OperandWrapper& dst, const std::string& comment="");
 
@@ -417,6 +498,39 @@ namespace triton {
         //! [**symbolic api**] - Processes all recorded simplifications. Returns the simplified node.
         triton::ast::AbstractNode* processSimplification(triton::ast::AbstractNode* node, bool z3=false) const;
 
+        //! [**symbolic api**] - Defines the native simplification passes (and their order) applied when the triton::modes::AST_NATIVE_SIMPLIFICATIONS mode is enabled.
+        void setSimplificationPasses(const std::vector<triton::engines::symbolic::simplification_e>& passes);
+
+        //! [**symbolic api**] - Returns the native simplification passes in their order.
+        const std::vector<triton::engines::symbolic::simplification_e>& getSimplificationPasses(void) const;
+
+        //! [**symbolic api**] - Compiles and records a rewrite rule (e.g: `(bvxor x x) -> 0`) applied by the triton::engines::symbolic::REWRITE_RULES pass.
+        void addSimplificationRule(const std::string& rule);
+
+        //! [**symbolic api**] - Returns all recorded rewrite rules.
+        std::vector<std::string> getSimplificationRules(void) const;
+
+        //! [**symbolic api**] - Removes all recorded rewrite rules.
+        void removeAllSimplificationRules(void);
+
+        //! [**symbolic api**] - Writes the AST DAG of `node` into `stream` in the binary format. \sa triton::engines::symbolic::SymbolicSerialization
+        void saveAst(std::ostream& stream, triton::ast::AbstractNode* node) const;
+
+        //! [**symbolic api**] - Reads an AST DAG written by saveAst().
+        triton::ast::AbstractNode* loadAst(std::istream& stream);
+
+        //! [**symbolic api**] - Writes symbolic expressions (and the variables they use) into `stream` in the binary format.
+        void saveSymbolicExpressions(std::ostream& stream, const std::vector<triton::engines::symbolic::SymbolicExpression*>& exprs) const;
+
+        //! [**symbolic api**] - Reads symbolic expressions written by saveSymbolicExpressions(). They are recorded with new ids.
+        std::vector<triton::engines::symbolic::SymbolicExpression*> loadSymbolicExpressions(std::istream& stream);
+
+        //! [**symbolic api**] - Writes symbolic variables into `stream` in the binary format.
+        void saveSymbolicVariables(std::ostream& stream, const std::vector<triton::engines::symbolic::SymbolicVariable*>& vars) const;
+
+        //! [**symbolic api**] - Reads symbolic variables written by saveSymbolicVariables(). They are recorded with new ids.
+        std::vector<triton::engines::symbolic::SymbolicVariable*> loadSymbolicVariables(std::istream& stream);
+
         //! [**symbolic api**] - Returns the symbolic expression corresponding to an id.
         triton::engines::symbolic::SymbolicExpression* getSymbolicExpressionFromId(triton::usize symExprId) const;
 
@@ -480,6 +594,15 @@ namespace triton {
         //! [**symbolic api**] - Returns the full AST from a symbolic expression id.
         triton::ast::AbstractNode* getFullAstFromId(triton::usize symExprId);
 
+        //! [**symbolic api**] - Drops all memoized full ASTs. Does nothing if the symbolic engine is not defined.
+        void invalidateFullAsts(void);
+
+        //! [**symbolic api**] - Signals that a node has been modified in place. Drops the memoized full ASTs and the cached dependencies which reach the node. Does nothing if the symbolic engine is not defined.
+        void invalidateAsts(triton::ast::AbstractNode* node);
+
+        //! [**symbolic api**] - Returns the shared copy of a comment from the table of the symbolic engine (a new copy if the symbolic engine is not defined), nullptr if the comment is empty.
+        std::shared_ptr<const std::string> internComment(const std::string& comment);
+
         //! [**symbolic api**] - Slices all expressions from a given one.
         std::map<triton::usize, triton::engines::symbolic::SymbolicExpression*> sliceExpressions(triton::engines::symbolic::SymbolicExpression* expr);
 
@@ -517,6 +640,9 @@ namespace triton {
          */
         std::list<std::map<triton::uint32, triton::engines::solver::SolverModel>> getModels(triton::ast::AbstractNode* node, triton::uint32 limit) const;
 
+        //! [**solver api**] - Decides a symbolic constraint from the known bits of its nodes, without calling the solver. \sa triton::ast::KnownBits
+        enum triton::engines::solver::presolve_e preSolve(triton::ast::AbstractNode* node) const;
+
 
 
         /* Z3 interface API ============================================================================== */
@@ -17,6 +17,7 @@
 #include <vector>
 
 #include <triton/astEnums.hpp>
+#include <triton/astKnownBits.hpp>
 #include <triton/astVisitor.hpp>
 #include <triton/symbolicVariable.hpp>
 #include <triton/tritonTypes.hpp>
@@ -41,23 +42,71 @@ namespace triton {
     //! Abstract node
     class AbstractNode {
       protected:
+        //! The data of a node which are only used by some nodes, allocated on demand.
+        struct Extension {
+          //! The value of the tree from this root node if the node is wider than 64 bits.
+          triton::uint512 wideEval;
+
+          //! The known bits of the tree from this root node, nullptr if they are not computed yet.
+          KnownBits* knownBits;
+
+          //! Constructor.
+          Extension();
+
+          //! Destructor.
+          ~Extension();
+        };
+
         //! The kind of the node.
         enum kind_e kind;
 
+        //! The size of the node.
+        triton::uint32 size;
+
         //! The childs of the node.
         std::vector<AbstractNode*> childs;
 
         //! The parents of the node. Empty if there is still no parent.
         std::set<AbstractNode*> parents;
 
-        //! The size of the node.
-        triton::uint32 size;
+        //! The value of the tree from this root node (the 64 lower bits if the node is wider than 64 bits).
+        triton::uint64 eval;
+
+        //! The structural hash of the tree from this root node. Computed once at init() from the childs' hashes.
+        triton::uint64 hash;
 
-        //! The value of the tree from this root node.
-        triton::uint512 eval;
+        //! The wide value and the known bits of the node, nullptr if the node has none.
+        Extension* extension;
 
         //! This value is set to true if the tree contains a symbolic variable.
-        bool symbolized;
+        bool symbolized : 1;
+
+        //! True if a child has been modified since the last init(). Only set with the `AST_LAZY_EVALUATION` mode.
+        bool dirty : 1;
+
+        //! True if the node has been reached during the mark phase of the AST garbage collector.
+        bool marked : 1;
+
+        //! True if the node is recorded into the AST dictionaries.
+        bool recorded : 1;
+
+        //! Sets the value of the node. The size of the node must be set before.
+        void setEvaluation(const triton::uint512& value);
+
+        //! Returns the extension of the node, allocated if needed.
+        Extension* getExtension(void);
+
+        //! Drops the known bits and releases the extension if it is not used anymore.
+        void releaseExtension(void);
+
+        //! Clears the dirty flag and spreads the modification to the parents (init or mark them dirty).
+        void initParents(void);
+
+        //! Marks this node and all its ancestors dirty.
+        void setDirty(void);
+
+        //! Re-initializes all dirty nodes of the tree in a single topological pass.
+        void refresh(void);
 
       public:
         //! Constructor.
@@ -81,15 +130,42 @@ namespace triton {
         //! Returns the vector mask according the size of the node.
         triton::uint512 getBitvectorMask(void) const;
 
+        //! Returns the vector mask according the size of the node, saturated to 64 bits.
+        triton::uint64 getBitvectorMask64(void) const;
+
         //! According to the size of the expression, returns true if the MSB is 1.
         bool isSigned(void) const;
 
         //! Returns true if the tree contains a symbolic variable.
         bool isSymbolized(void) const;
 
+        //! Returns true if the node must be re-evaluated (`AST_LAZY_EVALUATION` mode).
+        bool isDirty(void) const;
+
+        //! Returns true if the node has been reached during the mark phase of the AST garbage collector.
+        bool isMarked(void) const;
+
+        //! Sets the mark of the AST garbage collector.
+        void setMarked(bool flag);
+
+        //! Returns true if the node is recorded into the AST dictionaries.
+        bool isRecorded(void) const;
+
+        //! Sets if the node is recorded into the AST dictionaries.
+        void setRecorded(bool flag);
+
         //! Evaluates the tree.
         triton::uint512 evaluate(void) const;
 
+        //! Evaluates the tree and returns its 64 lower bits. Uses native arithmetic for nodes up to 64 bits.
+        triton::uint64 evaluate64(void) const;
+
+        //! Returns the structural hash of the tree. The hash is cached on the node, so this is O(1).
+        triton::uint64 getHash(void) const;
+
+        //! Returns the facts known about all the values of the tree. Computed on demand and cached on the nodes.
+        const KnownBits& getKnownBits(void);
+
         //! Returns the childs of the node.
         std::vector<AbstractNode*>& getChilds(void);
 
@@ -125,8 +201,8 @@ namespace triton {
         //! Entry point for a visitor.
         virtual void accept(AstVisitor& v) = 0;
 
-        //! Returns the has of the tree. The hash is computed recursively on the whole tree.
-        virtual triton::uint512 hash(triton::uint32 deep) = 0;
+        //! Computes the hash of the tree from the cached hashes of its childs. Called by init().
+        virtual void initHash(void) = 0;
     };
 
 
@@ -138,7 +214,7 @@ namespace triton {
         virtual ~AssertNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -150,7 +226,7 @@ namespace triton {
         virtual ~BvaddNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -162,7 +238,7 @@ namespace triton {
         virtual ~BvandNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -174,7 +250,7 @@ namespace triton {
         virtual ~BvashrNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -186,7 +262,7 @@ namespace triton {
         virtual ~BvdeclNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -198,7 +274,7 @@ namespace triton {
         virtual ~BvlshrNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -210,7 +286,7 @@ namespace triton {
         virtual ~BvmulNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -222,7 +298,7 @@ namespace triton {
         virtual ~BvnandNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -234,7 +310,7 @@ namespace triton {
         virtual ~BvnegNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -246,7 +322,7 @@ namespace triton {
         virtual ~BvnorNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -258,7 +334,7 @@ namespace triton {
         virtual ~BvnotNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -270,7 +346,7 @@ namespace triton {
         virtual ~BvorNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -283,7 +359,7 @@ namespace triton {
         virtual ~BvrolNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -296,7 +372,7 @@ namespace triton {
         virtual ~BvrorNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -308,7 +384,7 @@ namespace triton {
         virtual ~BvsdivNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -320,7 +396,7 @@ namespace triton {
         virtual ~BvsgeNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -332,7 +408,7 @@ namespace triton {
         virtual ~BvsgtNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -344,7 +420,7 @@ namespace triton {
         virtual ~BvshlNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -356,7 +432,7 @@ namespace triton {
         virtual ~BvsleNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -368,7 +444,7 @@ namespace triton {
         virtual ~BvsltNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -380,7 +456,7 @@ namespace triton {
         virtual ~BvsmodNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -392,7 +468,7 @@ namespace triton {
         virtual ~BvsremNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -404,7 +480,7 @@ namespace triton {
         virtual ~BvsubNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -416,7 +492,7 @@ namespace triton {
         virtual ~BvudivNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -428,7 +504,7 @@ namespace triton {
         virtual ~BvugeNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -440,7 +516,7 @@ namespace triton {
         virtual ~BvugtNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -452,7 +528,7 @@ namespace triton {
         virtual ~BvuleNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -464,7 +540,7 @@ namespace triton {
         virtual ~BvultNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -476,7 +552,7 @@ namespace triton {
         virtual ~BvuremNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -488,7 +564,7 @@ namespace triton {
         virtual ~BvxnorNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -500,7 +576,7 @@ namespace triton {
         virtual ~BvxorNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -512,7 +588,7 @@ namespace triton {
         virtual ~BvNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -524,7 +600,7 @@ namespace triton {
         virtual ~CompoundNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -538,7 +614,7 @@ namespace triton {
         virtual ~ConcatNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -553,7 +629,7 @@ namespace triton {
         virtual ~DecimalNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
 
         triton::uint512 getValue(void);
     };
@@ -567,7 +643,7 @@ namespace triton {
         virtual ~DeclareFunctionNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -579,7 +655,7 @@ namespace triton {
         virtual ~DistinctNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -591,7 +667,7 @@ namespace triton {
         virtual ~EqualNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -603,7 +679,7 @@ namespace triton {
         virtual ~ExtractNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -615,7 +691,7 @@ namespace triton {
         virtual ~IteNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -627,7 +703,7 @@ namespace triton {
         virtual ~LandNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -639,7 +715,7 @@ namespace triton {
         virtual ~LetNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -651,7 +727,7 @@ namespace triton {
         virtual ~LnotNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -663,7 +739,7 @@ namespace triton {
         virtual ~LorNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -678,7 +754,7 @@ namespace triton {
         virtual ~ReferenceNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
 
         triton::usize getValue(void);
     };
@@ -695,7 +771,7 @@ namespace triton {
         virtual ~StringNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
 
         std::string getValue(void);
     };
@@ -709,13 +785,14 @@ namespace triton {
         virtual ~SxNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
     //! Variable node
     class VariableNode : public AbstractNode {
       protected:
+        triton::usize id;
         std::string value;
 
       public:
@@ -724,8 +801,9 @@ namespace triton {
         virtual ~VariableNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
 
+        triton::usize getId(void);
         std::string getValue(void);
     };
 
@@ -738,7 +816,7 @@ namespace triton {
         virtual ~ZxNode();
         virtual void init(void);
         virtual void accept(AstVisitor& v);
-        virtual triton::uint512 hash(triton::uint32 deep);
+        virtual void initHash(void);
     };
 
 
@@ -749,6 +827,15 @@ namespace triton {
     //! Compares two trees.
     bool operator==(AbstractNode& node1, AbstractNode& node2);
 
+    /*!
+     * \brief Returns true if two trees have the same structure.
+     *
+     * \details Unlike `operator==`, which only compares the values and the hashes of the roots,
+     * the trees are compared node by node (kinds, sizes and leaf values). Identical subtrees are
+     * skipped and each pair of nodes is compared once.
+     */
+    bool isSameTree(AbstractNode* node1, AbstractNode* node2);
+
 
     //! AST C++ API - bv node builder
     AbstractNode* bv(triton::uint512 value, triton::uint32 size);
@@ -918,12 +1005,40 @@ namespace triton {
     //! AST C++ API - Duplicates the AST
     AbstractNode* newInstance(AbstractNode* node);
 
+    /*!
+     * \brief AST C++ API - Returns a node of the same kind and attributes as `node` but with new childs.
+     *
+     * \details The node is built through the node builders, so it goes through the AST dictionaries.
+     * If `childs` are the current childs of `node`, `node` itself is returned.
+     */
+    AbstractNode* newInstance(AbstractNode* node, std::vector<AbstractNode*>& childs);
+
+    /*!
+     * \brief AST C++ API - Builds a node of the given kind from its childs.
+     *
+     * \details Childs follow the layout of the node (e.g: the high and low decimal nodes of an
+     * extract come before the expression). Leaf kinds cannot be built this way.
+     */
+    AbstractNode* newInstance(enum kind_e kind, std::vector<AbstractNode*>& childs);
+
+    /*!
+     * \brief AST C++ API - Extracts all unique nodes of a DAG in post-order (a node comes after all its childs).
+     *
+     * \details The walk is iterative and visits each node once, so it scales linearly with the number
+     * of unique nodes and does not depend on the depth of the tree. If `unroll` is true, reference
+     * nodes are followed into the ASTs of the symbolic expressions they point to.
+     */
+    void nodesExtraction(std::vector<AbstractNode*>& result, AbstractNode* root, bool unroll=false);
+
     //! Custom pow function for hash routine.
     triton::uint512 pow(triton::uint512 hash, triton::uint32 n);
 
     //! Custom rotate left function for hash routine.
     triton::uint512 rotl(triton::uint512 value, triton::uint32 shift);
 
+    //! Custom mix function for hash routine. Spreads a value over all the bits of a hash.
+    triton::uint64 mix(triton::uint64 value);
+
     //! Custom modular sign extend for bitwise operation.
     triton::sint512 modularSignExtend(AbstractNode* node);
 
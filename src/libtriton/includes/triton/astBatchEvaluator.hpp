@@ -0,0 +1,103 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_ASTBATCHEVALUATOR_H
+#define TRITON_ASTBATCHEVALUATOR_H
+
+#include <map>
+#include <unordered_map>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The AST namespace
+  namespace ast {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup ast
+   *  @{
+   */
+
+    /*!
+     *  \brief Evaluates an AST over a batch of assignments of its symbolic variables.
+     *
+     *  \details Each variable is assigned a column of values and every node of the DAG is computed once
+     *  for the whole batch. Nodes whose operands fit in 64 bits are computed by tight loops over uint64
+     *  lanes, wider nodes fall back on a per-lane evaluation. Neither the nodes nor the symbolic variables
+     *  are modified.
+     */
+    class AstBatchEvaluator {
+      private:
+        //! The number of assignments of the batch.
+        triton::usize count;
+
+        //! The column of each evaluated node in `columns`.
+        std::unordered_map<AbstractNode*, triton::usize> positions;
+
+        //! The values of the evaluated nodes (the 64 lower bits if the node is wider than 64 bits).
+        std::vector<std::vector<triton::uint64>> columns;
+
+        //! The values of the evaluated nodes wider than 64 bits.
+        std::unordered_map<triton::usize, std::vector<triton::uint512>> wideColumns;
+
+        //! The columns of the assigned variables by id.
+        std::unordered_map<triton::usize, const std::vector<triton::uint64>*> variables;
+
+        //! Allocates the column of a node and returns its lanes.
+        triton::uint64* newColumn(AbstractNode* node);
+
+        //! Returns the lanes of an evaluated node.
+        const triton::uint64* getColumn(AbstractNode* node);
+
+        //! Returns the value of an evaluated node for one assignment.
+        triton::uint512 getLane(AbstractNode* node, triton::usize lane);
+
+        //! Records the same value for all the assignments.
+        void broadcast(AbstractNode* node, const triton::uint512& value);
+
+        //! Computes the column of a node from uint64 lanes.
+        void evaluateNarrowNode(AbstractNode* node);
+
+        //! Computes the column of a node lane by lane.
+        void evaluateWideNode(AbstractNode* node);
+
+        //! Computes the column of a node from the columns of its childs.
+        void evaluateNode(AbstractNode* node);
+
+        //! Evaluates all the nodes of `node`.
+        void run(AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values);
+
+      public:
+        //! Constructor.
+        AstBatchEvaluator();
+
+        //! Destructor.
+        virtual ~AstBatchEvaluator();
+
+        //! Evaluates `node` where variables are assigned by id to columns of the same length. Variables which are not assigned use their concrete value.
+        std::vector<triton::uint512> evaluate(AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values);
+
+        //! Evaluates `node` like evaluate() but `node` must not be wider than 64 bits.
+        std::vector<triton::uint64> evaluate64(AbstractNode* node, const std::map<triton::usize, std::vector<triton::uint64>>& values);
+    };
+
+  /*! @} End of ast namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_ASTBATCHEVALUATOR_H */
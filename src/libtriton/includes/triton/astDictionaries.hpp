@@ -8,7 +8,8 @@
 #ifndef TRITON_ASTDICTIONARIES_H
 #define TRITON_ASTDICTIONARIES_H
 
-#include <set>
+#include <map>
+#include <string>
 #include <vector>
 
 #include <triton/ast.hpp>
@@ -32,172 +33,66 @@ namespace triton {
    */
 
     //! \class AstDictionaries
-    /*! \brief The AST dictionaries class */
+    /*!
+     *  \brief The AST dictionaries class
+     *
+     *  \details The dictionaries only index the recorded nodes, they do not own them. Nodes are owned
+     *  (and deleted) by the epochs of the AST garbage collector, which removes them from the dictionaries
+     *  before deleting them.
+     */
     class AstDictionaries {
-      private:
-        //! Defines if this instance is used as a backup.
-        bool backupFlag;
-
       protected:
         //! Total of allocated nodes.
         triton::usize allocatedNodes;
 
-        //! Total of allocated dictionaries.
-        std::set<triton::ast::AbstractNode*> allocatedDictionaries;
-
-        //! Assert Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> assertDictionary;
-
-        //! Bvadd Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvaddDictionary;
-
-        //! Bvand Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvandDictionary;
-
-        //! Bvashr Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvashrDictionary;
-
-        //! Bvdecl Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvdeclDictionary;
-
-        //! Bvlshr Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvlshrDictionary;
-
-        //! Bvmul Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvmulDictionary;
-
-        //! Bvnand Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvnandDictionary;
-
-        //! Bvneg Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvnegDictionary;
-
-        //! Bvnor Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvnorDictionary;
-
-        //! Bvnot Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvnotDictionary;
-
-        //! Bvor Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvorDictionary;
-
-        //! Bvrol Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvrolDictionary;
-
-        //! Bvror Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvrorDictionary;
-
-        //! Bvsdiv Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvsdivDictionary;
-
-        //! Bvsge Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvsgeDictionary;
-
-        //! Bvsgt Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvsgtDictionary;
-
-        //! Bvshl Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvshlDictionary;
-
-        //! Bvsle Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvsleDictionary;
+        //! Total of nodes recorded into the dictionaries.
+        triton::usize allocatedDictionaries;
 
-        //! Bvslt Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvsltDictionary;
+        //! Total of lookups which returned an already allocated node.
+        triton::usize hits;
 
-        //! Bvsmod Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvsmodDictionary;
+        //! Total of lookups which recorded a new node.
+        triton::usize misses;
 
-        //! Bvsrem Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvsremDictionary;
+        /*!
+         * \brief The hash-consing table.
+         *
+         * \details Open addressing with linear probing. Its capacity is always a power of two and
+         * an empty slot is a `nullptr`. Keys are the kind, the size, the childs' addresses (or the
+         * value for leaf nodes) of the recorded node.
+         */
+        std::vector<triton::ast::AbstractNode*> table;
 
-        //! Bvsub Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvsubDictionary;
+        //! The key hash of each slot of the table (avoids rehashing keys on growth).
+        std::vector<triton::uint64> tableHashes;
 
-        //! Bvudiv Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvudivDictionary;
+        //! Total of recorded nodes per kind.
+        std::vector<triton::usize> kinds;
 
-        //! Bvuge Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvugeDictionary;
+        //! Returns the hash of the hash-consing key of a node.
+        triton::uint64 getKeyHash(triton::ast::AbstractNode* node) const;
 
-        //! Bvugt Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvugtDictionary;
+        //! Returns true if two nodes have the same hash-consing key.
+        bool isSameKey(triton::ast::AbstractNode* node1, triton::ast::AbstractNode* node2) const;
 
-        //! Bvule Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvuleDictionary;
+        //! Inserts a node into the table without lookup.
+        void insertIntoTable(triton::ast::AbstractNode* node, triton::uint64 hash);
 
-        //! Bvult Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvultDictionary;
+        //! Doubles the capacity of the table.
+        void growTable(void);
 
-        //! Bvurem Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvuremDictionary;
+        //! Removes the nodes which are not marked from the table (they are not deleted).
+        void sweepAstDictionaries(void);
 
-        //! Bvxnor Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvxnorDictionary;
+        //! Removes a node from the table (it is not deleted).
+        void removeFromAstDictionaries(triton::ast::AbstractNode* node);
 
-        //! Bvxor Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvxorDictionary;
-
-        //! Bv Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> bvDictionary;
-
-        //! Compound Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> compoundDictionary;
-
-        //! Concat Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> concatDictionary;
-
-        //! Decimal Dictionary
-        std::map<triton::uint512, triton::ast::AbstractNode*> decimalDictionary;
-
-        //! Declare Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> declareFunctionDictionary;
-
-        //! Distinct Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> distinctDictionary;
-
-        //! Equal Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> equalDictionary;
-
-        //! Extract Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> extractDictionary;
-
-        //! Ite Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> iteDictionary;
-
-        //! Land Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> landDictionary;
-
-        //! Let Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> letDictionary;
-
-        //! Lnot Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> lnotDictionary;
-
-        //! Lor Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> lorDictionary;
-
-        //! Reference Dictionary
-        std::map<triton::usize, triton::ast::AbstractNode*> referenceDictionary;
-
-        //! String Dictionary
-        std::map<std::string, triton::ast::AbstractNode*> stringDictionary;
-
-        //! Sx Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> sxDictionary;
-
-        //! Variable Dictionary
-        std::map<std::string, triton::ast::AbstractNode*> variableDictionary;
-
-        //! Zx Dictionary
-        std::map<std::vector<triton::ast::AbstractNode*>, triton::ast::AbstractNode*> zxDictionary;
-
-        //! Dictionaries
-        std::map<triton::uint32, void*> dictionaries;
+        //! Removes all nodes from the table (they are not deleted).
+        void clearAstDictionaries(void);
 
     public:
         //! Constructor.
-        AstDictionaries(bool isBackup=false);
+        AstDictionaries();
 
         //! Constructor.
         AstDictionaries(const AstDictionaries& copy);
@@ -211,10 +106,12 @@ namespace triton {
         //! Copies an AstDictionaries.
         void copy(const AstDictionaries& other);
 
-        //! Links all sub dictionaries to the root one.
-        void linkDictionaries(void);
-
-        //! Browses into dictionaries.
+        /*!
+         * \brief Browses into dictionaries.
+         *
+         * \details Returns the node already recorded with the same key (the duplicate `node`
+         * is then deleted) or records `node` and returns `nullptr`.
+         */
         triton::ast::AbstractNode* browseAstDictionaries(triton::ast::AbstractNode* node);
 
         //! Returns stats about dictionaries.
@@ -0,0 +1,95 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_ASTEVALUATOR_H
+#define TRITON_ASTEVALUATOR_H
+
+#include <map>
+#include <unordered_map>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The AST namespace
+  namespace ast {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup ast
+   *  @{
+   */
+
+    /*!
+     *  \brief Evaluates an AST under an assignment of its symbolic variables.
+     *
+     *  \details The DAG is evaluated in a single post-order pass where each node is computed once.
+     *  Nodes up to 64 bits are computed with native arithmetic, and sub-trees which do not contain
+     *  any symbolic variable use their cached value. The semantics of the operations are the ones of
+     *  triton::ast::getOperationSemantics(). Neither the nodes nor the symbolic variables are
+     *  modified. References are followed into the ASTs of the symbolic expressions.
+     */
+    class AstEvaluator {
+      private:
+        //! The position of each evaluated node in `values`.
+        std::unordered_map<AbstractNode*, triton::usize> positions;
+
+        //! The values of the evaluated nodes (the 64 lower bits if the node is wider than 64 bits).
+        std::vector<triton::uint64> values;
+
+        //! The values of the evaluated nodes wider than 64 bits.
+        std::unordered_map<triton::usize, triton::uint512> wideValues;
+
+        //! The values of the assigned variables by id.
+        std::unordered_map<triton::usize, triton::uint512> variables;
+
+        //! The values of the operands of the node being computed, if it is not wider than 64 bits.
+        std::vector<triton::uint64> narrowOperands;
+
+        //! The values of the operands of the node being computed, if it is wider than 64 bits.
+        std::vector<triton::uint512> wideOperands;
+
+        //! Returns the value of an evaluated node.
+        triton::uint512 getValue(AbstractNode* node);
+
+        //! Returns the 64 lower bits of the value of an evaluated node.
+        triton::uint64 getValue64(AbstractNode* node);
+
+        //! Records the value of a node.
+        void setValue(AbstractNode* node, const triton::uint512& value);
+
+        //! Records the value of a node up to 64 bits.
+        void setValue64(AbstractNode* node, triton::uint64 value);
+
+        //! Computes the value of a node from the values of its childs.
+        void evaluateNode(AbstractNode* node);
+
+      public:
+        //! Constructor.
+        AstEvaluator();
+
+        //! Destructor.
+        virtual ~AstEvaluator();
+
+        //! Evaluates `node` where variables are assigned by id. Variables which are not assigned use their concrete value.
+        triton::uint512 evaluate(AbstractNode* node, const std::map<triton::usize, triton::uint512>& values);
+    };
+
+  /*! @} End of ast namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_ASTEVALUATOR_H */
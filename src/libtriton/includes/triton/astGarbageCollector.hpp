@@ -8,8 +8,10 @@
 #ifndef TRITON_ASTGARBAGECOLLECTOR_H
 #define TRITON_ASTGARBAGECOLLECTOR_H
 
+#include <map>
 #include <set>
 #include <string>
+#include <vector>
 
 #include <triton/ast.hpp>
 #include <triton/astDictionaries.hpp>
@@ -34,7 +36,18 @@ namespace triton {
    */
 
     //! \class AstGarbageCollector
-    /*! \brief The AST garbage collector class */
+    /*!
+     *  \brief The AST garbage collector class
+     *
+     *  \details Allocated nodes are grouped by epoch. The last opened epoch is the current one and every new node
+     *  is recorded into it with a single append. An epoch is a list of individually allocated nodes, not an arena.
+     *  It is either closed (its nodes are merged into the enclosing epoch) or freed (its nodes which are not used
+     *  anymore are deleted in one pass, the others are merged into the enclosing epoch). The IR builder opens an
+     *  epoch per instruction and users may open their own epochs. The first epoch is never closed.
+     *
+     *  Nodes recorded into the AST dictionaries are owned by their epoch too, the dictionaries only index them.
+     *  Unreachable nodes can be freed with a mark and sweep collection from a set of roots. Recorded variable nodes and pinned nodes are always roots.
+     */
     class AstGarbageCollector : public triton::ast::AstDictionaries {
       private:
         //! Modes API
@@ -44,12 +57,30 @@ namespace triton {
         bool backupFlag;
 
       protected:
-        //! This container contains all allocated nodes.
-        std::set<triton::ast::AbstractNode*> allocatedNodes;
+        //! The allocated nodes grouped by epoch. The last item is the current epoch.
+        std::vector<std::vector<triton::ast::AbstractNode*>> epochs;
+
+        //! The set returned by getAllocatedAstNodes(), built on each call.
+        mutable std::set<triton::ast::AbstractNode*> allocatedNodes;
+
+        //! Removes a node which is going to be deleted from the parents of its childs (and of its referenced AST).
+        void unlinkAstNode(triton::ast::AbstractNode* node);
+
+        //! Removes from a set of nodes to free the ones which are still used: the roots, the pinned nodes, the recorded variables, the nodes with a parent which is not freed and their childs.
+        void keepSharedAstNodes(std::set<triton::ast::AbstractNode*>& nodes, const std::vector<triton::ast::AbstractNode*>& roots=std::vector<triton::ast::AbstractNode*>());
 
         //! This map maintains a link between symbolic variables and their nodes.
         std::map<std::string, triton::ast::AbstractNode*> variableNodes;
 
+        //! The number of handles (e.g: Python objects) held on each pinned node.
+        std::map<triton::ast::AbstractNode*, triton::usize> pinnedNodes;
+
+        //! The number of nodes recorded since the last collection.
+        triton::usize recordedNodes;
+
+        //! The number of recorded nodes which triggers the next collection.
+        triton::usize collectionThreshold;
+
       public:
         //! Constructor.
         AstGarbageCollector(triton::modes::Modes* modes, bool isBackup=false);
@@ -72,6 +103,33 @@ namespace triton {
         //! Frees a set of nodes and removes them from the global container.
         void freeAstNodes(std::set<triton::ast::AbstractNode*>& nodes);
 
+        //! Opens a new epoch. All nodes allocated from now are recorded into this epoch.
+        void beginAstEpoch(void);
+
+        //! Closes the current epoch. Its nodes are kept and merged into the enclosing epoch.
+        void endAstEpoch(void);
+
+        //! Frees the nodes allocated during the current epoch and closes it. Nodes which are still used (see keepSharedAstNodes()) are kept and merged into the enclosing epoch.
+        void freeAstEpoch(const std::vector<triton::ast::AbstractNode*>& roots=std::vector<triton::ast::AbstractNode*>());
+
+        //! Returns the number of opened epochs.
+        triton::usize getAstEpochsDepth(void) const;
+
+        //! Frees all nodes which are not reachable from the roots, the variable nodes or the pinned nodes. Returns the number of freed nodes.
+        triton::usize freeUnreachableAstNodes(const std::vector<triton::ast::AbstractNode*>& roots);
+
+        //! Returns true if enough nodes have been recorded since the last collection.
+        bool isAstCollectionRequired(void) const;
+
+        //! Pins a node. A pinned node is never freed by freeUnreachableAstNodes().
+        void pinAstNode(triton::ast::AbstractNode* node);
+
+        //! Unpins a node.
+        void unpinAstNode(triton::ast::AbstractNode* node);
+
+        //! Returns the pinned nodes.
+        std::vector<triton::ast::AbstractNode*> getPinnedAstNodes(void) const;
+
         //! Extracts all unique nodes from a partial AST into the uniqueNodes set.
         void extractUniqueAstNodes(std::set<triton::ast::AbstractNode*>& uniqueNodes, triton::ast::AbstractNode* root) const;
 
@@ -81,7 +139,7 @@ namespace triton {
         //! Records a variable AST node.
         void recordVariableAstNode(const std::string& name, triton::ast::AbstractNode* node);
 
-        //! Returns all allocated nodes.
+        //! Returns all allocated nodes. The set is built from the epochs and stays valid until the next call.
         const std::set<triton::ast::AbstractNode*>& getAllocatedAstNodes(void) const;
 
         //! Returns all variable nodes recorded.
@@ -97,6 +155,30 @@ namespace triton {
         void setAstVariableNodes(const std::map<std::string, triton::ast::AbstractNode*>& nodes);
     };
 
+
+    //! \class AstEpochScope
+    /*!
+     *  \brief Opens an AST epoch for the lifetime of the scope.
+     *
+     *  \details If the scope is left while its epoch is still opened (e.g: on exception), the epoch
+     *  is closed and its nodes are kept, as they may already be used by symbolic expressions.
+     */
+    class AstEpochScope {
+      private:
+        //! The AST garbage collector.
+        AstGarbageCollector* astGarbageCollector;
+
+        //! The depth of the epoch opened by this scope.
+        triton::usize depth;
+
+      public:
+        //! Constructor. Opens a new epoch.
+        AstEpochScope(AstGarbageCollector* astGarbageCollector);
+
+        //! Destructor. Closes the epoch if it is still opened.
+        ~AstEpochScope();
+    };
+
   /*! @} End of ast namespace */
   };
 /*! @} End of triton namespace */
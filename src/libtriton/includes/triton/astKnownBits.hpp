@@ -0,0 +1,103 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_ASTKNOWNBITS_H
+#define TRITON_ASTKNOWNBITS_H
+
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The AST namespace
+  namespace ast {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup ast
+   *  @{
+   */
+
+    class AbstractNode;
+
+    /*!
+     *  \brief Facts about all the values a tree may take, whatever the values of its symbolic variables.
+     *
+     *  \details The facts are the bits known to be zero, the bits known to be one and an unsigned interval
+     *  which contains all the values. They are computed from the facts of the childs (an abstract
+     *  interpretation of the tree) and are cached on each node (see triton::ast::AbstractNode::getKnownBits()).
+     *  The facts are sound but not complete: a bit which is not known may still be constant.
+     */
+    class KnownBits {
+      private:
+        //! The size of the tree.
+        triton::uint32 size;
+
+        //! The bits known to be zero.
+        triton::uint512 zeros;
+
+        //! The bits known to be one.
+        triton::uint512 ones;
+
+        //! The minimum unsigned value.
+        triton::uint512 min;
+
+        //! The maximum unsigned value.
+        triton::uint512 max;
+
+        //! Tightens the known bits and the interval with each other.
+        void normalize(void);
+
+      public:
+        //! Constructor. Nothing is known about the values.
+        KnownBits(triton::uint32 size);
+
+        //! Constructor. The tree is the constant `value`.
+        KnownBits(triton::uint32 size, const triton::uint512& value);
+
+        //! Constructor.
+        KnownBits(triton::uint32 size, const triton::uint512& zeros, const triton::uint512& ones, const triton::uint512& min, const triton::uint512& max);
+
+        //! Returns the size of the tree.
+        triton::uint32 getBitvectorSize(void) const;
+
+        //! Returns the bits known to be zero.
+        const triton::uint512& getKnownZeros(void) const;
+
+        //! Returns the bits known to be one.
+        const triton::uint512& getKnownOnes(void) const;
+
+        //! Returns the minimum unsigned value.
+        const triton::uint512& getMin(void) const;
+
+        //! Returns the maximum unsigned value.
+        const triton::uint512& getMax(void) const;
+
+        //! Returns true if the tree always has the same value.
+        bool isConstant(void) const;
+
+        //! Returns true if the tree is never zero (a constraint which is always true).
+        bool isTrue(void) const;
+
+        //! Returns true if the tree is always zero (a constraint which is always false).
+        bool isFalse(void) const;
+
+        //! Computes the facts of a node from the facts of its childs.
+        static KnownBits compute(AbstractNode* node);
+    };
+
+  /*! @} End of ast namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_ASTKNOWNBITS_H */
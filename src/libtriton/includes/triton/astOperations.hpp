@@ -0,0 +1,87 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_ASTOPERATIONS_H
+#define TRITON_ASTOPERATIONS_H
+
+#include <triton/ast.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The AST namespace
+  namespace ast {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup ast
+   *  @{
+   */
+
+    //! The attributes of an operation which do not depend on the values of its operands.
+    struct OperationInfo {
+      //! The size of the result.
+      triton::uint32 size;
+
+      //! The size of the first operand.
+      triton::uint32 operandSize;
+
+      //! The low bit of an extract, the rotation of a rotate (modulo the size) or the size of the second operand of a concat.
+      triton::uint32 parameter;
+
+      //! The mask of the result (its 64 lower bits).
+      triton::uint64 mask;
+    };
+
+    //! Computes an operation over `count` lanes where `operands[i]` are the lanes of the i-th operand. The operands and the result fit in 64 bits.
+    typedef void (*NarrowOperation)(triton::uint64* result, const triton::uint64* const* operands, triton::usize count, const OperationInfo& info);
+
+    //! Computes an operation on operands of any size.
+    typedef triton::uint512 (*WideOperation)(const triton::uint512* operands, const OperationInfo& info);
+
+    //! The concrete semantics of an operation.
+    struct OperationSemantics {
+      //! The operation on uint64 lanes.
+      NarrowOperation narrow;
+
+      //! The operation on triton::uint512.
+      WideOperation wide;
+    };
+
+    //! Returns true if the node is a parameter of its parent (e.g: the bounds of an extract) and not an operand.
+    bool isOperationParameter(AbstractNode* node);
+
+    //! Returns true if the kind of node has concrete semantics.
+    bool hasOperationSemantics(triton::uint32 kind);
+
+    //! Returns the concrete semantics of a kind of node. In the table, a concat has two operands.
+    const OperationSemantics& getOperationSemantics(triton::uint32 kind);
+
+    //! Returns the attributes of an operation node. The parameter of a concat is the size of its second child.
+    OperationInfo getOperationInfo(AbstractNode* node);
+
+    //! Returns true if the node or one of its operands is wider than 64 bits.
+    bool isWideOperation(AbstractNode* node);
+
+    //! Computes the value of an operation node from the values of its operands (its childs which are not parameters). The node must not be wide.
+    triton::uint64 evaluateNarrowOperation(AbstractNode* node, const triton::uint64* operands);
+
+    //! Computes the value of an operation node from the values of its operands (its childs which are not parameters).
+    triton::uint512 evaluateWideOperation(AbstractNode* node, const triton::uint512* operands);
+
+  /*! @} End of ast namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_ASTOPERATIONS_H */
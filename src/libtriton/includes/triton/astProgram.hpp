@@ -0,0 +1,141 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_ASTPROGRAM_H
+#define TRITON_ASTPROGRAM_H
+
+#include <map>
+#include <unordered_map>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/astOperations.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The AST namespace
+  namespace ast {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup ast
+   *  @{
+   */
+
+    /*!
+     *  \brief A linear register-based program compiled from an AST.
+     *
+     *  \details Each operation node of the DAG, references included, becomes one instruction which reads
+     *  and writes registers. Constant sub-trees are folded into registers at compilation time and symbolic
+     *  variables are the inputs of the program. Instructions up to 64 bits work on native integers.
+     *  Once compiled, the program does not depend on the nodes anymore and may be evaluated many times.
+     *  A program is not reentrant, copy it to evaluate it from several threads.
+     */
+    class AstProgram {
+      private:
+        //! An instruction of the program.
+        struct Instruction {
+          //! The semantics of the operation.
+          const OperationSemantics* semantics;
+
+          //! True if the instruction has to be computed on triton::uint512.
+          bool wide;
+
+          //! The attributes of the operation.
+          OperationInfo info;
+
+          //! The destination register.
+          triton::uint32 dst;
+
+          //! The operand registers.
+          triton::uint32 src[3];
+        };
+
+        //! The instructions.
+        std::vector<Instruction> instructions;
+
+        //! The registers (the 64 lower bits if the register is wider than 64 bits).
+        std::vector<triton::uint64> registers;
+
+        //! The registers wider than 64 bits.
+        std::vector<triton::uint512> wideRegisters;
+
+        //! The size of each register.
+        std::vector<triton::uint32> sizes;
+
+        //! The symbolic variables (by id) which are the inputs of the program.
+        std::vector<triton::usize> variables;
+
+        //! The register of each input.
+        std::vector<triton::uint32> inputs;
+
+        //! The register of the result.
+        triton::uint32 result;
+
+        //! The register of each compiled node.
+        std::unordered_map<AbstractNode*, triton::uint32> compiled;
+
+        //! Allocates a register of `size` bits.
+        triton::uint32 newRegister(triton::uint32 size);
+
+        //! Allocates a register holding a constant.
+        triton::uint32 newConstant(triton::uint32 size, const triton::uint512& value);
+
+        //! Returns the value of a register.
+        triton::uint512 getRegister(triton::uint32 reg) const;
+
+        //! Sets the value of a register.
+        void setRegister(triton::uint32 reg, const triton::uint512& value);
+
+        //! Compiles a node whose childs are already compiled.
+        void compileNode(AbstractNode* node);
+
+        //! Compiles `node`.
+        void compile(AbstractNode* node);
+
+        //! Executes an instruction on triton::uint512.
+        void executeWide(const Instruction& inst);
+
+        //! Executes the program once the inputs are set.
+        triton::uint512 execute(void);
+
+      public:
+        //! Constructor. Compiles `node`.
+        AstProgram(AbstractNode* node);
+
+        //! Destructor.
+        virtual ~AstProgram();
+
+        //! Returns the size of the result.
+        triton::uint32 getBitvectorSize(void) const;
+
+        //! Returns the number of instructions.
+        triton::usize getSize(void) const;
+
+        //! Returns the ids of the symbolic variables which are the inputs of the program, in the order expected by evaluate().
+        const std::vector<triton::usize>& getVariables(void) const;
+
+        //! Evaluates the program where `values` are the values of the inputs in the order of getVariables().
+        triton::uint512 evaluate(const std::vector<triton::uint512>& values);
+
+        //! Evaluates the program where variables are assigned by id. Variables which are not assigned use their concrete value.
+        triton::uint512 evaluate(const std::map<triton::usize, triton::uint512>& values);
+    };
+
+  /*! @} End of ast namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_ASTPROGRAM_H */
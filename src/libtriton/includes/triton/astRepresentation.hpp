@@ -9,6 +9,10 @@
 #define TRITON_ASTREPRESENTATION_H
 
 #include <iostream>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
 
 #include <triton/astPythonRepresentation.hpp>
 #include <triton/astRepresentationInterface.hpp>
@@ -43,10 +47,21 @@ namespace triton {
       enum mode_e {
         SMT_REPRESENTATION,     /*!< SMT representation */
         PYTHON_REPRESENTATION,  /*!< Python representation */
+        SMT_DAG_REPRESENTATION, /*!< SMT representation where shared sub-terms are bound with `let` */
         LAST_REPRESENTATION
       };
 
-      //! Pseudo code of SMT AST.
+      /*!
+       *  \brief Pseudo code of SMT AST.
+       *
+       *  \details Representations display a node by writing its childs into the stream. While a single
+       *  node is displayed, writing a child only records it with its offset in the output. The tree is
+       *  then displayed with an explicit stack instead of recursive calls, so deep trees do not overflow
+       *  the call stack.
+       *
+       *  In the SMT_DAG_REPRESENTATION mode, sub-terms reached several times are bound once with a `let`
+       *  and then displayed by their alias, so the text grows with the DAG and not with the unrolled tree.
+       */
       class AstRepresentation {
         protected:
           //! The representation mode.
@@ -55,6 +70,24 @@ namespace triton {
           //! AstRepresentation interface.
           triton::ast::representations::AstRepresentationInterface* representations[triton::ast::representations::LAST_REPRESENTATION];
 
+          //! True while a single node is displayed.
+          bool nested;
+
+          //! The childs (and their offset in the output) met while a single node is displayed.
+          std::vector<std::pair<triton::usize, AbstractNode*>> childs;
+
+          //! The aliases of the shared sub-terms bound while a DAG is displayed.
+          std::unordered_map<AbstractNode*, std::string> aliases;
+
+          //! Displays a single node into `text` and returns its childs.
+          void display(AbstractNode* node, std::string& text, std::vector<std::pair<triton::usize, AbstractNode*>>& childs);
+
+          //! Displays a tree, childs which have an alias are displayed by their alias.
+          std::ostream& printTree(std::ostream& stream, AbstractNode* node);
+
+          //! Displays a DAG, binding its shared sub-terms with `let`.
+          std::ostream& printDag(std::ostream& stream, AbstractNode* node);
+
 
         public:
           //! Constructor.
@@ -76,6 +109,26 @@ namespace triton {
       //! The AST representation interface as global for all instances of API.
       extern triton::ast::representations::AstRepresentation astRepresentation;
 
+
+      //! \class AstRepresentationScope
+      /*!
+       *  \brief Sets the representation mode for the lifetime of the scope.
+       *
+       *  \details The previous mode is restored when the scope is left, even on exception.
+       */
+      class AstRepresentationScope {
+        private:
+          //! The mode to restore.
+          triton::uint32 mode;
+
+        public:
+          //! Constructor. Sets `mode` as the representation mode.
+          AstRepresentationScope(triton::uint32 mode);
+
+          //! Destructor. Restores the previous representation mode.
+          ~AstRepresentationScope();
+      };
+
     /*! @} End of representations namespace */
     };
   /*! @} End of ast namespace */
@@ -107,6 +107,18 @@ namespace triton {
     };
 
 
+    /*! \class SymbolicSerialization
+     *  \brief The exception class used by the symbolic serialization. */
+    class SymbolicSerialization : public triton::exceptions::SymbolicEngine {
+      public:
+        //! Constructor.
+        SymbolicSerialization(const char* message) : triton::exceptions::SymbolicEngine(message) {};
+
+        //! Constructor.
+        SymbolicSerialization(const std::string& message) : triton::exceptions::SymbolicEngine(message) {};
+    };
+
+
     /*! \class SymbolicVariable
      *  \brief The exception class used by symbolic variables. */
     class SymbolicVariable : public triton::exceptions::SymbolicEngine {
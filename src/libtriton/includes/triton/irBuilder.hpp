@@ -8,8 +8,13 @@
 #ifndef TRITON_IRBUILDER_H
 #define TRITON_IRBUILDER_H
 
+#include <map>
+#include <string>
+#include <vector>
+
 #include <triton/architecture.hpp>
 #include <triton/astGarbageCollector.hpp>
+#include <triton/cpuInterface.hpp>
 #include <triton/instruction.hpp>
 #include <triton/modes.hpp>
 #include <triton/semanticsInterface.hpp>
@@ -42,9 +47,6 @@ namespace triton {
         //! AST garbage collector API
         triton::ast::AstGarbageCollector* astGarbageCollector;
 
-        //! Backup AST garbage collector
-        triton::ast::AstGarbageCollector* backupAstGarbageCollector;
-
         //! Modes API
         triton::modes::Modes* modes;
 
@@ -57,6 +59,41 @@ namespace triton {
         //! Taint engine API
         triton::engines::taint::TaintEngine* taintEngine;
 
+        //! A fork of the state (see fork()).
+        struct Fork {
+          //! The CPU state.
+          triton::arch::CpuInterface* cpu;
+
+          //! The symbolic engine.
+          triton::engines::symbolic::SymbolicEngine* symbolicEngine;
+
+          //! The taint engine.
+          triton::engines::taint::TaintEngine* taintEngine;
+
+          //! The variable nodes of the AST garbage collector.
+          std::map<std::string, triton::ast::AbstractNode*> variableNodes;
+        };
+
+        /*! \brief map of forks
+         *
+         * \description
+         * **item1**: fork id<br>
+         * **item2**: fork
+         */
+        std::map<triton::usize, Fork> forks;
+
+        //! Forks id.
+        triton::usize uniqueForkId;
+
+        //! Returns a copy of the CPU state.
+        triton::arch::CpuInterface* copyCpu(triton::arch::CpuInterface* cpu) const;
+
+        //! Deletes the states held by a fork.
+        void deleteFork(Fork& state);
+
+        //! Spreads the taint of the instruction without building its semantics. Returns true if the instruction is supported.
+        bool buildTaintSemantics(triton::arch::Instruction& inst);
+
         //! Removes all symbolic expressions of an instruction.
         void removeSymbolicExpressions(triton::arch::Instruction& inst, std::set<triton::ast::AbstractNode*>& uniqueNodes);
 
@@ -75,6 +112,30 @@ namespace triton {
         //! Destructor.
         virtual ~IrBuilder();
 
+        //! Frees the symbolic expressions which are not reachable anymore and their AST nodes. Returns the number of freed expressions.
+        triton::usize freeUnreachableSymbolicExpressions(void);
+
+        //! Adds into `roots` all AST nodes held by the symbolic engine and by the forks.
+        void getAstRoots(std::vector<triton::ast::AbstractNode*>& roots) const;
+
+        /*!
+         * \brief Forks the CPU state, the symbolic engine and the taint engine. Returns the id of the fork.
+         *
+         * \details The fork is copy-on-write: its cost does not depend on the number of symbolic expressions
+         * nor on the size of the memory, and the current state and the fork diverge safely. The AST nodes of
+         * a fork are kept alive by the garbage collections until the fork is removed.
+         */
+        triton::usize fork(void);
+
+        //! Restores the state saved by a fork. The fork is kept and may be restored again.
+        void restoreFork(triton::usize id);
+
+        //! Removes a fork.
+        void removeFork(triton::usize id);
+
+        //! Returns the ids of the forks.
+        std::vector<triton::usize> getForks(void) const;
+
         //! Builds the semantics of the instruction. Returns true if the instruction is supported.
         bool buildSemantics(triton::arch::Instruction& inst);
 
@@ -0,0 +1,82 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_MEMORYREFERENCETABLE_H
+#define TRITON_MEMORYREFERENCETABLE_H
+
+#include <map>
+#include <utility>
+#include <vector>
+
+#include <triton/pagedMemory.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The Engines namespace
+  namespace engines {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup engines
+   *  @{
+   */
+
+    //! The Symbolic Execution namespace
+    namespace symbolic {
+    /*!
+     *  \ingroup engines
+     *  \addtogroup symbolic
+     *  @{
+     */
+
+      /*! \class MemoryReferenceTable
+       *  \brief The table of memory address -> symbolic expression id.
+       *
+       *  \details The table is a triton::arch::PagedMemory of expression ids whose unmapped addresses are
+       *  UNSET. Accessing a byte is an array indexing once its page is found, and copying the table shares
+       *  its pages until they are written. Symbolic bytes are sparse, so the pages only cover 256 addresses
+       *  (2 KiB of ids) instead of the 4 KiB of the default pages.
+       */
+      class MemoryReferenceTable : public triton::arch::PagedMemory<triton::usize, 8> {
+        public:
+          //! Constructor.
+          MemoryReferenceTable();
+
+          //! Constructor by copy.
+          MemoryReferenceTable(const MemoryReferenceTable& copy);
+
+          //! Destructor.
+          virtual ~MemoryReferenceTable();
+
+          //! Copies a MemoryReferenceTable.
+          void operator=(const MemoryReferenceTable& copy);
+
+          //! Assigns an expression id to an address. Assigning UNSET removes the assignment.
+          void set(triton::uint64 addr, triton::usize id);
+
+          //! Returns all the assignments (addr:id) sorted by address.
+          std::map<triton::uint64, triton::usize> getReferences(void) const;
+
+          //! Returns the assignments (addr:id) of [addr, addr+size) sorted by address.
+          std::vector<std::pair<triton::uint64, triton::usize>> getReferences(triton::uint64 addr, triton::usize size) const;
+      };
+
+    /*! @} End of symbolic namespace */
+    };
+  /*! @} End of engines namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_MEMORYREFERENCETABLE_H */
@@ -29,14 +29,20 @@ namespace triton {
 
     //! Enumerates all kinds of mode.
     enum mode_e {
-      /* AST */
-      AST_DICTIONARIES,      //!< [ast mode] Abstract Syntax Tree dictionaries.
-
-      /* Symbolic */
-      ALIGNED_MEMORY,        //!< [symbolic mode] Keep a map of aligned memory.
-      ONLY_ON_SYMBOLIZED,    //!< [symbolic mode] Perform symbolic execution only on symbolized expressions.
-      ONLY_ON_TAINTED,       //!< [symbolic mode] Perform symbolic execution only on tainted instructions.
-      PC_TRACKING_SYMBOLIC,  //!< [symbolic mode] Track path constraints only if they are symbolized.
+      AST_DICTIONARIES,            //!< [ast mode] Abstract Syntax Tree dictionaries (hash-consing).
+      ALIGNED_MEMORY,              //!< [symbolic mode] Keep a map of aligned memory.
+      ONLY_ON_SYMBOLIZED,          //!< [symbolic mode] Perform symbolic execution only on symbolized expressions.
+      ONLY_ON_TAINTED,             //!< [symbolic mode] Perform symbolic execution only on tainted instructions.
+      PC_TRACKING_SYMBOLIC,        //!< [symbolic mode] Track path constraints only if they are symbolized.
+
+      /* New modes are appended, so the values of the existing ones never change */
+      AST_LAZY_EVALUATION,         //!< [ast mode] Re-evaluate Abstract Syntax Tree nodes lazily when a child is modified.
+      AST_GARBAGE_COLLECTION,      //!< [ast mode] Free unreachable Abstract Syntax Tree nodes while processing instructions.
+      AST_NATIVE_SIMPLIFICATIONS,  //!< [ast mode] Apply the native simplification passes when Abstract Syntax Tree nodes are built.
+      PACKED_MEMORY,               //!< [symbolic mode] Assign one symbolic expression per memory write instead of one per byte.
+      SYMBOLIC_COMMENTS,           //!< [symbolic mode] Keep the comments of symbolic expressions.
+      SYMBOLIC_GARBAGE_COLLECTION, //!< [symbolic mode] Free unreachable symbolic expressions while processing instructions.
+      TAINT_ONLY,                  //!< [taint mode] Spread the taint from the operands without building the semantics when the symbolic engine is disabled.
     };
 
 
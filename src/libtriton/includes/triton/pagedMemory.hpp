@@ -0,0 +1,296 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_PAGEDMEMORY_H
+#define TRITON_PAGEDMEMORY_H
+
+#include <algorithm>
+#include <bitset>
+#include <map>
+#include <memory>
+#include <new>
+#include <unordered_map>
+#include <vector>
+
+#include <triton/exceptions.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The Architecture namespace
+  namespace arch {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup arch
+   *  @{
+   */
+
+    /*! \class PagedMemory
+     *  \brief A copy-on-write table of address -> value.
+     *
+     *  \details The table is split into pages of 2^Bits addresses (4 KiB by default). Each page is a flat array of values, one per
+     *  address, allocated when the first address of the page is mapped and released when its last
+     *  address is unmapped. Pages are shared between copies of a table: copying a table only copies
+     *  the page pointers and a page is duplicated the first time a shared page is written. A copy is
+     *  thus a cheap fork whose writes never affect the original table, and vice versa. The last page
+     *  used is cached so that the addresses of a same access hit the cache.
+     */
+    template <typename T, triton::uint32 Bits = 12>
+    class PagedMemory {
+      public:
+        //! The number of bits of the offset into a page.
+        static const triton::uint32 PAGE_BITS = Bits;
+
+        //! The number of addresses of a page.
+        static const triton::uint32 PAGE_SIZE = (1 << PAGE_BITS);
+
+      private:
+        //! A page of the table.
+        struct Page {
+          //! The value of each address.
+          T values[PAGE_SIZE];
+
+          //! The mapped addresses.
+          std::bitset<PAGE_SIZE> mapped;
+
+          //! The number of mapped addresses.
+          triton::uint32 count;
+        };
+
+        /*! \brief map of page index -> page
+         *
+         * \description
+         * **item1**: address >> PAGE_BITS<br>
+         * **item2**: page (shared with the copies of the table)
+         */
+        std::unordered_map<triton::uint64, std::shared_ptr<Page>> pages;
+
+        //! The number of mapped addresses.
+        triton::usize count;
+
+        //! The value returned for an unmapped address.
+        T undefined;
+
+        //! The index of the last page used.
+        mutable triton::uint64 lastIndex;
+
+        //! The last page used (nullptr if none).
+        mutable Page* lastPage;
+
+        //! Returns the page of an address, nullptr if the page is not allocated.
+        Page* findPage(triton::uint64 addr) const {
+          typename std::unordered_map<triton::uint64, std::shared_ptr<Page>>::const_iterator it;
+          triton::uint64 index = (addr >> PAGE_BITS);
+
+          if (this->lastPage != nullptr && this->lastIndex == index)
+            return this->lastPage;
+
+          if ((it = this->pages.find(index)) == this->pages.end())
+            return nullptr;
+
+          this->lastIndex = index;
+          this->lastPage  = it->second.get();
+
+          return this->lastPage;
+        }
+
+        //! Returns the page of an address to be written. Allocates the page if needed and duplicates it if it is shared.
+        Page* getWritablePage(triton::uint64 addr) {
+          triton::uint64 index = (addr >> PAGE_BITS);
+          std::shared_ptr<Page>& page = this->pages[index];
+
+          if (page == nullptr) {
+            page = std::shared_ptr<Page>(new(std::nothrow) Page);
+            if (page == nullptr)
+              throw triton::exceptions::Architecture("PagedMemory::getWritablePage(): Not enough memory.");
+            std::fill(page->values, page->values + PAGE_SIZE, this->undefined);
+            page->count = 0;
+          }
+
+          else if (page.use_count() > 1) {
+            page = std::shared_ptr<Page>(new(std::nothrow) Page(*page));
+            if (page == nullptr)
+              throw triton::exceptions::Architecture("PagedMemory::getWritablePage(): Not enough memory.");
+          }
+
+          this->lastIndex = index;
+          this->lastPage  = page.get();
+
+          return this->lastPage;
+        }
+
+      public:
+        //! Constructor. `undefined` is the value of the unmapped addresses.
+        PagedMemory(const T& undefined=T()) : undefined(undefined) {
+          this->count     = 0;
+          this->lastIndex = 0;
+          this->lastPage  = nullptr;
+        }
+
+        //! Constructor by copy. The pages are shared until they are written.
+        PagedMemory(const PagedMemory& copy) : pages(copy.pages), undefined(copy.undefined) {
+          this->count     = copy.count;
+          this->lastIndex = 0;
+          this->lastPage  = nullptr;
+        }
+
+        //! Destructor.
+        virtual ~PagedMemory() {
+        }
+
+        //! Copies a PagedMemory. The pages are shared until they are written.
+        void operator=(const PagedMemory& copy) {
+          if (this == &copy)
+            return;
+
+          this->pages     = copy.pages;
+          this->count     = copy.count;
+          this->undefined = copy.undefined;
+          this->lastPage  = nullptr;
+        }
+
+        //! Returns true if the address is mapped.
+        bool isMapped(triton::uint64 addr) const {
+          Page* page = this->findPage(addr);
+
+          if (page == nullptr)
+            return false;
+
+          return page->mapped.test(addr & (PAGE_SIZE - 1));
+        }
+
+        //! Returns the value of an address, the undefined value if the address is not mapped.
+        const T& get(triton::uint64 addr) const {
+          Page* page = this->findPage(addr);
+
+          if (page == nullptr)
+            return this->undefined;
+
+          return page->values[addr & (PAGE_SIZE - 1)];
+        }
+
+        //! Returns the value of a mapped address to be modified in place. The page is duplicated if it is shared.
+        T& getWritable(triton::uint64 addr) {
+          if (!this->isMapped(addr))
+            throw triton::exceptions::Architecture("PagedMemory::getWritable(): Address not mapped.");
+          return this->getWritablePage(addr)->values[addr & (PAGE_SIZE - 1)];
+        }
+
+        //! Maps an address and sets its value.
+        void set(triton::uint64 addr, const T& value) {
+          Page* page = this->getWritablePage(addr);
+          triton::uint32 offset = (addr & (PAGE_SIZE - 1));
+
+          if (!page->mapped.test(offset)) {
+            page->mapped.set(offset);
+            page->count++;
+            this->count++;
+          }
+
+          page->values[offset] = value;
+        }
+
+        //! Unmaps an address.
+        void remove(triton::uint64 addr) {
+          Page* page = this->findPage(addr);
+          triton::uint32 offset = (addr & (PAGE_SIZE - 1));
+
+          if (page == nullptr || !page->mapped.test(offset))
+            return;
+
+          this->count--;
+
+          /* The last address of a page releases the page, shared or not */
+          if (page->count == 1) {
+            this->pages.erase(addr >> PAGE_BITS);
+            this->lastPage = nullptr;
+            return;
+          }
+
+          page = this->getWritablePage(addr);
+          page->mapped.reset(offset);
+          page->values[offset] = this->undefined;
+          page->count--;
+        }
+
+        //! Unmaps all the addresses.
+        void clear(void) {
+          this->pages.clear();
+          this->count    = 0;
+          this->lastPage = nullptr;
+        }
+
+        //! Returns the number of mapped addresses.
+        triton::usize size(void) const {
+          return this->count;
+        }
+
+        //! Returns true if no address is mapped.
+        bool empty(void) const {
+          return (this->count == 0);
+        }
+
+        //! Returns the mapped addresses of [addr, addr+size) and their values (addr:value) sorted by address. Pages which are not allocated are skipped.
+        std::vector<std::pair<triton::uint64, T>> getItems(triton::uint64 addr, triton::usize size) const {
+          std::vector<std::pair<triton::uint64, T>> ret;
+
+          while (size > 0) {
+            const Page* page      = this->findPage(addr);
+            triton::uint32 offset = (addr & (PAGE_SIZE - 1));
+            triton::usize count   = std::min(size, static_cast<triton::usize>(PAGE_SIZE - offset));
+
+            if (page != nullptr) {
+              for (triton::uint32 index = 0; index < count; index++) {
+                if (page->mapped.test(offset + index))
+                  ret.push_back(std::make_pair(addr + index, page->values[offset + index]));
+              }
+            }
+
+            addr += count;
+            size -= count;
+          }
+
+          return ret;
+        }
+
+        //! Returns all the mapped addresses and their values (addr:value) sorted by address.
+        std::map<triton::uint64, T> getItems(void) const {
+          std::map<triton::uint64, T> ret;
+          std::vector<triton::uint64> indexes;
+          typename std::unordered_map<triton::uint64, std::shared_ptr<Page>>::const_iterator it;
+
+          /* Pages are scanned by increasing addresses, so each address is inserted at the end of the map */
+          for (it = this->pages.begin(); it != this->pages.end(); it++)
+            indexes.push_back(it->first);
+          std::sort(indexes.begin(), indexes.end());
+
+          for (triton::usize i = 0; i < indexes.size(); i++) {
+            const Page* page = this->pages.at(indexes[i]).get();
+            triton::uint64 base = (indexes[i] << PAGE_BITS);
+            for (triton::uint32 offset = 0; offset < PAGE_SIZE; offset++) {
+              if (page->mapped.test(offset))
+                ret.insert(ret.end(), std::make_pair(base + offset, page->values[offset]));
+            }
+          }
+
+          return ret;
+        }
+    };
+
+  /*! @} End of arch namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_PAGEDMEMORY_H */
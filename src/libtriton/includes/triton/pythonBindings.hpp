@@ -111,6 +111,12 @@ namespace triton {
       //! Initializes the MODE python namespace.
       void initModeNamespace(PyObject* modeDict);
 
+      //! Initializes the PRESOLVE python namespace.
+      void initPresolveNamespace(PyObject* presolveDict);
+
+      //! Initializes the SIMPLIFICATION python namespace.
+      void initSimplificationNamespace(PyObject* simplificationDict);
+
       //! Initializes the SYMEXPR python namespace.
       void initSymExprNamespace(PyObject* symExprDict);
 
@@ -10,6 +10,7 @@
 #define TRITON_PYOBJECT_H
 
 #include <triton/ast.hpp>
+#include <triton/astProgram.hpp>
 #include <triton/bitsVector.hpp>
 #include <triton/elf.hpp>
 #include <triton/elfDynamicTable.hpp>
@@ -58,6 +59,9 @@ namespace triton {
       //! Creates the AstNode python class.
       PyObject* PyAstNode(triton::ast::AbstractNode* node);
 
+      //! Creates the AstProgram python class.
+      PyObject* PyAstProgram(const triton::ast::AstProgram& program);
+
       //! Creates the Bitvector python class.
       PyObject* PyBitvector(const triton::arch::Immediate& imm);
 
@@ -154,11 +158,23 @@ namespace triton {
       typedef struct {
         PyObject_HEAD
         triton::ast::AbstractNode* node;
+        triton::usize generation; //!< The generation of the engines the node is pinned in, 0 if it is not pinned.
       } AstNode_Object;
 
       //! pyAstNode type.
       extern PyTypeObject AstNode_Type;
 
+      /* AstProgram ===================================================== */
+
+      //! pyAstProgram object.
+      typedef struct {
+        PyObject_HEAD
+        triton::ast::AstProgram* program;
+      } AstProgram_Object;
+
+      //! pyAstProgram type.
+      extern PyTypeObject AstProgram_Type;
+
       /* Bitvector ====================================================== */
 
       //! pyBitvector object.
@@ -397,6 +413,8 @@ namespace triton {
       typedef struct {
         PyObject_HEAD
         triton::engines::symbolic::SymbolicExpression* symExpr;
+        triton::usize id;
+        triton::usize generation; //!< The generation of the engines the expression is pinned in, 0 if it is not pinned.
       } SymbolicExpression_Object;
 
       //! pySymbolicExpression type.
@@ -424,6 +442,12 @@ namespace triton {
 /*! Returns the triton::ast::AbstractNode. */
 #define PyAstNode_AsAstNode(v) (((triton::bindings::python::AstNode_Object*)(v))->node)
 
+/*! Checks if the pyObject is a triton::ast::AstProgram. */
+#define PyAstProgram_Check(v) ((v)->ob_type == &triton::bindings::python::AstProgram_Type)
+
+/*! Returns the triton::ast::AstProgram. */
+#define PyAstProgram_AsAstProgram(v) (((triton::bindings::python::AstProgram_Object*)(v))->program)
+
 /*! Checks if the pyObject is a triton::arch::BitsVector. */
 #define PyBitvector_Check(v)  ((v)->ob_type == &triton::bindings::python::Bitvector_Type)
 
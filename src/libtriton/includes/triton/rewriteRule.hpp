@@ -0,0 +1,143 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_REWRITERULE_H
+#define TRITON_REWRITERULE_H
+
+#include <string>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/astEnums.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The Engines namespace
+  namespace engines {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup engines
+   *  @{
+   */
+
+    //! The Symbolic Execution namespace
+    namespace symbolic {
+    /*!
+     *  \ingroup engines
+     *  \addtogroup symbolic
+     *  @{
+     */
+
+      //! \class RewriteRule
+      /*! \brief A simplification rule compiled from a `<pattern> -> <replacement>` S-expression.
+       *
+       * \details The pattern is compiled into a flat list of match instructions run in pre-order
+       * over the node, and the replacement into a list of build instructions run in post-order.
+       * See \ref SMT_simplification_page for the syntax of rules.
+       */
+      class RewriteRule {
+        private:
+          //! Kinds of compiled instructions.
+          enum opcode_e {
+            MATCH_NODE,     //!< Matches the kind, the parameters and the arity of a node.
+            MATCH_VARIABLE, //!< Binds a variable, or compares the node with the node already bound.
+            MATCH_CONSTANT, //!< Matches a constant bitvector.
+            BUILD_NODE,     //!< Builds a node with the last built operands.
+            BUILD_VARIABLE, //!< Pushes the node bound to a variable.
+            BUILD_CONSTANT, //!< Pushes a constant bitvector.
+          };
+
+          //! A compiled instruction.
+          struct Instruction {
+            //! The kind of instruction.
+            opcode_e opcode;
+
+            //! The kind of node (MATCH_NODE and BUILD_NODE).
+            triton::ast::kind_e kind;
+
+            //! The number of expression childs (MATCH_NODE and BUILD_NODE).
+            triton::uint32 arity;
+
+            //! The decimal parameters of an indexed node, e.g: the high and low bits of an extract.
+            std::vector<triton::uint32> parameters;
+
+            //! The variable index (MATCH_VARIABLE and BUILD_VARIABLE).
+            triton::uint32 variable;
+
+            //! The expected or built bitvector size, 0 means any (or the size of the sibling operands or of the rewritten node).
+            triton::uint32 size;
+
+            //! The constant value (MATCH_CONSTANT and BUILD_CONSTANT).
+            triton::uint512 value;
+          };
+
+          //! The rule as written by the user.
+          std::string rule;
+
+          //! The kind of the root node of the pattern.
+          triton::ast::kind_e kind;
+
+          //! The names of the variables, their index is used by the instructions.
+          std::vector<std::string> variables;
+
+          //! The compiled pattern.
+          std::vector<Instruction> matcher;
+
+          //! The compiled replacement.
+          std::vector<Instruction> builder;
+
+          //! Compiles a term of the pattern. Returns the position of the next token.
+          triton::usize compilePattern(const std::vector<std::string>& tokens, triton::usize pos);
+
+          //! Compiles a term of the replacement. Returns the position of the next token.
+          triton::usize compileReplacement(const std::vector<std::string>& tokens, triton::usize pos);
+
+          //! Compiles the head of a node, e.g: `bvadd` or `(_ extract 7 0)`. Returns the position of the next token.
+          triton::usize compileOperator(const std::vector<std::string>& tokens, triton::usize pos, Instruction& ins) const;
+
+          //! Compiles an atom (variable or constant) into an instruction.
+          void compileAtom(const std::string& token, Instruction& ins, bool replacement);
+
+        public:
+          //! Constructor. Compiles the rule, throws a triton::exceptions::SymbolicSimplification exception if the rule is invalid.
+          RewriteRule(const std::string& rule);
+
+          //! Constructor by copy.
+          RewriteRule(const RewriteRule& copy);
+
+          //! Destructor.
+          virtual ~RewriteRule();
+
+          //! Returns the rule as written by the user.
+          const std::string& getRule(void) const;
+
+          //! Returns the kind of the root node of the pattern.
+          triton::ast::kind_e getKind(void) const;
+
+          //! Returns the rewritten node if the rule matches the node, nullptr otherwise.
+          triton::ast::AbstractNode* apply(triton::ast::AbstractNode* node) const;
+
+          //! Copies a RewriteRule.
+          void operator=(const RewriteRule& other);
+      };
+
+    /*! @} End of symbolic namespace */
+    };
+  /*! @} End of engines namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_REWRITERULE_H */
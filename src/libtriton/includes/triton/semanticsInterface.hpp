@@ -36,6 +36,9 @@ namespace triton {
 
         //! Builds the semantics of the instruction. Returns true if the instruction is supported.
         virtual bool buildSemantics(triton::arch::Instruction& inst) = 0;
+
+        //! Spreads the taint of the instruction from its operands without building its semantics. Returns true if the instruction is supported.
+        virtual bool buildTaintSemantics(triton::arch::Instruction& inst) = 0;
     };
 
   /*! @} End of arch namespace */
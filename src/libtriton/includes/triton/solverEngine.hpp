@@ -43,6 +43,13 @@ namespace triton {
      *  @{
      */
 
+      /*! Results of the pre-solver */
+      enum presolve_e {
+        PRESOLVE_UNKNOWN = 0, /*!< The constraint cannot be decided without the solver */
+        PRESOLVE_SAT,         /*!< The constraint is true whatever the values of the variables */
+        PRESOLVE_UNSAT,       /*!< The constraint is false whatever the values of the variables */
+      };
+
       //! \class SolverEngine
       /*! \brief The solver engine class. */
       class SolverEngine {
@@ -74,6 +81,9 @@ namespace triton {
            * **item2**: model
            */
           std::list<std::map<triton::uint32, SolverModel>> getModels(triton::ast::AbstractNode* node, triton::uint32 limit) const;
+
+          //! Decides a symbolic constraint from the known bits of its nodes, without calling the solver. Constraints which are found UNSAT never reach the solver.
+          enum presolve_e preSolve(triton::ast::AbstractNode* node) const;
       };
 
     /*! @} End of solver namespace */
@@ -10,13 +10,19 @@
 
 #include <list>
 #include <map>
+#include <memory>
+#include <set>
 #include <string>
+#include <unordered_map>
+#include <vector>
 
 #include <triton/architecture.hpp>
 #include <triton/ast.hpp>
 #include <triton/callbacks.hpp>
 #include <triton/memoryAccess.hpp>
+#include <triton/memoryReferenceTable.hpp>
 #include <triton/modes.hpp>
+#include <triton/pagedMemory.hpp>
 #include <triton/pathManager.hpp>
 #include <triton/register.hpp>
 #include <triton/symbolicEnums.hpp>
@@ -69,29 +75,44 @@ namespace triton {
           //! Symbolic variables id.
           triton::usize uniqueSymVarId;
 
-          /*! \brief The map of symbolic variables
+          //! The number of symbolic expressions created since the last collection.
+          triton::usize createdExpressions;
+
+          //! The number of created symbolic expressions which triggers the next collection.
+          triton::usize collectionThreshold;
+
+          /*! \brief map of pinned symbolic expressions
            *
            * \description
-           * **item1**: variable id<br>
-           * **item2**: symbolic variable
+           * **item1**: symbolic reference id<br>
+           * **item2**: number of handles (e.g: Python objects) held on the expression
            */
-          std::map<triton::usize, SymbolicVariable*> symbolicVariables;
+          std::map<triton::usize, triton::usize> pinnedExpressions;
 
-          /*! \brief The map of symbolic expressions
+          /*! \brief The map of symbolic variables
            *
            * \description
-           * **item1**: symbolic reference id<br>
-           * **item2**: symbolic expression
+           * **item1**: variable id<br>
+           * **item2**: symbolic variable (shared with the copies of the engine)
            */
-          std::map<triton::usize, SymbolicExpression*> symbolicExpressions;
+          std::map<triton::usize, std::shared_ptr<SymbolicVariable>> symbolicVariables;
+
+          //! The map returned by getSymbolicExpressions(), built on each call.
+          mutable std::map<triton::usize, SymbolicExpression*> symbolicExpressionsView;
 
-          /*! \brief map of address -> symbolic expression
+          //! The map returned by getSymbolicVariables(), built on each call.
+          mutable std::map<triton::usize, SymbolicVariable*> symbolicVariablesView;
+
+          /*! \brief The paged table of symbolic expressions
            *
            * \description
-           * **item1**: memory address<br>
-           * **item2**: symbolic reference id
+           * **item1**: symbolic reference id<br>
+           * **item2**: symbolic expression (shared with the copies of the engine)
            */
-          std::map<triton::uint64, triton::usize> memoryReference;
+          triton::arch::PagedMemory<std::shared_ptr<SymbolicExpression>> symbolicExpressions;
+
+          //! The paged table of memory address -> symbolic reference id.
+          triton::engines::symbolic::MemoryReferenceTable memoryReference;
 
           /*! \brief map of <address:size> -> symbolic expression.
            *
@@ -101,6 +122,48 @@ namespace triton {
            */
           std::map<std::pair<triton::uint64, triton::uint32>, triton::ast::AbstractNode*> alignedMemoryReference;
 
+          /*! \brief map of symbolic expression -> memoized full AST.
+           *
+           * \description
+           * **item1**: symbolic reference id<br>
+           * **item2**: <AST of the expression when it was unrolled:unrolled AST>
+           */
+          std::map<triton::usize, std::pair<triton::ast::AbstractNode*, triton::ast::AbstractNode*>> unrolledAsts;
+
+          /*! \brief map of AST -> cached dependencies.
+           *
+           * \description
+           * **item1**: AST of a symbolic expression<br>
+           * **item2**: ids of the symbolic expressions referenced by the AST (see SymbolicExpression::getDependencies())
+           */
+          std::unordered_map<triton::ast::AbstractNode*, std::vector<triton::usize>> dependencies;
+
+          /*! \brief paged table of symbolic expression -> registers (reverse index of symbolicReg).
+           *
+           * \description
+           * **item1**: symbolic reference id<br>
+           * **item2**: parent register ids (shared with the copies of the engine until they are written)
+           */
+          triton::arch::PagedMemory<std::shared_ptr<std::set<triton::uint32>>> registerLocations;
+
+          /*! \brief paged table of symbolic expression -> memory (reverse index of memoryReference).
+           *
+           * \description
+           * **item1**: symbolic reference id<br>
+           * **item2**: memory addresses (shared with the copies of the engine until they are written)
+           */
+          triton::arch::PagedMemory<std::shared_ptr<std::set<triton::uint64>>> memoryLocations;
+
+          /*! \brief map of comment -> shared comment.
+           *
+           * \description
+           * Expressions share the same few comments (e.g: "ADD operation"), so each comment is stored once
+           * and expressions only point on it. The table is owned by the engine and released with it.<br>
+           * **item1**: comment<br>
+           * **item2**: shared comment
+           */
+          std::unordered_map<std::string, std::shared_ptr<const std::string>> comments;
+
         private:
           //! Architecture API
           triton::arch::Architecture* architecture;
@@ -111,20 +174,43 @@ namespace triton {
           //! Modes API.
           triton::modes::Modes* modes;
 
-          //! Defines if this instance is used as a backup.
-          bool backupFlag;
+          //! Assigns a symbolic reference id (or UNSET) to a parent register and updates the reverse index.
+          void setRegisterReference(triton::uint32 regId, triton::usize id);
 
-          //! Slices all expressions from a given node.
-          void sliceExpressions(triton::ast::AbstractNode* node, std::map<triton::usize, SymbolicExpression*>& exprs);
+          //! Removes a memory address from the reverse index of a symbolic reference id.
+          void removeMemoryLocation(triton::usize id, triton::uint64 addr);
+
+          //! Returns the size (in bits) of the effective address of a memory access: the size of its index, base or displacement, the size of the registers otherwise.
+          triton::uint32 getLeaBitSize(const triton::arch::MemoryAccess& mem) const;
+
+          //! Returns the dependencies of a symbolic expression. They are cached until its AST is modified.
+          const std::vector<triton::usize>& getDependencies(SymbolicExpression* expr);
+
+          //! Returns `size` bytes of `node` from the byte `offset`.
+          triton::ast::AbstractNode* extractBytes(triton::ast::AbstractNode* node, triton::uint32 offset, triton::uint32 size) const;
+
+          //! Returns the expression assigned to `addr` if it holds the byte at its offset from its origin memory, nullptr otherwise.
+          SymbolicExpression* getPackedMemoryExpression(triton::uint64 addr) const;
+
+          //! Returns a symbolic memory where consecutive bytes of a same expression are loaded with a single node (see triton::modes::PACKED_MEMORY).
+          triton::ast::AbstractNode* buildSymbolicPackedMemory(const triton::arch::MemoryAccess& mem);
+
+          //! Converts a symbolic memory to a symbolic variable when the memory is packed.
+          void convertPackedMemoryToSymbolicVariable(const triton::arch::MemoryAccess& mem, triton::ast::AbstractNode* symVarNode);
 
         public:
-          //! Constructor. If you use this class as backup or copy you should define the `isBackup` flag as true.
+          //! Constructor.
           SymbolicEngine(triton::arch::Architecture* architecture,
                          triton::modes::Modes* modes,
-                         triton::callbacks::Callbacks* callbacks=nullptr,
-                         bool isBackup=false);
+                         triton::callbacks::Callbacks* callbacks=nullptr);
 
-          //! Constructor by copy.
+          /*!
+           * \brief Constructor by copy.
+           *
+           * \details The copy is a fork: the symbolic expressions, the symbolic variables and the tables
+           * are shared with `copy` until one of the engines writes them (copy-on-write), so copying an
+           * engine does not depend on the number of expressions and both engines then diverge safely.
+           */
           SymbolicEngine(const SymbolicEngine& copy);
 
           //! Destructor.
@@ -136,15 +222,43 @@ namespace triton {
           //! Copies a SymbolicEngine.
           void operator=(const SymbolicEngine& other);
 
+          //! Restores the state of a copy of the engine. The ids are not reused and the pinned expressions are kept.
+          void restore(const SymbolicEngine& other);
+
           //! Symbolic register state.
           triton::usize* symbolicReg;
 
           //! Creates a new symbolic expression.
           SymbolicExpression* newSymbolicExpression(triton::ast::AbstractNode* node, symkind_e kind, const std::string& comment="");
 
+          //! Returns the shared copy of a comment, nullptr if the comment is empty.
+          std::shared_ptr<const std::string> internComment(const std::string& comment);
+
           //! Removes the symbolic expression corresponding to the id.
           void removeSymbolicExpression(triton::usize symExprId);
 
+          /*!
+           * \brief Frees all symbolic expressions which are not reachable anymore. Returns the ids of the freed expressions.
+           *
+           * \details The roots are the expressions assigned to registers and memory, the pinned expressions and
+           * the expressions referenced by the path constraints, the aligned memory and the `roots` nodes (e.g: the
+           * pinned AST nodes). An expression is reachable if it is a root or if it is referenced by the AST of a
+           * reachable expression.
+           */
+          std::vector<triton::usize> freeUnreachableSymbolicExpressions(const std::vector<triton::ast::AbstractNode*>& roots);
+
+          //! Drops symbolic expressions without concretizing their locations. Used by a backup engine once its original engine has freed them.
+          void forgetSymbolicExpressions(const std::vector<triton::usize>& symExprIds);
+
+          //! Returns true if enough symbolic expressions have been created since the last collection.
+          bool isSymbolicCollectionRequired(void) const;
+
+          //! Pins a symbolic expression. A pinned expression is never freed by freeUnreachableSymbolicExpressions().
+          void pinSymbolicExpression(triton::usize symExprId);
+
+          //! Unpins a symbolic expression.
+          void unpinSymbolicExpression(triton::usize symExprId);
+
           //! Adds an aligned entry.
           void addAlignedMemory(triton::uint64 address, triton::uint32 size, triton::ast::AbstractNode* node);
 
@@ -160,6 +274,9 @@ namespace triton {
           //! Adds a symbolic variable.
           SymbolicVariable* newSymbolicVariable(symkind_e kind, triton::uint64 kindValue, triton::uint32 size, const std::string& comment="");
 
+          //! Removes the symbolic variable corresponding to the id. Its id is never given again.
+          void removeSymbolicVariable(triton::usize symVarId);
+
           //! Converts a symbolic expression to a symbolic variable. `symVarSize` must be in bits.
           SymbolicVariable* convertExpressionToSymbolicVariable(triton::usize exprId, triton::uint32 symVarSize, const std::string& symVarComment="");
 
@@ -181,6 +298,9 @@ namespace triton {
           //! Returns the symbolic expression corresponding to an id.
           SymbolicExpression* getSymbolicExpressionFromId(triton::usize symExprId) const;
 
+          //! Returns the symbolic expression corresponding to an id to be modified. The expression is duplicated if it is shared with a copy of the engine.
+          SymbolicExpression* getWritableSymbolicExpression(triton::usize symExprId);
+
           //! Returns the map of symbolic registers defined.
           std::map<triton::arch::Register, SymbolicExpression*> getSymbolicRegisters(void) const;
 
@@ -241,6 +361,25 @@ namespace triton {
           //! Returns the new symbolic volatile expression expression and links this expression to the instruction.
           SymbolicExpression* createSymbolicVolatileExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, const std::string& comment="");
 
+          /*!
+           * \brief Same as createSymbolicExpression() with a comment which is a string literal (e.g: the comments of the semantics).
+           *
+           * \details The comment is only copied the first time it is read (see SymbolicExpression::setLiteralComment()).
+           */
+          SymbolicExpression* createSymbolicExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::OperandWrapper& dst, const char* comment);
+
+          //! Same as createSymbolicMemoryExpression() with a comment which is a string literal. The comments of the bytes are built from it once per write.
+          SymbolicExpression* createSymbolicMemoryExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::MemoryAccess& mem, const char* comment);
+
+          //! Same as createSymbolicRegisterExpression() with a comment which is a string literal, only copied the first time it is read.
+          SymbolicExpression* createSymbolicRegisterExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::Register& reg, const char* comment);
+
+          //! Same as createSymbolicFlagExpression() with a comment which is a string literal, only copied the first time it is read.
+          SymbolicExpression* createSymbolicFlagExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, triton::arch::Register& flag, const char* comment);
+
+          //! Same as createSymbolicVolatileExpression() with a comment which is a string literal, only copied the first time it is read.
+          SymbolicExpression* createSymbolicVolatileExpression(triton::arch::Instruction& inst, triton::ast::AbstractNode* node, const char* comment);
+
           //! Returns an unique symbolic expression id.
           triton::usize getUniqueSymExprId(void);
 
@@ -253,22 +392,40 @@ namespace triton {
           //! Assigns a symbolic expression to a memory.
           void assignSymbolicExpressionToMemory(SymbolicExpression *se, const triton::arch::MemoryAccess& mem);
 
-          //! Returns the full AST of a root node.
-          triton::ast::AbstractNode* getFullAst(triton::ast::AbstractNode* node, std::set<triton::usize>& processed);
-
-          //! Returns the full AST of a root node.
+          /*!
+           * \brief Returns the full AST of a root node.
+           *
+           * \details Reference nodes are replaced by the ASTs they point to in a new DAG, the
+           * stored expressions are left untouched. The full AST of each referenced expression is
+           * memoized, so successive queries on overlapping slices only unroll new expressions.
+           */
           triton::ast::AbstractNode* getFullAst(triton::ast::AbstractNode* node);
 
-          //! Slices all expressions from a given one.
+          //! Drops all memoized full ASTs and cached dependencies (e.g: all nodes are going to be freed).
+          void invalidateFullAsts(void);
+
+          //! Drops the memoized full ASTs and the cached dependencies which use one of the nodes (e.g: nodes which are going to be freed).
+          void invalidateFullAsts(const std::set<triton::ast::AbstractNode*>& nodes);
+
+          //! Drops the memoized full ASTs and the cached dependencies which reach a node modified in place (or an AST replaced in a symbolic expression).
+          void invalidateAsts(triton::ast::AbstractNode* node);
+
+          //! Slices all expressions from a given one. The slice follows the dependencies of the expressions (see SymbolicExpression::getDependencies()), which are cached.
           std::map<triton::usize, SymbolicExpression*> sliceExpressions(SymbolicExpression* expr);
 
           //! Returns the list of the tainted symbolic expressions.
           std::list<SymbolicExpression*> getTaintedSymbolicExpressions(void) const;
 
-          //! Returns all symbolic expressions.
+          //! Returns all symbolic expressions. The map is built from the paged table and stays valid until the next call.
           const std::map<triton::usize, SymbolicExpression*>& getSymbolicExpressions(void) const;
 
-          //! Returns all symbolic variables.
+          //! Returns the number of symbolic expressions.
+          triton::usize getNumberOfSymbolicExpressions(void) const;
+
+          //! Adds into `roots` all AST nodes directly held by the engine (expressions, path constraints and aligned memory).
+          void getAstRoots(std::vector<triton::ast::AbstractNode*>& roots) const;
+
+          //! Returns all symbolic variables. The map is built from the shared variables and stays valid until the next call.
           const std::map<triton::usize, SymbolicVariable*>& getSymbolicVariables(void) const;
 
           //! Returns all variable declarations representation.
@@ -310,8 +467,11 @@ namespace triton {
           //! Returns true if the register expression contains a symbolic variable.
           bool isRegisterSymbolized(const triton::arch::Register& reg) const;
 
-          //! Initializes the memory access AST (LOAD and STORE).
+          //! Initializes the memory access AST (LOAD and STORE) and its address (see initLeaAddress()).
           void initLeaAst(triton::arch::MemoryAccess& mem, bool force=false);
+
+          //! Initializes the address of a memory access from the concrete context, without building its AST. The address is only initialized if it is not already defined, unless `force` is true.
+          void initLeaAddress(triton::arch::MemoryAccess& mem, bool force=false) const;
       };
 
     /*! @} End of symbolic namespace */
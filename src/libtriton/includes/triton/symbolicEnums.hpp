@@ -51,6 +51,17 @@ namespace triton {
         MEM        //!< Assigned to a memory.
       };
 
+      //! Enumerates all native simplification passes.
+      enum simplification_e {
+        CONSTANT_FOLDING = 0, //!< Folds bitvector operations on constants.
+        NEUTRAL_ELEMENTS,     //!< Removes neutral elements and applies absorbing ones (e.g: `x + 0`, `x & 0`).
+        DOUBLE_NEGATION,      //!< Removes double negations (e.g: `~~x`, `-(-x)`).
+        SELF_OPERATIONS,      //!< Simplifies operations on the same operand (e.g: `x ^ x`, `x - x`, `x & x`).
+        EXTRACT_REDUCTION,    //!< Reduces extractions of zero extensions, concatenations and extractions.
+        CONSTANT_CONDITION,   //!< Selects the branch of an `ite` which has a constant condition.
+        REWRITE_RULES,        //!< Applies the rewrite rules recorded by the user.
+      };
+
     /*! @} End of symbolic namespace */
     };
   /*! @} End of engines namespace */
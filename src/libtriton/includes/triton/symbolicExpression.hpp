@@ -8,7 +8,9 @@
 #ifndef TRITON_SYMBOLICEXPRESSION_H
 #define TRITON_SYMBOLICEXPRESSION_H
 
+#include <memory>
 #include <string>
+#include <vector>
 
 #include <triton/ast.hpp>
 #include <triton/memoryAccess.hpp>
@@ -52,8 +54,11 @@ namespace triton {
           //! The root node (AST) of the symbolic expression.
           triton::ast::AbstractNode* ast;
 
-          //! The comment of the symbolic expression.
-          std::string comment;
+          //! The comment of the symbolic expression (shared with the other expressions of the same comment, nullptr if there is no comment).
+          mutable std::shared_ptr<const std::string> comment;
+
+          //! The comment given as a string literal, copied into `comment` the first time it is read (nullptr if none).
+          const char* literalComment;
 
           //! The symbolic expression id. This id is unique.
           triton::usize id;
@@ -92,6 +97,14 @@ namespace triton {
           //! Returns the comment of the symbolic expression.
           const std::string& getComment(void) const;
 
+          /*!
+           * \brief Returns the ids of the symbolic expressions directly referenced by the AST, sorted.
+           *
+           * \details This is the use-def edge of the expression. It is computed from the AST without
+           * crossing the references. The symbolic engine caches it for the slices until the AST is modified.
+           */
+          std::vector<triton::usize> getDependencies(void) const;
+
           //! Returns the id as string of the symbolic expression according the mode of the AST representation.
           std::string getFormattedId(void) const;
 
@@ -107,9 +120,15 @@ namespace triton {
           //! Sets a root node.
           void setAst(triton::ast::AbstractNode* node);
 
-          //! Sets a comment to the symbolic expression.
+          //! Sets a comment to the symbolic expression. The comment is interned by the symbolic engine (see triton::API::internComment()).
           void setComment(const std::string& comment);
 
+          //! Sets a comment shared with other expressions (see triton::engines::symbolic::SymbolicEngine::internComment()).
+          void setComment(const std::shared_ptr<const std::string>& comment);
+
+          //! Sets a comment which is a string literal. It is only copied (and interned) the first time it is read.
+          void setLiteralComment(const char* comment);
+
           //! Sets the kind of the symbolic expression.
           void setKind(symkind_e k);
 
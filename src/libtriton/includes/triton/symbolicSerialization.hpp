@@ -0,0 +1,109 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the BSD License.
+*/
+
+#ifndef TRITON_SYMBOLICSERIALIZATION_H
+#define TRITON_SYMBOLICSERIALIZATION_H
+
+#include <istream>
+#include <ostream>
+#include <string>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/symbolicEngine.hpp>
+#include <triton/symbolicExpression.hpp>
+#include <triton/symbolicVariable.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The Engines namespace
+  namespace engines {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup engines
+   *  @{
+   */
+
+    //! The Symbolic Execution namespace
+    namespace symbolic {
+    /*!
+     *  \ingroup engines
+     *  \addtogroup symbolic
+     *  @{
+     */
+
+      //! The magic number of a serialized DAG.
+      const char SERIALIZATION_MAGIC[] = "TRDG";
+
+      //! The version of the serialization format.
+      const triton::uint32 SERIALIZATION_VERSION = 1;
+
+      //! \class SymbolicSerialization
+      /*! \brief Saves and loads AST DAGs, symbolic expressions and symbolic variables in a compact binary format.
+       *
+       * \details Each unique node is written once in a node table and childs are referenced by their
+       * index in this table. All integers are varint-encoded. See \ref engine_SymbolicSerialization_page.
+       */
+      class SymbolicSerialization {
+        private:
+          //! Symbolic engine API
+          triton::engines::symbolic::SymbolicEngine* symbolic;
+
+          //! Writes an unsigned integer as a varint.
+          void writeVarint(std::ostream& stream, triton::uint512 value) const;
+
+          //! Writes a string (its length then its bytes).
+          void writeString(std::ostream& stream, const std::string& value) const;
+
+          //! Reads a varint.
+          triton::uint512 readVarint(std::istream& stream) const;
+
+          //! Reads a varint which must fit in `bits` bits.
+          triton::uint64 readVarint(std::istream& stream, triton::uint32 bits) const;
+
+          //! Reads a string.
+          std::string readString(std::istream& stream) const;
+
+          //! Returns the expression referenced by a saved node.
+          SymbolicExpression* getReferencedExpression(triton::usize id) const;
+
+          //! Returns the expressions to save, the referenced ones included, each one after its references.
+          std::vector<SymbolicExpression*> sortExpressions(const std::vector<triton::ast::AbstractNode*>& nodes, const std::vector<SymbolicExpression*>& exprs) const;
+
+        public:
+          //! Constructor.
+          SymbolicSerialization(triton::engines::symbolic::SymbolicEngine* symbolic);
+
+          //! Writes `nodes`, `exprs` and `vars` into `stream`. Variables and expressions used by the nodes and the expressions are written too.
+          void save(std::ostream& stream,
+                    const std::vector<triton::ast::AbstractNode*>& nodes,
+                    const std::vector<SymbolicExpression*>& exprs,
+                    const std::vector<SymbolicVariable*>& vars) const;
+
+          //! Reads a stream written by save(). The stream is checked before loaded expressions and variables are created in the symbolic engine with new ids.
+          void load(std::istream& stream,
+                    std::vector<triton::ast::AbstractNode*>& nodes,
+                    std::vector<SymbolicExpression*>& exprs,
+                    std::vector<SymbolicVariable*>& vars);
+      };
+
+    /*! @} End of symbolic namespace */
+    };
+  /*! @} End of engines namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_SYMBOLICSERIALIZATION_H */
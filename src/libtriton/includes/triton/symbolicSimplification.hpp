@@ -8,8 +8,14 @@
 #ifndef TRITON_SYMBOLICSIMPLIFICATION_H
 #define TRITON_SYMBOLICSIMPLIFICATION_H
 
+#include <map>
+#include <string>
+#include <vector>
+
 #include <triton/ast.hpp>
 #include <triton/callbacks.hpp>
+#include <triton/rewriteRule.hpp>
+#include <triton/symbolicEnums.hpp>
 
 
 
@@ -36,6 +42,9 @@ namespace triton {
      *  @{
      */
 
+      //! The maximal number of nested rewrites (a rule applied on nodes built by another rule).
+      const triton::uint32 REWRITE_RULES_MAX_DEPTH = 32;
+
       //! \class SymbolicSimplification
       /*! \brief The symbolic simplification class */
       class SymbolicSimplification {
@@ -43,6 +52,29 @@ namespace triton {
           //! Callbacks API
           triton::callbacks::Callbacks* callbacks;
 
+          //! The ordered list of native simplification passes.
+          std::vector<triton::engines::symbolic::simplification_e> passes;
+
+          //! The recorded rewrite rules.
+          std::vector<triton::engines::symbolic::RewriteRule> rules;
+
+          /*! \brief map of node kind -> rewrite rules.
+           *
+           * \description
+           * **item1**: kind of the root node of the pattern<br>
+           * **item2**: indexes of the rules, in their recording order
+           */
+          std::map<triton::ast::kind_e, std::vector<triton::usize>> rulesByKind;
+
+          //! The current number of nested rewrites.
+          mutable triton::uint32 rewriteDepth;
+
+          //! Applies the first matching rewrite rule on a node.
+          triton::ast::AbstractNode* applyRewriteRules(triton::ast::AbstractNode* node) const;
+
+          //! Applies a native simplification pass on a node.
+          triton::ast::AbstractNode* applyNativeSimplification(triton::engines::symbolic::simplification_e pass, triton::ast::AbstractNode* node) const;
+
         public:
           //! Constructor.
           SymbolicSimplification(triton::callbacks::Callbacks* callbacks=nullptr);
@@ -59,6 +91,32 @@ namespace triton {
           //! Processes all recorded simplifications. Returns the simplified node.
           triton::ast::AbstractNode* processSimplification(triton::ast::AbstractNode* node) const;
 
+          /*!
+           * \brief Applies the native simplification passes on a node. Returns the simplified node.
+           *
+           * \details The childs of the node are expected to be already simplified, which is the
+           * case when the passes are applied at the construction of the nodes.
+           */
+          triton::ast::AbstractNode* applyNativeSimplifications(triton::ast::AbstractNode* node) const;
+
+          //! Applies the native simplification passes on all nodes of an AST, from the leaves to the root. Returns the simplified AST.
+          triton::ast::AbstractNode* processNativeSimplifications(triton::ast::AbstractNode* node) const;
+
+          //! Defines the native simplification passes and their order. Throws an exception if a pass is unknown.
+          void setNativeSimplificationPasses(const std::vector<triton::engines::symbolic::simplification_e>& passes);
+
+          //! Returns the native simplification passes in their order.
+          const std::vector<triton::engines::symbolic::simplification_e>& getNativeSimplificationPasses(void) const;
+
+          //! Compiles and records a rewrite rule (e.g: `(bvxor x x) -> 0`).
+          void addSimplificationRule(const std::string& rule);
+
+          //! Returns all recorded rewrite rules.
+          std::vector<std::string> getSimplificationRules(void) const;
+
+          //! Removes all recorded rewrite rules.
+          void removeAllSimplificationRules(void);
+
           //! Copies a SymbolicSimplification.
           void operator=(const SymbolicSimplification& other);
       };
@@ -11,6 +11,7 @@
 #include <set>
 
 #include <triton/memoryAccess.hpp>
+#include <triton/pagedMemory.hpp>
 #include <triton/register.hpp>
 #include <triton/symbolicEngine.hpp>
 #include <triton/tritonTypes.hpp>
@@ -57,8 +58,11 @@ namespace triton {
           //! Defines if the taint engine is enabled or disabled.
           bool enableFlag;
 
-          //! The set of tainted addresses.
-          std::set<triton::uint64> taintedMemory;
+          //! The tainted addresses, shared with the copies of the engine until they are written.
+          triton::arch::PagedMemory<bool> taintedMemory;
+
+          //! The set returned by getTaintedMemory(), built on each call.
+          mutable std::set<triton::uint64> taintedMemoryView;
 
           //! The set of tainted registers. Currently it is an over approximation of the taint.
           std::set<triton::arch::Register> taintedRegisters;
@@ -82,7 +86,7 @@ namespace triton {
           //! Enables or disables the taint engine.
           void enable(bool flag);
 
-          //! Returns the tainted addresses.
+          //! Returns the tainted addresses. The set is built from the paged table and stays valid until the next call.
           const std::set<triton::uint64>& getTaintedMemory(void) const;
 
           //! Returns the tainted registers.
@@ -208,6 +212,9 @@ namespace triton {
 
           //! Spreads RegisterRegister with assignment.
           bool assignmentRegisterRegister(const triton::arch::Register& regDst, const triton::arch::Register& regSrc);
+
+          //! Sets the taint of the symbolic expression assigned to a memory byte.
+          void setTaintMemoryExpression(triton::uint64 addr, bool flag);
       };
 
     /*! @} End of taint namespace */
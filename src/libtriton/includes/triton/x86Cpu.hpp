@@ -16,6 +16,7 @@
 #include <triton/cpuInterface.hpp>
 #include <triton/instruction.hpp>
 #include <triton/memoryAccess.hpp>
+#include <triton/pagedMemory.hpp>
 #include <triton/register.hpp>
 #include <triton/registerSpecification.hpp>
 #include <triton/tritonTypes.hpp>
@@ -54,13 +55,8 @@ namespace triton {
           triton::callbacks::Callbacks* callbacks;
 
         protected:
-          /*! \brief map of address -> concrete value
-           *
-           * \description
-           * **item1**: memory address<br>
-           * **item2**: concrete value
-           */
-          std::map<triton::uint64, triton::uint8> memory;
+          //! The concrete memory (address -> concrete value), shared with the copies of the CPU until it is written.
+          triton::arch::PagedMemory<triton::uint8> memory;
 
           //! Concrete value of eax
           triton::uint8 eax[DWORD_SIZE];
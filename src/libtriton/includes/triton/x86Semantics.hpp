@@ -64,6 +64,9 @@ namespace triton {
           //! Builds the semantics of the instruction. Returns true if the instruction is supported.
           bool buildSemantics(triton::arch::Instruction& inst);
 
+          //! Spreads the taint of the instruction from its operands without building its semantics. Returns true if the instruction is supported.
+          bool buildTaintSemantics(triton::arch::Instruction& inst);
+
           //! Aligns the stack (add). Returns the new stack value.
           triton::uint64 alignAddStack_s(triton::arch::Instruction& inst, triton::uint32 delta);
 
@@ -71,10 +74,10 @@ namespace triton {
           triton::uint64 alignSubStack_s(triton::arch::Instruction& inst, triton::uint32 delta);
 
           //! Clears a flag.
-          void clearFlag_s(triton::arch::Instruction& inst, triton::arch::Register& flag, std::string comment="");
+          void clearFlag_s(triton::arch::Instruction& inst, triton::arch::Register& flag, const char* comment="");
 
           //! Sets a flag.
-          void setFlag_s(triton::arch::Instruction& inst, triton::arch::Register& flag, std::string comment="");
+          void setFlag_s(triton::arch::Instruction& inst, triton::arch::Register& flag, const char* comment="");
 
           //! Control flow semantics. Used to represent IP.
           void controlFlow_s(triton::arch::Instruction& inst);
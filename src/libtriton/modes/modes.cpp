@@ -14,6 +14,7 @@ namespace triton {
 
     Modes::Modes() {
       this->enableMode(triton::modes::PC_TRACKING_SYMBOLIC, true); /* This mode is enabled by default */
+      this->enableMode(triton::modes::SYMBOLIC_COMMENTS, true);    /* This mode is enabled by default */
     }
 
 
@@ -17,6 +17,20 @@ class TestAstDictionaries(unittest.TestCase):
         setArchitecture(ARCH.X86_64)
         enableMode(MODE.AST_DICTIONARIES, True)
 
+    def test_default(self):
+        # Nodes are shared, so the mode is opt-in
+        setArchitecture(ARCH.X86_64)
+        self.assertFalse(isModeEnabled(MODE.AST_DICTIONARIES))
+
+    def test_set_child_aliasing(self):
+        # A node modified in place is seen by every tree which uses it
+        node = bvadd(bv(1, 8), bv(2, 8))
+        tree1 = bvnot(node)
+        tree2 = bvneg(bvadd(bv(1, 8), bv(2, 8)))
+        node.setChild(1, bv(3, 8))
+        self.assertEqual(tree1.evaluate(), (~4) & 0xff)
+        self.assertEqual(tree2.evaluate(), (-4) & 0xff)
+
     def test_dictionaries(self):
         # d is empty
         d = getAstDictionariesStats()
@@ -31,6 +45,8 @@ class TestAstDictionaries(unittest.TestCase):
         self.assertEqual(d['decimal'], 3)
         self.assertEqual(d['allocatedDictionaries'], 5)
         self.assertEqual(d['allocatedNodes'], 6)
+        self.assertEqual(d['hits'], 1)
+        self.assertEqual(d['misses'], 5)
 
         # Same allocation
         bv1 = bv(1, 8)
@@ -41,3 +57,25 @@ class TestAstDictionaries(unittest.TestCase):
         self.assertEqual(d['decimal'], 3)
         self.assertEqual(d['allocatedDictionaries'], 5)
         self.assertEqual(d['allocatedNodes'], 12)
+        self.assertEqual(d['hits'], 7)
+        self.assertEqual(d['misses'], 5)
+
+        # Same node
+        self.assertEqual(bv(1, 8).getHash(), bv1.getHash())
+        self.assertNotEqual(bv(1, 16).getHash(), bv1.getHash())
+
+    def test_free_nodes(self):
+        """Nodes of removed expressions are removed from the dictionaries."""
+        enableMode(MODE.ONLY_ON_SYMBOLIZED, True)
+
+        inst = Instruction()
+        inst.setOpcodes("\x48\x01\xD8") # add rax, rbx
+
+        before = getAstDictionariesStats()
+        processing(inst)
+        after = getAstDictionariesStats()
+
+        self.assertEqual(len(inst.getSymbolicExpressions()), 0)
+        self.assertLess(after['allocatedDictionaries'] - before['allocatedDictionaries'], after['misses'] - before['misses'])
+
+        enableMode(MODE.ONLY_ON_SYMBOLIZED, False)
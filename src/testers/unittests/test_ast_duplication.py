@@ -79,3 +79,12 @@ class TestAstDuplication(unittest.TestCase):
         for n in self.node:
             self.assertEqual(n.getHash(), duplicate(n).getHash())
 
+
+    def test_hash(self):
+        node = bvadd(self.v1, self.v2)
+        self.assertEqual(node.getHash(), bvadd(self.v1, self.v2).getHash())
+        self.assertNotEqual(node.getHash(), bvsub(self.v1, self.v2).getHash())
+
+        # The cached hash must follow the tree modifications
+        node.setChild(1, self.v1)
+        self.assertEqual(node.getHash(), bvadd(self.v1, self.v1).getHash())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python2
+# coding: utf-8
+"""Test AST epochs."""
+
+import unittest
+
+from triton     import *
+from triton.ast import *
+
+
+class TestAstEpochs(unittest.TestCase):
+
+    """Testing the AST epochs."""
+
+    def setUp(self):
+        """Define the arch."""
+        setArchitecture(ARCH.X86_64)
+        enableMode(MODE.AST_DICTIONARIES, False)
+
+    def tearDown(self):
+        """Restore the default modes."""
+        resetEngines()
+
+    def test_end_epoch(self):
+        """Nodes of a closed epoch are kept."""
+        beginAstEpoch()
+        node = bvadd(bv(1, 8), bv(2, 8))
+        endAstEpoch()
+        self.assertEqual(node.evaluate(), 3)
+
+    def test_free_epoch(self):
+        """Nodes of a freed epoch do not leak into the enclosing one."""
+        kept = bvadd(bv(1, 8), bv(2, 8))
+        beginAstEpoch()
+        bvmul(kept, bv(3, 8))
+        freeAstEpoch()
+        self.assertEqual(kept.evaluate(), 3)
+
+    def test_free_epoch_keeps_used_nodes(self):
+        """Nodes of a freed epoch which are still used are kept."""
+        kept = bvadd(bv(1, 8), bv(2, 8))
+        beginAstEpoch()
+        # Pinned by a Python object
+        node = bvmul(bv(2, 8), bv(3, 8))
+        # Child of a node of a previous epoch
+        kept.setChild(1, bvsub(bv(9, 8), bv(4, 8)))
+        # AST of a symbolic expression
+        expr = newSymbolicExpression(bvxor(bv(0xff, 8), bv(0x0f, 8)))
+        freeAstEpoch()
+
+        self.assertEqual(node.evaluate(), 6)
+        self.assertEqual(kept.evaluate(), 6)
+        self.assertEqual(expr.getAst().evaluate(), 0xf0)
+
+        # Kept nodes now belong to the enclosing epoch
+        with self.assertRaises(TypeError):
+            freeAstEpoch()
+        self.assertEqual(str(getFullAst(expr.getAst())), "(bvxor (_ bv255 8) (_ bv15 8))")
+
+    def test_no_opened_epoch(self):
+        """The first epoch cannot be closed."""
+        with self.assertRaises(TypeError):
+            endAstEpoch()
+        with self.assertRaises(TypeError):
+            freeAstEpoch()
+
+    def test_dictionaries(self):
+        """Nodes recorded into the AST dictionaries are freed with their epoch."""
+        enableMode(MODE.AST_DICTIONARIES, True)
+        kept = bvadd(bv(1, 8), bv(2, 8))
+        before = getAstDictionariesStats()
+
+        beginAstEpoch()
+        bvmul(kept, bv(3, 8))
+        freeAstEpoch()
+
+        after = getAstDictionariesStats()
+        self.assertGreater(after['misses'], before['misses'])
+        self.assertEqual(after['allocatedDictionaries'], before['allocatedDictionaries'])
+        self.assertEqual(kept.evaluate(), 3)
+
+        # A node recorded again after its epoch has been freed is a new one
+        self.assertEqual(bvmul(kept, bv(3, 8)).evaluate(), 9)
+
+    def test_instruction_epoch(self):
+        """Nodes of an instruction are freed with its epoch when the symbolic engine is disabled."""
+        enableMode(MODE.AST_DICTIONARIES, True)
+        enableSymbolicEngine(False)
+        taintRegister(REG.RAX)
+
+        inst = Instruction()
+        inst.setOpcodes("\x48\x01\xC3") # add rbx, rax
+
+        before = getAstDictionariesStats()['allocatedDictionaries']
+        processing(inst)
+
+        self.assertTrue(isRegisterTainted(REG.RBX))
+        self.assertEqual(len(inst.getSymbolicExpressions()), 0)
+        self.assertEqual(getAstDictionariesStats()['allocatedDictionaries'], before)
@@ -4,10 +4,14 @@
 
 import unittest
 
-from triton import setArchitecture, ARCH, evaluateAstViaZ3
+from triton import (setArchitecture, ARCH, evaluateAstViaZ3, evaluateAst,
+                    evaluateAstBatch, newSymbolicVariable, compileAst,
+                    newSymbolicExpression)
 from triton.ast import (bv, bvsub, bvadd, bvxor, bvor, bvand, bvnand, bvnor,
                         bvxnor, bvmul, bvneg, bvnot, bvsdiv, sx, zx, bvudiv,
-                        bvashr, bvlshr, bvshl, bvrol, bvror, bvsmod, bvsrem)
+                        bvashr, bvlshr, bvshl, bvrol, bvror, bvsmod, bvsrem,
+                        concat, extract, variable, reference, ite, equal,
+                        bvslt, bvsge, bvurem)
 
 
 class TestAstEval(unittest.TestCase):
@@ -802,3 +806,136 @@ class TestAstEval(unittest.TestCase):
             bvsrem(zx(64, bv(9223372036854775808, 64)), sx(64, bv(18446744073709551615, 64))),
         ]
         self.check_ast(tests)
+
+    def test_wide(self):
+        """Check operations crossing the 64 bits native fast path."""
+        tests = [
+            bvadd(bv(0xffffffffffffffff, 64), bv(1, 64)),
+            bvmul(bv(0xffffffffffffffff, 64), bv(0xffffffffffffffff, 64)),
+            bvshl(bv(1, 64), bv(63, 64)),
+            bvlshr(bv(0x8000000000000000, 64), bv(64, 64)),
+            bvnot(bv(0, 64)),
+            bvneg(bv(1, 64)),
+            bvadd(bv(0xffffffffffffffffffffffffffffffff, 128), bv(1, 128)),
+            bvxor(bv(0x11223344556677889900aabbccddeeff, 128), bv(0xffffffffffffffff0000000000000000, 128)),
+            concat([bv(0x1122334455667788, 64), bv(0x99aabbccddeeff00, 64)]),
+            extract(127, 64, concat([bv(0x1122334455667788, 64), bv(0x99aabbccddeeff00, 64)])),
+            extract(71, 8, zx(64, bv(0x99aabbccddeeff00, 64))),
+            sx(64, bv(0x8000000000000000, 64)),
+            zx(64, bv(0xffffffffffffffff, 64)),
+        ]
+        self.check_ast(tests)
+
+    def test_assignment(self):
+        """Check the evaluation under a variable assignment."""
+        var1 = newSymbolicVariable(32)
+        var2 = newSymbolicVariable(128)
+        node = bvadd(bvmul(variable(var1), bv(3, 32)), extract(31, 0, bvlshr(variable(var2), bv(64, 128))))
+        self.assertEqual(evaluateAst(node, {var1.getId(): 5, var2.getId(): 0x70000000000000000}), 22)
+        self.assertEqual(evaluateAst(node, {var1.getId(): 0xffffffff}), 0xfffffffd)
+        self.assertEqual(evaluateAst(node, {}), node.evaluate())
+        self.assertEqual(node.evaluate(), 0)
+        self.assertEqual(var1.getConcreteValue(), 0)
+
+    def test_batch(self):
+        """Check the evaluation over a batch of assignments."""
+        var1 = newSymbolicVariable(32)
+        var2 = newSymbolicVariable(128)
+        narrow = bvsub(bvmul(variable(var1), bv(3, 32)), sx(24, extract(7, 0, variable(var1))))
+        wide = bvadd(variable(var2), zx(96, variable(var1)))
+        inputs = [0, 1, 0x80, 0xffffffff, 0x12345678]
+
+        results = evaluateAstBatch(narrow, {var1.getId(): inputs})
+        self.assertEqual(len(results), len(inputs))
+        for value, result in zip(inputs, results):
+            self.assertEqual(result, evaluateAst(narrow, {var1.getId(): value}))
+
+        results = evaluateAstBatch(wide, {var1.getId(): inputs, var2.getId(): inputs})
+        for value, result in zip(inputs, results):
+            self.assertEqual(result, value * 2)
+
+        self.assertRaises(OverflowError, evaluateAstBatch, narrow, {var1.getId(): [1, 1 << 64]})
+        self.assertRaises(OverflowError, evaluateAstBatch, narrow, {var1.getId(): [-1]})
+        self.assertRaises(OverflowError, evaluateAstBatch, narrow, {var1.getId(): [-(1 << 70)]})
+        self.assertRaises(TypeError, evaluateAstBatch, narrow, {var1.getId(): [1, "a"]})
+
+        try:
+            import numpy
+        except ImportError:
+            return
+        results = evaluateAstBatch(narrow, {var1.getId(): numpy.array(inputs, dtype=numpy.uint32)})
+        self.assertEqual(results.dtype, numpy.uint64)
+        self.assertEqual(list(results), list(evaluateAstBatch(narrow, {var1.getId(): inputs})))
+
+    def test_compile(self):
+        """Check a compiled AST is evaluated like the AST."""
+        var1 = newSymbolicVariable(32)
+        var2 = newSymbolicVariable(64)
+        expr = newSymbolicExpression(bvxor(bvrol(5, variable(var1)), bv(0x5a5a5a5a, 32)))
+        node = ite(equal(extract(31, 0, variable(var2)), reference(expr.getId())),
+                   concat([bvsdiv(reference(expr.getId()), bv(7, 32)), variable(var1)]),
+                   bvmul(zx(64, bvashr(variable(var1), bv(3, 32))), sx(64, bv(0x80000000, 32))))
+        program = compileAst(node)
+        self.assertEqual(program.getVariables(), [var2.getId(), var1.getId()])
+        self.assertEqual(program.getBitvectorSize(), 64)
+
+        for v1 in [0, 1, 0x80000000, 0xffffffff, 0x12345678]:
+            for v2 in [0, v1, ((v1 << 5) | (v1 >> 27)) & 0xffffffff ^ 0x5a5a5a5a]:
+                values = {var1.getId(): v1, var2.getId(): v2}
+                self.assertEqual(program(values), evaluateAst(node, values))
+                self.assertEqual(program(v2, v1), evaluateAst(node, values))
+
+    def check_semantics(self, operation, size, inputs):
+        """Check the evaluator, the batch evaluator and a program compute an operation like the nodes."""
+        var1 = newSymbolicVariable(size)
+        var2 = newSymbolicVariable(size)
+        node = operation(variable(var1), variable(var2))
+        program = compileAst(node)
+        expected = [operation(bv(a, size), bv(b, size)).evaluate() for a, b in inputs]
+
+        # The columns of a batch are up to 64 bits
+        if all(a >> 64 == 0 and b >> 64 == 0 for a, b in inputs):
+            results = evaluateAstBatch(node, {var1.getId(): [a for a, b in inputs], var2.getId(): [b for a, b in inputs]})
+            self.assertEqual(list(results), expected)
+
+        for (a, b), value in zip(inputs, expected):
+            values = {var1.getId(): a, var2.getId(): b}
+            self.assertEqual(evaluateAst(node, values), value)
+            self.assertEqual(program(values), value)
+
+    def test_semantics_shifts(self):
+        """Check the shifts by amounts up to and beyond the size."""
+        for size in [8, 32, 64, 128]:
+            mask = (1 << size) - 1
+            inputs = [(0x81 & mask, 0), (0x81, 1), (mask, size - 1), (mask, size), (mask, size + 1),
+                      (1 << (size - 1), 3), (0x7f, mask), (1 << (size - 1), size * 2)]
+            for operation in [bvshl, bvlshr, bvashr]:
+                self.check_semantics(operation, size, inputs)
+
+    def test_semantics_division_by_zero(self):
+        """Check the divisions and remainders by zero."""
+        for size in [8, 64, 128]:
+            mask = (1 << size) - 1
+            inputs = [(0, 0), (1, 0), (mask, 0), (1 << (size - 1), 0), (0x55, 0)]
+            for operation in [bvudiv, bvurem, bvsdiv, bvsrem, bvsmod]:
+                self.check_semantics(operation, size, inputs)
+
+    def test_semantics_signed(self):
+        """Check the signed operations on negative operands and bounds."""
+        for size in [8, 32, 64, 128]:
+            mask = (1 << size) - 1
+            smin = 1 << (size - 1)
+            inputs = [(smin, mask), (mask, mask), (7, mask), (mask - 6, 2), (7, mask - 1),
+                      (mask - 6, mask - 1), (smin, 1), (smin - 1, smin), (0, smin)]
+            for operation in [bvsdiv, bvsrem, bvsmod, bvslt, bvsge, bvashr]:
+                self.check_semantics(operation, size, inputs)
+            self.check_semantics(lambda a, b: bvadd(sx(size, a), zx(size, b)), size, inputs)
+
+    def test_semantics_concat(self):
+        """Check the concatenations of several operands, narrow and wide."""
+        inputs = [(0, 0), (0x12, 0xff), (0xffffffff, 0x80000000), (0x12345678, 0x9abcdef0)]
+        self.check_semantics(lambda a, b: concat([a, b]), 32, inputs)
+        self.check_semantics(lambda a, b: concat([extract(7, 0, a), b, extract(15, 0, b)]), 32, inputs)
+        self.check_semantics(lambda a, b: concat([a, b, a]), 32, inputs)
+        self.check_semantics(lambda a, b: concat([a, b, a, b, a]), 32, inputs)
+        self.check_semantics(lambda a, b: extract(71, 8, concat([b, a, b])), 32, inputs)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python2
+# coding: utf-8
+"""Test the AST garbage collection."""
+
+import unittest
+
+from triton     import *
+from triton.ast import *
+
+
+class TestAstGarbageCollection(unittest.TestCase):
+
+    """Testing the AST garbage collection."""
+
+    def setUp(self):
+        """Define the arch."""
+        setArchitecture(ARCH.X86_64)
+
+    def tearDown(self):
+        """Restore the default modes."""
+        resetEngines()
+
+    def test_dictionaries(self):
+        """Unreachable nodes recorded into dictionaries are freed."""
+        enableMode(MODE.AST_DICTIONARIES, True)
+        node = bvadd(bv(1, 8), bv(2, 8))
+        del node
+        self.assertGreater(freeUnreachableAstNodes(), 0)
+        self.assertEqual(getAstDictionariesStats()['bvadd'], 0)
+
+    def test_handles(self):
+        """Nodes held by a Python handle are kept."""
+        node = bvadd(bv(1, 8), bv(2, 8))
+        freeUnreachableAstNodes()
+        self.assertEqual(node.evaluate(), 3)
+        self.assertEqual(str(node), "(bvadd (_ bv1 8) (_ bv2 8))")
+
+    def test_expressions(self):
+        """Nodes of symbolic expressions are kept."""
+        inst = Instruction()
+        inst.setOpcodes("\x48\xc7\xc0\x01\x00\x00\x00") # mov rax, 1
+        processing(inst)
+        del inst
+
+        freeUnreachableAstNodes()
+        self.assertEqual(getSymbolicRegisterValue(REG.RAX), 1)
+        self.assertEqual(getFullAstFromId(getSymbolicRegisterId(REG.RAX)).evaluate(), 1)
+
+    def test_mode(self):
+        """Processing instructions with the garbage collection enabled."""
+        enableMode(MODE.AST_GARBAGE_COLLECTION, True)
+        for _ in range(100):
+            inst = Instruction()
+            inst.setOpcodes("\x48\xff\xc0") # inc rax
+            processing(inst)
+        self.assertEqual(getSymbolicRegisterValue(REG.RAX), 100)
+
+    def test_taint_only(self):
+        """Collections between instructions processed without the symbolic engine."""
+        enableMode(MODE.AST_DICTIONARIES, True)
+        enableSymbolicEngine(False)
+        taintRegister(REG.RAX)
+        for _ in range(10):
+            inst = Instruction()
+            inst.setOpcodes("\x48\x01\xC3") # add rbx, rax
+            processing(inst)
+            freeUnreachableAstNodes()
+        self.assertTrue(isRegisterTainted(REG.RBX))
@@ -86,3 +86,31 @@ class TestAstRepresentation(unittest.TestCase):
         for n in self.node:
             self.assertEqual(str(n[0]), n[2])
 
+
+    def test_deep_representation(self):
+        """Deep trees are displayed without recursion."""
+        setAstRepresentationMode(AST_REPRESENTATION.SMT)
+        node = self.v1
+        for _ in range(100000):
+            node = bvnot(node)
+        self.assertEqual(str(node), "(bvnot " * 100000 + "SymVar_0" + ")" * 100000)
+
+    def test_dag_representation(self):
+        """Shared sub-terms are bound once with a let."""
+        setAstRepresentationMode(AST_REPRESENTATION.SMT_DAG)
+        shared = self.v1 + self.v2
+        self.assertEqual(str(shared * shared), "(let ((dag!0 (bvadd SymVar_0 SymVar_1))) (bvmul dag!0 dag!0))")
+        self.assertEqual(str(self.v1 & self.v2), "(bvand SymVar_0 SymVar_1)")
+
+        node = shared
+        for _ in range(64):
+            node = node * node
+        self.assertLess(len(str(node)), 64 * 100)
+        setAstRepresentationMode(AST_REPRESENTATION.SMT)
+
+    def test_solver_keeps_mode(self):
+        """The solver does not change the representation mode."""
+        setAstRepresentationMode(AST_REPRESENTATION.PYTHON)
+        self.assertTrue(getModel(equal(self.v1 + self.v2, bv(3, 8))))
+        self.assertEqual(getAstRepresentationMode(), AST_REPRESENTATION.PYTHON)
+        setAstRepresentationMode(AST_REPRESENTATION.SMT)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python2
+# coding: utf-8
+"""Test AST serialization."""
+
+import unittest
+
+from triton     import *
+from triton.ast import *
+
+
+class TestAstSerialization(unittest.TestCase):
+
+    """Testing the binary serialization of ASTs, expressions and variables."""
+
+    def setUp(self):
+        """Define the arch."""
+        setArchitecture(ARCH.X86_64)
+
+    def test_ast(self):
+        """An AST is loaded back with the same semantics."""
+        node = extract(7, 0, bvadd(bv(0x1234, 16), zx(8, bv(0x10, 8))))
+        loaded = loadAst(saveAst(node))
+        self.assertEqual(str(loaded), str(node))
+        self.assertEqual(loaded.evaluate(), 0x44)
+
+    def test_shared_nodes(self):
+        """A shared sub-tree is saved once."""
+        node = bvadd(bv(1, 32), bv(2, 32))
+        for _ in xrange(32):
+            node = bvadd(node, node)
+        data = saveAst(node)
+        self.assertLess(len(data), 512)
+        self.assertEqual(loadAst(data).evaluate(), node.evaluate())
+
+    def test_variables(self):
+        """Variables used by an AST are created again with new ids."""
+        var = newSymbolicVariable(32, "input")
+        node = bvmul(variable(var), bv(3, 32))
+        loaded = loadAst(saveAst(node))
+        self.assertNotEqual(str(loaded), str(node))
+        self.assertEqual(getSymbolicVariableFromId(var.getId() + 1).getComment(), "input")
+
+        vars = loadSymbolicVariables(saveSymbolicVariables([var]))
+        self.assertEqual(len(vars), 1)
+        self.assertEqual(vars[0].getBitSize(), 32)
+        self.assertEqual(vars[0].getComment(), "input")
+
+    def test_expressions(self):
+        """References between loaded expressions are remapped on their new ids."""
+        expr1 = newSymbolicExpression(bv(1, 8), "first")
+        expr2 = newSymbolicExpression(bvadd(reference(expr1.getId()), bv(2, 8)), "second")
+
+        exprs = loadSymbolicExpressions(saveSymbolicExpressions([expr2, expr1]))
+        self.assertEqual(len(exprs), 2)
+        self.assertEqual(exprs[0].getComment(), "first")
+        self.assertEqual(exprs[1].getComment(), "second")
+        self.assertIn("ref!%d" % exprs[0].getId(), str(exprs[1].getAst()))
+        self.assertEqual(getFullAst(exprs[1].getAst()).evaluate(), 3)
+
+    def test_referenced_expressions(self):
+        """Expressions referenced by the saved ones are saved too."""
+        expr1 = newSymbolicExpression(bv(1, 8), "first")
+        expr2 = newSymbolicExpression(bvadd(reference(expr1.getId()), bv(2, 8)), "second")
+        expr3 = newSymbolicExpression(bvmul(reference(expr2.getId()), reference(expr1.getId())), "third")
+
+        exprs = loadSymbolicExpressions(saveSymbolicExpressions([expr3]))
+        self.assertEqual([e.getComment() for e in exprs], ["first", "second", "third"])
+        self.assertEqual(getFullAst(exprs[2].getAst()).evaluate(), 3)
+
+        node = loadAst(saveAst(bvadd(reference(expr2.getId()), bv(1, 8))))
+        self.assertEqual(getFullAst(node).evaluate(), 4)
+
+    def test_invalid(self):
+        """An invalid stream is rejected."""
+        with self.assertRaises(TypeError):
+            loadAst("invalid")
+        with self.assertRaises(TypeError):
+            loadAst(saveAst(bv(1, 8))[:-1])
+
+        # A rejected stream does not modify the engine
+        var = newSymbolicVariable(8)
+        data = saveAst(bvadd(variable(var), bv(1, 8)))
+        count = len(getSymbolicVariables())
+        with self.assertRaises(TypeError):
+            loadAst(data[:-1])
+        self.assertEqual(len(getSymbolicVariables()), count)
@@ -90,3 +90,132 @@ class TestAstSimplification(unittest.TestCase):
                     return c1_nonNot ^ c2_nonNot
 
         return node
+
+
+
+class TestAstNativeSimplification(unittest.TestCase):
+
+    """Testing native AST simplification passes."""
+
+    def setUp(self):
+        setArchitecture(ARCH.X86_64)
+        enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, True)
+        self.x = variable(newSymbolicVariable(8))
+        self.y = variable(newSymbolicVariable(8))
+
+    def tearDown(self):
+        enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, False)
+
+    def test_constant_folding(self):
+        self.assertEqual(str(bv(1, 8) + bv(2, 8)), "(_ bv3 8)")
+        self.assertEqual(str(zx(8, bv(0xff, 8))), "(_ bv255 16)")
+        self.assertEqual(str(equal(bv(1, 8), bv(1, 8))), "(= (_ bv1 8) (_ bv1 8))")
+
+    def test_neutral_elements(self):
+        self.assertEqual(str(self.x + bv(0, 8)), str(self.x))
+        self.assertEqual(str(bv(1, 8) * self.x), str(self.x))
+        self.assertEqual(str(self.x & bv(0, 8)), "(_ bv0 8)")
+        self.assertEqual(str(self.x | bv(0xff, 8)), "(_ bv255 8)")
+
+    def test_double_negation(self):
+        self.assertEqual(str(~~self.x), str(self.x))
+        self.assertEqual(str(-(-self.x)), str(self.x))
+
+    def test_self_operations(self):
+        self.assertEqual(str(self.x ^ self.x), "(_ bv0 8)")
+        self.assertEqual(str(self.x - self.x), "(_ bv0 8)")
+        self.assertEqual(str(self.x & self.x), str(self.x))
+
+    def test_extract_reduction(self):
+        self.assertEqual(str(extract(7, 0, zx(24, self.x))), str(self.x))
+        self.assertEqual(str(extract(31, 8, zx(24, self.x))), "(_ bv0 24)")
+        self.assertEqual(str(extract(15, 8, concat([self.x, self.y]))), str(self.x))
+        self.assertEqual(str(extract(3, 0, concat([self.x, self.y]))), "((_ extract 3 0) %s)" % (str(self.y)))
+
+    def test_constant_condition(self):
+        self.assertEqual(str(ite(equal(bv(1, 8), bv(1, 8)), self.x, self.y)), str(self.x))
+        self.assertEqual(str(ite(equal(bv(1, 8), bv(2, 8)), self.x, self.y)), str(self.y))
+        self.assertEqual(str(ite(equal(self.x, bv(2, 8)), self.x, self.y)), "(ite (= %s (_ bv2 8)) %s %s)" % (str(self.x), str(self.x), str(self.y)))
+
+    def test_passes(self):
+        setSimplificationPasses([SIMPLIFICATION.SELF_OPERATIONS])
+        self.assertEqual(getSimplificationPasses(), [SIMPLIFICATION.SELF_OPERATIONS])
+        self.assertEqual(str(bv(1, 8) + bv(2, 8)), "(bvadd (_ bv1 8) (_ bv2 8))")
+        self.assertEqual(str(self.x ^ self.x), "(_ bv0 8)")
+        with self.assertRaises(TypeError):
+            setSimplificationPasses([SIMPLIFICATION.REWRITE_RULES + 1])
+        self.assertEqual(getSimplificationPasses(), [SIMPLIFICATION.SELF_OPERATIONS])
+
+    def test_self_operations_structure(self):
+        # Operands are compared node by node, not only by their values and hashes
+        enableMode(MODE.AST_DICTIONARIES, False)
+        self.assertEqual(str((self.x + bv(1, 8)) ^ (self.x + bv(1, 8))), "(_ bv0 8)")
+        self.assertEqual(str((self.x + bv(1, 8)) ^ (self.y + bv(1, 8))), "(bvxor (bvadd %s (_ bv1 8)) (bvadd %s (_ bv1 8)))" % (str(self.x), str(self.y)))
+
+    def test_simplify(self):
+        enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, False)
+        node = (self.x ^ self.x) + bv(1, 8)
+        enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, True)
+        self.assertEqual(str(simplify(node)), "(_ bv1 8)")
+
+
+
+class TestAstRewriteRules(unittest.TestCase):
+
+    """Testing rewrite rules."""
+
+    def setUp(self):
+        setArchitecture(ARCH.X86_64)
+        enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, True)
+        self.a = variable(newSymbolicVariable(8))
+        self.b = variable(newSymbolicVariable(8))
+        self.c = variable(newSymbolicVariable(16))
+
+    def tearDown(self):
+        enableMode(MODE.AST_NATIVE_SIMPLIFICATIONS, False)
+
+    def test_rule(self):
+        addSimplificationRule("(bvor (bvand a (bvnot b)) (bvand (bvnot a) b)) -> (bvxor a b)")
+        self.assertEqual(getSimplificationRules(), ["(bvor (bvand a (bvnot b)) (bvand (bvnot a) b)) -> (bvxor a b)"])
+        self.assertEqual(str((self.a & ~self.b) | (~self.a & self.b)), str(self.a ^ self.b))
+        # Variables bound twice must match the same expression
+        self.assertNotEqual(str((self.a & ~self.b) | (~self.b & self.a)), str(self.a ^ self.b))
+        # Bound expressions are compared by structure, not by value
+        enableMode(MODE.AST_DICTIONARIES, False)
+        self.assertEqual(str(((self.a + bv(1, 8)) & ~self.b) | (~(self.a + bv(1, 8)) & self.b)), str((self.a + bv(1, 8)) ^ self.b))
+        self.assertNotEqual(str(((self.a + bv(1, 8)) & ~self.b) | (~(self.b + bv(1, 8)) & self.b)), str((self.a + bv(1, 8)) ^ self.b))
+
+    def test_size_condition(self):
+        addSimplificationRule("(bvadd x:8 1) -> (bvsub x 0xff)")
+        self.assertEqual(str(self.a + bv(1, 8)), str(self.a - bv(0xff, 8)))
+        self.assertEqual(str(self.c + bv(1, 16)), "(bvadd %s (_ bv1 16))" % (str(self.c)))
+
+    def test_indexed_operators(self):
+        setSimplificationPasses([SIMPLIFICATION.REWRITE_RULES])
+        addSimplificationRule("((_ extract 15 8) (concat x y)) -> x")
+        addSimplificationRule("((_ zero_extend 8) (_ bv0 8)) -> 0")
+        self.assertEqual(str(extract(15, 8, concat([self.a, self.b]))), str(self.a))
+
+    def test_constant_size(self):
+        # Constants without size take the size of their sibling operands
+        addSimplificationRule("(= x 0) -> (bvule x 0)")
+        self.assertEqual(str(equal(self.c, bv(0, 16))), "(bvule %s (_ bv0 16))" % (str(self.c)))
+        for rule in ["(bvadd x y) -> (concat x 0)", "(bvnot x) -> (bvnot 0)", "(bvadd x y) -> (bvadd 1 2)", "(bvadd x y) -> (ite 1 x y)"]:
+            with self.assertRaises(TypeError):
+                addSimplificationRule(rule)
+
+    def test_not_applicable(self):
+        # Operands of different sizes, the rule is not applied
+        addSimplificationRule("(concat x y) -> (bvadd x y)")
+        self.assertEqual(str(concat([self.a, self.c])), "(concat %s %s)" % (str(self.a), str(self.c)))
+
+    def test_invalid_rules(self):
+        for rule in ["(bvadd x 0)", "x -> x", "(bvadd x) -> x", "(bvfoo x y) -> x", "(bvadd x y) -> z", "(bvadd x y -> x"]:
+            with self.assertRaises(TypeError):
+                addSimplificationRule(rule)
+
+    def test_remove(self):
+        addSimplificationRule("(bvxor x y) -> x")
+        removeAllSimplificationRules()
+        self.assertEqual(getSimplificationRules(), [])
+        self.assertEqual(str(self.a ^ self.b), "(bvxor %s %s)" % (str(self.a), str(self.b)))
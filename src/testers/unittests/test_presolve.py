@@ -0,0 +1,53 @@
+#!/usr/bin/env python2
+# coding: utf-8
+"""Testing the pre-solving of constraints."""
+
+import unittest
+
+from triton import (setArchitecture, ARCH, PRESOLVE, preSolve, getModel,
+                    newSymbolicVariable, CPUSIZE)
+from triton.ast import (bv, bvadd, bvand, bvor, bvult, bvugt, bvlshr, equal,
+                        land, lnot, zx, extract, variable, bvsdiv, bvsmod,
+                        concat)
+
+
+class TestPreSolve(unittest.TestCase):
+
+    """Testing the pre-solving of constraints."""
+
+    def setUp(self):
+        """Define the arch and variables."""
+        setArchitecture(ARCH.X86_64)
+        self.x = variable(newSymbolicVariable(CPUSIZE.DWORD_BIT))
+        self.b = variable(newSymbolicVariable(CPUSIZE.BYTE_BIT))
+
+    def test_unsat(self):
+        """Check constraints which are always false."""
+        self.assertEqual(preSolve(equal(bvand(self.x, bv(0xff00, 32)), bv(1, 32))), PRESOLVE.UNSAT)
+        self.assertEqual(preSolve(equal(bvor(self.x, bv(1, 32)), bv(0, 32))), PRESOLVE.UNSAT)
+        self.assertEqual(preSolve(bvugt(zx(24, self.b), bv(255, 32))), PRESOLVE.UNSAT)
+        self.assertEqual(preSolve(land(bvult(self.x, bv(0, 32)), equal(self.x, bv(1, 32)))), PRESOLVE.UNSAT)
+
+    def test_sat(self):
+        """Check constraints which are always true."""
+        self.assertEqual(preSolve(bvult(zx(24, self.b), bv(256, 32))), PRESOLVE.SAT)
+        self.assertEqual(preSolve(bvult(bvlshr(self.x, bv(28, 32)), bv(16, 32))), PRESOLVE.SAT)
+        self.assertEqual(preSolve(equal(extract(0, 0, bvor(self.x, bv(1, 32))), bv(1, 1))), PRESOLVE.SAT)
+        self.assertEqual(preSolve(lnot(equal(bvand(self.x, bv(0xf0, 32)), bv(1, 32)))), PRESOLVE.SAT)
+
+    def test_unknown(self):
+        """Check constraints which need the solver."""
+        self.assertEqual(preSolve(equal(self.x, bv(5, 32))), PRESOLVE.UNKNOWN)
+        self.assertEqual(preSolve(bvult(bvadd(self.x, bv(1, 32)), bv(16, 32))), PRESOLVE.UNKNOWN)
+
+    def test_constant_operands(self):
+        """Check operations on operands with a single value are folded."""
+        zero = bvand(self.x, bv(0, 32))
+        self.assertEqual(preSolve(equal(bvsdiv(zero, bv(0, 32)), bv(0xffffffff, 32))), PRESOLVE.SAT)
+        self.assertEqual(preSolve(equal(bvsmod(bvor(self.x, bv(0xffffffff, 32)), bv(3, 32)), bv(2, 32))), PRESOLVE.SAT)
+        self.assertEqual(preSolve(equal(concat([zero, bvor(self.b, bv(0xff, 8))]), bv(0xff, 40))), PRESOLVE.SAT)
+
+    def test_model(self):
+        """Check the solver is not queried on unsat constraints."""
+        self.assertEqual(getModel(equal(bvand(self.x, bv(0xff00, 32)), bv(1, 32))), {})
+        self.assertEqual(len(getModel(equal(self.x, bv(5, 32)))), 1)
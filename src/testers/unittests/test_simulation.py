@@ -371,6 +371,17 @@ class TestSymboliqueEngineAligned(BaseTestSimulation, unittest.TestCase):
         super(TestSymboliqueEngineAligned, self).setUp()
 
 
+class TestSymboliqueEnginePacked(BaseTestSimulation, unittest.TestCase):
+
+    """Testing the symbolic emulation engine with PACKED_MEMORY."""
+
+    def setUp(self):
+        """Define the arch and modes."""
+        setArchitecture(ARCH.X86_64)
+        enableMode(MODE.PACKED_MEMORY, True)
+        super(TestSymboliqueEnginePacked, self).setUp()
+
+
 class TestSymboliqueEngineAlignedAst(BaseTestSimulation, unittest.TestCase):
 
     """Testing the symbolic engine with ALIGNED_MEMORY and AST Dict."""
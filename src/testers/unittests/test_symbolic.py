@@ -11,7 +11,17 @@ from triton import (setArchitecture, ARCH, processing, REG, Instruction,
                     getSymbolicExpressionFromId, getSymbolicMemoryId,
                     getSymbolicMemoryValue, assignSymbolicExpressionToMemory,
                     assignSymbolicExpressionToRegister, buildSymbolicImmediate,
-                    buildSymbolicRegister, Immediate)
+                    buildSymbolicRegister, Immediate, getFullAst,
+                    sliceExpressions, getSymbolicMemory, concretizeMemory,
+                    isMemorySymbolized, convertMemoryToSymbolicVariable,
+                    enableMode, MODE, Register, setConcreteRegisterValue,
+                    convertRegisterToSymbolicVariable, getSymbolicRegisterId,
+                    buildSymbolicMemory, AST_NODE, getSymbolicExpressions,
+                    freeUnreachableSymbolicExpressions, fork, restoreFork,
+                    removeFork, getForks, setConcreteMemoryValue,
+                    getConcreteMemoryValue, taintMemory, untaintMemory,
+                    isMemoryTainted, taintRegister,
+                    taintAssignmentMemoryRegister)
 
 
 class TestSymbolic(unittest.TestCase):
@@ -49,6 +59,75 @@ class TestSymbolic(unittest.TestCase):
         # Try to reset engine after a backup to test if the bug #385 is fixed.
         resetEngines()
 
+    def test_deep_slicing(self):
+        """Check slicing and unrolling of a long chain of expressions."""
+        expr = newSymbolicExpression(ast.bv(0, 8))
+        for _ in range(10000):
+            expr = newSymbolicExpression(ast.bvadd(ast.reference(expr.getId()), ast.bv(1, 8)))
+
+        self.assertEqual(len(sliceExpressions(expr)), 10001)
+        self.assertEqual(getFullAst(expr.getAst()).evaluate(), 10000 & 0xff)
+
+    def test_slicing_dependencies(self):
+        """Check slices follow the dependencies of the expressions."""
+        expr1 = newSymbolicExpression(ast.bv(1, 8))
+        expr2 = newSymbolicExpression(ast.bv(2, 8))
+        ref1  = ast.reference(expr1.getId())
+        expr3 = newSymbolicExpression(ast.bvadd(ref1, ast.bvmul(ref1, ast.reference(expr2.getId()))))
+        expr4 = newSymbolicExpression(ast.bvsub(ast.reference(expr3.getId()), ref1))
+
+        self.assertEqual(expr3.getDependencies(), [expr1.getId(), expr2.getId()])
+        self.assertEqual(expr4.getDependencies(), [expr1.getId(), expr3.getId()])
+        self.assertEqual(sorted(sliceExpressions(expr4).keys()), [expr1.getId(), expr2.getId(), expr3.getId(), expr4.getId()])
+
+        # The dependencies follow a new AST
+        expr3.setAst(ast.bv(3, 8))
+        self.assertEqual(expr3.getDependencies(), [])
+        self.assertEqual(sorted(sliceExpressions(expr4).keys()), [expr1.getId(), expr3.getId(), expr4.getId()])
+
+        # The dependencies follow an AST modified in place
+        expr4.getAst().setChild(1, ast.reference(expr2.getId()))
+        self.assertEqual(expr4.getDependencies(), [expr2.getId(), expr3.getId()])
+        self.assertEqual(sorted(sliceExpressions(expr4).keys()), [expr2.getId(), expr3.getId(), expr4.getId()])
+
+    def test_full_ast(self):
+        """Check unrolling does not modify the expressions and follows new ASTs."""
+        expr1 = newSymbolicExpression(ast.bv(1, 8))
+        expr2 = newSymbolicExpression(ast.bvadd(ast.reference(expr1.getId()), ast.bv(2, 8)))
+
+        self.assertEqual(str(getFullAst(expr2.getAst())), "(bvadd (_ bv1 8) (_ bv2 8))")
+        self.assertIn("ref!", str(expr2.getAst()))
+
+        # The memoized full AST of expr1 is dropped
+        expr1.setAst(ast.bv(5, 8))
+        self.assertEqual(getFullAst(expr2.getAst()).evaluate(), 7)
+        self.assertIn("ref!", str(expr2.getAst()))
+
+        # And so is the one of an AST modified in place
+        expr3 = newSymbolicExpression(ast.bvadd(ast.bv(3, 8), ast.bv(4, 8)))
+        expr4 = newSymbolicExpression(ast.bvmul(ast.reference(expr3.getId()), ast.bv(2, 8)))
+        self.assertEqual(getFullAst(expr4.getAst()).evaluate(), 14)
+        expr3.getAst().setChild(1, ast.bv(5, 8))
+        self.assertEqual(getFullAst(expr4.getAst()).evaluate(), 16)
+
+    def test_invalidation(self):
+        """Check a node modified in place only invalidates the ASTs which reach it."""
+        expr1 = newSymbolicExpression(ast.bvadd(ast.bv(1, 8), ast.bvmul(ast.bv(2, 8), ast.bv(3, 8))))
+        expr2 = newSymbolicExpression(ast.bvadd(ast.reference(expr1.getId()), ast.bv(1, 8)))
+        expr3 = newSymbolicExpression(ast.bvadd(ast.reference(expr2.getId()), ast.bv(1, 8)))
+        expr4 = newSymbolicExpression(ast.bvsub(ast.bv(9, 8), ast.bv(1, 8)))
+
+        self.assertEqual(getFullAst(expr3.getAst()).evaluate(), 9)
+        self.assertEqual(getFullAst(expr4.getAst()).evaluate(), 8)
+        self.assertEqual(sorted(sliceExpressions(expr3).keys()), [expr1.getId(), expr2.getId(), expr3.getId()])
+
+        # A nested node of expr1 is reached through the references of expr2 and expr3
+        expr1.getAst().getChilds()[1].setChild(0, ast.reference(expr4.getId()))
+        self.assertEqual(getFullAst(expr3.getAst()).evaluate(), 27)
+        self.assertEqual(getFullAst(expr4.getAst()).evaluate(), 8)
+        self.assertEqual(expr1.getDependencies(), [expr4.getId()])
+        self.assertEqual(sorted(sliceExpressions(expr3).keys()), [expr1.getId(), expr2.getId(), expr3.getId(), expr4.getId()])
+
     def test_bind_expr_to_memory(self):
         """Check symbolic expression binded to memory can be retrieve."""
         # Bind expr1 to 0x100
@@ -81,6 +160,272 @@ class TestSymbolic(unittest.TestCase):
 
         self.assertEqual(getSymbolicMemoryValue(mem), 0x11223344)
 
+    def test_bind_expr_across_pages(self):
+        """Check memory references crossing a page boundary."""
+        expr = newSymbolicExpression(ast.bv(0x11223344, 32))
+        assignSymbolicExpressionToMemory(expr, MemoryAccess(0xffe, CPUSIZE.DWORD))
+        assignSymbolicExpressionToMemory(expr, MemoryAccess(0xfffffffffffffffc, CPUSIZE.DWORD))
+
+        self.assertEqual(getSymbolicMemoryValue(MemoryAccess(0xffe, CPUSIZE.DWORD)), 0x11223344)
+        self.assertEqual(sorted(getSymbolicMemory().keys()), getSymbolicMemory().keys())
+        self.assertEqual(len(getSymbolicMemory()), 8)
+
+        # Unassigned bytes of an allocated page
+        self.assertEqual(getSymbolicMemoryId(0xffd), getSymbolicMemoryId(0x1002))
+
+        concretizeMemory(0x1000)
+        concretizeMemory(0x1001)
+        self.assertEqual(sorted(getSymbolicMemory().keys()), [0xffe, 0xfff, 0xfffffffffffffffc,
+                                                              0xfffffffffffffffd, 0xfffffffffffffffe,
+                                                              0xffffffffffffffff])
+
+        self.assertFalse(isMemorySymbolized(MemoryAccess(0xffe, CPUSIZE.DWORD)))
+        convertMemoryToSymbolicVariable(MemoryAccess(0xfff, CPUSIZE.WORD))
+        self.assertTrue(isMemorySymbolized(MemoryAccess(0xffe, CPUSIZE.DWORD)))
+
+    def test_memory_symbolized_range(self):
+        """Check symbolized bytes are found anywhere in a range of several pages."""
+        expr = newSymbolicExpression(ast.bv(0x11223344, 32))
+        assignSymbolicExpressionToMemory(expr, MemoryAccess(0x1fe, CPUSIZE.DWORD))
+        convertMemoryToSymbolicVariable(MemoryAccess(0x2ff, CPUSIZE.BYTE))
+
+        self.assertFalse(isMemorySymbolized(MemoryAccess(0x1f0, CPUSIZE.DQQWORD)))
+        self.assertTrue(isMemorySymbolized(MemoryAccess(0x2e0, CPUSIZE.DQQWORD)))
+        self.assertTrue(isMemorySymbolized(MemoryAccess(0x2ff, CPUSIZE.BYTE)))
+        self.assertFalse(isMemorySymbolized(MemoryAccess(0x2b0, CPUSIZE.DQQWORD)))
+        self.assertFalse(isMemorySymbolized(MemoryAccess(0x300, CPUSIZE.DQQWORD)))
+
+        convertMemoryToSymbolicVariable(MemoryAccess(0xffffffffffffffff, CPUSIZE.BYTE))
+        self.assertTrue(isMemorySymbolized(MemoryAccess(0xfffffffffffffff8, CPUSIZE.QWORD)))
+
+    def test_only_on_symbolized(self):
+        """Check discarded expressions are unassigned from registers and memory."""
+        enableMode(MODE.ONLY_ON_SYMBOLIZED, True)
+        setConcreteRegisterValue(Register(REG.RAX, 0x1000))
+        convertRegisterToSymbolicVariable(REG.RBX)
+
+        # mov [rax], rbx
+        inst = Instruction()
+        inst.setOpcodes("\x48\x89\x18")
+        processing(inst)
+        self.assertEqual(len(getSymbolicMemory()), 8)
+
+        # mov rbx, 1
+        inst = Instruction()
+        inst.setOpcodes("\x48\xc7\xc3\x01\x00\x00\x00")
+        processing(inst)
+        self.assertEqual(getSymbolicRegisterId(REG.RBX), getSymbolicRegisterId(REG.RCX))
+
+        # mov qword ptr [rax], 0
+        inst = Instruction()
+        inst.setOpcodes("\x48\xc7\x00\x00\x00\x00\x00")
+        processing(inst)
+        self.assertEqual(getSymbolicMemory(), {})
+
+    def test_packed_memory(self):
+        """Check a memory write is assigned to a single expression."""
+        enableMode(MODE.PACKED_MEMORY, True)
+        setConcreteRegisterValue(Register(REG.RAX, 0x1000))
+        setConcreteRegisterValue(Register(REG.RBX, 0x1122334455667788))
+
+        # mov [rax], rbx
+        inst = Instruction()
+        inst.setOpcodes("\x48\x89\x18")
+        processing(inst)
+        exprs = [e for e in inst.getSymbolicExpressions() if e.isMemory()]
+        self.assertEqual(len(exprs), 1)
+        self.assertEqual(set(e.getId() for e in getSymbolicMemory().values()), set([exprs[0].getId()]))
+
+        # Aligned, unaligned and overlapping loads
+        expr = exprs[0]
+        self.assertEqual(buildSymbolicMemory(MemoryAccess(0x1000, CPUSIZE.QWORD)).getKind(), AST_NODE.REFERENCE)
+        self.assertEqual(getSymbolicMemoryValue(MemoryAccess(0x1000, CPUSIZE.QWORD)), 0x1122334455667788)
+        self.assertEqual(getSymbolicMemoryValue(MemoryAccess(0x1003, CPUSIZE.DWORD)), 0x33445566)
+        self.assertEqual(getSymbolicMemoryValue(MemoryAccess(0x1004, CPUSIZE.QWORD)), 0x11223344)
+
+        # mov [rax+2], bx
+        inst = Instruction()
+        inst.setOpcodes("\x66\x89\x58\x02")
+        processing(inst)
+        self.assertEqual(getSymbolicMemoryValue(MemoryAccess(0x1000, CPUSIZE.QWORD)), 0x1122334477887788)
+        self.assertEqual(getSymbolicMemoryId(0x1000), expr.getId())
+
+        # The variable is seen through the expression of the first write
+        var = convertMemoryToSymbolicVariable(MemoryAccess(0x1001, CPUSIZE.WORD))
+        self.assertTrue(expr.isSymbolized())
+        self.assertTrue(isMemorySymbolized(MemoryAccess(0x1002, CPUSIZE.BYTE)))
+        self.assertEqual(var.getConcreteValue(), 0x8877)
+
+    def test_packed_memory_assignment(self):
+        """Check an assigned expression is wrapped and left untouched in packed mode."""
+        enableMode(MODE.PACKED_MEMORY, True)
+        expr = newSymbolicExpression(ast.bv(0x11223344, 32))
+        assignSymbolicExpressionToMemory(expr, MemoryAccess(0x2000, CPUSIZE.DWORD))
+
+        self.assertFalse(expr.isMemory())
+        self.assertNotEqual(getSymbolicMemoryId(0x2000), expr.getId())
+        self.assertEqual(getSymbolicMemoryId(0x2000), getSymbolicMemoryId(0x2003))
+        self.assertEqual(getSymbolicMemoryValue(MemoryAccess(0x2000, CPUSIZE.DWORD)), 0x11223344)
+        self.assertEqual(getSymbolicMemoryValue(MemoryAccess(0x2002, CPUSIZE.WORD)), 0x1122)
+
+    def test_comments(self):
+        """Check comments of symbolic expressions can be disabled."""
+        inst = Instruction()
+        # inc rax
+        inst.setOpcodes("\x48\xFF\xC0")
+        processing(inst)
+        self.assertEqual(inst.getSymbolicExpressions()[0].getComment(), "INC operation")
+        self.assertEqual(inst.getSymbolicExpressions()[1].getComment(), "Adjust flag")
+
+        # A comment read then replaced
+        expr = inst.getSymbolicExpressions()[0]
+        expr.setComment("my comment")
+        self.assertEqual(expr.getComment(), "my comment")
+        expr.setComment("")
+        self.assertEqual(expr.getComment(), "")
+
+        # push rax, the bytes of the write have the comment of the write
+        inst = Instruction()
+        inst.setOpcodes("\x50")
+        processing(inst)
+        comments = [e.getComment() for e in inst.getSymbolicExpressions() if e.isMemory()]
+        self.assertEqual(len(comments), 8)
+        self.assertEqual(set(comments), set(["Byte reference - PUSH operation"]))
+
+        enableMode(MODE.SYMBOLIC_COMMENTS, False)
+        inst = Instruction()
+        inst.setOpcodes("\x48\xFF\xC0")
+        processing(inst)
+        for expr in inst.getSymbolicExpressions():
+            self.assertEqual(expr.getComment(), "")
+
+        # Explicit comments are still kept
+        expr = newSymbolicExpression(ast.bv(1, 8), "my comment")
+        expr.setComment("other comment")
+        self.assertEqual(expr.getComment(), "other comment")
+
+    def test_free_unreachable_expressions(self):
+        """Check unreachable expressions are freed and reachable ones are kept."""
+        # A handle keeps the expressions of the first instruction alive
+        inst = Instruction()
+        inst.setOpcodes("\x48\xFF\xC0")  # inc rax
+        processing(inst)
+        pinned = inst.getSymbolicExpressions()
+
+        for _ in range(10):
+            inst = Instruction()
+            inst.setOpcodes("\x48\xFF\xC0")  # inc rax
+            processing(inst)
+
+        count = len(getSymbolicExpressions())
+        freed = freeUnreachableSymbolicExpressions()
+        self.assertGreater(freed, 0)
+        self.assertEqual(len(getSymbolicExpressions()), count - freed)
+        self.assertEqual(freeUnreachableSymbolicExpressions(), 0)
+
+        # The chain of RAX is reachable from the register
+        self.assertEqual(getSymbolicRegisterValue(REG.RAX), 11)
+        self.assertEqual(getFullAst(getSymbolicExpressionFromId(getSymbolicRegisterId(REG.RAX)).getAst()).evaluate(), 11)
+
+        for expr in pinned:
+            self.assertEqual(getSymbolicExpressionFromId(expr.getId()).getId(), expr.getId())
+
+    def test_free_expressions_of_pinned_nodes(self):
+        """Check the expressions referenced by a node held from Python are not freed."""
+        expr = newSymbolicExpression(ast.bv(5, 8))
+        node = ast.bvadd(ast.reference(expr.getId()), ast.bv(1, 8))
+        exprId = expr.getId()
+        del expr
+
+        freeUnreachableSymbolicExpressions()
+        self.assertEqual(getSymbolicExpressionFromId(exprId).getAst().evaluate(), 5)
+        self.assertEqual(getFullAst(node).evaluate(), 6)
+
+    def test_pins_after_reset(self):
+        """Check a handle from reset engines does not unpin an expression of the new engines."""
+        old = newSymbolicExpression(ast.bv(1, 8))
+        oldId = old.getId()
+        resetEngines()
+        new = newSymbolicExpression(ast.bv(2, 8))
+        self.assertEqual(oldId, new.getId())
+
+        del old
+        freeUnreachableSymbolicExpressions()
+        self.assertEqual(getSymbolicExpressionFromId(new.getId()).getAst().evaluate(), 2)
+
+    def test_fork(self):
+        """Check a fork restores the state and diverges from it."""
+        setConcreteMemoryValue(0x1000, 0x11)
+        taintMemory(0x1000)
+        inst = Instruction()
+        inst.setOpcodes("\x48\xFF\xC0")  # inc rax
+        processing(inst)
+
+        state = fork()
+        self.assertEqual(getForks(), [state])
+        count = len(getSymbolicExpressions())
+
+        # Explore one side
+        for _ in range(3):
+            inst = Instruction()
+            inst.setOpcodes("\x48\xFF\xC0")  # inc rax
+            processing(inst)
+        setConcreteMemoryValue(0x1000, 0x22)
+        untaintMemory(0x1000)
+        self.assertEqual(getSymbolicRegisterValue(REG.RAX), 4)
+
+        # Back to the fork
+        restoreFork(state)
+        self.assertEqual(getSymbolicRegisterValue(REG.RAX), 1)
+        self.assertEqual(getConcreteMemoryValue(0x1000), 0x11)
+        self.assertTrue(isMemoryTainted(0x1000))
+        self.assertEqual(len(getSymbolicExpressions()), count)
+
+        # Explore the other side, the fork is left untouched
+        inst = Instruction()
+        inst.setOpcodes("\x48\xFF\xC8")  # dec rax
+        processing(inst)
+        self.assertEqual(getSymbolicRegisterValue(REG.RAX), 0)
+
+        restoreFork(state)
+        self.assertEqual(getSymbolicRegisterValue(REG.RAX), 1)
+
+        removeFork(state)
+        self.assertEqual(getForks(), [])
+        with self.assertRaises(Exception):
+            restoreFork(state)
+
+    def test_fork_copy_on_write(self):
+        """Check the expressions shared with a fork are copied before being modified."""
+        inst = Instruction()
+        inst.setOpcodes("\x48\xFF\xC0")  # inc rax
+        processing(inst)
+        regId = getSymbolicRegisterId(REG.RAX)
+
+        expr = newSymbolicExpression(ast.bv(0x41, 8))
+        assignSymbolicExpressionToMemory(expr, MemoryAccess(0x2000, CPUSIZE.BYTE))
+        memId = getSymbolicMemoryId(0x2000)
+        taintRegister(REG.RAX)
+
+        state = fork()
+        convertRegisterToSymbolicVariable(REG.RAX)
+        convertMemoryToSymbolicVariable(MemoryAccess(0x2000, CPUSIZE.BYTE))
+        taintAssignmentMemoryRegister(MemoryAccess(0x2000, CPUSIZE.BYTE), REG.AL)
+        self.assertEqual(getSymbolicExpressionFromId(regId).getAst().getKind(), AST_NODE.VARIABLE)
+        self.assertTrue(getSymbolicExpressionFromId(memId).isTainted())
+        lastId = newSymbolicExpression(ast.bv(1, 8)).getId()
+
+        # The fork still has the previous expressions
+        restoreFork(state)
+        self.assertNotEqual(getSymbolicExpressionFromId(regId).getAst().getKind(), AST_NODE.VARIABLE)
+        self.assertEqual(getSymbolicRegisterValue(REG.RAX), 1)
+        self.assertNotEqual(getSymbolicExpressionFromId(memId).getAst().getKind(), AST_NODE.VARIABLE)
+        self.assertFalse(getSymbolicExpressionFromId(memId).isTainted())
+
+        # Ids are not reused after a restore
+        self.assertGreater(newSymbolicExpression(ast.bv(1, 8)).getId(), lastId)
+        removeFork(state)
+
     def test_bind_expr_to_register(self):
         """Check symbolic expression binded to register."""
         expr1 = newSymbolicExpression(ast.bv(0x11223344, 64))
@@ -3,7 +3,8 @@
 """Test Symbolic Variable."""
 
 import unittest
-from triton import *
+from triton     import *
+from triton.ast import bv, bvadd, bvmul, variable
 
 
 class TestSymbolicVariable(unittest.TestCase):
@@ -68,6 +69,39 @@ class TestSymbolicVariable(unittest.TestCase):
         self.assertEqual(self.v1.getConcreteValue(), 0x20)
         self.assertEqual(self.v2.getConcreteValue(), 0x30)
 
+    def test_lazy_evaluation(self):
+        """Test the lazy re-evaluation of ASTs"""
+        enableMode(MODE.AST_LAZY_EVALUATION, True)
+        node = bvmul(bvadd(variable(self.v0), bv(1, 8)), bv(2, 8))
+        self.assertEqual(node.evaluate(), 2)
+
+        self.v0.setConcreteValue(0x10)
+        self.assertEqual(node.evaluate(), 0x22)
+        self.assertTrue(node.isSymbolized())
+
+        # The hash of the parents of a modified node is refreshed too
+        child = bvadd(bv(1, 8), bv(2, 8))
+        node  = bvmul(child, bv(2, 8))
+        child.setChild(1, bv(3, 8))
+        self.assertEqual(node.getHash(), bvmul(bvadd(bv(1, 8), bv(3, 8)), bv(2, 8)).getHash())
+
+    def test_from_name(self):
+        """Test the lookup of variables by name"""
+        self.assertEqual(getSymbolicVariableFromName("SymVar_2").getId(), 2)
+        self.assertEqual(getSymbolicVariableFromName("SymVar_2").getComment(), "test com")
+        self.assertEqual(str(variable(self.v1)), "SymVar_1")
+        for name in ["SymVar_3", "SymVar_02", "SymVar_", "Var_1"]:
+            self.assertIsNone(getSymbolicVariableFromName(name))
+
+    def test_hash(self):
+        """Test the hashes of variables differ over all their bits"""
+        h0 = variable(self.v0).getHash()
+        h1 = variable(self.v1).getHash()
+        self.assertEqual(variable(self.v0).getHash(), h0)
+        self.assertLess(h0, 1 << 64)
+        self.assertNotEqual((h0 ^ h1) >> 32, 0)
+        self.assertNotEqual((h0 ^ h1) & 0xffffffff, 0)
+
     def test_str(self):
         """Test variable representation"""
         self.assertEqual(str(self.v0), "SymVar_0:8")
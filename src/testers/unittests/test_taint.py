@@ -13,7 +13,8 @@ from triton import (setArchitecture, ARCH, REG, taintRegister, processing,
                     taintUnionMemoryImmediate, taintUnionMemoryMemory,
                     taintUnionMemoryRegister, taintUnionRegisterImmediate,
                     taintUnionRegisterMemory, taintUnionRegisterRegister,
-                    getTaintedRegisters, getTaintedMemory)
+                    getTaintedRegisters, getTaintedMemory, enableMode, MODE,
+                    enableSymbolicEngine, setConcreteRegisterValue, Register)
 
 
 class TestTaint(unittest.TestCase):
@@ -421,3 +422,46 @@ class TestTaint(unittest.TestCase):
         self.assertTrue(0x4003 in m)
         self.assertFalse(0x5000 in m)
 
+    def test_taint_only(self):
+        """Spread the taint without building the semantics."""
+        setArchitecture(ARCH.X86_64)
+        enableSymbolicEngine(False)
+        enableMode(MODE.TAINT_ONLY, True)
+
+        setConcreteRegisterValue(Register(REG.RSP, 0x7fff0000))
+        setConcreteRegisterValue(Register(REG.RDI, 0x1000))
+        taintMemory(MemoryAccess(0x1008, 8))
+
+        for opcodes in ["\x48\x8B\x47\x08",  # mov rax, [rdi + 8]
+                        "\x48\x01\xC3",      # add rbx, rax
+                        "\x50",              # push rax
+                        "\x48\x31\xC9",      # xor rcx, rcx
+                        "\x48\x39\xCB"]:     # cmp rbx, rcx
+            inst = Instruction()
+            inst.setOpcodes(opcodes)
+            self.assertTrue(processing(inst))
+            self.assertEqual(len(inst.getSymbolicExpressions()), 0)
+
+        self.assertTrue(inst.isTainted())
+        self.assertTrue(isRegisterTainted(REG.RAX))
+        self.assertTrue(isRegisterTainted(REG.RBX))
+        self.assertFalse(isRegisterTainted(REG.RCX))
+        self.assertFalse(isRegisterTainted(REG.RSP))
+        self.assertTrue(isRegisterTainted(REG.CF))
+        self.assertTrue(isRegisterTainted(REG.ZF))
+        self.assertTrue(isMemoryTainted(MemoryAccess(0x7fff0000 - 8, 8)))
+        self.assertFalse(isMemoryTainted(MemoryAccess(0x7fff0000, 8)))
+
+        # je +2
+        inst = Instruction()
+        inst.setOpcodes("\x74\x02")
+        processing(inst)
+        self.assertTrue(isRegisterTainted(REG.RIP))
+
+        # Unsupported instructions are processed by the semantics
+        inst = Instruction()
+        inst.setOpcodes("\x48\xD1\xE3") # shl rbx, 1
+        self.assertTrue(processing(inst))
+        self.assertEqual(len(inst.getSymbolicExpressions()), 0)
+        self.assertTrue(isRegisterTainted(REG.RBX))
+        self.assertFalse(isRegisterTainted(REG.RIP))